@@ -2,7 +2,7 @@
 # Rotor_Wake_Fidelity_One.py
 #
 # Created:  Jan 2022, R. Erhard
-# Modified: 
+# Modified: Oct 2026, agent
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -69,6 +69,10 @@ class Rotor_Wake_Fidelity_One(Energy_Component):
         # wake convergence criteria
         self.maximum_convergence_iteration            = 10
         self.axial_velocity_convergence_tolerance     = 1e-2
+        self.wake_state_cache_size                    = 64   # operating points stored on the rotor for warm starts, 0 disables the cache
+        
+        # Barnes-Hut opening angle for the wake-induced velocities, 0 uses direct summation
+        self.induced_velocity_opening_angle           = 0.
         
         # flags for slipstream interaction
         self.slipstream                 = False
@@ -99,9 +103,12 @@ class Rotor_Wake_Fidelity_One(Energy_Component):
         None
         
         """
-        # run the BET once using fidelity zero inflow
-        rotor_temp = copy.deepcopy(rotor)
-        rotor_temp.Wake = Rotor_Wake_Fidelity_Zero()
+        # run the BET once using fidelity zero inflow, without copying the stored wake states
+        wake_state       = rotor.pop('wake_state',None)
+        rotor_temp       = copy.deepcopy(rotor)
+        if wake_state is not None:
+            rotor.wake_state = wake_state
+        rotor_temp.Wake  = Rotor_Wake_Fidelity_Zero()
         _,_,_,_,outputs,_ = rotor_temp.spin(conditions)
         
         rotor.outputs = outputs
@@ -236,7 +243,7 @@ class Rotor_Wake_Fidelity_One(Energy_Component):
     
         # compute the induced velocity from the rotor wake on the lifting surfaces
         VD.Wake         = wake_vortex_distribution
-        rot_V_wake_ind  = compute_wake_induced_velocity(wake_vortex_distribution,VD,num_ctrl_pts)        
+        rot_V_wake_ind  = compute_wake_induced_velocity(wake_vortex_distribution,VD,num_ctrl_pts,opening_angle=self.induced_velocity_opening_angle)        
         
         return rot_V_wake_ind
     
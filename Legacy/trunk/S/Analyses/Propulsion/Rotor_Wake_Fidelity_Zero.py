@@ -50,8 +50,9 @@ class Rotor_Wake_Fidelity_Zero(Energy_Component):
         None
         """
 
-        self.tag            = 'rotor_wake'
-        self.wake_method    = 'Fidelity_Zero'
+        self.tag               = 'rotor_wake'
+        self.wake_method       = 'Fidelity_Zero'
+        self.use_newton_solver = True     # per-station Newton solve of the inflow angle, False uses fsolve
 
     
     def evaluate(self,rotor,wake_inputs,conditions):
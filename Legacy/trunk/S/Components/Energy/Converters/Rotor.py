@@ -12,6 +12,7 @@
 #           Jul 2021, R. Erhard
 #           Sep 2021, R. Erhard
 #           Feb 2022, R. Erhard
+#           Oct 2026, agent
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -21,6 +22,7 @@ from Legacy.trunk.S.Components.Energy.Energy_Component import Energy_Component
 from Legacy.trunk.S.Core import ContainerOrdered 
 from Legacy.trunk.S.Analyses.Propulsion.Rotor_Wake_Fidelity_Zero import Rotor_Wake_Fidelity_Zero
 from Legacy.trunk.S.Analyses.Propulsion.Rotor_Wake_Fidelity_One import Rotor_Wake_Fidelity_One
+from Legacy.trunk.S.Methods.Propulsion.Rotor_Wake.Fidelity_One.fidelity_one_wake_convergence import initialize_wake_state
 from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.BET_calculations \
      import compute_airfoil_aerodynamics,compute_inflow_and_tip_loss
 from Legacy.trunk.S.Methods.Geometry.Three_Dimensional \
@@ -102,6 +104,7 @@ class Rotor(Energy_Component):
         
         # Initialize the default wake set to Fidelity Zero
         self.Wake                              = Rotor_Wake_Fidelity_Zero()
+        self.wake_state                        = initialize_wake_state()   # converged Fidelity One wakes, reused at nearby operating points
 
     def append_airfoil(self,airfoil):
         """ Adds an airfoil to the rotor
@@ -3,6 +3,7 @@
 #
 # Created:  Sep 2021, R. Erhard
 # Modified: Jan 2022, R. Erhard
+#           Oct 2026, agent
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -82,7 +83,7 @@ def compute_fidelity_one_inflow_velocities( wake, prop ):
         # Compute induced velocities at blade from the helical fixed wake
         VD.Wake_collapsed = WD
         
-        V_ind   = compute_wake_induced_velocity(WD, VD, cpts, azi_start_idx=i)
+        V_ind   = compute_wake_induced_velocity(WD, VD, cpts, azi_start_idx=i, opening_angle=wake.induced_velocity_opening_angle)
         
         # velocities in vehicle frame
         u       = V_ind[:,:,0]   # velocity in vehicle x-frame
@@ -3,31 +3,37 @@
 # 
 # Created:  Sep 2020, M. Clarke 
 # Modified: Dec 2021, R. Erhard
+#           Oct 2026, agent
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
 # package imports
+from Legacy.trunk.S.Core import Data
 import numpy as np 
 
 ## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
-def compute_wake_induced_velocity(WD,VD,cpts,azi_start_idx=0,sigma=0.11,suppress_root=False):  
+def compute_wake_induced_velocity(WD,VD,cpts,azi_start_idx=0,sigma=0.11,suppress_root=False,opening_angle=0.):  
     """ This computes the velocity induced by the Fidelity One semi-prescribed vortex wake (PVW)
     on lifting surface control points
 
     Assumptions:  
+    A positive opening angle evaluates the wake with a Barnes-Hut tree, direct summation otherwise
     
     Source:   
     
     Inputs: 
-    WD     - helical wake distribution points               [Unitless] 
-    VD     - vortex distribution points on lifting surfaces [Unitless] 
-    cpts   - control points in segment                      [Unitless] 
+    WD            - helical wake distribution points               [Unitless] 
+    VD            - vortex distribution points on lifting surfaces [Unitless] 
+    cpts          - control points in segment                      [Unitless] 
+    opening_angle - Barnes-Hut opening angle                       [Unitless] 
 
     Properties Used:
     N/A
     """    
+    if opening_angle > 0:
+        return compute_wake_induced_velocity_tree(WD,VD,cpts,azi_start_idx,sigma,opening_angle)
     
     # control point, time step , blade number , location on blade 
     num_vortex_pts = len(WD.XA1[0,0,:])    # number of vortex points
@@ -84,6 +90,181 @@ def compute_wake_induced_velocity(WD,VD,cpts,azi_start_idx=0,sigma=0.11,suppress
 
     return V_ind
   
+
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
+def compute_wake_induced_velocity_tree(WD,VD,cpts,azi_start_idx,sigma,opening_angle,leaf_size=8,max_pairs=2**18):
+    """ This computes the velocity induced by the Fidelity One semi-prescribed vortex wake (PVW)
+    on lifting surface control points with a Barnes-Hut tree. The vortex segments of each control
+    point are sorted into an octree. A cell whose radius is smaller than the opening angle times its
+    distance to an evaluation point is evaluated with a dipole expansion of the Biot-Savart law,
+    closer cells are opened and the segments of the leaf cells are summed with the regularized kernel.
+
+    Assumptions:  
+    The regularization kernel reduces to the Biot-Savart law outside of the vortex core
+    
+    Source:   
+    Barnes, J. and Hut, P., "A hierarchical O(N log N) force-calculation algorithm", Nature, 1986.
+    
+    Inputs: 
+    WD            - helical wake distribution points               [Unitless] 
+    VD            - vortex distribution points on lifting surfaces [Unitless] 
+    cpts          - control points in segment                      [Unitless] 
+    azi_start_idx - azimuthal start index of the wake              [Unitless] 
+    sigma         - regularization radius                          [m] 
+    opening_angle - Barnes-Hut opening angle                       [Unitless] 
+    leaf_size     - mean number of segments in the leaf cells      [Unitless] 
+    max_pairs     - near field pairs evaluated at once             [Unitless] 
+
+    Outputs:
+    V_ind         - induced velocities, shape (cpts,n_cp,3)        [m/s] 
+
+    Properties Used:
+    N/A
+    """   
+    n_eval = VD.n_cp
+    XC     = np.stack([np.ravel(VD.XC),np.ravel(VD.YC),np.ravel(VD.ZC)],axis=1).astype(np.float64)
+    
+    # corner points of each panel, shape (cpts,num_vortex_pts,3)
+    A1 = np.stack([WD.XA1[azi_start_idx],WD.YA1[azi_start_idx],WD.ZA1[azi_start_idx]],axis=2).astype(np.float64)
+    A2 = np.stack([WD.XA2[azi_start_idx],WD.YA2[azi_start_idx],WD.ZA2[azi_start_idx]],axis=2).astype(np.float64)
+    B1 = np.stack([WD.XB1[azi_start_idx],WD.YB1[azi_start_idx],WD.ZB1[azi_start_idx]],axis=2).astype(np.float64)
+    B2 = np.stack([WD.XB2[azi_start_idx],WD.YB2[azi_start_idx],WD.ZB2[azi_start_idx]],axis=2).astype(np.float64)
+    GAMMA = WD.GAMMA[azi_start_idx].astype(np.float64)
+    
+    # ignore the bound vortices of the row of panels corresponding to the lifting line of the rotor
+    m                   = np.shape(WD.reshaped_wake.XA1)[1]
+    lifting_line_panels = np.zeros(np.shape(WD.reshaped_wake.XA1[0]),dtype=bool)
+    lifting_line_panels[:,:,:,0] = True
+    lifting_line_panels = np.reshape(lifting_line_panels,(m,-1))
+    GAMMA_AB            = np.where(lifting_line_panels,0.,GAMMA)
+    
+    # vortex segments of the four sides of each panel
+    P1 = np.concatenate([A1,B1,B2,A2],axis=1)
+    P2 = np.concatenate([B1,B2,A2,A1],axis=1)
+    G  = np.concatenate([GAMMA_AB,GAMMA,GAMMA,GAMMA],axis=1)
+    M  = np.tile(np.arange(cpts)[:,None],(1,np.shape(G)[1]))
+    
+    # segments without circulation do not induce any velocity
+    keep = G != 0.
+    P1   = P1[keep]
+    P2   = P2[keep]
+    G    = G[keep]
+    M    = M[keep]
+    V_ind = np.zeros((cpts*n_eval,3))
+    if len(G) == 0:
+        return np.reshape(V_ind,(cpts,n_eval,3))
+    
+    # sort the segments into the cells of the finest level
+    mid    = (P1 + P2)/2
+    lo     = np.min(np.minimum(P1,P2),axis=0)
+    size   = np.max(np.max(np.maximum(P1,P2),axis=0) - lo)*(1 + 1e-9) + 1e-12
+    n_lev  = int(np.clip(np.ceil(np.log(max(len(G)/cpts/leaf_size,1.))/np.log(8.)),1,10))
+    ijk    = np.floor((mid - lo)/size*(2**n_lev)).astype(np.int64)
+    morton = np.zeros(len(G),dtype=np.int64)
+    for bit in range(n_lev):
+        for axis in range(3):
+            morton |= ((ijk[:,axis] >> bit) & 1) << (3*bit + axis)
+    order  = np.argsort(M*(8**n_lev) + morton,kind='stable')
+    P1, P2, G, M, mid, morton = P1[order], P2[order], G[order], M[order], mid[order], morton[order]
+    
+    # dipole expansion of the segments in each cell about the mean segment midpoint
+    a     = G[:,None]*(P2 - P1)
+    a_mid = (a[:,:,None]*mid[:,None,:]).reshape(-1,9)
+    cells = []
+    for lev in range(n_lev+1):
+        codes            = M*(8**lev) + (morton >> (3*(n_lev - lev)))
+        cell_codes,start = np.unique(codes,return_index=True)
+        end              = np.append(start[1:],len(G))
+        count            = end - start
+        center           = np.add.reduceat(mid,start,axis=0)/count[:,None]
+        Omega            = np.add.reduceat(a,start,axis=0)
+        D                = np.add.reduceat(a_mid,start,axis=0).reshape(-1,3,3) - Omega[:,:,None]*center[:,None,:]
+        seg_center       = np.repeat(center,count,axis=0)
+        dist             = np.maximum(np.linalg.norm(P1 - seg_center,axis=1),np.linalg.norm(P2 - seg_center,axis=1))
+        radius           = np.maximum.reduceat(dist,start)
+        cells.append(Data(codes=cell_codes,start=start,end=end,center=center,Omega=Omega,D=D,radius=radius))
+    
+    # start with the root cell of each control point for every evaluation point
+    targets = np.arange(cpts*n_eval)
+    t_ctrl  = targets // n_eval
+    t_pts   = XC[targets % n_eval]
+    root    = np.searchsorted(cells[0].codes,t_ctrl)
+    valid   = (root < len(cells[0].codes))
+    valid[valid] = cells[0].codes[root[valid]] == t_ctrl[valid]
+    t_idx   = targets[valid]
+    c_idx   = root[valid]
+    
+    for lev in range(n_lev+1):
+        cell  = cells[lev]
+        r_vec = t_pts[t_idx] - cell.center[c_idx]
+        r_mag = np.linalg.norm(r_vec,axis=1)
+        far   = cell.radius[c_idx] < opening_angle*r_mag
+        
+        # far field from the dipole expansion of the Biot-Savart law
+        if np.any(far):
+            r     = r_vec[far]
+            rm    = r_mag[far][:,None]
+            r_hat = r/rm
+            D     = cell.D[c_idx[far]]
+            u     = np.einsum('nij,nj->ni',D,r_hat)
+            eps_D = np.stack([D[:,1,2] - D[:,2,1],D[:,2,0] - D[:,0,2],D[:,0,1] - D[:,1,0]],axis=1)
+            V_far = (np.cross(cell.Omega[c_idx[far]],r) - eps_D + 3*np.cross(u,r_hat))/(4*np.pi*rm**3)
+            for axis in range(3):
+                V_ind[:,axis] += np.bincount(t_idx[far],weights=V_far[:,axis],minlength=cpts*n_eval)
+        
+        t_idx = t_idx[~far]
+        c_idx = c_idx[~far]
+        if len(t_idx) == 0:
+            break
+        
+        if lev < n_lev:
+            # open the near cells
+            child_codes = cells[lev+1].codes
+            c_start     = np.searchsorted(child_codes >> 3,cell.codes[c_idx],side='left')
+            c_count     = np.searchsorted(child_codes >> 3,cell.codes[c_idx],side='right') - c_start
+            t_idx, c_idx = expand_ranges(t_idx,c_start,c_count)
+        else:
+            # near field from the regularized kernel of each segment in the leaf cells, in blocks of pairs
+            s_start = cell.start[c_idx]
+            s_count = cell.end[c_idx] - s_start
+            blocks  = np.searchsorted(np.cumsum(s_count),np.arange(max_pairs,np.sum(s_count),max_pairs),side='right')
+            for block in np.split(np.arange(len(t_idx)),blocks):
+                b_idx, s_idx = expand_ranges(t_idx[block],s_start[block],s_count[block])
+                X            = t_pts[b_idx]
+                COEF, _      = vortex(X[:,0],X[:,1],X[:,2],P1[s_idx,0],P1[s_idx,1],P1[s_idx,2],P2[s_idx,0],P2[s_idx,1],P2[s_idx,2],sigma)
+                V_near       = G[s_idx]*COEF
+                for axis in range(3):
+                    V_ind[:,axis] += np.bincount(b_idx,weights=V_near[axis],minlength=cpts*n_eval)
+
+    return np.reshape(V_ind,(cpts,n_eval,3))
+
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
+def expand_ranges(idx,start,count):
+    """ This pairs each index with every element of its range [start, start + count).
+    
+    Assumptions:  
+    None 
+    
+    Source: 
+    N/A
+    
+    Inputs:
+    idx     - indices to repeat                    [Unitless]
+    start   - first element of the range of each   [Unitless]
+    count   - number of elements in each range     [Unitless]
+    
+    Outputs:
+    idx     - repeated indices                     [Unitless]
+    elems   - range elements                       [Unitless]
+    
+    Properties Used:
+    N/A
+    """   
+    idx    = np.repeat(idx,count)
+    offset = np.arange(len(idx)) - np.repeat(np.cumsum(count) - count,count)
+    elems  = np.repeat(start,count) + offset
+    
+    return idx, elems
   
 # -------------------------------------------------------------------------------
 # vortex strength computation
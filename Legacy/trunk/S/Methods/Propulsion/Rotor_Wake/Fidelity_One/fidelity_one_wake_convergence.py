@@ -2,44 +2,60 @@
 # fidelity_one_wake_convergence.py
 #
 # Created:  Feb 2022, R. Erhard
-# Modified: 
+# Modified: Oct 2026, agent
 
+from Legacy.trunk.S.Core import Data
 from Legacy.trunk.S.Methods.Propulsion.Rotor_Wake.Fidelity_One.compute_fidelity_one_inflow_velocities import compute_fidelity_one_inflow_velocities
-from Legacy.trunk.S.Methods.Propulsion.Rotor_Wake.Fidelity_One.generate_fidelity_one_wake_shape import generate_fidelity_one_wake_shape
+from Legacy.trunk.S.Methods.Propulsion.Rotor_Wake.Fidelity_One.generate_fidelity_one_wake_shape import generate_fidelity_one_wake_shape, generate_fidelity_one_fixed_geometry
 from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.BET_calculations import compute_inflow_and_tip_loss
 
 import numpy as np
+import copy
 
 ## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
 def fidelity_one_wake_convergence(wake,rotor,wake_inputs):
     """
-    This converges on the wake shape for the fidelity-one rotor wake.
-    
+    This converges on the wake shape for the fidelity-one rotor wake. Converged wakes are stored on
+    the rotor: a repeated operating point reuses the stored wake, and the semi-prescribed iteration
+    starts from the axial inflow of the nearest stored operating point.
+
     Assumptions:
     None
-    
+
     Source:
     N/A
-    
+
     Inputs:
     wake        - rotor wake
     rotor       - rotor
     wake_inputs - inputs passed from the BET rotor spin function
-    
+
     Outputs:
     None
-    
+
     Properties Used:
     None
-    """    
+    """
     # Unpack inputs
     Ua = wake_inputs.velocity_axial
     Ut = wake_inputs.velocity_tangential
     r  = wake_inputs.radius_distribution
-    
+
     R  = rotor.tip_radius
-    B  = rotor.number_of_blades    
-    
+    B  = rotor.number_of_blades
+
+    # reuse the wake of a repeated operating point, rotors without stored wake states are not cached
+    wake_state      = rotor.get('wake_state')
+    operating_point = compute_wake_operating_point(rotor)
+    wake_key        = compute_wake_key(wake,rotor,wake_inputs,operating_point)
+    use_wake_state  = wake.wake_state_cache_size > 0 and wake_state is not None
+    if use_wake_state and wake_state.key is not None and wake_keys_match(wake_state.key,wake_key):
+        rotor.vortex_distribution                 = copy.deepcopy(wake_state.rotor_vortex_distribution)
+        rotor.outputs.disc_axial_induced_velocity = np.copy(wake_state.disc_axial_induced_velocity)
+        rotor.start_angle                         = wake_state.start_angle
+        rotor.wake_skew_angle                     = np.copy(wake_state.wake_skew_angle)
+        return copy.deepcopy(wake_state.vortex_distribution), np.copy(wake_state.va), np.copy(wake_state.vt)
+
     # converge on va for a semi-prescribed wake method
     va_diff, ii = 1, 0
     tol = wake.axial_velocity_convergence_tolerance
@@ -47,37 +63,252 @@ def fidelity_one_wake_convergence(wake,rotor,wake_inputs):
         if wake.verbose:
             print("\tConverging on semi-prescribed wake shape...")
         ii_max = wake.maximum_convergence_iteration
+
+        # warm start from the nearest converged operating points
+        if use_wake_state:
+            warm_start_wake_state(wake_state,rotor,operating_point)
     else:
         if wake.verbose:
             print("\tGenerating fully-prescribed wake shape...")
         ii_max = 1
-        
 
-    while va_diff > tol:  
-        # generate wake geometry for rotor
-        wake, rotor  = generate_fidelity_one_wake_shape(wake,rotor)
-        
+    # the blade geometry and wake circulation do not change with the axial inflow
+    fixed_geometry = generate_fidelity_one_fixed_geometry(wake,rotor)
+
+    while va_diff > tol:
+        # update wake geometry for rotor
+        wake, rotor  = generate_fidelity_one_wake_shape(wake,rotor,fixed_geometry)
+
         # compute axial wake-induced velocity (a byproduct of the circulation distribution which is an input to the wake geometry)
         va, vt = compute_fidelity_one_inflow_velocities(wake,rotor)
-    
+
         # compute new blade velocities
         Wa   = va + Ua
         Wt   = Ut - vt
-    
+
         lamdaw, F, _ = compute_inflow_and_tip_loss(r,R,Wa,Wt,B)
-    
+
         va_diff = np.max(abs(F*va - rotor.outputs.disc_axial_induced_velocity))
-    
+
         # update the axial disc velocity based on new va from HFW
-        rotor.outputs.disc_axial_induced_velocity = F*va 
-        
+        rotor.outputs.disc_axial_induced_velocity = F*va
+
         ii+=1
         if ii>=ii_max and va_diff>tol:
             if wake.semi_prescribed_converge and wake.verbose:
                 print("Semi-prescribed vortex wake did not converge on axial inflow used for wake shape.")
             break
-        
+
     # save converged wake:
-    wake, rotor  = generate_fidelity_one_wake_shape(wake,rotor)
-    
-    return wake.vortex_distribution, va, vt
\ No newline at end of file
+    wake, rotor  = generate_fidelity_one_wake_shape(wake,rotor,fixed_geometry)
+
+    # store the wake state
+    if use_wake_state:
+        wake_state.key                         = wake_key
+        wake_state.vortex_distribution         = copy.deepcopy(wake.vortex_distribution)
+        wake_state.rotor_vortex_distribution   = copy.deepcopy(rotor.vortex_distribution)
+        wake_state.disc_axial_induced_velocity = np.copy(rotor.outputs.disc_axial_induced_velocity)
+        wake_state.start_angle                 = rotor.start_angle
+        wake_state.wake_skew_angle             = np.copy(rotor.wake_skew_angle)
+        wake_state.va                          = np.copy(va)
+        wake_state.vt                          = np.copy(vt)
+        if wake.semi_prescribed_converge and va_diff <= tol:
+            append_wake_state(wake_state,operating_point,rotor.outputs.disc_axial_induced_velocity,wake.wake_state_cache_size)
+
+    return wake.vortex_distribution, va, vt
+
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
+def compute_wake_operating_point(rotor):
+    """
+    This computes the operating point of each control point used to look up stored wake states:
+    the blade tip speed, the freestream velocity and the blade pitch command.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    rotor            - rotor
+
+    Outputs:
+    operating_point  - [omega*R, V_x, V_y, V_z, pitch], shape (ctrl_pts,5)      [m/s, m/s, m/s, m/s, rad]
+
+    Properties Used:
+    None
+    """
+    omega = rotor.outputs.omega
+    V_inf = rotor.outputs.velocity
+    m     = len(omega)
+    pitch = np.zeros((m,1)) + np.reshape(rotor.inputs.pitch_command,(-1,1))
+
+    operating_point = np.hstack((omega*rotor.tip_radius,V_inf,pitch))
+
+    return operating_point
+
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
+def compute_wake_key(wake,rotor,wake_inputs,operating_point):
+    """
+    This packs everything the converged wake depends on, so that a repeated operating point can
+    reuse the stored wake.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    wake             - rotor wake
+    rotor            - rotor
+    wake_inputs      - inputs passed from the BET rotor spin function
+    operating_point  - operating point of each control point
+
+    Outputs:
+    wake_key         - list of settings and arrays
+
+    Properties Used:
+    None
+    """
+    settings = (wake.semi_prescribed_converge,
+                wake.axial_velocity_convergence_tolerance,
+                wake.maximum_convergence_iteration,
+                wake.wake_settings.number_rotor_rotations,
+                wake.wake_settings.number_steps_per_rotation,
+                wake.wake_settings.initial_timestep_offset,
+                tuple(np.ravel(rotor.origin)))
+
+    wake_key = [settings,
+                operating_point,
+                rotor.outputs.disc_circulation,
+                rotor.outputs.disc_axial_induced_velocity,
+                wake_inputs.velocity_axial,
+                wake_inputs.velocity_tangential]
+
+    return [np.copy(k) if isinstance(k,np.ndarray) else k for k in wake_key]
+
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
+def wake_keys_match(key_1,key_2):
+    """
+    This checks if two wake keys are identical.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    key_1, key_2  - wake keys
+
+    Outputs:
+    match         - True if the keys are identical
+
+    Properties Used:
+    None
+    """
+    if key_1[0] != key_2[0]:
+        return False
+
+    return all([np.shape(k1) == np.shape(k2) and np.array_equal(k1,k2) for k1,k2 in zip(key_1[1:],key_2[1:])])
+
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
+def warm_start_wake_state(wake_state,rotor,operating_point):
+    """
+    This sets the initial axial inflow of each control point to the converged axial inflow of the
+    nearest stored operating point. Velocities are compared relative to the blade tip speed and
+    the pitch command in radians.
+
+    Assumptions:
+    Tip speeds below 1 m/s are scaled as 1 m/s, so that a stopped rotor is compared by absolute velocities
+
+    Source:
+    N/A
+
+    Inputs:
+    wake_state       - stored wake states
+    rotor            - rotor
+    operating_point  - operating point of each control point
+
+    Outputs:
+    None
+
+    Properties Used:
+    None
+    """
+    va_0 = rotor.outputs.disc_axial_induced_velocity
+    if wake_state.operating_points is None or np.shape(wake_state.disc_axial_induced_velocities)[1:] != np.shape(va_0)[1:]:
+        return
+
+    points    = wake_state.operating_points
+    delta     = operating_point[:,None,:] - points[None,:,:]
+    tip_speed = np.maximum(np.abs(operating_point[:,0,None]),1.)
+    distance  = np.sum(delta[:,:,:4]**2,axis=2)/(tip_speed**2) + delta[:,:,4]**2
+    nearest   = np.argmin(distance,axis=1)
+
+    rotor.outputs.disc_axial_induced_velocity = np.copy(wake_state.disc_axial_induced_velocities[nearest])
+
+    return
+
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
+def append_wake_state(wake_state,operating_point,va,cache_size):
+    """
+    This stores the converged axial inflow of each control point, keeping the most recent operating points.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    wake_state       - stored wake states
+    operating_point  - operating point of each control point
+    va               - converged axial inflow at the rotor disc, shape (ctrl_pts,Nr,Na)     [m/s]
+    cache_size       - maximum number of stored operating points                           [-]
+
+    Outputs:
+    None
+
+    Properties Used:
+    None
+    """
+    if wake_state.operating_points is None or np.shape(wake_state.disc_axial_induced_velocities)[1:] != np.shape(va)[1:]:
+        points = operating_point
+        vas    = va
+    else:
+        points = np.concatenate((wake_state.operating_points,operating_point))
+        vas    = np.concatenate((wake_state.disc_axial_induced_velocities,va))
+
+    wake_state.operating_points              = points[-cache_size:]
+    wake_state.disc_axial_induced_velocities = vas[-cache_size:]
+
+    return
+
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
+def initialize_wake_state():
+    """
+    This initializes the stored wake states of a rotor.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    None
+
+    Outputs:
+    wake_state  - stored wake states
+
+    Properties Used:
+    None
+    """
+    wake_state                               = Data()
+    wake_state.key                           = None
+    wake_state.operating_points              = None
+    wake_state.disc_axial_induced_velocities = None
+
+    return wake_state
@@ -2,7 +2,7 @@
 # generate_fidelity_one_wake_shape.py
 #
 # Created:  Jan 2022, R. Erhard
-# Modified: 
+# Modified: Oct 2026, agent
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -16,7 +16,7 @@ import numpy as np
 
 
 ## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
-def generate_fidelity_one_wake_shape(wake,rotor):
+def generate_fidelity_one_wake_shape(wake,rotor,fixed_geometry=None):
     """
     This generates the propeller wake control points and vortex distribution that make up the prescribed vortex wake. 
     All (x,y,z) coordinates are in the vehicle frame of reference (X points nose to tail).
@@ -28,57 +28,36 @@ def generate_fidelity_one_wake_shape(wake,rotor):
        None
     
     Inputs:
-       rotor  -  A SUAVE rotor component for which the wake is generated
+       wake            -  rotor wake
+       rotor           -  A SUAVE rotor component for which the wake is generated
+       fixed_geometry  -  wake geometry that does not depend on the axial inflow, regenerated if None
     
     """
+    if fixed_geometry is None:
+        fixed_geometry = generate_fidelity_one_fixed_geometry(wake,rotor)
         
-    # Unpack rotor
-    R                = rotor.tip_radius
-    r                = rotor.radius_distribution 
-    c                = rotor.chord_distribution 
-    beta             = rotor.twist_distribution + rotor.inputs.pitch_command
-    B                = rotor.number_of_blades  
+    # Unpack fixed geometry
+    R           = fixed_geometry.tip_radius
+    Na          = fixed_geometry.number_azimuthal_stations
+    Nr          = fixed_geometry.number_radial_stations
+    B           = fixed_geometry.number_of_blades
+    m           = fixed_geometry.number_control_points
+    nts         = fixed_geometry.number_time_steps
+    ts          = fixed_geometry.time_steps
+    rot         = fixed_geometry.rotation
+    x_pts0      = fixed_geometry.x_pts0
+    y_pts0      = fixed_geometry.y_pts0
+    z_pts0      = fixed_geometry.z_pts0
+    sy_inf      = fixed_geometry.sy_inf
+    x_c_4_rotor = fixed_geometry.x_c_4_rotor
+    y_c_4_rotor = fixed_geometry.y_c_4_rotor
+    z_c_4_rotor = fixed_geometry.z_c_4_rotor
+    Gamma       = fixed_geometry.Gamma
     
     rotor_outputs    = rotor.outputs
-    Na               = rotor_outputs.number_azimuthal_stations
-    Nr               = rotor_outputs.number_radial_stations
-
     omega            = rotor_outputs.omega                               
     va               = rotor_outputs.disc_axial_induced_velocity
     V_inf            = rotor_outputs.velocity
-    gamma            = rotor_outputs.disc_circulation
-    rot              = rotor.rotation
-    
-    # apply rotation direction to twist and chord distribution
-    c    = -rot*c
-    beta = -rot*beta
-    
-    # dimensions for analysis                      
-    Nr   = len(r)                   # number of radial stations
-    m    = len(omega)               # number of control points
-
-    # Compute blade angles starting from each of Na azimuthal stations, shape: (Na,B)
-    azi          = np.linspace(0,2*np.pi,Na+1)[:-1]
-    azi_initial  = np.atleast_2d(np.linspace(0,2*np.pi,B+1)[:-1])
-    blade_angles = (azi_initial + np.atleast_2d(azi).T) 
-    
-    # Extract specified wake settings:
-    init_timestep_offset = wake.wake_settings.initial_timestep_offset
-    n_rotations          = wake.wake_settings.number_rotor_rotations
-    tsteps_per_rot       = wake.wake_settings.number_steps_per_rotation
-    
-    # Calculate additional wake properties
-    dt    = (azi[1]-azi[0])/omega[0][0]
-    nts   = tsteps_per_rot*n_rotations
-    
-    # Compute properties for each wake timestep
-    ts                = np.linspace(0,dt*(nts-1),nts) 
-    omega_ts          = np.multiply(omega,np.atleast_2d(ts))  # Angle of each azimuthal station in nts
-    
-    # Update start angle of rotor
-    t0                = dt*init_timestep_offset
-    start_angle       = omega[0]*t0 
-    rotor.start_angle = start_angle[0]
     
     # extract mean inflow velocities
     axial_induced_velocity = np.mean(va,axis = 2) # radial inflow, averaged around the azimuth
@@ -95,22 +74,6 @@ def generate_fidelity_one_wake_shape(wake,rotor):
     # wake skew angle 
     wake_skew_angle = -(np.arctan(mu_prop/lambda_tot))
     wake_skew_angle = np.tile(wake_skew_angle[:,:,None],(1,Nr,nts))
-    
-    # reshape gamma to find the average between stations           
-    gamma_new = (gamma[:,:-1,:] + gamma[:,1:,:])*0.5  # [control points, Nr-1, Na ] one less radial station because ring
-    
-    num       = Na//B
-    time_idx  = np.arange(nts)
-    Gamma     = np.zeros((Na,m,B,Nr-1,nts))
-    
-    # generate Gamma for each start angle
-    for ito in range(Na):
-        t_idx     = np.atleast_2d(time_idx).T 
-        B_idx     = np.arange(B) 
-        B_loc     = (ito + B_idx*num - t_idx )%Na 
-        Gamma1    = gamma_new[:,:,B_loc]  
-        Gamma1    = Gamma1.transpose(0,3,1,2) 
-        Gamma[ito,:,:,:,:] = Gamma1
   
     # --------------------------------------------------------------------------------------------------------------
     #    ( control point , blade number , radial location on blade , time step )
@@ -119,75 +82,10 @@ def generate_fidelity_one_wake_shape(wake,rotor):
                     
     sx_inf0            = np.multiply(V_p*np.cos(wake_skew_angle), np.repeat(np.atleast_2d(ts)[:,None,:],Nr,axis=1))
     sx_inf             = np.tile(sx_inf0[None,:, None, :,:], (Na,1,B,1,1))
-                      
-    sy_inf0            = np.multiply(np.atleast_2d(V_inf[:,1]).T,np.atleast_2d(ts)) # = zero since no crosswind
-    sy_inf             = -rot*np.tile(sy_inf0[None,:, None, None,:], (Na,1,B,Nr,1)) 
     
     sz_inf0            = np.multiply(V_p*np.sin(wake_skew_angle),np.repeat(np.atleast_2d(ts)[:,None,:],Nr,axis=1))
     sz_inf             = np.tile(sz_inf0[None,:, None, :,:], (Na,1,B,1,1))        
     
-    # wake panel and blade angles
-    start_angle_offset = np.tile(start_angle[None,:,None,None,None], (Na,1,B,Nr,nts))
-    blade_angle_loc    = start_angle_offset + np.tile( blade_angles[:,None,:,None,None], (1,m,1,Nr,nts))  # negative rotation, positive blade angle location
-    
-    # offset angle of trailing wake panels relative to blade location
-    total_angle_offset = np.tile(omega_ts[None,:,None,None,:], (Na,1,B,Nr,1))   
-    
-    # azimuthal position of each wake panel, (blade start index, ctrl_pts, B, Nr, nts)
-    panel_azimuthal_positions = rot*(total_angle_offset - blade_angle_loc)      # axial view in rotor frame (angle 0 aligned with z-axis); 
-    
-    # put into velocity frame and find (y,z) components
-    azi_y   = np.sin(panel_azimuthal_positions)
-    azi_z   = np.cos(panel_azimuthal_positions) 
-   
-    # trailing edge points in airfoil coordinates 
-    airfoils = rotor.Airfoils
-    af       = airfoils[list(airfoils.keys())[0]]
-    a_loc    = rotor.airfoil_polar_stations
-    xupper   = np.zeros((Nr,len(af.geometry.x_upper_surface)))
-    yupper   = np.zeros((Nr,len(af.geometry.x_upper_surface)))
-    for i,airfoil in enumerate(airfoils):
-        a_geo        = airfoil.geometry
-        locs         = np.where(np.array(a_loc) == i )
-        xupper[locs] = a_geo.x_upper_surface 
-        yupper[locs] = a_geo.y_upper_surface 
-    
-    # Align the quarter chords of the airfoils (zero sweep)
-    airfoil_le_offset = -c/2
-    xte_airfoils      = xupper[:,-1]*c + airfoil_le_offset
-    yte_airfoils      = yupper[:,-1]*c  
-    xle_airfoils      = xupper[:,0]*c + airfoil_le_offset
-    yle_airfoils      = yupper[:,0]*c  
-    x_c_4_airfoils    = (xle_airfoils - xte_airfoils)/4 - airfoil_le_offset
-    y_c_4_airfoils    = (yle_airfoils - yte_airfoils)/4
-    
-    # apply blade twist rotation along rotor radius
-    xte_twisted = np.cos(beta)*xte_airfoils - np.sin(beta)*yte_airfoils        
-    yte_twisted = np.sin(beta)*xte_airfoils + np.cos(beta)*yte_airfoils    
-    
-    x_c_4_twisted = np.cos(beta)*x_c_4_airfoils - np.sin(beta)*y_c_4_airfoils 
-    y_c_4_twisted = np.sin(beta)*x_c_4_airfoils + np.cos(beta)*y_c_4_airfoils  
-    
-    # transform coordinates from airfoil frame to rotor frame
-    xte = np.tile(np.atleast_2d(yte_twisted), (B,1))
-    xte_rotor = np.tile(xte[None,:,:,None], (m,1,1,nts))  
-    yte_rotor = -np.tile(xte_twisted[None,None,:,None],(m,B,1,1))*np.cos(panel_azimuthal_positions)
-    zte_rotor = np.tile(xte_twisted[None,None,:,None],(m,B,1,1))*np.sin(panel_azimuthal_positions)
-    
-    r_4d = np.tile(r[None,None,:,None], (m,B,1,nts))
-    
-    x0 = 0
-    y0 = r_4d*azi_y
-    z0 = r_4d*azi_z
-    
-    x_pts0 = x0 + xte_rotor
-    y_pts0 = y0 + yte_rotor
-    z_pts0 = z0 + zte_rotor
-    
-    x_c_4_rotor = x0 - np.tile(y_c_4_twisted[None,None,:,None], (m,B,1,nts))
-    y_c_4_rotor = y0 + np.tile(x_c_4_twisted[None,None,:,None], (m,B,1,nts))*np.cos(panel_azimuthal_positions)
-    z_c_4_rotor = z0 - np.tile(x_c_4_twisted[None,None,:,None], (m,B,1,nts))*np.sin(panel_azimuthal_positions)   
-    
     # compute wake contraction, apply to y-z plane
     X_pts0           = x_pts0 + sx_inf
     wake_contraction = compute_wake_contraction_matrix(rotor,Nr,m,nts,X_pts0,rotor_outputs) 
@@ -202,9 +100,9 @@ def generate_fidelity_one_wake_shape(wake,rotor):
     #------------------------------------------------------     
     # Account for lifting line panels
     #------------------------------------------------------
-    x_c_4 = np.repeat(x_c_4_rotor[None,:,:,:,:], Na, axis=0) + rotor.origin[0][0]
-    y_c_4 = (y_c_4_rotor) + rotor.origin[0][1]
-    z_c_4 = (z_c_4_rotor) + rotor.origin[0][2]
+    x_c_4 = fixed_geometry.x_c_4
+    y_c_4 = fixed_geometry.y_c_4
+    z_c_4 = fixed_geometry.z_c_4
     
     # prepend points at quarter chord to account for rotor lifting line
     X_pts = np.append(x_c_4[:,:,:,:,0][:,:,:,:,None], X_pts, axis=4) 
@@ -291,6 +189,178 @@ def generate_fidelity_one_wake_shape(wake,rotor):
     
     return wake, rotor
 
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
+def generate_fidelity_one_fixed_geometry(wake,rotor):
+    """
+    This generates the parts of the prescribed vortex wake that do not depend on the axial inflow at the
+    rotor disc: the blade geometry, the azimuthal positions of the wake panels and the wake circulation.
+    The semi-prescribed wake iteration only updates the inflow-dependent parts of the wake.
+    
+    Assumptions:
+       None
+    
+    Source: 
+       None
+    
+    Inputs:
+       wake   -  rotor wake
+       rotor  -  A SUAVE rotor component for which the wake is generated
+       
+    Outputs:
+       fixed_geometry  -  wake geometry that does not depend on the axial inflow
+    
+    """
+        
+    # Unpack rotor
+    r                = rotor.radius_distribution 
+    c                = rotor.chord_distribution 
+    beta             = rotor.twist_distribution + rotor.inputs.pitch_command
+    B                = rotor.number_of_blades  
+    
+    rotor_outputs    = rotor.outputs
+    Na               = rotor_outputs.number_azimuthal_stations
+
+    omega            = rotor_outputs.omega                               
+    V_inf            = rotor_outputs.velocity
+    gamma            = rotor_outputs.disc_circulation
+    rot              = rotor.rotation
+    
+    # apply rotation direction to twist and chord distribution
+    c    = -rot*c
+    beta = -rot*beta
+    
+    # dimensions for analysis                      
+    Nr   = len(r)                   # number of radial stations
+    m    = len(omega)               # number of control points
+
+    # Compute blade angles starting from each of Na azimuthal stations, shape: (Na,B)
+    azi          = np.linspace(0,2*np.pi,Na+1)[:-1]
+    azi_initial  = np.atleast_2d(np.linspace(0,2*np.pi,B+1)[:-1])
+    blade_angles = (azi_initial + np.atleast_2d(azi).T) 
+    
+    # Extract specified wake settings:
+    init_timestep_offset = wake.wake_settings.initial_timestep_offset
+    n_rotations          = wake.wake_settings.number_rotor_rotations
+    tsteps_per_rot       = wake.wake_settings.number_steps_per_rotation
+    
+    # Calculate additional wake properties
+    dt    = (azi[1]-azi[0])/omega[0][0]
+    nts   = tsteps_per_rot*n_rotations
+    
+    # Compute properties for each wake timestep
+    ts                = np.linspace(0,dt*(nts-1),nts) 
+    omega_ts          = np.multiply(omega,np.atleast_2d(ts))  # Angle of each azimuthal station in nts
+    
+    # Update start angle of rotor
+    t0                = dt*init_timestep_offset
+    start_angle       = omega[0]*t0 
+    rotor.start_angle = start_angle[0]
+    
+    # reshape gamma to find the average between stations           
+    gamma_new = (gamma[:,:-1,:] + gamma[:,1:,:])*0.5  # [control points, Nr-1, Na ] one less radial station because ring
+    
+    # generate Gamma for each start angle, shape: (Na,m,B,Nr-1,nts)
+    num       = Na//B
+    ito       = np.arange(Na)[:,None,None]
+    t_idx     = np.arange(nts)[None,:,None]
+    B_idx     = np.arange(B)[None,None,:]
+    B_loc     = (ito + B_idx*num - t_idx)%Na 
+    Gamma     = gamma_new[:,:,B_loc].transpose(2,0,4,1,3)
+    
+    sy_inf0            = np.multiply(np.atleast_2d(V_inf[:,1]).T,np.atleast_2d(ts)) # = zero since no crosswind
+    sy_inf             = -rot*np.tile(sy_inf0[None,:, None, None,:], (Na,1,B,Nr,1)) 
+    
+    # wake panel and blade angles
+    start_angle_offset = np.tile(start_angle[None,:,None,None,None], (Na,1,B,Nr,nts))
+    blade_angle_loc    = start_angle_offset + np.tile( blade_angles[:,None,:,None,None], (1,m,1,Nr,nts))  # negative rotation, positive blade angle location
+    
+    # offset angle of trailing wake panels relative to blade location
+    total_angle_offset = np.tile(omega_ts[None,:,None,None,:], (Na,1,B,Nr,1))   
+    
+    # azimuthal position of each wake panel, (blade start index, ctrl_pts, B, Nr, nts)
+    panel_azimuthal_positions = rot*(total_angle_offset - blade_angle_loc)      # axial view in rotor frame (angle 0 aligned with z-axis); 
+    
+    # put into velocity frame and find (y,z) components
+    azi_y   = np.sin(panel_azimuthal_positions)
+    azi_z   = np.cos(panel_azimuthal_positions) 
+   
+    # trailing edge points in airfoil coordinates 
+    airfoils = rotor.Airfoils
+    af       = airfoils[list(airfoils.keys())[0]]
+    a_loc    = rotor.airfoil_polar_stations
+    xupper   = np.zeros((Nr,len(af.geometry.x_upper_surface)))
+    yupper   = np.zeros((Nr,len(af.geometry.x_upper_surface)))
+    for i,airfoil in enumerate(airfoils):
+        a_geo        = airfoil.geometry
+        locs         = np.where(np.array(a_loc) == i )
+        xupper[locs] = a_geo.x_upper_surface 
+        yupper[locs] = a_geo.y_upper_surface 
+    
+    # Align the quarter chords of the airfoils (zero sweep)
+    airfoil_le_offset = -c/2
+    xte_airfoils      = xupper[:,-1]*c + airfoil_le_offset
+    yte_airfoils      = yupper[:,-1]*c  
+    xle_airfoils      = xupper[:,0]*c + airfoil_le_offset
+    yle_airfoils      = yupper[:,0]*c  
+    x_c_4_airfoils    = (xle_airfoils - xte_airfoils)/4 - airfoil_le_offset
+    y_c_4_airfoils    = (yle_airfoils - yte_airfoils)/4
+    
+    # apply blade twist rotation along rotor radius
+    xte_twisted = np.cos(beta)*xte_airfoils - np.sin(beta)*yte_airfoils        
+    yte_twisted = np.sin(beta)*xte_airfoils + np.cos(beta)*yte_airfoils    
+    
+    x_c_4_twisted = np.cos(beta)*x_c_4_airfoils - np.sin(beta)*y_c_4_airfoils 
+    y_c_4_twisted = np.sin(beta)*x_c_4_airfoils + np.cos(beta)*y_c_4_airfoils  
+    
+    # transform coordinates from airfoil frame to rotor frame
+    xte = np.tile(np.atleast_2d(yte_twisted), (B,1))
+    xte_rotor = np.tile(xte[None,:,:,None], (m,1,1,nts))  
+    yte_rotor = -np.tile(xte_twisted[None,None,:,None],(m,B,1,1))*np.cos(panel_azimuthal_positions)
+    zte_rotor = np.tile(xte_twisted[None,None,:,None],(m,B,1,1))*np.sin(panel_azimuthal_positions)
+    
+    r_4d = np.tile(r[None,None,:,None], (m,B,1,nts))
+    
+    x0 = 0
+    y0 = r_4d*azi_y
+    z0 = r_4d*azi_z
+    
+    x_pts0 = x0 + xte_rotor
+    y_pts0 = y0 + yte_rotor
+    z_pts0 = z0 + zte_rotor
+    
+    x_c_4_rotor = x0 - np.tile(y_c_4_twisted[None,None,:,None], (m,B,1,nts))
+    y_c_4_rotor = y0 + np.tile(x_c_4_twisted[None,None,:,None], (m,B,1,nts))*np.cos(panel_azimuthal_positions)
+    z_c_4_rotor = z0 - np.tile(x_c_4_twisted[None,None,:,None], (m,B,1,nts))*np.sin(panel_azimuthal_positions)   
+    
+    # lifting line points at the quarter chord
+    x_c_4 = np.repeat(x_c_4_rotor[None,:,:,:,:], Na, axis=0) + rotor.origin[0][0]
+    y_c_4 = (y_c_4_rotor) + rotor.origin[0][1]
+    z_c_4 = (z_c_4_rotor) + rotor.origin[0][2]
+    
+    # pack fixed geometry
+    fixed_geometry                           = Data()
+    fixed_geometry.tip_radius                = rotor.tip_radius
+    fixed_geometry.number_azimuthal_stations = Na
+    fixed_geometry.number_radial_stations    = Nr
+    fixed_geometry.number_of_blades          = B
+    fixed_geometry.number_control_points     = m
+    fixed_geometry.number_time_steps         = nts
+    fixed_geometry.time_steps                = ts
+    fixed_geometry.rotation                  = rot
+    fixed_geometry.x_pts0                    = x_pts0
+    fixed_geometry.y_pts0                    = y_pts0
+    fixed_geometry.z_pts0                    = z_pts0
+    fixed_geometry.sy_inf                    = sy_inf
+    fixed_geometry.x_c_4_rotor               = x_c_4_rotor
+    fixed_geometry.y_c_4_rotor               = y_c_4_rotor
+    fixed_geometry.z_c_4_rotor               = z_c_4_rotor
+    fixed_geometry.x_c_4                     = x_c_4
+    fixed_geometry.y_c_4                     = y_c_4
+    fixed_geometry.z_c_4                     = z_c_4
+    fixed_geometry.Gamma                     = Gamma
+    
+    return fixed_geometry
+
 ## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
 def initialize_distributions(Nr, Na, B, n_wts, m, VD):
     """
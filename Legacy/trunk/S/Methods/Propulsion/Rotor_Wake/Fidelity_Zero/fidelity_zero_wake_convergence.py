@@ -49,17 +49,189 @@ def fidelity_zero_wake_convergence(wake,rotor,wake_inputs):
     else:
         PSI    = np.ones((ctrl_pts,Nr))
 
-    PSI_final,infodict,ier,msg = sp.optimize.fsolve(iteration,PSI,args=(wake_inputs,rotor),xtol=rotor.sol_tolerance,full_output = 1,band=(1,0))
-    
-    if ier!=1:
+    if wake.use_newton_solver:
+        PSI_final, converged = solve_inflow_angle(PSI,wake_inputs,rotor)
+        converged            = np.all(converged)
+    else:
+        PSI_final,infodict,ier,msg = sp.optimize.fsolve(iteration,PSI,args=(wake_inputs,rotor),xtol=rotor.sol_tolerance,full_output = 1,band=(1,0))
+        converged            = ier == 1
+
+    if not converged:
         print("Rotor BEVW did not converge to a solution (Stall)")
-    
+
     # Calculate the velocities given PSI
     va, vt = va_vt(PSI_final, wake_inputs, rotor)
 
-    
+
     return va, vt
 
+## @defgroup Methods-Propulsion-Rotor_Wake-Fidelity_Zero
+def solve_inflow_angle(PSI,wake_inputs,rotor,max_iterations=50,max_step=0.5,max_backtracks=4):
+    """
+    Solves the BEVW residual for the inflow angle at every blade station. The residual
+    of each station only depends on its own inflow angle, so the Jacobian is diagonal
+    and each station is solved by its own damped Newton iteration, all stations being
+    advanced together. Stations that have not converged when the Newton iterations run
+    out are bracketed and solved by regula falsi.
+
+    Assumptions:
+    Convergence of a station is declared on the relative Newton step, following the
+    xtol convention of fsolve.
+
+    Source:
+    N/A
+
+    Inputs:
+       PSI                        initial inflow angle                            [rad]
+       wake_inputs                rotor wake inputs                               [-]
+       rotor                      rotor                                           [-]
+       max_iterations             maximum number of Newton iterations             [-]
+       max_step                   largest Newton step on the inflow angle         [rad]
+       max_backtracks             largest number of step halvings per iteration   [-]
+
+    Outputs:
+       PSI                        inflow angle                                    [rad]
+       converged                  converged stations                              [Boolean]
+
+    """
+    tol       = rotor.sol_tolerance
+    shape     = np.shape(PSI)
+    PSI       = np.array(PSI,dtype=float)
+    R         = np.reshape(iteration(PSI,wake_inputs,rotor),shape)
+    converged = np.zeros(shape,dtype=bool)
+
+    for i in range(max_iterations):
+        dR_dpsi   = compute_dR_dpsi(PSI,wake_inputs,rotor)
+        dPSI      = -R/dR_dpsi
+
+        # stations converge on their last Newton step, which is still taken
+        done      = ~converged & (np.abs(dPSI) <= tol*(np.abs(PSI) + tol))
+        PSI[done] = PSI[done] + dPSI[done]
+        converged = converged | done
+        if np.all(converged):
+            break
+        dPSI[converged | ~np.isfinite(dPSI)] = 0.
+        dPSI      = np.clip(dPSI,-max_step,max_step)
+
+        # halve the steps of the stations whose residual grows
+        for j in range(max_backtracks + 1):
+            PSI_new = PSI + dPSI
+            R_new   = np.reshape(iteration(PSI_new,wake_inputs,rotor),shape)
+            worse   = ~(np.abs(R_new) <= np.abs(R))
+            if j == max_backtracks or not np.any(worse):
+                break
+            dPSI[worse] = 0.5*dPSI[worse]
+
+        # stations whose residual cannot be evaluated keep their inflow angle
+        failed        = ~np.isfinite(R_new)
+        PSI_new[failed] = PSI[failed]
+        R_new[failed] = R[failed]
+        PSI = PSI_new
+        R   = R_new
+
+    if not np.all(converged):
+        PSI, converged = bracket_inflow_angle(PSI,R,converged,wake_inputs,rotor)
+
+    return PSI, converged
+
+## @defgroup Methods-Propulsion-Rotor_Wake-Fidelity_Zero
+def bracket_inflow_angle(PSI,R,converged,wake_inputs,rotor,n_samples=73,n_levels=3,max_iterations=100):
+    """
+    Solves the BEVW residual of the stations the Newton iteration did not converge by
+    regula falsi, with the Illinois modification. The residual of each station is
+    sampled over all inflow angles, then sampled again more finely around the smallest
+    residual, until a sign change is found. Stations without a sign change are left at
+    the inflow angle of smallest residual and are not converged.
+
+    Assumptions:
+    The residual is sampled on inflow angles between -pi and pi.
+
+    Source:
+    N/A
+
+    Inputs:
+       PSI                        inflow angle                                    [rad]
+       R                          residual at the inflow angle                    [-]
+       converged                  converged stations                              [Boolean]
+       wake_inputs                rotor wake inputs                               [-]
+       rotor                      rotor                                           [-]
+       n_samples                  number of sampled inflow angles per level       [-]
+       n_levels                   number of sampling levels                       [-]
+       max_iterations             maximum number of regula falsi iterations       [-]
+
+    Outputs:
+       PSI                        inflow angle                                    [rad]
+       converged                  converged stations                              [Boolean]
+
+    """
+    tol      = rotor.sol_tolerance
+    shape    = np.shape(PSI)
+    PSI      = np.array(PSI)
+    active   = ~converged
+    found    = np.zeros(shape,dtype=bool)
+    a        = np.zeros(shape)
+    b        = np.zeros(shape)
+    Ra       = np.zeros(shape)
+    Rb       = np.zeros(shape)
+    best     = np.array(PSI)
+    R_best   = np.where(np.isfinite(R),np.abs(R),np.inf)
+    center   = np.zeros(shape)
+    half     = np.pi
+    offsets  = np.linspace(-1.,1.,n_samples)[(slice(None),) + (None,)*len(shape)]
+
+    for level in range(n_levels):
+        # sample the residual of every station and pick the sign change closest to PSI
+        psi_s  = center + half*offsets
+        R_s    = np.array([np.reshape(iteration(psi,wake_inputs,rotor),shape) for psi in psi_s])
+        change = (np.sign(R_s[:-1])*np.sign(R_s[1:]) <= 0.) & np.isfinite(R_s[:-1]) & np.isfinite(R_s[1:])
+        dist   = np.where(change,np.abs(0.5*(psi_s[:-1] + psi_s[1:]) - PSI),np.inf)
+        k      = np.argmin(dist,axis=0)[None]
+        new    = active & ~found & np.isfinite(np.min(dist,axis=0))
+        a      = np.where(new,np.take_along_axis(psi_s,k,0)[0],a)
+        b      = np.where(new,np.take_along_axis(psi_s,k+1,0)[0],b)
+        Ra     = np.where(new,np.take_along_axis(R_s,k,0)[0],Ra)
+        Rb     = np.where(new,np.take_along_axis(R_s,k+1,0)[0],Rb)
+        found  = found | new
+
+        # keep the smallest residual and sample around it at the next level
+        abs_R  = np.where(np.isfinite(R_s),np.abs(R_s),np.inf)
+        k      = np.argmin(abs_R,axis=0)[None]
+        R_min  = np.take_along_axis(abs_R,k,0)[0]
+        better = R_min < R_best
+        best   = np.where(better,np.take_along_axis(psi_s,k,0)[0],best)
+        R_best = np.where(better,R_min,R_best)
+        if not np.any(active & ~found):
+            break
+        center = best
+        half   = 2.*half/(n_samples - 1)
+
+    PSI     = np.where(active & ~found,best,PSI)
+    active  = active & found
+    side    = np.zeros(shape)
+    for i in range(max_iterations):
+        if not np.any(active):
+            break
+        c       = np.where(Rb != Ra,(a*Rb - b*Ra)/(Rb - Ra + (Rb == Ra)),0.5*(a + b))
+        c       = np.where(active,c,PSI)
+        Rc      = np.reshape(iteration(c,wake_inputs,rotor),shape)
+        left    = active & (np.sign(Rc) == np.sign(Ra))
+        right   = active & ~left
+
+        # the Illinois modification halves the residual of an end point kept twice
+        Rb      = np.where(left & (side == -1),0.5*Rb,Rb)
+        Ra      = np.where(right & (side == 1),0.5*Ra,Ra)
+        a       = np.where(left,c,a)
+        Ra      = np.where(left,Rc,Ra)
+        b       = np.where(right,c,b)
+        Rb      = np.where(right,Rc,Rb)
+        side    = np.where(left,-1,np.where(right,1,side))
+        PSI     = np.where(active,c,PSI)
+        done    = active & ((np.abs(b - a) <= tol*(np.abs(c) + tol)) | (Rc == 0.))
+        converged = converged | done
+        active  = active & ~done
+
+    return PSI, converged
+
 
 ## @defgroup Methods-Propulsion-Rotor_Wake-Fidelity_Zero
 def iteration(PSI, wake_inputs, rotor):
@@ -194,10 +366,13 @@ def va_vt(PSI, wake_inputs, rotor):
 ## @defgroup Methods-Propulsion-Rotor_Wake-Fidelity_Zero
 def compute_dR_dpsi(PSI,wake_inputs,rotor):
     """
-    Computes the analytical derivative for the BEVW iteration.
+    Computes the analytical derivative for the BEVW iteration. The residual of each
+    blade station only depends on its own inflow angle, so the derivative is returned
+    per station rather than as a diagonal Jacobian.
 
     Assumptions:
-    N/A
+    The lift coefficient is differentiated through the bilinear interpolation of the
+    airfoil polars, or through the lift model used when no airfoils are specified.
 
     Source:
     N/A
@@ -224,61 +399,140 @@ def compute_dR_dpsi(PSI,wake_inputs,rotor):
     U               = wake_inputs.velocity_total
     Ua              = wake_inputs.velocity_axial
     Ut              = wake_inputs.velocity_tangential
+    use_2d_analysis = wake_inputs.use_2d_analysis
     beta            = wake_inputs.twist_distribution
+    c               = wake_inputs.chord_distribution
     r               = wake_inputs.radius_distribution
+    a               = wake_inputs.speed_of_sounds
+    nu              = wake_inputs.dynamic_viscosities
     ctrl_pts        = wake_inputs.ctrl_pts
     Nr              = wake_inputs.Nr
-    Na              = wake_inputs.Na    
+    Na              = wake_inputs.Na
+
+    # Unpack rotor data
+    R            = rotor.tip_radius
+    B            = rotor.number_of_blades
+    tc           = rotor.thickness_to_chord
+    airfoils     = rotor.Airfoils
+    a_loc        = rotor.airfoil_polar_stations
 
-    # Unpack rotor data        
-    R        = rotor.tip_radius
-    B        = rotor.number_of_blades      
-    
     # Reshape PSI because the solver gives it flat
-    if wake_inputs.use_2d_analysis:
+    if use_2d_analysis:
         PSI    = np.reshape(PSI,(ctrl_pts,Nr,Na))
     else:
-        PSI    = np.reshape(PSI,(ctrl_pts,Nr))    
-    
-    
-    # An analytical derivative for dR_dpsi used in the Newton iteration for the BEVW
-    # This was solved symbolically in Matlab and exported
-    # compute velocities
+        PSI    = np.reshape(PSI,(ctrl_pts,Nr))
+
+    # compute velocities and their derivatives
     sin_psi      = np.sin(PSI)
     cos_psi      = np.cos(PSI)
     Wa           = 0.5*Ua + 0.5*U*sin_psi
     Wt           = 0.5*Ut + 0.5*U*cos_psi
-    
+    vt           = Ut - Wt
+    dWa          = 0.5*U*cos_psi
+    dWt          = -0.5*U*sin_psi
+
+    # derivative of the circulation from the inflow and tip loss
     lamdaw, F, piece = compute_inflow_and_tip_loss(r,R,Wa,Wt,B)
-    
-    pi          = np.pi
-    pi2         = np.pi**2
-    BB          = B*B
-    BBB         = BB*B
-    f_wt_2      = 4*Wt*Wt
-    f_wa_2      = 4*Wa*Wa
-    arccos_piece = np.arccos(piece)
-    Ucospsi     = U*cos_psi
-    Usinpsi     = U*sin_psi
-    Utcospsi    = Ut*cos_psi
-    Uasinpsi    = Ua*sin_psi
-    UapUsinpsi  = (Ua + Usinpsi)
-    utpUcospsi  = (Ut + Ucospsi)
-    utpUcospsi2 = utpUcospsi*utpUcospsi
-    UapUsinpsi2 = UapUsinpsi*UapUsinpsi
-    dR_dpsi     = ((4.*U*r*arccos_piece*sin_psi*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5))/B -
-                   (pi*U*(Ua*cos_psi - Ut*sin_psi)*(beta - np.arctan((Wa+Wa)/(Wt+Wt))))/(2.*(f_wt_2 + f_wa_2)**(0.5))
-                   + (pi*U*(f_wt_2 +f_wa_2)**(0.5)*(U + Utcospsi  +  Uasinpsi))/(2.*(f_wa_2/(f_wt_2) + 1.)*utpUcospsi2)
-                   - (4.*U*piece*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5)*(R - r)*(Ut/2. -
-                    (Ucospsi)/2.)*(U + Utcospsi + Uasinpsi ))/(f_wa_2*(1. - np.exp(-(B*(Wt+Wt)*(R -
-                    r))/(r*(Wa+Wa))))**(0.5)) + (128.*U*r*arccos_piece*(Wa+Wa)*(Ut/2. - (Ucospsi)/2.)*(U +
-                    Utcospsi  + Uasinpsi ))/(BBB*pi2*utpUcospsi*utpUcospsi2*((16.*f_wa_2)/(BB*pi2*f_wt_2) + 1.)**(0.5)))
+    dlamdaw      = r*(dWa*Wt - Wa*dWt)/(R*Wt*Wt)
+    dlamdaw      = np.where(r*Wa/(R*Wt) > 0.,dlamdaw,0.)
+    tipfactor    = B/2.0*(R/r - 1)/lamdaw
+    dF           = -2.*piece*tipfactor*dlamdaw/(np.pi*lamdaw*np.sqrt(1. - piece*piece))
+    k            = 4.*R/(np.pi*B*r)
+    S            = (1. + (k*lamdaw)*(k*lamdaw))**0.5
+    dS           = k*k*lamdaw*dlamdaw/S
+    dGamma       = (4.*np.pi*r/B)*(-dWt*F*S + vt*dF*S + vt*F*dS)
+
+    # derivative of the blade circulation from the section lift
+    Cl, Cdval, alpha, Ma, W = compute_airfoil_aerodynamics(beta,c,r,R,B,Wa,Wt,a,nu,airfoils,a_loc,ctrl_pts,Nr,Na,tc,use_2d_analysis)
+    Re           = (W*c)/nu
+    dW           = (Wa*dWa + Wt*dWt)/W
+    dalpha       = -(Wt*dWa - Wa*dWt)/(W*W)
+    dCl_dalpha, dCl_dRe, dCl_dMa = compute_lift_coefficient_derivatives(Re,alpha,Ma,Cl,airfoils,a_loc,tc)
+    dCl          = dCl_dalpha*dalpha + dCl_dRe*(dW*c/nu) + dCl_dMa*(dW/a)
+    dR_dpsi      = dGamma - 0.5*c*(dW*Cl + W*dCl)
 
     dR_dpsi[np.isnan(dR_dpsi)] = 0.1
-    
-    # This needs to be made into a jacobian
-    dR_dpsi = dR_dpsi.flatten()
-    L       = np.size(PSI)
-    jac     = np.eye(L)*dR_dpsi
-    
-    return jac
\ No newline at end of file
+
+    return dR_dpsi
+
+## @defgroup Methods-Propulsion-Rotor_Wake-Fidelity_Zero
+def compute_lift_coefficient_derivatives(Re,alpha,Ma,Cl,airfoils,a_loc,tc):
+    """
+    Computes the derivatives of the section lift coefficients returned by
+    compute_airfoil_aerodynamics with respect to the Reynolds number, the angle of
+    attack and the Mach number.
+
+    Assumptions:
+    The airfoil polars are interpolated bilinearly.
+
+    Source:
+    N/A
+
+    Inputs:
+       Re                         Reynolds number                                 [-]
+       alpha                      section local angle of attack                   [rad]
+       Ma                         section Mach number                             [-]
+       Cl                         lift coefficient                                [-]
+       airfoils                   Data structure of airfoil polar information     [-]
+       a_loc                      airfoil of each radial station                  [-]
+       tc                         thickness to chord                              [-]
+
+    Outputs:
+       dCl_dalpha                 derivative of lift wrt angle of attack          [1/rad]
+       dCl_dRe                    derivative of lift wrt Reynolds number          [-]
+       dCl_dMa                    derivative of lift wrt Mach number              [-]
+
+    """
+    dCl_dalpha = np.zeros_like(Re)
+    dCl_dRe    = np.zeros_like(Re)
+    dCl_dMa    = np.zeros_like(Re)
+
+    if a_loc != None:
+        for jj,airfoil in enumerate(airfoils):
+            pd       = airfoil.polars
+            xp       = pd.reynolds_numbers
+            yp       = pd.angle_of_attacks
+            zp       = pd.lift_coefficients
+            ix       = np.clip(np.searchsorted(xp, Re, side="right"), 1, len(xp) - 1)
+            iy       = np.clip(np.searchsorted(yp, alpha, side="right"), 1, len(yp) - 1)
+            dx       = xp[ix] - xp[ix - 1]
+            dy       = yp[iy] - yp[iy - 1]
+            tx       = (Re - xp[ix - 1])/dx
+            ty       = (alpha - yp[iy - 1])/dy
+            z_11     = zp[ix - 1, iy - 1]
+            z_21     = zp[ix, iy - 1]
+            z_12     = zp[ix - 1, iy]
+            z_22     = zp[ix, iy]
+            locs     = np.array(a_loc) == jj
+            dCl_dRe[:,locs]    = (((1. - ty)*(z_21 - z_11) + ty*(z_22 - z_12))/dx)[:,locs]
+            dCl_dalpha[:,locs] = (((1. - tx)*(z_12 - z_11) + tx*(z_22 - z_21))/dy)[:,locs]
+    else:
+        # lift curve slope of 2*pi up to the estimated Cl max
+        tc_1       = tc*100
+        Cl_max_ref = -0.0009*tc_1**3 + 0.0217*tc_1**2 - 0.0442*tc_1 + 0.7005
+        Cl_max_ref[Cl_max_ref<0.7] = 0.7
+        Re_ref     = 9.*10**6
+        Cl1maxp    = Cl_max_ref * ( Re / Re_ref ) **0.1
+        Cl_2d      = 2.*np.pi*alpha
+        stalled    = Cl_2d > Cl1maxp
+        Cl_2d[stalled]     = Cl1maxp[stalled]
+        dCl_dalpha[:]      = 2.*np.pi
+        dCl_dalpha[stalled] = 0.
+        dCl_dRe[stalled]   = 0.1*Cl1maxp[stalled]/Re[stalled]
+        dCl_dalpha[alpha>=np.pi/2] = 0.
+        dCl_dRe[alpha>=np.pi/2]    = 0.
+
+        # Karman-Tsien scaling
+        KT_cond    = np.logical_and((Ma<1.),(Cl_2d>0))
+        M          = Ma[KT_cond]
+        C          = Cl_2d[KT_cond]
+        s          = (1 - M*M)**0.5
+        q          = (M*M)/(1 + s)
+        D          = s + q*C/2
+        ds         = -M/s
+        dq         = (2*M*(1 + s) - M*M*ds)/((1 + s)*(1 + s))
+        dCl_dalpha[KT_cond] = dCl_dalpha[KT_cond]*s/(D*D)
+        dCl_dRe[KT_cond]    = dCl_dRe[KT_cond]*s/(D*D)
+        dCl_dMa[KT_cond]    = -C*(ds + dq*C/2)/(D*D)
+
+    return dCl_dalpha, dCl_dRe, dCl_dMa
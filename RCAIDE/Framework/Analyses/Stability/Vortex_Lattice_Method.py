@@ -110,6 +110,13 @@ class Vortex_Lattice_Method(Stability):
         self.settings.leading_edge_suction_multiplier               = 1.0  
         self.settings.use_VORLAX_matrix_calculation                 = False
         self.settings.floating_point_precision                      = np.float32 
+        self.settings.vortex_distribution_cache_size                = 8
+        self.settings.AIC_factorization_cache_size                  = 64
+        self.settings.max_aic_memory                                = None
+        self.settings.vlm_kernel                                    = 'numpy'
+        self.settings.use_symmetric_solve                           = False
+        self.settings.surrogate_store_directory                     = None
+        self.settings.training_workers                              = 1
     
         # conditions table, used for surrogate model training
         self.training                                               = Data()
@@ -132,6 +139,9 @@ class Vortex_Lattice_Method(Stability):
         self.training.pitch_rate                                    = np.array([0.3 ,0.15  , 0.0 ])  * Units.rad / Units.sec
         self.training.roll_rate                                     = np.array([0.3 ,0.15  , 0.0])  * Units.rad / Units.sec
         self.training.yaw_rate                                      = np.array([0.3 ,0.15  , 0.0])  * Units.rad / Units.sec
+        self.training.adaptive                                      = False
+        self.training.adaptive_tolerance                            = 7E-2
+        self.training.adaptive_budget                               = 250
     
         self.reference_values                                       = Data()
         self.reference_values.S_ref                                 = 0
@@ -189,8 +199,10 @@ class Vortex_Lattice_Method(Stability):
 
         # If we are using the surrogate
         if use_surrogate == True: 
-            # sample training data
-            train_VLM_surrogates(self)
+            # sample training data, unless an identical geometry and training grid has already been trained
+            if not load_VLM_surrogates(self):
+                train_VLM_surrogates(self)
+                save_VLM_surrogates(self)
 
             # build surrogate
             build_VLM_surrogates(self)  
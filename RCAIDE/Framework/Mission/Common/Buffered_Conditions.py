@@ -0,0 +1,265 @@
+## @ingroup Analyses-Mission-Segments-Conditions
+# RCAIDE/Framework/Analyses/Mission/Segments/Conditions/Buffered_Conditions.py
+#
+#
+# Created:  Oct 2026, agent
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from .Conditions                   import Conditions
+from Legacy.trunk.S.Core.Arrays    import array_type, matrix_type
+
+# python imports
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Buffered_Conditions
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Analyses-Mission-Segments-Conditions
+class Buffered_Conditions(Conditions):
+    """ Conditions whose arrays are views into a single contiguous vector, laid out in the order of pack_array.
+        Packing copies the vector once and unpacking copies into it once, instead of walking the data and stacking
+        every array on each solver iteration.
+
+        Assumptions:
+        Arrays that are replaced rather than written in place are copied into the vector when packing. The layout is
+        rebuilt whenever keys are added, removed or reordered, a nested data is replaced or an array changes shape.
+        Data holding non float arrays or matrices fall back to the Data implementation.
+
+        Source:
+        None
+    """
+
+    __slots__ = ('_buffer','_layout','_containers')
+
+    def __defaults__(self):
+        """This sets the default values.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+        self._buffer     = None
+        self._layout     = None
+        self._containers = None
+
+    def pack_array(self,output='vector'):
+        """ Returns a copy of the contiguous vector of the data
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            output - either 'vector' (default), or 'array'      [string]
+
+            Outputs:
+            array  - the packed array                           [array]
+
+            Properties Used:
+            None
+        """
+        if output != 'vector' or not self.update_buffer():
+            return Conditions.pack_array(self,output)
+
+        return self._buffer.copy()
+
+    def unpack_array(self,M):
+        """ Copies a 1d vector into the contiguous vector of the data
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            M      - 1d vector                                  [array]
+
+            Outputs:
+            a reference to self, updates self in place
+
+            Properties Used:
+            None
+        """
+        if np.ndim(M) != 1 or not self.update_buffer() or len(M) != len(self._buffer):
+            return Conditions.unpack_array(self,M)
+
+        buffer    = self._buffer
+        buffer[:] = M
+
+        # scalars and replaced arrays are not views into the vector
+        for container,key,view,start,stop,shape in self._layout:
+            if view is None:
+                container[key] = buffer[start]
+            else:
+                value = container[key]
+                if value is not view:
+                    value[...] = np.reshape(buffer[start:stop],shape,order='F')
+
+        return self
+
+    def update_buffer(self):
+        """ Brings the contiguous vector up to date with the data, building the layout if the structure has changed
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            valid  - False if the data can not be buffered      [boolean]
+
+            Properties Used:
+            None
+        """
+        for attempt in range(2):
+            if self._layout is None and not self.build_buffer():
+                return False
+            if self.gather_buffer():
+                return True
+            self._layout = None
+
+        return False
+
+    def gather_buffer(self):
+        """ Copies arrays that have been replaced, and scalars, into the contiguous vector
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            valid  - False if the layout is out of date         [boolean]
+
+            Properties Used:
+            None
+        """
+        for parent,key,container,keys in self._containers:
+            if (parent is not None and parent.get(key) is not container) or tuple(container.keys()) != keys:
+                return False
+
+        buffer = self._buffer
+        for container,key,view,start,stop,shape in self._layout:
+            value = container.get(key)
+            if value is view:
+                continue
+            elif view is None:
+                if not isinstance(value,(int,float)):
+                    return False
+                buffer[start] = value
+            elif isinstance(value,array_type) and not isinstance(value,matrix_type) and value.shape == shape:
+                buffer[start:stop] = np.ravel(value,order='F')
+            else:
+                return False
+
+        return True
+
+    def build_buffer(self):
+        """ Allocates the contiguous vector and replaces every array of the data by a view into it
+
+            Assumptions:
+            Follows the traversal order of Data.pack_array
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            valid  - False if the data can not be buffered      [boolean]
+
+            Properties Used:
+            None
+        """
+        containers = []
+        leaves     = []
+
+        def do_layout(D,parent=None,key=None):
+            containers.append((parent,key,D,tuple(D.keys())))
+            for k,v in D.items():
+                if isinstance(v,dict):
+                    if not do_layout(v,D,k):
+                        return False
+                    continue
+                elif isinstance(v,matrix_type):
+                    return False
+                elif isinstance(v,array_type):
+                    if v.ndim > 2:
+                        continue
+                    elif v.dtype != np.float64:
+                        return False
+                elif not isinstance(v,(int,float)):
+                    continue
+                leaves.append((D,k,v))
+            return True
+
+        if not do_layout(self):
+            return False
+
+        sizes   = [np.size(v) for D,k,v in leaves]
+        offsets = np.hstack([0,np.cumsum(sizes)]).astype(int)
+        buffer  = np.zeros(offsets[-1])
+        layout  = []
+        for (D,k,v),start,stop in zip(leaves,offsets[:-1],offsets[1:]):
+            if isinstance(v,array_type) and v.ndim > 0:
+                shape              = v.shape
+                view               = np.reshape(buffer[start:stop],shape,order='F')
+                view[...]          = v
+                D[k]               = view
+            else:
+                shape              = ()
+                view               = None
+                buffer[start]      = v
+            layout.append((D,k,view,start,stop,shape))
+
+        self._buffer     = buffer
+        self._layout     = layout
+        self._containers = containers
+
+        return True
+
+    def __getstate__(self):
+        """ Returns the attributes that are not keys for copying and pickling, the copied arrays are not views
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            state  [tuple]
+
+            Properties Used:
+            None
+        """
+        return None, {'_size':self._size}
@@ -2,6 +2,7 @@
 # 
 # 
 # Created:  Jul 2023, M. Clarke
+# Modified: Oct 2026, agent
  
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
@@ -11,6 +12,7 @@ from RCAIDE.Framework.Core                    import Data
 
 # python imports 
 import numpy as np 
+from copy import deepcopy
 # ----------------------------------------------------------------------------------------------------------------------
 #  Conditions
 # ----------------------------------------------------------------------------------------------------------------------
@@ -21,13 +23,93 @@ class Conditions(Data):
         to collect the information.
     
         Assumptions:
-        None
+        Keys are stored as the instance attributes, so that attribute access is resolved by the interpreter rather
+        than by Data.__getattribute__. The number of control points is the only attribute that is not a key.
         
         Source:
         None   
     """ 
 
-    _size = 1
+    __slots__        = ('_size',)
+    __getattribute__ = object.__getattribute__
+    __setattr__      = object.__setattr__
+    __delattr__      = object.__delattr__
+    
+    def __new__(cls,*args,**kwarg):
+        """ Creates a new Conditions() class whose instance dictionary is the dictionary of keys
+    
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            Conditions
+    
+            Properties Used:
+            None
+        """
+        self = dict.__new__(cls)
+        object.__setattr__(self,'__dict__',self)
+        self._size   = 1
+        
+        # fill in defaults trunk to leaf
+        for klass in self.get_bases()[::-1]:
+            try:
+                klass.__defaults__(self)
+            except:
+                pass
+            
+        return self
+    
+    def __getstate__(self):
+        """ Returns the attributes that are not keys for copying and pickling, the keys are restored as items
+    
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            state  [tuple]
+    
+            Properties Used:
+            None
+        """
+        return None, {'_size':self._size}
+    
+    def writeable_array(self,key):
+        """ Returns the array stored under key for writing in place. An array shared with other conditions is
+            copied first, so that the write does not reach the conditions it is shared with.
+    
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            key    [str]
+    
+            Outputs:
+            array  [array]
+    
+            Properties Used:
+            None
+        """
+        value = self[key]
+        if not value.flags.writeable:
+            value     = np.copy(value)
+            self[key] = value
+        return value
     
     def ones_row(self,cols):
         """ returns a row vector of ones with given number of columns 
@@ -135,6 +217,78 @@ class Conditions(Data):
         
         return
         
+## @ingroup Analyses-Mission-Segments-Conditions
+def alias_conditions(reference):
+    """ Returns a view of the reference conditions, used for the results of identical propulsors in place of a deep
+        copy. The containers are new, so that keys assigned to the view do not reach the reference, while the arrays
+        are read-only views of the reference arrays. An array of the view is copied by writeable_array before it is
+        written in place, and every array is copied by detach_conditions once the segment has converged.
+    
+        Assumptions:
+        The reference owns its arrays: writes to the reference are seen by the view until it is aliased again.
+    
+        Source:
+        None
+    
+        Inputs:
+        reference  - conditions or Data to share                          [-]
+    
+        Outputs:
+        view       - conditions or Data of the same type as the reference  [-]
+    
+        Properties Used:
+        None
+    """
+    
+    view = dict.__new__(type(reference))
+    if isinstance(reference,Conditions):
+        object.__setattr__(view,'__dict__',view)
+        view._size = reference._size
+    
+    for key,value in dict.items(reference):
+        if isinstance(value,np.ndarray):
+            value                 = value.view()
+            value.flags.writeable = False
+        elif isinstance(value,expanded_array):
+            value = deepcopy(value)
+        elif isinstance(value,Data):
+            value = alias_conditions(value)
+        elif isinstance(value,(list,dict,set)):
+            value = deepcopy(value)
+        dict.__setitem__(view,key,value)
+    
+    return view
+
+## @ingroup Analyses-Mission-Segments-Conditions
+def detach_conditions(conditions):
+    """ Replaces the read-only arrays of views made by alias_conditions with copies, so that the results of a
+        converged segment own their arrays and can be modified in place.
+    
+        Assumptions:
+        None
+    
+        Source:
+        None
+    
+        Inputs:
+        conditions  - conditions or Data                [-]
+    
+        Outputs:
+        None
+    
+        Properties Used:
+        None
+    """
+    
+    for key,value in dict.items(conditions):
+        if isinstance(value,np.ndarray):
+            if not value.flags.writeable:
+                dict.__setitem__(conditions,key,np.copy(value))
+        elif isinstance(value,Data):
+            detach_conditions(value)
+    
+    return
+        
 ## @ingroup Analyses-Mission-Segments-Conditions        
 class expanded_array(Data):
     """ This is an array that will expand later when the mission is initialized. It is called specifically by conditions
@@ -48,7 +48,9 @@ class Numerics(Conditions):
         self.tag                              = 'numerics' 
         self.number_of_control_points         = 16
         self.discretization_method            = chebyshev_data 
-        self.solver_jacobian                  = "none"
+        self.solver_jacobian                  = "none"   # "none", "sparse" or an analytic function jacobian(segment,unknowns)
+        self.solver_method                    = "newton" # "newton", "hybr" or "lm", used when solver_jacobian is not "none"
+        self.jacobian_sparsity_threshold      = 0.       # relative size of couplings neglected by the "sparse" jacobian
         self.tolerance_solution               = 1e-8
         self.converged                        = None
         self.max_evaluations                  = 0.
@@ -8,14 +8,14 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
 
-from .Conditions import Conditions
+from .Buffered_Conditions import Buffered_Conditions
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  Residuals
 # ----------------------------------------------------------------------------------------------------------------------
 
 ## @ingroup Analyses-Mission-Segments-Conditions
-class Residuals(Conditions):
+class Residuals(Buffered_Conditions):
     """ Creates the data structure for the residuals that solved in a mission
     
         Assumptions:
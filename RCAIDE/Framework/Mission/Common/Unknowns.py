@@ -7,14 +7,14 @@
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
-from .Conditions import Conditions
+from .Buffered_Conditions import Buffered_Conditions
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  Unknowns
 # ----------------------------------------------------------------------------------------------------------------------
 
 ## @ingroup Analyses-Mission-Segments-Conditions
-class Unknowns(Conditions):
+class Unknowns(Buffered_Conditions):
     """ Creates the data structure for the unknowns that solved in a mission
     
         Assumptions:
@@ -9,9 +9,10 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
 
-from .Conditions   import Conditions
-from .Numerics     import Numerics
-from .Residuals    import Residuals
-from .Results      import Results
-from .State        import State
-from .Unknowns     import Unknowns
\ No newline at end of file
+from .Conditions          import Conditions, alias_conditions, detach_conditions
+from .Buffered_Conditions import Buffered_Conditions
+from .Numerics            import Numerics
+from .Residuals           import Residuals
+from .Results             import Results
+from .State               import State
+from .Unknowns            import Unknowns
\ No newline at end of file
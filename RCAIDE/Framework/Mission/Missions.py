@@ -10,6 +10,7 @@
 # RCAIDE imports        
 from . import Segments
 from RCAIDE.Framework.Core import Container , Data 
+from RCAIDE.Library.Mission.Common import evaluate_batch
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  Mission
@@ -48,6 +49,26 @@ class Missions(Container):
     def append_mission(self,mission): 
         
         self.append(mission)
-        return        
+        return
     
-     
\ No newline at end of file
+    def evaluate_batch(self,parameter_grid=None,executor='process',workers=None):
+        """ Evaluates the missions in parallel, optionally over a grid of parameters
+    
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            parameter_grid  - list of dictionaries of dotted paths and values  [list]
+            executor        - 'process', 'thread' or 'serial'                  [string]
+            workers         - number of workers                                [int]
+    
+            Outputs:
+            Results         - results of every mission                         [Data()]
+    
+            Properties Used:
+            None
+        """   
+        return evaluate_batch(self,parameter_grid,executor,workers)
@@ -123,6 +123,7 @@ class Evaluate(Segment):
         #  Post Process   
         # -------------------------------------------------------------- 
         post_process                    = self.process.post_process   
+        post_process.conditions         = Common.Update.detached_conditions
         post_process.inertial_position  = Common.Update.inertial_horizontal_position
         post_process.battery_age        = Common.Update.battery_age  
         post_process.noise              = Common.Update.noise
@@ -10,6 +10,7 @@
 # RCAIDE imports   
 import RCAIDE
 from RCAIDE.Library.Mission.Common.Segments    import  sequential_segments
+from RCAIDE.Library.Mission.Common             import  evaluate_batch
 from RCAIDE.Library.Mission.Common.Pre_Process import  aerodynamics,stability, energy,set_residuals_and_unknowns
 from RCAIDE.Framework.Core                               import Container as ContainerBase
 from RCAIDE.Framework.Analyses                           import Process 
@@ -112,6 +113,31 @@ class Sequential_Segments(Segments.Segment.Container):
         self.process(self)
         return self     
         
+    def evaluate_batch(self,parameter_grid,executor='process',workers=None):
+        """ Evaluates the mission over a grid of parameters in parallel
+    
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            parameter_grid  - list of dictionaries of dotted paths and values  [list]
+            executor        - 'process', 'thread' or 'serial'                  [string]
+            workers         - number of workers                                [int]
+    
+            Outputs:
+            Results         - results of every grid point                      [list]
+    
+            Properties Used:
+            None
+        """  
+        missions = RCAIDE.Framework.Core.Data()
+        missions[self.tag] = self
+        results  = evaluate_batch(missions,parameter_grid,executor,workers)
+        return results[self.tag]
+        
     
 # ----------------------------------------------------------------------
 #   Container Class
@@ -154,6 +180,28 @@ class Container(ContainerBase):
             
         return results
     
+    def evaluate_batch(self,parameter_grid=None,executor='process',workers=None):
+        """ Evaluates the missions in parallel, optionally over a grid of parameters
+    
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            parameter_grid  - list of dictionaries of dotted paths and values  [list]
+            executor        - 'process', 'thread' or 'serial'                  [string]
+            workers         - number of workers                                [int]
+    
+            Outputs:
+            Results         - results of every mission                         [Data()]
+    
+            Properties Used:
+            None
+        """   
+        return evaluate_batch(self,parameter_grid,executor,workers)
+    
     def finalize(self):
         """ Stub
     
@@ -0,0 +1,60 @@
+## @ingroup Analyses-Mission
+# RCAIDE/Framework/Analyses/Mission/Simultaneous_Segments.py
+# 
+# 
+# Created:  Oct 2026, agent 
+# Modified: Oct 2026, agent 
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------  
+# RCAIDE imports   
+from RCAIDE.Library.Mission.Common.Segments    import  simultaneous_segments
+from .Sequential_Segments                      import  Sequential_Segments
+
+# ----------------------------------------------------------------------------------------------------------------------
+# ANALYSIS
+# ----------------------------------------------------------------------------------------------------------------------  
+## @ingroup Analyses-Mission
+class Simultaneous_Segments(Sequential_Segments):
+    """ Solves all segments at once. The initial state of every segment is appended to the unknowns and its
+        continuity with the final state of the previous segment to the residuals, so that a single Newton loop
+        converges the whole mission. Segments are perturbed independently when the Jacobian is computed. Segments that
+        share no analyses and no vehicle may be evaluated on several threads, segments sharing analyses are evaluated
+        one after another.
+    
+        Assumptions:
+        None
+        
+        Source:
+        None
+    """
+    
+    def __defaults__(self):
+        """This sets the default values.
+    
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            None
+        """          
+
+        self.tag = 'mission'
+        
+        #   Converge 
+        self.process.converge               = simultaneous_segments
+        
+        #   Settings
+        self.settings.number_of_workers     = 1 
+
+        return  
@@ -8,7 +8,8 @@
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
 # ---------------------------------------------------------------------------------------------------------------------- 
-from .Missions            import Missions
-from .Sequential_Segments import Sequential_Segments 
-from .                    import Common
-from .                    import Segments 
\ No newline at end of file
+from .Missions              import Missions
+from .Sequential_Segments   import Sequential_Segments 
+from .Simultaneous_Segments import Simultaneous_Segments
+from .                      import Common
+from .                      import Segments 
\ No newline at end of file
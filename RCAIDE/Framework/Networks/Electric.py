@@ -3,6 +3,7 @@
 # 
 # 
 # Created:  Jul 2023, M. Clarke 
+# Modified: Oct 2026, agent
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
@@ -105,50 +106,58 @@ class Electric(Network):
                 if recharging_flag:
                     for battery in batteries: 
                         # append compoment power to bus 
-                        avionics_power         = (avionics_conditions.power*battery.bus_power_split_ratio)/len(batteries)* state.ones_row(1)
-                        payload_power          = (payload_conditions.power*battery.bus_power_split_ratio)/len(batteries)* state.ones_row(1)            
+                        avionics_power         = avionics_conditions.power*battery.bus_power_split_ratio* state.ones_row(1)
+                        payload_power          = payload_conditions.power*battery.bus_power_split_ratio* state.ones_row(1)            
                         total_esc_power        = 0 * state.ones_row(1)     
-                        charging_power         = (state.conditions.energy[bus.tag][battery.tag].pack.charging_current*bus_voltage*battery.bus_power_split_ratio)/len(batteries)
+                        charging_power         = (state.conditions.energy[bus.tag][battery.tag].pack.charging_current*bus_voltage*battery.bus_power_split_ratio)
                        
                         # append bus outputs to battery
                         battery_conditions                   = state.conditions.energy[bus.tag][battery.tag] 
                         battery_conditions.pack.power_draw   = ((avionics_power + payload_power + total_esc_power) - charging_power)/bus.efficiency
                         battery_conditions.pack.current_draw = -battery_conditions.pack.power_draw/bus_voltage
                         battery.energy_calc(state,bus,recharging_flag)  
-                else:       
-                    # compute energy consumption of each battery on bus  
-                    for battery in batteries: 
-                        stored_results_flag  = False
-                        stored_propulsor_tag = None 
-                        for propulsor in bus.propulsors:  
-                            if propulsor.active == True:  
-                                if bus.identical_propulsors == False:
-                                    # run analysis  
+                else:
+                    # compute the performance of the propulsors on the bus once, for all batteries
+                    bus_thrust           = 0. * state.ones_row(3)
+                    bus_moment           = 0. * state.ones_row(3)
+                    bus_power            = 0. * state.ones_row(1)
+                    stored_results_flag  = False
+                    stored_propulsor_tag = None
+                    for propulsor in bus.propulsors:
+                        if propulsor.active == True:
+                            if bus.identical_propulsors == False:
+                                # run analysis
+                                T,M,P,stored_results_flag,stored_propulsor_tag = propulsor.compute_performance(state,bus,bus_voltage,center_of_gravity)
+                            else:
+                                if stored_results_flag == False:
+                                    # run propulsor analysis
                                     T,M,P,stored_results_flag,stored_propulsor_tag = propulsor.compute_performance(state,bus,bus_voltage,center_of_gravity)
-                                else:             
-                                    if stored_results_flag == False: 
-                                        # run propulsor analysis 
-                                        T,M,P,stored_results_flag,stored_propulsor_tag = propulsor.compute_performance(state,bus,bus_voltage,center_of_gravity)
-                                    else:
-                                        # use previous propulsor results 
-                                        T,M,P = propulsor.reuse_stored_data(state,bus,stored_propulsor_tag,center_of_gravity)
-                                  
-                                total_thrust += T   
-                                total_moment += M   
-                                total_power  += P 
-                        
-                        # compute power from each componemnt 
-                        avionics_power  = (avionics_conditions.power*battery.bus_power_split_ratio)/len(batteries)* state.ones_row(1) 
-                        payload_power   = (payload_conditions.power*battery.bus_power_split_ratio)/len(batteries) * state.ones_row(1)   
-                        charging_power  = (state.conditions.energy[bus.tag][battery.tag].pack.charging_current*bus_voltage*battery.bus_power_split_ratio)/len(batteries) 
-                        total_esc_power = total_power*battery.bus_power_split_ratio  
-                           
-                        # append bus outputs to battery 
-                        battery_conditions                    = state.conditions.energy[bus.tag][battery.tag] 
+                                else:
+                                    # use previous propulsor results
+                                    T,M,P = propulsor.reuse_stored_data(state,bus,stored_propulsor_tag,center_of_gravity)
+
+                            bus_thrust += T
+                            bus_moment += M
+                            bus_power  += P
+
+                    total_thrust += bus_thrust
+                    total_moment += bus_moment
+                    total_power  += bus_power
+
+                    # distribute the power of the bus to its batteries
+                    for battery in batteries:
+                        # compute power from each componemnt
+                        avionics_power  = avionics_conditions.power*battery.bus_power_split_ratio* state.ones_row(1)
+                        payload_power   = payload_conditions.power*battery.bus_power_split_ratio * state.ones_row(1)
+                        charging_power  = (state.conditions.energy[bus.tag][battery.tag].pack.charging_current*bus_voltage*battery.bus_power_split_ratio)
+                        total_esc_power = bus_power*battery.bus_power_split_ratio
+
+                        # append bus outputs to battery
+                        battery_conditions                    = state.conditions.energy[bus.tag][battery.tag]
                         battery_conditions.pack.power_draw    = ((avionics_power + payload_power + total_esc_power) - charging_power)/bus.efficiency
                         battery_conditions.pack.current_draw  = battery_conditions.pack.power_draw/bus_voltage
-                        battery.energy_calc(state,bus,recharging_flag)        
-                
+                        battery.energy_calc(state,bus,recharging_flag)
+
         if reverse_thrust ==  True:
             total_thrust =  total_thrust * -1     
             total_moment =  total_moment* -1                    
@@ -32,6 +32,7 @@ class Airfoil(Component):
         self.geometry                   = None
         self.polar_files                = None
         self.polars                     = None
+        self.store_directory            = None  # on disk airfoil database of compute_airfoil_properties
         self.prev                       = None
         self.next                       = None
         self.number_of_points           = 201
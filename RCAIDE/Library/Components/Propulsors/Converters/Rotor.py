@@ -3,6 +3,7 @@
 # 
 # 
 # Created:  Mar 2024, M. Clarke
+# Modified: Oct 2026, agent
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
@@ -12,6 +13,7 @@ from RCAIDE.Framework.Core                              import Data , Units, Con
 from RCAIDE.Library.Components                          import Component 
 from RCAIDE.Framework.Analyses.Propulsion               import Rotor_Wake_Fidelity_Zero 
 from RCAIDE.Library.Methods.Propulsors.Converters.Rotor.append_rotor_conditions import  append_rotor_conditions
+from Legacy.trunk.S.Methods.Propulsion.Rotor_Wake.Fidelity_One.fidelity_one_wake_convergence import initialize_wake_state
 
 # package imports
 import numpy as np
@@ -95,6 +97,19 @@ class Rotor(Component):
 
         # Initialize the default wake set to Fidelity Zero 
         self.Wake                      = Rotor_Wake_Fidelity_Zero() 
+        self.wake_state                = initialize_wake_state()   # converged Fidelity One wakes, reused at nearby operating points
+
+        # performance map interpolated in place of the blade element analysis, see rotor_performance_surrogate
+        self.performance_surrogate                         = Data()
+        self.performance_surrogate.active                  = False
+        self.performance_surrogate.advance_ratio           = np.linspace(0.,2.,21)
+        self.performance_surrogate.tip_mach                = np.linspace(0.1,0.9,9)
+        self.performance_surrogate.reynolds_number         = np.logspace(5,8,13)  # omega*R*R/nu, interpolated in log10
+        self.performance_surrogate.pitch_command           = np.linspace(-10.,20.,7) * Units.degrees  # trained if variable pitch
+        self.performance_surrogate.extrapolation_tolerance = 0.05        # fraction of the trained range of each input
+        self.performance_surrogate.training_chunk_size     = 8
+        self.performance_surrogate.training_workers        = 1
+        self.performance_surrogate.store_directory         = None
         
         # blade optimization parameters     
         self.optimization_parameters                                    = Data() 
@@ -17,4 +17,4 @@ from .hess_smith                        import hess_smith
 from .infl_coeff                        import infl_coeff       
 from .panel_geometry                    import panel_geometry   
 from .thwaites_method                   import thwaites_method    
-from .velocity_distribution             import velocity_distribution 
\ No newline at end of file
+from .velocity_distribution             import velocity_distribution, velocity_coeff 
\ No newline at end of file
@@ -13,6 +13,8 @@ from RCAIDE.Framework.Core import Data
 # package imports  
 import numpy as np 
 
+from .surface_lanes import pack_surface_lanes, unpack_surface_lanes
+
 # ----------------------------------------------------------------------------------------------------------------------
 # heads_method
 # ---------------------------------------------------------------------------------------------------------------------- 
@@ -26,7 +28,7 @@ def heads_method(npanel,ncases,ncpts,DEL_0,THETA_0,DELTA_STAR_0,CF_0,ShapeFactor
     Journal of fluid mechanics 107 (1981): 297-338.
 
     Assumptions:
-    None  
+    The boundary layers of all cases and control points are marched along the surface together  
 
     Inputs: 
     ncases         - number of cases                                                               [unitless]
@@ -58,122 +60,69 @@ def heads_method(npanel,ncases,ncpts,DEL_0,THETA_0,DELTA_STAR_0,CF_0,ShapeFactor
     Properties Used:
     N/A
     """    
-    # Initialize vectors 
-    X_H          = np.zeros((npanel,ncases,ncpts))
-    THETA_H      = np.zeros_like(X_H)
-    DELTA_STAR_H = np.zeros_like(X_H)
-    H_H          = np.zeros_like(X_H)
-    CF_H         = np.zeros_like(X_H) 
-    RE_THETA_H   = np.zeros_like(X_H)
-    RE_X_H       = np.zeros_like(X_H)
-    DELTA_H      = np.zeros_like(X_H)      
+    # pack the points of every case and control point into lanes that are marched along the surface together, lanes
+    # without a turbulent surface are left empty 
+    shape          = (npanel,ncases,ncpts)
+    mask           = np.ma.getmaskarray(TURBULENT_COORD) | (TURBULENT_SURF == 0.0)[None,:,:]
+    x_i, order, n  = pack_surface_lanes(np.ma.array(TURBULENT_COORD.data, mask = mask), fill = 1.)
+    Ve_i, _, _     = pack_surface_lanes(np.ma.array(np.ma.getdata(VE_I), mask = mask), fill = 1.)
+    dVe_i, _, _    = pack_surface_lanes(np.ma.array(np.ma.getdata(DVE_I), mask = mask))
+    l              = np.where(TURBULENT_SURF == 0.0,1.,TURBULENT_SURF).reshape(-1)
+    Re_L           = RE_L.reshape(-1)
+    nu             = l/Re_L 
+    dx             = np.diff(x_i,axis = 0)
+    
+    H              = np.zeros_like(x_i) 
+    H[0]           = ShapeFactor_0.reshape(-1)
+    Theta          = np.zeros_like(x_i)
+    Theta[0]       = THETA_0.reshape(-1)
+    H1             = np.zeros_like(x_i) 
+    H1[0]          = ((DEL_0 - DELTA_STAR_0)/THETA_0).reshape(-1)
+    H1[0][H1[0]<3.3] = 3.417285
+    cf             = np.zeros_like(x_i)
+    cf[0]          = CF_0.reshape(-1)
+    VeThetaH1      = np.zeros_like(x_i)
+    VeThetaH1[0]   = Ve_i[0]*Theta[0]*H1[0]
+    
+    # define RK4 slope function for Theta
+    def dTheta_by_dx(index, X, THETA, VETHETAH1):
+        return 0.5*cf[index] - (THETA/Ve_i[index])*(2+H[index])*(dVe_i[index])
+    
+    # define RK4 slope function for VeThetaH1
+    def dVeThetaH1_by_dx(index, X, THETA, VETHETAH1):
+        return Ve_i[index]*0.0306*(((VETHETAH1/(Ve_i[index]*THETA))-3)**-0.6169)
     
-    for case in range(ncases):
-        for cpt in range(ncpts):  
-            # length of tubulent surface  
-            l = TURBULENT_SURF[case,cpt] 
-            if l == 0.0:
-                pass
-            else: 
-                def getcf(ind, H, THETA):
-                    ReTheta = (Re_L/l)*Ve_i[ind]*THETA;
-                    cf_var = 0.246*(10**(-0.678*H))*(ReTheta**-0.268);
-                    return cf_var
-
-
-                def getH(H1_var):
-                    if H1_var<3.3:
-                        H_var = 3.0
-                    elif H1_var < 5.39142:
-                        H_var = 0.6778 + 1.153793*(H1_var-3.3)**-0.32637;
-                    elif H1_var >= 5.39142:
-                        H_var = 1.1 + 0.8598636*(H1_var - 3.3)**-0.777;
-                    return H_var
-                
-             
-                # define RK4 slope function for Theta
-                def dTheta_by_dx(index, X, THETA, VETHETAH1):
-                    return 0.5*cf[index] - (THETA/Ve_i[index])*(2+H[index])*(dVe_i[index])
-                
-                # define RK4 slope function for VeThetaH1
-                def dVeThetaH1_by_dx(index, X, THETA, VETHETAH1):
-                    return Ve_i[index]*0.0306*(((VETHETAH1/(Ve_i[index]*THETA))-3)**-0.6169)
-                
-                x_i          = TURBULENT_COORD.data[:,case,cpt][TURBULENT_COORD.mask[:,case,cpt] ==False] 
-                Ve_i         = VE_I.data[:,case,cpt][TURBULENT_COORD.mask[:,case,cpt] ==False]
-                dVe_i        = DVE_I.data[:,case,cpt][TURBULENT_COORD.mask[:,case,cpt] ==False]
-                Re_L         = RE_L[case,cpt] 
-                nu           = l/Re_L 
-                n            = len(x_i)
-                dx           = np.diff(x_i)
-                
-                H            = np.zeros(n) 
-                H[0]         = ShapeFactor_0[case,cpt]
-                Theta        = np.zeros(n)
-                Theta[0]     = THETA_0[case,cpt]
-                H1           = np.zeros(n) 
-                H1[0]        = (DEL_0[case,cpt] - DELTA_STAR_0[case,cpt])/THETA_0[case,cpt]
-                if H1[0]<3.3:
-                    H1[0] = 3.417285
-                
-                cf           = np.zeros(n)
-                cf[0]        = CF_0[case,cpt] 
-                VeThetaH1    = np.zeros(n)
-                VeThetaH1[0] = Ve_i[0]*Theta[0]*H1[0]
-                
-                for i in range(1,n):
-                    # initialise the variable values at the current grid point using previous grid points (to define the error functions)
-                    H_er = H[i-1];  cf_er = cf[i-1];  H1_er = H1[i-1];  Theta_er = Theta[i-1];
-                    # assign previous grid point values of H and Cf to start RK4
-                    H[i] = H[i-1]; cf[i] = cf[i-1];
-                    
-                    #assume some error values
-                    erH = 0.2; erH1 = 0.2; erTheta = 0.2; ercf = 0.2;
-                    
-                    # iterate to get the variables at the grid point
-                    while abs(erH)>0.00001 or abs(erH1)>0.00001 or abs(erTheta)>0.00001 or abs(ercf)>0.00001:
-                        
-                        # get Theta and VeThetaH1
-                        Theta[i], VeThetaH1[i] = RK4(i-1, dx, x_i, Theta, VeThetaH1, dTheta_by_dx, dVeThetaH1_by_dx)
-                        if np.isnan(VeThetaH1[i]):
-                            VeThetaH1[i] = VeThetaH1[i-1]
-                       
-                        # get H1
-                        H1[i] = VeThetaH1[i]/(Ve_i[i]*Theta[i])
-                        
-                        # get H
-                        H[i] = getH(H1[i])
-                        
-                        # get skin friction
-                        cf[i] = getcf(i, H[i], Theta[i])
-                        
-                        # define errors
-                        erH = (H[i]-H_er)/H[i];
-                        erH1 = (H1[i]-H1_er)/H1[i];
-                        erTheta = (Theta[i]-Theta_er)/Theta[i];
-                        ercf = (cf[i]-cf_er)/cf[i];
-                        
-                        # assign current iteration variable values to the Var_er
-                        H_er = H[i]
-                        H1_er = H1[i]
-                        Theta_er = Theta[i]
-                        cf_er = cf[i]
-                
-                
-                delta_star   = H*Theta
-                Re_theta     = (Re_L/l)*Ve_i*Theta
-                Re_x         = (Ve_i*x_i)/nu
-                delta        = (Theta*H1) + delta_star
-                
-                indices = np.where(TURBULENT_COORD.mask[:,case,cpt] == False)
-                np.put(X_H[:,case,cpt],indices,x_i )
-                np.put(THETA_H[:,case,cpt],indices,Theta)
-                np.put(DELTA_STAR_H[:,case,cpt],indices,delta_star)
-                np.put(H_H[:,case,cpt],indices,H)
-                np.put(CF_H[:,case,cpt],indices,cf)
-                np.put(RE_THETA_H[:,case,cpt],indices,Re_theta)
-                np.put(RE_X_H[:,case,cpt],indices,Re_x)
-                np.put(DELTA_H[:,case,cpt],indices,delta)
+    # march every lane along the surface. The slopes of a step only depend on the start of the step, so the
+    # variables at each point are found in a single pass  
+    for i in range(1,np.max(n,initial=1)):
+        
+        # get Theta and VeThetaH1
+        Theta[i], VeThetaH1[i] = RK4(i-1, dx, x_i, Theta, VeThetaH1, dTheta_by_dx, dVeThetaH1_by_dx)
+        nan               = np.isnan(VeThetaH1[i])
+        VeThetaH1[i][nan] = VeThetaH1[i-1][nan]
+        
+        # get H1
+        H1[i] = VeThetaH1[i]/(Ve_i[i]*Theta[i])
+        
+        # get H
+        H[i]  = getH(H1[i])
+        
+        # get skin friction
+        cf[i] = getcf(Re_L/l*Ve_i[i], H[i], Theta[i])
+    
+    delta_star     = H*Theta
+    Re_theta       = (Re_L/l)*Ve_i*Theta
+    Re_x           = (Ve_i*x_i)/nu
+    delta          = (Theta*H1) + delta_star
+    
+    X_H            = unpack_surface_lanes(x_i,order,n,shape)
+    THETA_H        = unpack_surface_lanes(Theta,order,n,shape)
+    DELTA_STAR_H   = unpack_surface_lanes(delta_star,order,n,shape)
+    H_H            = unpack_surface_lanes(H,order,n,shape)
+    CF_H           = unpack_surface_lanes(cf,order,n,shape)
+    RE_THETA_H     = unpack_surface_lanes(Re_theta,order,n,shape)
+    RE_X_H         = unpack_surface_lanes(Re_x,order,n,shape)
+    DELTA_H        = unpack_surface_lanes(delta,order,n,shape)
 
     RESULTS = Data(
             X_H          = X_H,      
@@ -189,6 +138,55 @@ def heads_method(npanel,ncases,ncpts,DEL_0,THETA_0,DELTA_STAR_0,CF_0,ShapeFactor
     return  RESULTS
 
 
+def getcf(Ve_Re_L_by_l, H, THETA):
+    """ Computes the skin friction coefficient, cf, from the Ludwieg-Tillmann relation
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs: 
+    Ve_Re_L_by_l - boundary layer velocity times Reynolds number per unit length [1/m]
+    H            - shape factor                                                  [unitless]
+    THETA        - momentum thickness                                            [m]
+
+    Outputs:  
+    cf           - skin friction coefficient                                     [unitless]
+
+    Properties Used:
+    N/A 
+    """
+    ReTheta = Ve_Re_L_by_l*THETA
+    cf_var  = 0.246*(10**(-0.678*H))*(ReTheta**-0.268)
+    return cf_var
+
+def getH(H1_var):
+    """ Computes the shape factor, H, from the entrainment shape factor, H1
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs: 
+    H1_var  - entrainment shape factor [unitless]
+
+    Outputs:  
+    H_var   - shape factor [unitless]
+
+    Properties Used:
+    N/A
+    """
+    with np.errstate(invalid='ignore',divide='ignore'):
+        H_var = np.where(H1_var < 3.3, 3.0,
+                np.where(H1_var < 5.39142, 0.6778 + 1.153793*(H1_var-3.3)**-0.32637,
+                                           1.1 + 0.8598636*(H1_var - 3.3)**-0.777))
+    return H_var
+
+
 def RK4(ind, dx, x, Theta_var, VeThetaH1_var, Theta_slope, VeThetaH1_slope):
     k1 = Theta_slope(ind,  x[ind],  Theta_var[ind],  VeThetaH1_var[ind])
     l1 = VeThetaH1_slope(ind,  x[ind],  Theta_var[ind],  VeThetaH1_var[ind])
@@ -11,20 +11,31 @@
 # RCAIDE imports   
 from .panel_geometry import panel_geometry
 from .infl_coeff  import infl_coeff
-from .velocity_distribution import velocity_distribution
+from .velocity_distribution import velocity_coeff
 
 # pacakge imports  
 import numpy as np  
+import hashlib
+from collections import OrderedDict
+from scipy.linalg import lu_factor, lu_solve
+
+# LU factors of the influence coefficient matrices and the velocity coefficient matrices of airfoil geometries, 
+# least recently used first 
+panel_method_cache      = OrderedDict()
+panel_method_cache_size = 16
  
 # ----------------------------------------------------------------------------------------------------------------------
 # hess_smith
 # ---------------------------------------------------------------------------------------------------------------------- 
 ## @ingroup Methods-Aerodynamics-Airfoil_Panel_Method
-def hess_smith(x_coord,y_coord,alpha,Re,npanel):
+def hess_smith(x_coord,y_coord,alpha,Re,npanel,cache = False):
     """Computes the incompressible, inviscid flow over an airfoil of  arbitrary shape using the Hess-Smith panel method.  
+    The influence coefficient matrix only depends on the geometry, so it is computed and factored once for every 
+    distinct geometry among the cases and control points, and the right hand sides of all cases sharing that geometry
+    are back-substituted together. 
 
     Assumptions:
-    None
+    If cache is True, the factors are kept between calls for the geometries last used 
 
     Source:  "An introduction to theoretical and computational        
                     aerodynamics", J. Moran, Wiley, 1984  
@@ -37,6 +48,7 @@ def hess_smith(x_coord,y_coord,alpha,Re,npanel):
     npanel        -  Number of panels on the airfoil.  The number of nodes   [unitess] 
                       is equal to npanel+1, and the ith panel goes from node   
                       i to node i+1                                
+    cache         -  Flag to keep the factors of the geometries              [boolean] 
                                                                            
     Outputs                                                      
     cl            -  Airfoil lift coefficient                         [unitless]           
@@ -57,19 +69,69 @@ def hess_smith(x_coord,y_coord,alpha,Re,npanel):
     # generate panel geometry data for later use   
     l,st,ct,xbar,ybar,norm = panel_geometry(x_coord,y_coord,npanel,ncases,ncpts) 
     
-    # compute matrix of aerodynamic influence coefficients
-    ainfl         = infl_coeff(x_coord,y_coord,xbar,ybar,st,ct,npanel,ncases,ncpts) # ncases x ncpts x npanel+1 x npanel+1 
+    # lanes of cases and control points that share a geometry share their influence coefficients  
+    nodes         = np.concatenate([x_coord,y_coord],axis = 0).reshape(2*(npanel+1),ncases*ncpts).T 
+    geometries, geometry_index = np.unique(nodes,axis = 0,return_inverse = True)
+    geometry_index = geometry_index.reshape(-1)
     
     # compute right hand side vector for the specified angle of attack 
     b_2d          = np.zeros((npanel+1,ncases, ncpts))
     b_2d[:-1,:,:] = st*np.cos(alpha_2d) - np.sin(alpha_2d)*ct
     b_2d[-1,:,:]  = -(ct[0,:,:]*np.cos(alpha_2d[-1,:,:]) + st[0,:,:]*np.sin(alpha_2d[-1,:,:]))-(ct[-1,:,:]*np.cos(alpha_2d[-1,:,:]) +st[-1,:,:]*np.sin(alpha_2d[-1,:,:]))
-      
-    # solve matrix system for vector of q_i and gamma  
-    qg_T          = np.linalg.solve(ainfl,np.swapaxes(b_2d.T,0,1))
-    qg            = np.swapaxes(qg_T.T,1,2) 
+    b             = b_2d.reshape(npanel+1,ncases*ncpts)
+    
+    # solve matrix system for vector of q_i and gamma and compute the tangential velocity distribution at the 
+    # midpoint of panels, factoring the matrix of aerodynamic influence coefficients once per geometry   
+    vt            = (ct*np.cos(alpha_2d) + st*np.sin(alpha_2d)).reshape(npanel,ncases*ncpts)
+    for i, factors, vcoeff in panel_method_factors(geometries,npanel,cache):
+        lanes            = np.where(geometry_index == i)[0]
+        qg               = lu_solve(factors,b[:,lanes],check_finite=False)
+        vt[:,lanes]     += vcoeff @ qg
+    vt            = vt.reshape(npanel,ncases,ncpts)
+    
+    return  xbar,ybar,vt,norm 
+
+## @ingroup Methods-Aerodynamics-Airfoil_Panel_Method
+def panel_method_factors(geometries,npanel,cache):
+    """Yields the LU factors of the matrix of aerodynamic influence coefficients and the tangential velocity 
+    coefficient matrix of each geometry, computing the matrices of all geometries not found in the cache together
+
+    Assumptions:
+    None
+
+    Source:
+    None
+                                                     
+    Inputs          
+    geometries    -  x and y coordinates of the nodes of each geometry       [unitess]     
+    npanel        -  Number of panels on the airfoil                         [unitess] 
+    cache         -  Flag to keep the factors of the geometries              [boolean] 
+                                                                           
+    Outputs                                                      
+    i             -  index of the geometry                                   [unitless]           
+    factors       -  LU factors of the influence coefficient matrix          [unitless]      
+    vcoeff        -  tangential velocity coefficient matrix                  [unitless]            
+
+    Properties Used:
+    N/A
+    """      
+    keys    = [hashlib.sha1(nodes.tobytes()).hexdigest() for nodes in geometries]
+    entries = [panel_method_cache.pop(key,None) if cache else None for key in keys]
+    missing = [i for i, entry in enumerate(entries) if entry is None]
     
-    # compute the tangential velocity distribution at the midpoint of panels 
-    vt            = velocity_distribution(qg,x_coord,y_coord,xbar,ybar,st,ct,alpha_2d,npanel,ncases,ncpts)
+    if len(missing) > 0:
+        n_missing  = len(missing)
+        x          = geometries[missing,:npanel+1].T[:,:,None]
+        y          = geometries[missing,npanel+1:].T[:,:,None]
+        l,st,ct,xbar,ybar,norm = panel_geometry(x,y,npanel,n_missing,1) 
+        ainfl      = infl_coeff(x,y,xbar,ybar,st,ct,npanel,n_missing,1) # n_missing x 1 x npanel+1 x npanel+1 
+        vcoeff     = velocity_coeff(x,y,xbar,ybar,st,ct,npanel,n_missing,1) # n_missing x 1 x npanel x npanel+1
+        for j, i in enumerate(missing):
+            entries[i] = (lu_factor(ainfl[j,0],check_finite=False),vcoeff[j,0])
     
-    return  xbar,ybar,vt,norm 
\ No newline at end of file
+    for i, (key, entry) in enumerate(zip(keys,entries)):
+        if cache:
+            panel_method_cache[key] = entry
+            while len(panel_method_cache) > panel_method_cache_size:
+                panel_method_cache.popitem(last=False)
+        yield (i,) + entry
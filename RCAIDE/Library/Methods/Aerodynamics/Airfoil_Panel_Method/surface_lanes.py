@@ -0,0 +1,102 @@
+## @ingroup Methods-Aerodynamics-Airfoil_Panel_Method
+# RCAIDE/Methods/Aerodynamics/Airfoil_Panel_Method/surface_lanes.py
+#
+#
+# Created:  Oct 2026, agent
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# package imports
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+# pack_surface_lanes
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Methods-Aerodynamics-Airfoil_Panel_Method
+def pack_surface_lanes(ARRAY, fill = 0.):
+    """ Packs the unmasked points of each case and control point of a masked surface array, i.e. each lane along the
+    surface, to the start of the lane so that every lane can be marched along the surface together
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    ARRAY          - masked array of surface values, (npanel, ncases, ncpts)                     [unitless]
+    fill           - value of the points past the end of each lane                               [unitless]
+
+    Outputs:
+    packed         - unmasked values of each lane, (npanel, ncases*ncpts)                        [unitless]
+    order          - panel of each packed value                                                  [unitless]
+    n              - number of unmasked points of each lane                                      [unitless]
+
+    Properties Used:
+    N/A
+    """
+    npanel  = ARRAY.shape[0]
+    mask    = np.ma.getmaskarray(ARRAY).reshape(npanel,-1)
+    data    = np.ma.getdata(ARRAY).reshape(npanel,-1)
+    order   = np.argsort(mask,axis=0,kind='stable')
+    n       = np.sum(~mask,axis=0)
+    packed  = np.take_along_axis(data,order,axis=0)
+    packed  = np.where(np.arange(npanel)[:,None] < n,packed,fill)
+    return packed, order, n
+
+## @ingroup Methods-Aerodynamics-Airfoil_Panel_Method
+def unpack_surface_lanes(packed, order, n, shape):
+    """ Returns packed lanes to the panels they were taken from, with zeros on the masked panels
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    packed         - values of each lane, (npanel, ncases*ncpts)                                 [unitless]
+    order          - panel of each packed value                                                  [unitless]
+    n              - number of unmasked points of each lane                                      [unitless]
+    shape          - shape of the surface arrays, (npanel, ncases, ncpts)                        [unitless]
+
+    Outputs:
+    ARRAY          - surface values, (npanel, ncases, ncpts)                                     [unitless]
+
+    Properties Used:
+    N/A
+    """
+    ARRAY  = np.zeros(packed.shape)
+    np.put_along_axis(ARRAY,order,np.where(np.arange(packed.shape[0])[:,None] < n,packed,0.),axis=0)
+    return ARRAY.reshape(shape)
+
+## @ingroup Methods-Aerodynamics-Airfoil_Panel_Method
+def replace_diverged_points(VALUES, n, tol):
+    """ Replaces each point of a lane that changes by more than the tolerance relative to the previous point with
+    the previous point, in lanes where more than one point does
+
+    Assumptions:
+    The previous points are taken before any replacement
+
+    Source:
+    None
+
+    Inputs:
+    VALUES         - packed values of each lane, (npanel, nlanes)                                [unitless]
+    n              - number of points of each lane                                               [unitless]
+    tol            - boundary layer error correction tolerance                                   [unitless]
+
+    Outputs:
+    VALUES         - corrected values                                                            [unitless]
+
+    Properties Used:
+    N/A
+    """
+    with np.errstate(divide='ignore',invalid='ignore'):
+        diverged  = abs((VALUES[1:] - VALUES[:-1])/VALUES[:-1]) > tol
+    diverged &= np.arange(1,len(VALUES))[:,None] < n
+    replace   = diverged & (np.sum(diverged,axis=0) > 1)
+    VALUES    = VALUES.copy()
+    VALUES[1:][replace] = VALUES[:-1][replace]
+    return VALUES
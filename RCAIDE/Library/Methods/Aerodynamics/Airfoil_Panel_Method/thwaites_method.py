@@ -13,6 +13,8 @@ from RCAIDE.Framework.Core import Data
 # pacakge imports  
 import numpy as np
 
+from .surface_lanes import pack_surface_lanes, unpack_surface_lanes, replace_diverged_points
+
 def thwaites_method(npanel,ncases,ncpts,L,RE_L,X_I,VE_I, DVE_I,tol,THETA_0):
     """ Computes the boundary layer characteristics in laminar 
     flow pressure gradients
@@ -22,7 +24,7 @@ def thwaites_method(npanel,ncases,ncpts,L,RE_L,X_I,VE_I, DVE_I,tol,THETA_0):
     Aeronautical Quarterly 1.3 (1949): 245-280.
     
     Assumptions:
-    None  
+    The boundary layers of all cases and control points are marched along the surface together  
 
     Inputs:  
     npanel         - number of points on surface                                                 [unitless]
@@ -51,88 +53,62 @@ def thwaites_method(npanel,ncases,ncpts,L,RE_L,X_I,VE_I, DVE_I,tol,THETA_0):
     Properties Used:
     N/A
     """ 
-    # Initialize vectors
-    X_T          = np.zeros((npanel,ncases,ncpts))
-    THETA_T      = np.zeros_like(X_T)
-    DELTA_STAR_T = np.zeros_like(X_T)
-    H_T          = np.zeros_like(X_T)
-    CF_T         = np.zeros_like(X_T)
-    RE_THETA_T   = np.zeros_like(X_T)
-    RE_X_T       = np.zeros_like(X_T)
-    DELTA_T      = np.zeros_like(X_T)  
-      
-    for case in range(ncases):
-        for cpt in range(ncpts):
-            
-            def dy_by_dx(index, X, Y):
-                return 0.45*nu*Ve_i[index]**5            
-            
-            l              = L[case,cpt]
-            theta_0        = THETA_0 
-            Re_L           = RE_L[case,cpt]
-            nu             = l/Re_L    
-            x_i            = X_I.data[:,case,cpt][X_I.mask[:,case,cpt] ==False]
-            Ve_i           = VE_I.data[:,case,cpt][VE_I.mask[:,case,cpt] ==False]
-            dVe_i          = DVE_I.data[:,case,cpt][DVE_I.mask[:,case,cpt] ==False]
-            n              = len(x_i)
-            dx_i           = np.diff(x_i)
-            theta2_Ve6     = np.zeros(n)
-            theta2_Ve6[0]  = (theta_0**2)*Ve_i[0]**6
-            
-            # determine (Theta**2)*(Ve**6)
-            for i in range(1,n):
-                theta2_Ve6[i] = RK4(i-1, dx_i, x_i, theta2_Ve6, dy_by_dx)
-            
-            # Compute momentum thickness
-            theta       = np.sqrt(theta2_Ve6/Ve_i**6)
-            
-            # find theta values that do not converge and replace them with neighbor
-            idx1        = np.where(abs((theta[1:] - theta[:-1])/theta[:-1]) > tol)[0] 
-            if len(idx1)> 1:  
-                np.put(theta,idx1 + 1, theta[idx1])
-                
-            # Thwaites separation criteria 
-            lambda_val  = theta**2*dVe_i/nu 
-            
-            # Compute H 
-            H           = getH(lambda_val)
-            H[H<0]      = 1E-6   # H cannot be negative 
-            # find H values that do not converge and replace them with neighbor
-            idx1        = np.where(abs((H[1:] - H[:-1])/H[:-1]) > tol)[0]
-            if len(idx1)> 1: 
-                np.put(H,idx1 + 1, H[idx1]) 
-            
-            # Compute Reynolds numbers based on momentum thickness  
-            Re_theta    = Ve_i*theta/nu
-            
-            # Compute Reynolds numbers based on distance along airfoil
-            Re_x        = Ve_i*x_i/nu
-            
-            # Compute skin friction 
-            cf          = abs(getcf(lambda_val, Re_theta)) 
-            
-            # Compute displacement thickness
-            del_star    = H*theta   
-            
-            # Compute boundary layer thickness 
-            delta       = 5.2*x_i/np.sqrt(Re_x)
-            delta[0]    = 0   
-            
-            # Reynolds number at x=0 cannot be negative 
-            Re_x[0]     = 1E-5
-            
-            # Find where matrices are not masked 
-            indices = np.where(X_I.mask[:,case,cpt] == False)
-            
-            # Store results 
-            np.put(X_T[:,case,cpt],indices,x_i)
-            np.put(THETA_T[:,case,cpt],indices,theta)
-            np.put(DELTA_STAR_T[:,case,cpt],indices,del_star)
-            np.put(H_T[:,case,cpt],indices,H)
-            np.put(CF_T[:,case,cpt],indices ,cf)
-            np.put(RE_THETA_T[:,case,cpt],indices,Re_theta)
-            np.put(RE_X_T[:,case,cpt],indices,Re_x)
-            np.put(DELTA_T[:,case,cpt],indices,delta)
+    # pack the points of every case and control point into lanes that are marched along the surface together 
+    shape          = (npanel,ncases,ncpts)
+    x_i, order, n  = pack_surface_lanes(X_I, fill = 1.)
+    Ve_i, _, _     = pack_surface_lanes(VE_I, fill = 1.)
+    dVe_i, _, _    = pack_surface_lanes(DVE_I)
+    nu             = (L/RE_L).reshape(-1)
+    dx_i           = np.diff(x_i,axis = 0)
+    
+    # determine (Theta**2)*(Ve**6), the RK4 slope of each step only depends on the start of the step  
+    m              = 0.45*nu*Ve_i[:-1]**5
+    change         = (dx_i/6)*(m + 2*m + 2*m + m)
+    theta2_Ve6     = np.cumsum(np.concatenate([((THETA_0**2)*Ve_i[0]**6)[None,:],change],axis = 0),axis = 0)
+    
+    # Compute momentum thickness
+    theta          = np.sqrt(theta2_Ve6/Ve_i**6)
+    
+    # find theta values that do not converge and replace them with neighbor
+    theta          = replace_diverged_points(theta,n,tol)
+        
+    # Thwaites separation criteria 
+    lambda_val     = theta**2*dVe_i/nu 
+    
+    # Compute H 
+    H              = getH(lambda_val)
+    H[H<0]         = 1E-6   # H cannot be negative 
+    # find H values that do not converge and replace them with neighbor
+    H              = replace_diverged_points(H,n,tol)
+    
+    # Compute Reynolds numbers based on momentum thickness  
+    Re_theta       = Ve_i*theta/nu
+    
+    # Compute Reynolds numbers based on distance along airfoil
+    Re_x           = Ve_i*x_i/nu
+    
+    # Compute skin friction 
+    cf             = abs(getcf(lambda_val, Re_theta)) 
+    
+    # Compute displacement thickness
+    del_star       = H*theta   
+    
+    # Compute boundary layer thickness 
+    delta          = 5.2*x_i/np.sqrt(Re_x)
+    delta[0]       = 0   
+    
+    # Reynolds number at x=0 cannot be negative 
+    Re_x[0]        = 1E-5
+    
+    # Store results 
+    X_T            = unpack_surface_lanes(x_i,order,n,shape)
+    THETA_T        = unpack_surface_lanes(theta,order,n,shape)
+    DELTA_STAR_T   = unpack_surface_lanes(del_star,order,n,shape)
+    H_T            = unpack_surface_lanes(H,order,n,shape)
+    CF_T           = unpack_surface_lanes(cf,order,n,shape)
+    RE_THETA_T     = unpack_surface_lanes(Re_theta,order,n,shape)
+    RE_X_T         = unpack_surface_lanes(Re_x,order,n,shape)
+    DELTA_T        = unpack_surface_lanes(delta,order,n,shape)
     
     RESULTS = Data(
         X_T          = X_T,      
@@ -199,13 +175,3 @@ def getcf(lambda_val , Re_theta):
     cf      = 2*l/Re_theta  
     return cf
 
-
-def RK4(ind, dx, x, Var1, Slope1):
-    m1 = Slope1(ind,  x[ind],  Var1[ind])
-    m2 = Slope1(ind,  x[ind] + dx[ind]/2,  Var1[ind] + m1*dx[ind]/2)
-    m3 = Slope1(ind,  x[ind] + dx[ind]/2,  Var1[ind] + m2*dx[ind]/2)
-    m4 = Slope1(ind,  x[ind] + dx[ind],  Var1[ind] + m3*dx[ind])
-    
-    change = (dx[ind]/6)*(m1 + 2*m2 + 2*m3 + m4)
-    return Var1[ind] + change            
-            
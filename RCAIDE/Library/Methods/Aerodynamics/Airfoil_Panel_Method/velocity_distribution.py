@@ -46,11 +46,41 @@ def velocity_distribution(qg,x,y,xbar,ybar,st,ct,alpha_2d,npanel,ncases,ncpts):
     N/A
     """   
     # flow tangency boundary condition - source distribution  
-    vt_2d = ct *np.cos(alpha_2d) + st*np.sin(alpha_2d)
-    gamma = np.repeat(qg[-1,:,:][np.newaxis,:,:],npanel, axis = 0)  
+    vt_2d  = ct *np.cos(alpha_2d) + st*np.sin(alpha_2d)
     
+    # tangential velocities induced by the source/sink and vortex strengths 
+    vcoeff = velocity_coeff(x,y,xbar,ybar,st,ct,npanel,ncases,ncpts) 
+    vt_2d += np.einsum('abij,jab->iab',vcoeff,qg)
+    
+    return  vt_2d
+
+## @ingroup Methods-Aerodynamics-Airfoil_Panel_Method
+def velocity_coeff(x,y,xbar,ybar,st,ct,npanel,ncases,ncpts):
+    """Compute the matrix of the tangential velocities induced at the midpoint of each panel by the source/sink 
+    strength of each panel and by the vortex strength
+    
+    Source:
+    None
+
+    Assumptions:
+    None  
+    
+    Inputs:                                                    
+     x           -  Vector of x coordinates of the surface nodes  [unitless]         
+     y           -  Vector of y coordinates of the surface nodes  [unitless]            
+     xbar        -  x-coordinate of the midpoint of each panel    [unitless]           
+     ybar        -  y-coordinate of the midpoint of each panel    [unitless]           
+     st          -  np.sin(theta) for each panel                  [radians]                
+     ct          -  np.cos(theta) for each panel                  [radians]             
+     npanel      -  Number of panels on the airfoil               [unitless]  
+
+     Outputs:                                                        
+     vcoeff      -  Tangential velocity influence coefficient matrix, ncases x ncpts x npanel x npanel+1   [unitless]     
+
+    Properties Used:
+    N/A
+    """   
     # convert 1d matrices to 2d 
-    qg_2d                = np.repeat(qg[:-1,:,:][np.newaxis,:,:,:],npanel, axis = 0) 
     x_2d                 = np.repeat(np.swapaxes(np.swapaxes(x,0, 2),0,1)[:,:,np.newaxis,:],npanel, axis = 2)
     y_2d                 = np.repeat(np.swapaxes(np.swapaxes(y,0, 2),0,1)[:,:,np.newaxis,:],npanel, axis = 2)
     xbar_2d              = np.repeat(np.swapaxes(np.swapaxes(xbar,0, 2),0,1)[:,:,:,np.newaxis],npanel, axis = 3)
@@ -70,19 +100,10 @@ def velocity_distribution(qg,x,y,xbar,ybar,st,ct,alpha_2d,npanel,ncases,ncpts):
     r_ratio              = rij_dot_rij_plus_1/rij/rij_plus_1
     r_ratio[r_ratio>1.0] = 1.0 # numerical noise     
     betaij               = np.real(anglesign*np.arccos(r_ratio))     
-    # betaij[aoas,res,diag_indices,diag_indices] = np.pi
-    for i in range(ncases):
-        for j in range(ncpts):
-            np.fill_diagonal(betaij[i,j,:,:], np.pi)   
+    betaij[:,:,np.arange(npanel),np.arange(npanel)] = np.pi 
     
-    # swap axes 
-    sti_minus_j_2d  = np.swapaxes(np.swapaxes(sti_minus_j,0,2),1,3) 
-    betaij_2d       = np.swapaxes(np.swapaxes(betaij,0,2),1,3) 
-    cti_minus_j_2d  = np.swapaxes(np.swapaxes(cti_minus_j,0,2),1,3) 
-    rij_2d          = np.swapaxes(np.swapaxes(rij,0,2),1,3) 
-    rij_plus_1_2d   = np.swapaxes(np.swapaxes(rij_plus_1,0,2),1,3) 
-     
-    vt_2d += np.sum(qg_2d/2/np.pi*(sti_minus_j_2d*betaij_2d - cti_minus_j_2d*np.log(rij_plus_1_2d/rij_2d)),1)  + \
-             np.sum(gamma/2/np.pi*(sti_minus_j_2d*np.log(rij_plus_1_2d/rij_2d) + cti_minus_j_2d*betaij_2d),1)
+    vcoeff               = np.zeros((ncases,ncpts,npanel,npanel+1))
+    vcoeff[:,:,:,:-1]    = (sti_minus_j*betaij - cti_minus_j*np.log(rij_plus_1/rij))/2/np.pi
+    vcoeff[:,:,:,-1]     = np.sum((sti_minus_j*np.log(rij_plus_1/rij) + cti_minus_j*betaij)/2/np.pi,axis = 3)
     
-    return  vt_2d
+    return  vcoeff
@@ -8,10 +8,16 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------   
  
-from RCAIDE.Framework.Core import interp2d 
+from RCAIDE.Framework.Core import Data 
 
 # package imports 
 import numpy as np
+import hashlib
+from collections import OrderedDict
+
+# station lookup tables of the rotors last evaluated, keyed by hash of their airfoil polars and stations 
+airfoil_polar_table_cache      = OrderedDict()
+airfoil_polar_table_cache_size = 32
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  compute_airfoil_aerodynamics
@@ -69,29 +75,10 @@ def compute_airfoil_aerodynamics(beta,c,r,R,B,Wa,Wt,a,nu,airfoils,a_loc,ctrl_pts
     # If rotor airfoils are defined, use airfoil surrogate
     if a_loc != None:  
         # Compute blade Cl and Cd distribution from the airfoil data 
-        if use_2d_analysis:
-            # return the 2D Cl and CDval of shape (ctrl_pts, Nr, Na)
-            Cl      = np.zeros((ctrl_pts,Nr,Na))
-            Cdval   = np.zeros((ctrl_pts,Nr,Na))
-            for jj,airfoil in enumerate(airfoils):
-                pd              = airfoil.polars
-                Cl_af           = interp2d(Re,alpha,pd.reynolds_numbers, pd.angle_of_attacks, pd.lift_coefficients) 
-                Cdval_af        = interp2d(Re,alpha,pd.reynolds_numbers, pd.angle_of_attacks, pd.drag_coefficients)
-                locs            = np.where(np.array(a_loc) == jj )
-                Cl[:,locs,:]    = Cl_af[:,locs,:]
-                Cdval[:,locs,:] = Cdval_af[:,locs,:]
-        else:
-            # return the 1D Cl and CDval of shape (ctrl_pts, Nr)
-            Cl      = np.zeros((ctrl_pts,Nr))
-            Cdval   = np.zeros((ctrl_pts,Nr))
-
-            for jj,airfoil in enumerate(airfoils):
-                pd            = airfoil.polars
-                Cl_af         = interp2d(Re,alpha,pd.reynolds_numbers, pd.angle_of_attacks, pd.lift_coefficients)
-                Cdval_af      = interp2d(Re,alpha,pd.reynolds_numbers, pd.angle_of_attacks, pd.drag_coefficients)
-                locs          = np.where(np.array(a_loc) == jj )
-                Cl[:,locs]    = Cl_af[:,locs]
-                Cdval[:,locs] = Cdval_af[:,locs]
+        # return Cl and CDval of shape (ctrl_pts, Nr, Na) for 2D analysis or (ctrl_pts, Nr) for 1D analysis, 
+        # interpolating the polars of the airfoil of each radial station only 
+        tables     = compute_airfoil_polar_tables(airfoils,a_loc)
+        Cl, Cdval  = interpolate_airfoil_polar_tables(tables,Re,alpha)
     else:
         # Estimate Cl max
         tc_1 = tc*100
@@ -124,6 +111,197 @@ def compute_airfoil_aerodynamics(beta,c,r,R,B,Wa,Wt,a,nu,airfoils,a_loc,ctrl_pts
 
     return Cl, Cdval, alpha, Ma, W, Re  
 
+# ----------------------------------------------------------------------------------------------------------------------
+#  compute_airfoil_polar_tables
+# ----------------------------------------------------------------------------------------------------------------------   
+## @ingroup Methods-Aerodynamics-Common-Lift
+def compute_airfoil_polar_tables(airfoils,a_loc):
+    """
+    Stacks the lift and drag polars of the airfoils of a rotor into lookup tables indexed by radial station. Polars
+    with fewer Reynolds numbers or angles of attack than the others are padded with infinite grid points, which are
+    never bracketed. Tables are kept for the rotors last evaluated, so they are built once per rotor setup rather
+    than at every iteration of the wake solution.
+
+    Assumptions:
+    Each radial station uses the airfoil at index a_loc of airfoils
+
+    Source:
+    N/A
+
+    Inputs:
+       airfoils                   airfoils of the rotor, with polars              [-]
+       a_loc                      airfoil index of each radial station            [-]
+
+    Outputs:
+       tables.
+         reynolds_numbers             Reynolds numbers of each station, (Nr, nRe)     [-]
+         angle_of_attacks             angles of attack of each station, (Nr, nAoA)    [rad]
+         number_of_reynolds_numbers   grid points of each station                     [-]
+         number_of_angle_of_attacks   grid points of each station                     [-]
+         reynolds_number_indexing     'shared' if every station has the same grid,
+                                      'station' otherwise                             [-]
+         angle_of_attack_indexing     'uniform' if every station has the same
+                                      uniform grid, else as above                     [-]
+         coefficients                 lift and drag coefficients of each station,
+                                      (Nr, nRe, nAoA, 2)                              [-]
+    """
+    a_loc    = np.asarray(a_loc,dtype=int)
+    polars   = [airfoil.polars for airfoil in airfoils]
+
+    h = hashlib.sha1(a_loc.tobytes())
+    for pd in polars:
+        for values in [pd.reynolds_numbers,pd.angle_of_attacks,pd.lift_coefficients,pd.drag_coefficients]:
+            values = np.ascontiguousarray(values,dtype=float)
+            h.update(str(values.shape).encode())
+            h.update(values.tobytes())
+    key    = h.hexdigest()
+    tables = airfoil_polar_table_cache.pop(key,None)
+
+    if tables is None:
+        n_af   = len(polars)
+        n_Re   = np.array([len(pd.reynolds_numbers) for pd in polars])
+        n_AoA  = np.array([len(pd.angle_of_attacks) for pd in polars])
+        Re     = np.full((n_af,max(n_Re)),np.inf)
+        AoA    = np.full((n_af,max(n_AoA)),np.inf)
+        coeffs = np.zeros((n_af,max(n_Re),max(n_AoA),2))
+        for i, pd in enumerate(polars):
+            Re[i,:n_Re[i]]                   = pd.reynolds_numbers
+            AoA[i,:n_AoA[i]]                 = pd.angle_of_attacks
+            coeffs[i,:n_Re[i],:n_AoA[i],0]   = pd.lift_coefficients
+            coeffs[i,:n_Re[i],:n_AoA[i],1]   = pd.drag_coefficients
+
+        # angle of attack grids, such as the extended polars of compute_airfoil_properties, are usually shared and uniform
+        used    = np.unique(a_loc)
+        spacing = np.diff(AoA[used[0],:n_AoA[used[0]]])
+        uniform = n_AoA[used[0]] > 2 and np.allclose(spacing,spacing[0],rtol=1E-9,atol=0.)
+
+        tables = Data()
+        tables.reynolds_numbers           = Re[a_loc]
+        tables.angle_of_attacks           = AoA[a_loc]
+        tables.number_of_reynolds_numbers = n_Re[a_loc]
+        tables.number_of_angle_of_attacks = n_AoA[a_loc]
+        tables.reynolds_number_indexing   = grid_indexing(Re[used],False)
+        tables.angle_of_attack_indexing   = grid_indexing(AoA[used],uniform)
+        tables.coefficients               = coeffs[a_loc]
+
+    airfoil_polar_table_cache[key] = tables
+    while len(airfoil_polar_table_cache) > airfoil_polar_table_cache_size:
+        airfoil_polar_table_cache.popitem(last=False)
+
+    return tables
+
+## @ingroup Methods-Aerodynamics-Common-Lift
+def interpolate_airfoil_polar_tables(tables,Re,alpha):
+    """
+    Bilinear interpolation of the lift and drag coefficients of each radial station in the station lookup tables,
+    with the same bracketing and clamping as interp2d, in a single gather over all stations
+
+    Assumptions:
+    Radial stations are along axis 1 of Re and alpha
+
+    Source:
+    N/A
+
+    Inputs:
+       tables                     station lookup tables, see compute_airfoil_polar_tables  [-]
+       Re                         local Reynolds number, (ctrl_pts, Nr, ...)                [-]
+       alpha                      local angle of attack, (ctrl_pts, Nr, ...)                [rad]
+
+    Outputs:
+       Cl                         lift coefficients                                         [-]
+       Cdval                      drag coefficients                                         [-]
+    """
+    Nr       = Re.shape[1]
+    shape    = (1,Nr) + (1,)*(Re.ndim - 2)
+    station  = np.arange(Nr).reshape(shape)
+    ix       = grid_index(tables.reynolds_numbers,tables.number_of_reynolds_numbers,Re,shape,tables.reynolds_number_indexing)
+    iy       = grid_index(tables.angle_of_attacks,tables.number_of_angle_of_attacks,alpha,shape,tables.angle_of_attack_indexing)
+
+    xp       = tables.reynolds_numbers
+    yp       = tables.angle_of_attacks
+    x0       = xp[station,ix - 1]
+    x1       = xp[station,ix]
+    y0       = yp[station,iy - 1]
+    y1       = yp[station,iy]
+    wx       = (Re - x0)/(x1 - x0)
+    wy       = (alpha - y0)/(y1 - y0)
+
+    # gather the four corners of the lift and drag coefficients from the flattened tables
+    zp       = tables.coefficients
+    n_AoA    = zp.shape[2]
+    corner   = ((station*zp.shape[1] + ix - 1)*n_AoA + iy - 1)[...,None]*2 + np.arange(2)
+    zp       = zp.reshape(-1)
+    z_11     = np.take(zp,corner)
+    z_21     = np.take(zp,corner + 2*n_AoA)
+    z_12     = np.take(zp,corner + 2)
+    z_22     = np.take(zp,corner + 2*n_AoA + 2)
+
+    wx       = wx[...,None]
+    wy       = wy[...,None]
+    z        = (1 - wy)*((1 - wx)*z_11 + wx*z_21) + wy*((1 - wx)*z_12 + wx*z_22)
+
+    return z[...,0], z[...,1]
+
+def grid_indexing(grids,uniform):
+    """
+    Selects how values are located on the grids of the radial stations, see grid_index
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+       grids                      grid points of each airfoil used, (n_af, n_max) [-]
+       uniform                    flag if the first grid is uniform               [Boolean]
+
+    Outputs:
+       indexing                   'uniform', 'shared' or 'station'                [-]
+    """
+    if np.all(grids == grids[0]):
+        return 'uniform' if uniform else 'shared'
+    return 'station'
+
+def grid_index(grid,n,x,shape,indexing):
+    """
+    Index of the upper grid point bracketing each value, as np.searchsorted(grid, x, side="right") clipped to
+    [1, n - 1], on the grid of the radial station of each value. Grids shared by every station are searched once
+    and uniform grids are indexed directly.
+
+    Assumptions:
+    Radial stations are along axis 1 of x
+
+    Source:
+    N/A
+
+    Inputs:
+       grid                       grid points of each station, (Nr, n_max)        [-]
+       n                          number of grid points of each station           [-]
+       x                          values                                          [-]
+       shape                      broadcast shape of the station axis             [-]
+       indexing                   'uniform', 'shared' or 'station'                [-]
+
+    Outputs:
+       i                          grid index                                      [-]
+    """
+    if indexing == 'shared':
+        return np.clip(np.searchsorted(grid[0,:n[0]],x,side="right"),1,n[0] - 1)
+
+    if indexing == 'uniform':
+        points = grid[0,:n[0]]
+        with np.errstate(invalid='ignore'):
+            i  = np.floor((x - points[0])/(points[1] - points[0])).astype(int) + 1
+        i      = np.clip(i,0,n[0])
+
+        # correct roundoff in the division to the bracketing of searchsorted
+        i      = np.where((i > 0) & (points[np.maximum(i - 1,0)] > x),i - 1,i)
+        i      = np.where((i < n[0]) & (points[np.minimum(i,n[0] - 1)] <= x),i + 1,i)
+        return np.clip(i,1,n[0] - 1)
+
+    i = np.sum(grid.reshape(shape + (-1,)) <= x[...,None],axis=-1)
+    return np.clip(i,1,n.reshape(shape) - 1)
+
 # ----------------------------------------------------------------------------------------------------------------------
 #  compute_inflow_and_tip_loss
 # ----------------------------------------------------------------------------------------------------------------------   
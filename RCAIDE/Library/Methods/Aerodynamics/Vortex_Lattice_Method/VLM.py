@@ -14,8 +14,11 @@
 import numpy as np 
 from RCAIDE.Framework.Core import Data
 from .compute_wing_induced_velocity      import compute_wing_induced_velocity
-from .generate_vortex_distribution       import generate_vortex_distribution 
+from .compiled_induced_velocity          import select_induced_velocity_kernel
+from .cached_vortex_distribution         import cached_vortex_distribution 
 from .compute_RHS_matrix                 import compute_RHS_matrix 
+from .solve_AIC                          import solve_AIC 
+from .symmetric_half_model               import compute_panel_images, symmetric_conditions, half_model_panels, fold_AIC, mirror_receiver_rows
 
 # ----------------------------------------------------------------------
 #  Vortex Lattice
@@ -94,6 +97,11 @@ def VLM(conditions,settings,geometry):
     settings.discretize_control_surfaces       [Boolean], set to True to generate control surface panels
     settings.use_VORLAX_matrix_calculation     [boolean]
     settings.floating_point_precision          [float16/32/64]
+    settings.vortex_distribution_cache_size    [Unitless]
+    settings.AIC_factorization_cache_size      [Unitless]
+    settings.max_aic_memory                    [bytes], None builds the induced velocity matrix in a single block
+    settings.vlm_kernel                        ['numpy'/'numba'], induced velocity kernel
+    settings.use_symmetric_solve               [Boolean], set to True to solve symmetric flight conditions on half of a symmetric vehicle
        
     conditions.aerodynamics.angles.alpha    [radians]
     conditions.aerodynamics.angles.beta   [radians]
@@ -123,6 +131,38 @@ def VLM(conditions,settings,geometry):
         gamma                                  [Unitless], Vortex strengths of each panel
 
     
+    Properties Used:
+    N/A
+    """ 
+    stages = VLM_stages(conditions,settings,geometry)
+    A, m_unique, inv, RHS, key = next(stages)
+    return finish_VLM_stages(stages,solve_AIC(A,m_unique,inv,RHS,key,settings))
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def VLM_stages(conditions,settings,geometry):
+    """Runs the vortex lattice method of VLM as a generator that pauses at the solution of the vortex strengths. It
+    first yields the linear system, then receives its solution through send and returns the results of VLM. This
+    lets VLM_batch solve the systems of many geometries together.
+    
+    Assumptions:
+    See VLM
+    
+    Source:
+    See VLM
+    
+    Inputs:
+    See VLM
+    
+    Outputs:
+    yields:
+    A          - influence coefficient matrix of each unique Mach number    [Unitless]
+    m_unique   - unique Mach numbers                                        [Unitless]
+    inv        - index of the unique Mach number of each case               [Unitless]
+    RHS        - right-hand side of each case                               [Unitless]
+    key        - hash of the vortex distribution, None if not cached        [string]
+    returns:
+    results    - see VLM
+    
     Properties Used:
     N/A
     """ 
@@ -185,8 +225,8 @@ def VLM(conditions,settings,geometry):
     # ---------------------------------------------------------------------------------------
     # STEPS 1-9: Generate Panelization and Vortex Distribution
     # ------------------ --------------------------------------------------------------------    
-    # generate vortex distribution (VLM steps 1-9)
-    VD   = generate_vortex_distribution(geometry,settings)  
+    # generate vortex distribution (VLM steps 1-9), reusing the panelization of an unchanged geometry
+    VD   = cached_vortex_distribution(geometry,settings)  
     
     if not VD.is_postprocessed:
         raise ValueError('postprocess_VD has not been called since the panels have been modified')
@@ -245,30 +285,57 @@ def VLM(conditions,settings,geometry):
     RHS     = rhs.RHS*1
     ONSET   = rhs.ONSET*1
 
+    # Solve symmetric flight conditions of a symmetric vehicle on its starboard half, with the images of its vortices
+    use_symmetric_solve = settings.use_symmetric_solve if ('use_symmetric_solve' in settings.keys()) else False
+    if use_symmetric_solve and 'panel_images' not in VD:
+        VD.panel_images = compute_panel_images(VD)
+    symmetric = use_symmetric_solve and symmetric_conditions(RHS,VD.panel_images)
+    if symmetric:
+        half, receivers = half_model_panels(VD,VD.panel_images)
+    else:
+        receivers = None
+        
     # Build induced velocity matrix, C_mn
     # This is not affected by AoA, so we can use unique mach numbers only
     m_unique, inv = np.unique(mach,return_inverse=True)
     m_unique      = np.atleast_2d(m_unique).T
-    C_mn_small, s, RFLAG_small, EW_small = compute_wing_induced_velocity(VD,m_unique,compute_EW=True)
+    max_aic_memory = settings.max_aic_memory if ('max_aic_memory' in settings.keys()) else None
+    kernel         = select_induced_velocity_kernel(settings.vlm_kernel if ('vlm_kernel' in settings.keys()) else 'numpy')
+    C_mn_small, s, RFLAG_small, EW_small = compute_wing_induced_velocity(VD,m_unique,compute_EW=True,max_memory=max_aic_memory,kernel=kernel,receivers=receivers)
     
-    C_mn  = C_mn_small[inv,:,:,:]
     RFLAG = RFLAG_small[inv,:]
-    EW    = EW_small[inv,:,:]
 
     # Turn off sonic vortices when Mach>1
     RHS = RHS*RFLAG
     
-    # Build Aerodynamic Influence Coefficient Matrix
+    # Build Aerodynamic Influence Coefficient Matrix of each unique mach number
+    rows = slice(None) if receivers is None else receivers
     use_VORLAX_induced_velocity = settings.use_VORLAX_matrix_calculation
     if not use_VORLAX_induced_velocity:
-        A =   np.multiply(C_mn[:,:,:,0],np.atleast_3d(np.sin(delta)*np.cos(phi))) \
-            + np.multiply(C_mn[:,:,:,1],np.atleast_3d(np.cos(delta)*np.sin(phi))) \
-            - np.multiply(C_mn[:,:,:,2],np.atleast_3d(np.cos(phi)*np.cos(delta)))   # validated from book eqn 7.42 
+        # accumulated in place to limit the number of full size temporaries
+        A  =  np.multiply(C_mn_small[:,:,:,0],np.atleast_3d(np.sin(delta[:1,rows])*np.cos(phi[:1,rows]))) 
+        A +=  np.multiply(C_mn_small[:,:,:,1],np.atleast_3d(np.cos(delta[:1,rows])*np.sin(phi[:1,rows]))) 
+        A -=  np.multiply(C_mn_small[:,:,:,2],np.atleast_3d(np.cos(phi[:1,rows])*np.cos(delta[:1,rows])))   # validated from book eqn 7.42 
     else:
-        A = EW
-
-    # Compute vortex strength
-    GAMMA  = np.linalg.solve(A,RHS)
+        A = EW_small
+
+    # Compute vortex strength, factoring A once per unique mach number
+    key    = VD.geometry_key if 'geometry_key' in VD else None
+    if symmetric:
+        # images carry the same vortex strength, panels in the plane of symmetry carry none
+        images           = VD.panel_images
+        key              = None if key is None else key + '_symmetric'
+        GAMMA_half       = yield fold_AIC(A,half,receivers,images), m_unique, inv, RHS[:,half], key
+        GAMMA            = np.zeros(RHS.shape,dtype=GAMMA_half.dtype)
+        GAMMA[:,half]    = GAMMA_half
+        GAMMA[:,images[half]] = GAMMA_half
+        
+        # normalwash of the leading edge panels of the full vehicle
+        EW_LE = mirror_receiver_rows(EW_small,receivers,images,np.where(LE_ind)[0])
+    else:
+        GAMMA  = yield A, m_unique, inv, RHS, key
+        EW_LE  = EW_small[:,LE_ind,:]
+    EW = EW_LE[inv,:,:]
 
     # ---------------------------------------------------------------------------------------
     # STEP 11: Compute Pressure Coefficient
@@ -537,16 +604,43 @@ def VLM(conditions,settings,geometry):
     
     return results
 
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def finish_VLM_stages(stages,GAMMA):
+    """ Sends the vortex strengths to a VLM_stages generator paused at its linear system and returns its results
+    
+    Assumptions:
+    None
+    
+    Source:
+    None
+    
+    Inputs:
+    stages     - VLM_stages generator, paused at its linear system          [-]
+    GAMMA      - solution of the linear system                              [Unitless]
+    
+    Outputs:
+    results    - see VLM
+    
+    Properties Used:
+    N/A
+    """
+    try:
+        stages.send(GAMMA)
+    except StopIteration as stop:
+        return stop.value
+    raise RuntimeError('VLM_stages yielded more than one linear system')
+
 # ----------------------------------------------------------------------
 #  CLE rotation effects helper function
 # ----------------------------------------------------------------------
-def compute_rotation_effects(VD, settings, EW_small, GAMMA, len_mach, X, CHORD, XLE, XBAR, 
+def compute_rotation_effects(VD, settings, EW_LE, GAMMA, len_mach, X, CHORD, XLE, XBAR, 
                              rhs, COSINP, SINALF, PITCH, ROLL, YAW, STB, RNMAX):
     """ This computes the effects of the freestream and aircraft rotation rate on 
     CLE, the induced flow at the leading edge
     
     Assumptions:
     Several of the values needed in this calculation have been computed earlier and stored in VD
+    EW_LE holds the normalwash at the leading edge panels only
     
     Normally, VORLAX skips the calculation implemented in this function for linear 
     chordwise spacing (the if statement below). However, since the trends are correct, 
@@ -560,8 +654,8 @@ def compute_rotation_effects(VD, settings, EW_small, GAMMA, len_mach, X, CHORD,
     ##    return 0 #CLE not calculated till later for linear spacing
     
     # Computate rotational effects (pitch, roll, yaw rates) on LE suction
-    # pick leading edge strip values for EW and reshape GAMMA -> gamma accordingly
-    EW    = EW_small[: ,LE_ind, :]
+    # leading edge strip values of EW, reshape GAMMA -> gamma accordingly
+    EW    = EW_LE
     n_tot_strips = EW.shape[1]
     gamma = np.array(np.split(np.repeat(GAMMA, n_tot_strips, axis=0), len_mach))
     CLE = (EW*gamma).sum(axis=2)
@@ -0,0 +1,118 @@
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+# VLM_batch.py
+#
+# Created:  Oct 2026, agent
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+# package imports
+import numpy as np
+from .VLM import VLM_stages, finish_VLM_stages
+
+# ----------------------------------------------------------------------
+#  VLM Batch
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def VLM_batch(geometries,conditions,settings):
+    """Runs the vortex lattice method of VLM on several geometries at the same conditions, as in a planform trade
+    study. The linear systems of a group of geometries are padded to a common number of panels and solved together
+    in a single batched call, instead of one geometry and one Mach number at a time.
+
+    Assumptions:
+    Padded panels carry no vortex strength: their rows and columns are those of the identity matrix and their
+    right-hand sides are zero.
+    Geometries are grouped so that the stacked influence coefficient matrices of a group fit in
+    settings.max_aic_memory, if set. The factorizations are not kept in the cache of solve_AIC.
+
+    Source:
+    None
+
+    Inputs:
+    geometries                  list of vehicles                                        [-]
+    conditions                  see VLM                                                 [-]
+    settings                    see VLM
+    settings.max_aic_memory     [bytes], None solves every geometry in a single batch
+
+    Outputs:
+    results                     list of the results of VLM of each geometry              [-]
+
+    Properties Used:
+    N/A
+    """
+    max_memory = settings.max_aic_memory if ('max_aic_memory' in settings.keys()) else None
+    results    = []
+    stages     = []
+    systems    = []
+    size       = 0
+    for geometry in geometries:
+        stage  = VLM_stages(conditions,settings,geometry)
+        system = next(stage)
+        stages.append(stage)
+        systems.append(system)
+        size  += system[0].nbytes
+
+        # solve the group once the next geometry could exceed the memory limit
+        if max_memory is not None and size + size/len(stages) > max_memory:
+            results += [finish_VLM_stages(stage,GAMMA) for stage, GAMMA in zip(stages,solve_AIC_batch(systems))]
+            stages  = []
+            systems = []
+            size    = 0
+
+    if len(stages) > 0:
+        results += [finish_VLM_stages(stage,GAMMA) for stage, GAMMA in zip(stages,solve_AIC_batch(systems))]
+
+    return results
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def solve_AIC_batch(systems):
+    """ Solves the vortex lattice systems of several geometries with a single batched solve over every geometry and
+    unique Mach number. Systems are padded to the largest number of panels and the cases of each Mach number to the
+    largest number of cases.
+
+    Assumptions:
+    Every system has the same unique Mach numbers and cases, as geometries share the conditions.
+
+    Source:
+    None
+
+    Inputs:
+    systems    list of the linear systems of VLM_stages, (A, m_unique, inv, RHS, key)     [-]
+
+    Outputs:
+    GAMMA      list of the vortex strengths of each system                                  [Unitless]
+
+    Properties Used:
+    N/A
+    """
+    n_geom   = len(systems)
+    inv      = systems[0][2]
+    n_mach   = systems[0][0].shape[0]
+    n_panels = max([RHS.shape[1] for _, _, _, RHS, _ in systems])
+    dtype    = np.result_type(*[array for A, _, _, RHS, _ in systems for array in [A,RHS]])
+    cases    = [np.where(inv == i)[0] for i in range(n_mach)]
+    n_cases  = max([len(case) for case in cases])
+
+    # padded panels are decoupled from the others and carry no vortex strength
+    A_batch   = np.zeros((n_geom,n_mach,n_panels,n_panels),dtype=dtype)
+    RHS_batch = np.zeros((n_geom,n_mach,n_panels,n_cases),dtype=dtype)
+    A_batch[...,np.arange(n_panels),np.arange(n_panels)] = 1.
+    for g, (A, _, _, RHS, _) in enumerate(systems):
+        n = RHS.shape[1]
+        A_batch[g,:,:n,:n] = A
+        for i, case in enumerate(cases):
+            RHS_batch[g,i,:n,:len(case)] = RHS[case].T
+
+    GAMMA_batch = np.linalg.solve(A_batch,RHS_batch)
+
+    GAMMA = []
+    for g, (_, _, _, RHS, _) in enumerate(systems):
+        n       = RHS.shape[1]
+        GAMMA_g = np.zeros(RHS.shape,dtype=dtype)
+        for i, case in enumerate(cases):
+            GAMMA_g[case] = GAMMA_batch[g,i,:n,:len(case)].T
+        GAMMA.append(GAMMA_g)
+
+    return GAMMA
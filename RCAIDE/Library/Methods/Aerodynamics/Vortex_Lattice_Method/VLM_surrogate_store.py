@@ -0,0 +1,182 @@
+## @ingroup  Library-Methods-Aerodynamics-Vortex_Lattice_Method
+# RCAIDE/Library/Methods/Aerodynamics/Vortex_Lattice_Method/VLM_surrogate_store.py
+#
+# Created:  Oct 2026, agent
+# Modified: Oct 2026, agent
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+
+# RCAIDE imports
+from RCAIDE.Framework.Core import  Data
+from RCAIDE.Library.Methods.Utilities import Content_Addressed_Store, compute_hash, flatten_data, unflatten_data
+from .cached_vortex_distribution import cached_vortex_distribution, VD_settings_keys
+
+# package imports
+import os
+from copy import deepcopy
+
+# training data of every geometry and training grid trained in this process, keyed by hash
+VLM_surrogate_store = Content_Addressed_Store()
+
+# increment when the training data produced by train_VLM_surrogates changes, invalidating stored training data
+VLM_surrogate_store_version = 4
+
+# settings, in addition to the panelization, that change the training data
+VLM_settings_keys = ['use_VORLAX_matrix_calculation','leading_edge_suction_multiplier','propeller_wake_model']
+
+# analysis attributes set by train_VLM_surrogates
+VLM_surrogate_flags = ['aileron_flag','flap_flag','rudder_flag','elevator_flag','slat_flag']
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  VLM Surrogate Store
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Library-Methods-Aerodynamics-Vortex_Lattice_Method
+def load_VLM_surrogates(aerodynamics):
+    """Loads the training data of a previous training run of the same lifting surfaces, reference values and training
+    grid, from memory or from settings.surrogate_store_directory. Analyses of different configurations, and aerodynamic
+    and stability analyses, share a training run. As after training, the geometry is left with its vortex
+    distribution, which is reused from the vortex distribution cache when possible.
+
+    Assumptions:
+        Control surface deflections of the configuration are not part of the key since training sets them to zero.
+
+    Source:
+        None
+
+    Args:
+        aerodynamics       : VLM analysis          [unitless]
+
+    Returns:
+        loaded             : True if stored training data was found        [boolean]
+    """
+    key    = compute_VLM_surrogate_key(aerodynamics)
+    stored = VLM_surrogate_store.load(key,get_store_directory(aerodynamics.settings))
+
+    if stored is None:
+        return False
+
+    data = unflatten_data(stored)
+    aerodynamics.training.subsonic   = data.training.subsonic
+    aerodynamics.training.supersonic = data.training.supersonic
+    aerodynamics.training.transonic  = data.training.transonic
+    for name,value in data.reference_values.items():
+        aerodynamics.reference_values[name] = value
+    for flag in VLM_surrogate_flags:
+        if data[flag]:
+            aerodynamics[flag] = True
+
+    # training leaves every control surface undeflected
+    for wing in aerodynamics.geometry.wings:
+        for control_surface in wing.control_surfaces:
+            control_surface.deflection = 0.0
+
+    # training leaves the vortex distribution of the undeflected geometry on the geometry
+    cached_vortex_distribution(aerodynamics.geometry,aerodynamics.settings)
+
+    return True
+
+## @ingroup Library-Methods-Aerodynamics-Vortex_Lattice_Method
+def save_VLM_surrogates(aerodynamics):
+    """Stores the training data of an analysis in memory and, if settings.surrogate_store_directory is set, on disk.
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Args:
+        aerodynamics       : VLM analysis          [unitless]
+
+    Returns:
+        None
+    """
+    key                  = compute_VLM_surrogate_key(aerodynamics)
+    data                 = Data()
+    data.training        = Data()
+    data.training.subsonic   = aerodynamics.training.subsonic
+    data.training.supersonic = aerodynamics.training.supersonic
+    data.training.transonic  = aerodynamics.training.transonic
+    data.reference_values    = aerodynamics.reference_values
+    for flag in VLM_surrogate_flags:
+        data[flag] = aerodynamics[flag]
+
+    VLM_surrogate_store.save(key,flatten_data(data),get_store_directory(aerodynamics.settings))
+
+    return
+
+## @ingroup Library-Methods-Aerodynamics-Vortex_Lattice_Method
+def clear_VLM_surrogate_store():
+    """Empties the in memory store of training data, files on disk are kept.
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    VLM_surrogate_store.clear()
+    return
+
+## @ingroup Library-Methods-Aerodynamics-Vortex_Lattice_Method
+def compute_VLM_surrogate_key(aerodynamics):
+    """Hashes the geometry, settings and training grid that define the training data of a VLM analysis.
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Args:
+        aerodynamics       : VLM analysis          [unitless]
+
+    Returns:
+        key                : hash                  [string]
+    """
+    geometry = aerodynamics.geometry
+    settings = aerodynamics.settings
+
+    # training sets every control surface deflection to zero before sampling
+    wings = deepcopy(geometry.wings)
+    for wing in wings:
+        for control_surface in wing.control_surfaces:
+            control_surface.deflection = 0.0
+
+    settings_values = [settings[key] if key in settings.keys() else None for key in VD_settings_keys + VLM_settings_keys]
+    networks        = geometry.networks if settings.propeller_wake_model else None
+    training        = [(key,aerodynamics.training[key]) for key in sorted(aerodynamics.training.keys())
+                       if key not in ['subsonic','supersonic','transonic']]
+
+    return compute_hash(VLM_surrogate_store_version,wings,geometry.fuselages,geometry.reference_area,
+                        geometry.mass_properties.center_of_gravity,settings_values,networks,training)
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Library-Methods-Aerodynamics-Vortex_Lattice_Method
+def get_store_directory(settings):
+    """Returns the directory of the on disk store, or None if training data is only shared in memory.
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Args:
+        settings.surrogate_store_directory    [string]
+
+    Returns:
+        directory                             [string]
+    """
+    if 'surrogate_store_directory' not in settings.keys() or settings.surrogate_store_directory is None:
+        return None
+    return os.path.expanduser(settings.surrogate_store_directory)
@@ -15,10 +15,16 @@ from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.generate_VD_h
 from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.make_VLM_wings            import make_VLM_wings  
 from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.deflect_control_surface   import deflect_control_surface
 from .compute_RHS_matrix                      import compute_RHS_matrix 
+from .compiled_induced_velocity               import compiled_induced_velocity, select_induced_velocity_kernel
 from .compute_wing_induced_velocity           import compute_wing_induced_velocity 
 from .generate_vortex_distribution            import generate_vortex_distribution
+from .cached_vortex_distribution              import cached_vortex_distribution, clear_vortex_distribution_cache
+from .solve_AIC                               import solve_AIC, clear_AIC_cache
+from .symmetric_half_model                    import compute_panel_images, symmetric_conditions
 from .train_VLM_surrogates                    import train_VLM_surrogates
+from .VLM_surrogate_store                     import load_VLM_surrogates, save_VLM_surrogates, clear_VLM_surrogate_store
 from .build_VLM_surrogates                    import build_VLM_surrogates 
 from .VLM                                     import VLM
+from .VLM_batch                               import VLM_batch
 from .evaluate_VLM import *  
 
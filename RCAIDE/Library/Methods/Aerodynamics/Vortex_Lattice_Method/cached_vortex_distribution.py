@@ -0,0 +1,118 @@
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+# cached_vortex_distribution.py
+#
+# Created:  Oct 2026, agent
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+# package imports
+from collections import OrderedDict
+from .generate_vortex_distribution import generate_vortex_distribution
+from RCAIDE.Library.Methods.Utilities.hash_data import compute_hash
+
+# vortex distributions of recently panelized geometries, least recently used first
+VD_cache = OrderedDict()
+
+# settings that change the panelization
+VD_settings_keys = ['number_of_spanwise_vortices','number_of_chordwise_vortices','wing_spanwise_vortices',
+                    'wing_chordwise_vortices','fuselage_spanwise_vortices','fuselage_chordwise_vortices',
+                    'spanwise_cosine_spacing','model_fuselage','floating_point_precision','discretize_control_surfaces']
+
+# ----------------------------------------------------------------------
+#  Cached Vortex Distribution
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def cached_vortex_distribution(geometry,settings):
+    """ Returns the vortex distribution of the geometry, reusing a previously generated vortex distribution if the
+    wings (planform, airfoils and control surface deflections), fuselages and discretization settings are unchanged.
+    Cached vortex distributions are evicted least recently used first.
+
+    Assumptions:
+    Geometries are identified by the content of geometry.wings, geometry.fuselages and the discretization settings.
+    A cached vortex distribution whose panels have been modified (VD.is_postprocessed is False) is regenerated.
+
+    Source:
+    None
+
+    Inputs:
+    geometry.wings                                [Unitless]
+    geometry.fuselages                            [Unitless]
+    settings.vortex_distribution_cache_size       [Unitless], 0 disables the cache
+    settings (see generate_vortex_distribution)
+
+    Outputs:
+    VD - vehicle vortex distribution              [Unitless]
+
+    Properties Used:
+    N/A
+    """
+    cache_size = settings.vortex_distribution_cache_size if ('vortex_distribution_cache_size' in settings.keys()) else 0
+    if not cache_size:
+        return generate_vortex_distribution(geometry,settings)
+
+    key = compute_vortex_distribution_key(geometry,settings)
+    VD  = VD_cache.pop(key,None)
+
+    # invalidate vortex distributions whose panels have been modified since they were postprocessed
+    if VD is None or not VD.is_postprocessed:
+        VD = generate_vortex_distribution(geometry,settings)
+    else:
+        geometry.vortex_distribution = VD
+
+    # identifies the geometry when reusing influence coefficient matrix factorizations
+    VD.geometry_key = key
+    VD_cache[key]   = VD
+    while len(VD_cache) > cache_size:
+        VD_cache.popitem(last=False)
+
+    return VD
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def clear_vortex_distribution_cache():
+    """ Empties the vortex distribution cache
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    None
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    VD_cache.clear()
+    return
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def compute_vortex_distribution_key(geometry,settings):
+    """ Hashes the content of the geometry and settings that define the vortex distribution
+
+    Assumptions:
+    Objects that are not data, arrays, numbers or strings are identified by their type
+
+    Source:
+    None
+
+    Inputs:
+    geometry.wings                                [Unitless]
+    geometry.fuselages                            [Unitless]
+    settings                                      [Unitless]
+
+    Outputs:
+    key                                           [string]
+
+    Properties Used:
+    N/A
+    """
+    settings_values = [settings[key] if key in settings.keys() else None for key in VD_settings_keys]
+
+    return compute_hash(geometry.wings,geometry.fuselages,*settings_values)
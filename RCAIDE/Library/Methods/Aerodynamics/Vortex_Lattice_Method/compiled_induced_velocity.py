@@ -0,0 +1,231 @@
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+# compiled_induced_velocity.py
+#
+# Created:  Oct 2026, agent
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+# package imports
+import numpy as np
+import warnings
+
+# numba is optional, without it the kernel runs as plain python, which is only practical for small lattices
+try:
+    from numba import njit, prange
+    numba_available = True
+except ImportError:
+    numba_available = False
+    prange          = range
+    def njit(*args,**kwargs):
+        return lambda function: function
+
+# ----------------------------------------------------------------------
+#  Select Kernel
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def select_induced_velocity_kernel(kernel):
+    """ Returns the induced velocity kernel to use, falling back to numpy if numba is not installed
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    kernel   - requested kernel, 'numpy' or 'numba'               [string]
+
+    Outputs:
+    kernel   - available kernel, 'numpy' or 'numba'               [string]
+
+    Properties Used:
+    N/A
+    """
+    if kernel not in ['numpy','numba']:
+        raise ValueError("VLM kernel must be 'numpy' or 'numba', not '" + str(kernel) + "'")
+    if kernel == 'numba' and not numba_available:
+        warnings.warn('numba is not installed, using the numpy VLM kernel',RuntimeWarning)
+        kernel = 'numpy'
+    return kernel
+
+# ----------------------------------------------------------------------
+#  Compiled Induced Velocity
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+@njit(parallel=True,cache=True,error_model='numpy')
+def compiled_induced_velocity(XO,YO,ZO,xc,yc,zc,costheta,sintheta,s,t,TOL,TOLSQ,TOLSQ2,COX,B2,rows,U,V,W):
+    """ This computes the velocities induced on a block of control points by every horseshoe vortex, evaluating
+    each control point, horseshoe and mach number in a single fused loop that is parallel over control points.
+    The algebra follows subsonic, supersonic and supersonic_in_plane of compute_wing_induced_velocity, which
+    remains the reference implementation.
+
+    Assumptions:
+    Trailing vortex legs infinity are alligned to freestream
+    Sonic vortex flags are applied afterwards by apply_sonic_flags
+
+    Source:
+    1. Miranda, Luis R., Robert D. Elliot, and William M. Baker. "A generalized vortex
+    lattice method for subsonic and supersonic flow applications." (1977). (NASA CR)
+
+    2. VORLAX Source Code
+
+    Inputs:
+    XO, YO, ZO           control points of the block                        [m]
+    xc, yc, zc           middle front of each horseshoe vortex              [m]
+    costheta, sintheta   inclination of each horseshoe vortex               [-]
+    s                    semispan of each horseshoe vortex                  [m]
+    t                    tangent of each horseshoe vortex                   [-]
+    TOL, TOLSQ, TOLSQ2   numerical tolerances of each horseshoe vortex      [-]
+    COX                  chordwise length of each panel                     [m]
+    B2                   mach^2-1 (-beta2) of each mach number              [-]
+    rows                 indices of the control points of the block         [-]
+
+    Outputs:
+    U                    X velocity, (n_mach, n_block, n_cp)                 [unitless]
+    V                    Y velocity, (n_mach, n_block, n_cp)                 [unitless]
+    W                    Z velocity, (n_mach, n_block, n_cp)                 [unitless]
+
+    Properties Used:
+    N/A
+    """
+    n_mach = B2.shape[0]
+    n_rows = XO.shape[0]
+    n_cp   = xc.shape[0]
+
+    # constants of the float32 reference implementation
+    zero   = np.float32(0.)
+    one    = np.float32(1.)
+    half   = np.float32(0.5)
+    CUTOFF = np.float32(0.8)
+    CPI_4  = np.float32(4*np.pi)
+    CPI_2  = np.float32(2*np.pi)
+
+    for i in prange(n_rows):
+        for j in range(n_cp):
+
+            # rotated axes and coordinates of the receiving point with respect to the end points of the skewed leg
+            T      = t[j]
+            xobar  = XO[i] - xc[j]
+            yobar  = (YO[i] - yc[j])*costheta[j] + (ZO[i] - zc[j])*sintheta[j]
+            Z      =-(YO[i] - yc[j])*sintheta[j] + (ZO[i] - zc[j])*costheta[j]
+            X1     = xobar + T*s[j]
+            Y1     = yobar + s[j]
+            X2     = xobar - T*s[j]
+            Y2     = yobar - s[j]
+            XTY    = xobar - T*yobar
+            ZSQ    = Z *Z
+            RTV1   = Y1 *Y1 + ZSQ
+            RTV2   = Y2 *Y2 + ZSQ
+            XSQ1   = X1 *X1
+            XSQ2   = X2 *X2
+
+            for m in range(n_mach):
+                b2  = B2[m]
+                RO1 = b2*RTV1
+                RO2 = b2*RTV2
+
+                if b2 < zero:
+                    # subsonic horseshoe vortex
+                    RAD1  = np.sqrt(XSQ1 - RO1)
+                    RAD2  = np.sqrt(XSQ2 - RO2)
+                    DENOM = XTY * XTY + (T*T-b2)*ZSQ
+                    if DENOM < TOLSQ[j]:
+                        DENOM = TOLSQ[j]
+                    FB1 = (T *X1 - b2 *Y1) /RAD1
+                    FT1 = (X1 + RAD1) /(RAD1 *RTV1)
+                    if RTV1 < TOLSQ[j]:
+                        FT1 = zero
+                    FB2 = (T *X2 - b2 *Y2) /RAD2
+                    FT2 = (X2 + RAD2) /(RAD2 *RTV2)
+                    if RTV2 < TOLSQ[j]:
+                        FT2 = zero
+                    QB     = (FB1 - FB2) /DENOM
+                    ZETAPI = Z /CPI_4
+                    u      = ZETAPI *QB
+                    v      = ZETAPI * (FT1 - FT2 - QB *T)
+                    if ZSQ < TOLSQ[j]:
+                        u = zero
+                        v = zero
+                    w      = - (QB *XTY + FT1 *Y1 - FT2 *Y2) /CPI_4
+                else:
+                    # supersonic horseshoe vortex
+                    T2   = T*T
+                    RAD1 = np.sqrt(XSQ1 - RO1)
+                    RAD2 = np.sqrt(XSQ2 - RO2)
+                    if np.isnan(RAD1):
+                        RAD1 = zero
+                    if np.isnan(RAD2):
+                        RAD2 = zero
+                    DENOM = XTY * XTY + (T2 - b2) *ZSQ
+                    if abs(DENOM) < TOLSQ[j]:
+                        DENOM = -TOLSQ[j] if DENOM < zero else TOLSQ[j]
+
+                    bool1 = RAD1 != zero
+                    if X1 < TOL[j]:
+                        bool1 = False
+                        RAD1  = zero
+                    if RO1 > CUTOFF*XSQ1:
+                        bool1 = False
+                    FB1 = (T*X1-b2*Y1)/RAD1
+                    FT1 = X1/(RAD1*RTV1)
+                    if RTV1 < TOLSQ[j]:
+                        FT1 = zero
+                    if np.isnan(FB1) or np.isinf(FB1):
+                        FB1 = one
+                    if np.isnan(FT1) or np.isinf(FT1):
+                        FT1 = one
+                    if not bool1:
+                        FB1 = zero
+                        FT1 = zero
+
+                    bool2 = RAD2 != zero
+                    if X2 < TOL[j]:
+                        bool2 = False
+                        RAD2  = zero
+                    if RO2 > CUTOFF*XSQ2:
+                        bool2 = False
+                    FB2 = (T *X2 - b2 *Y2)/RAD2
+                    FT2 = X2 /(RAD2 *RTV2)
+                    if RTV2 < TOLSQ[j]:
+                        FT2 = zero
+                    if np.isnan(FB2) or np.isinf(FB2):
+                        FB2 = one
+                    if np.isnan(FT2) or np.isinf(FT2):
+                        FT2 = one
+                    if not bool2:
+                        FB2 = zero
+                        FT2 = zero
+
+                    QB     = (FB1 - FB2) /DENOM
+                    ZETAPI = Z/CPI_2
+                    u      = ZETAPI *QB
+                    v      = ZETAPI *(FT1 - FT2 - QB *T)
+                    w      = - (QB *XTY + FT1 *Y1 - FT2 *Y2) /CPI_2
+
+                    # receiving point in the plane of the horseshoe
+                    if ZSQ < TOLSQ2[j]:
+                        F1 = 0.
+                        F2 = 0.
+                        if abs(Y1) > TOL[j]:
+                            F1 = np.float64(RAD1/Y1)
+                        if abs(Y2) > TOL[j]:
+                            F2 = np.float64(RAD2/Y2)
+                        u = zero
+                        v = zero
+                        w = zero
+                        if abs(XTY) > TOL[j]:
+                            w = np.float32((-F1 + F2)/np.float64(XTY*CPI_2))
+
+                    # generalized principal part of the vortex-induced velocity integral of the vortex on itself
+                    if rows[i] == j and b2 > T2:
+                        w = w + np.float32(- half *np.sqrt(b2 - T2)/COX[j])
+
+                U[m,i,j] = u
+                V[m,i,j] = v
+                W[m,i,j] = w
+
+    return
@@ -9,11 +9,17 @@
 #  Imports
 # ----------------------------------------------------------------------
 
+# RCAIDE imports
+from .compiled_induced_velocity import compiled_induced_velocity
+
 # package imports 
 import numpy as np 
 
+# approximate peak memory of the temporary arrays per mach number, receiving point and horseshoe
+BYTES_PER_ELEMENT = 96
+
 ## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
-def compute_wing_induced_velocity(VD,mach,compute_EW=False):
+def compute_wing_induced_velocity(VD,mach,compute_EW=False,max_memory=None,kernel='numpy',receivers=None):
     """ This computes the induced velocities at each control point of the vehicle vortex lattice 
 
     Assumptions: 
@@ -31,6 +37,12 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     Inputs: 
     VD       - vehicle vortex distribution                    [Unitless] 
     mach                                                      [Unitless] 
+    compute_EW - compute the normalwash in the VORLAX frame   [boolean] 
+    max_memory - memory limit of the temporary arrays, None   [bytes] 
+                 evaluates every control point at once 
+    kernel     - 'numpy', or 'numba' for the compiled kernel  [string] 
+    receivers  - control points at which the velocities are  [-] 
+                 induced, None for every control point 
     
     Outputs:                                
     C_mn     - total induced velocity matrix                  [Unitless] 
@@ -48,6 +60,7 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     TE_ind       = VD.trailing_edge_indices
     n_cp         = VD.n_cp
     n_mach       = len(mach)
+    n_rec        = n_cp if receivers is None else len(receivers)
     mach         = np.array(mach,dtype=np.float32)
 
     # Control points from the VLM 
@@ -113,9 +126,9 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     zc = 0.5*(za+zb)
     
     # This is the receiving point, or the control points
-    xo = XC.T
-    yo = YC.T
-    zo = ZC.T
+    XO = XC.T
+    YO = YC.T
+    ZO = ZC.T
     
     # Incline the vortex
     theta    = np.arctan2(zb-za,yb-ya)
@@ -126,30 +139,13 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     x1bar = (xb - xc)
     y1bar = (yb - yc)*costheta + (zb - zc)*sintheta
     
-    xobar = (xo - xc)
-    yobar = (yo - yc)*costheta + (zo - zc)*sintheta
-    zobar =-(yo - yc)*sintheta + (zo - zc)*costheta
-    
-    # COMPUTE COORDINATES OF RECEIVING POINT WITH RESPECT TO END POINTS OF SKEWED LEG.
-    shape   = np.shape(xobar)
-    shape_0 = shape[0]
-    shape_1 = shape[1]
+    # semispan and tangent of each horseshoe, broadcast against the receiving points
     s       = np.abs(y1bar)
     t       = x1bar/y1bar  
-    s       = np.repeat(s,shape_0,axis=0)
-    t       = np.repeat(t,shape_0,axis=0)
-    
-    X1 = xobar + t*s # In a planar case XC-XAH
-    Y1 = yobar + s   # In a planar case YC-YAH
-    X2 = xobar - t*s # In a planar case XC-XBH
-    Y2 = yobar - s   # In a planar case YC-YBH
     
     # The cutoff hardcoded into vorlax
     CUTOFF = 0.8
     
-    # CALCULATE AXIAL DISTANCE BETWEEN PROJECTION OF RECEIVING POINT ONTO HORSESHOE PLANE AND EXTENSION OF SKEWED LEG.
-    XTY = xobar - t*yobar
-    
     # The notation in this method is flipped from the paper
     B2 = np.atleast_3d(mach**2-1.)
     
@@ -157,63 +153,130 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     TOL    = s /500.0
     TOLSQ  = TOL *TOL
     TOLSQ2 = 2500.0 *TOLSQ
-    ZSQ    = zobar *zobar
-    YSQ1   = Y1 *Y1
-    YSQ2   = Y2 *Y2
-    RTV1   = YSQ1 + ZSQ
-    RTV2   = YSQ2 + ZSQ
-    XSQ1   = X1 *X1
-    XSQ2   = X2 *X2
     
     # Split the vectors into subsonic and supersonic
     sub      = (B2<0)[:,0,0]
+    sup      = (B2>=0)[:,0,0]
     B2_sub   = B2[sub,:,:]
-    RO1_sub  = B2_sub*RTV1
-    RO2_sub  = B2_sub*RTV2
-    
-    # ZERO-OUT PERTURBATION VELOCITY COMPONENTS
-    U = np.zeros((n_mach,shape_0,shape_1),dtype=np.float32)
-    V = np.zeros((n_mach,shape_0,shape_1),dtype=np.float32)
-    W = np.zeros((n_mach,shape_0,shape_1),dtype=np.float32)    
-    
-    if np.sum(sub)>0:
-        # COMPUTATION FOR SUBSONIC HORSESHOE VORTEX
-        U[sub], V[sub], W[sub] = subsonic(zobar,XSQ1,RO1_sub,XSQ2,RO2_sub,XTY,t,B2_sub,ZSQ,TOLSQ,X1,Y1,X2,Y2,RTV1,RTV2)   
-
-    
-    # COMPUTATION FOR SUPERSONIC HORSESHOE VORTEX. some values computed in a preprocessing section in VLM
-    sup         = (B2>=0)[:,0,0]
-    B2_sup      = B2[sup,:,:]
-    RO1_sup     = B2[sup,:,:]*RTV1
-    RO2_sup     = B2[sup,:,:]*RTV2
-    RNMAX       = VD.panels_per_strip
-    CHORD       = VD.chord_lengths
-    CHORD       = np.repeat(CHORD,shape_0,axis=0)
-    RFLAG       = np.ones((n_mach,shape_1),dtype=np.int8)
-    
-    if np.sum(sup)>0:
-        U[sup], V[sup], W[sup], RFLAG[sup,:] = supersonic(zobar,XSQ1,RO1_sup,XSQ2,RO2_sup,XTY,t,B2_sup,ZSQ,TOLSQ,TOL,TOLSQ2,\
-                                                    X1,Y1,X2,Y2,RTV1,RTV2,CUTOFF,CHORD,RNMAX,n_cp,TE_ind,LE_ind)
-         
-    
-    # Rotate into the vehicle frame and pack into a velocity matrix
-    C_mn = np.stack([U, V*costheta - W*sintheta, V*sintheta + W*costheta],axis=-1)
-    
+    B2_sup   = B2[sup,:,:]
+    RNMAX    = VD.panels_per_strip
+    CHORD    = VD.chord_lengths
     
+    # Induced velocity matrix, rotated into the vehicle frame, and sonic vortex flags
+    C_mn     = np.zeros((n_mach,n_rec,n_cp,3),dtype=np.float32)
+    RFLAG    = np.ones((n_mach,n_cp),dtype=np.int8)
     if compute_EW == True:
-        # Calculate the W velocity in the VORLAX frame for later calcs
-        # The angles are Dihedral angle of the current panel - dihedral angle of the influencing panel
-        COS1   = np.cos(DL.T - DL)
-        SIN1   = np.sin(DL.T - DL) 
-        WEIGHT = 1
-        
-        EW = (W*COS1-V*SIN1)*WEIGHT
+        EW   = np.zeros((n_mach,n_rec,n_cp),dtype=np.float32)
     else:
         # Assume that this function is being used outside of VLM, EW is not needed
-        EW = np.nan
+        EW   = np.nan
+    
+    # -------------------------------------------------------------------------------------------
+    # Evaluate blocks of receiving points, bounding the memory of the temporary arrays
+    # ------------------------------------------------------------------------------------------- 
+    if kernel == 'numba':
+        kernel_inputs = [np.ascontiguousarray(np.ravel(x),dtype=np.float32) for x in [xc,yc,zc,costheta,sintheta,s,t,TOL,TOLSQ,TOLSQ2,CHORD/RNMAX]]
+        if np.sum(sup)>0:
+            RFLAG[sup,:], FLAG_bool = compute_sonic_flags(t*t,B2_sup,TE_ind,LE_ind)
+            
+    block_size = compute_block_size(n_mach,n_cp,max_memory)
+    for start in range(0,n_rec,block_size):
+        block   = slice(start,min(start + block_size,n_rec))
+        rows    = block if receivers is None else receivers[block]
+        shape_0 = block.stop - block.start
+        
+        # ZERO-OUT PERTURBATION VELOCITY COMPONENTS
+        U = np.zeros((n_mach,shape_0,n_cp),dtype=np.float32)
+        V = np.zeros((n_mach,shape_0,n_cp),dtype=np.float32)
+        W = np.zeros((n_mach,shape_0,n_cp),dtype=np.float32)    
+        
+        if kernel == 'numba':
+            # Fused evaluation of every control point, horseshoe and mach number of the block
+            compiled_induced_velocity(XO[rows,0],YO[rows,0],ZO[rows,0],*kernel_inputs,B2[:,0,0],np.arange(n_cp)[rows],U,V,W)
+            if np.sum(sup)>0:
+                W[sup] = apply_sonic_flags(W[sup],FLAG_bool,rows)
+        else:
+            xo      = XO[rows]
+            yo      = YO[rows]
+            zo      = ZO[rows]
+        
+            xobar = (xo - xc)
+            yobar = (yo - yc)*costheta + (zo - zc)*sintheta
+            zobar =-(yo - yc)*sintheta + (zo - zc)*costheta
+        
+            # COMPUTE COORDINATES OF RECEIVING POINT WITH RESPECT TO END POINTS OF SKEWED LEG.
+            X1 = xobar + t*s # In a planar case XC-XAH
+            Y1 = yobar + s   # In a planar case YC-YAH
+            X2 = xobar - t*s # In a planar case XC-XBH
+            Y2 = yobar - s   # In a planar case YC-YBH
+        
+            # CALCULATE AXIAL DISTANCE BETWEEN PROJECTION OF RECEIVING POINT ONTO HORSESHOE PLANE AND EXTENSION OF SKEWED LEG.
+            XTY = xobar - t*yobar
         
+            ZSQ    = zobar *zobar
+            YSQ1   = Y1 *Y1
+            YSQ2   = Y2 *Y2
+            RTV1   = YSQ1 + ZSQ
+            RTV2   = YSQ2 + ZSQ
+            XSQ1   = X1 *X1
+            XSQ2   = X2 *X2
+        
+            if np.sum(sub)>0:
+                # COMPUTATION FOR SUBSONIC HORSESHOE VORTEX
+                RO1_sub  = B2_sub*RTV1
+                RO2_sub  = B2_sub*RTV2
+                U[sub], V[sub], W[sub] = subsonic(zobar,XSQ1,RO1_sub,XSQ2,RO2_sub,XTY,t,B2_sub,ZSQ,TOLSQ,X1,Y1,X2,Y2,RTV1,RTV2)   
+        
+            # COMPUTATION FOR SUPERSONIC HORSESHOE VORTEX. some values computed in a preprocessing section in VLM
+            if np.sum(sup)>0:
+                RO1_sup  = B2_sup*RTV1
+                RO2_sup  = B2_sup*RTV2
+                U[sup], V[sup], W[sup], RFLAG[sup,:] = supersonic(zobar,XSQ1,RO1_sup,XSQ2,RO2_sup,XTY,t,B2_sup,ZSQ,TOLSQ,TOL,TOLSQ2,\
+                                                            X1,Y1,X2,Y2,RTV1,RTV2,CUTOFF,CHORD,RNMAX,n_cp,TE_ind,LE_ind,rows)
+        
+        # Rotate into the vehicle frame and pack into a velocity matrix
+        C_mn[:,block,:,0] = U
+        C_mn[:,block,:,1] = V*costheta - W*sintheta
+        C_mn[:,block,:,2] = V*sintheta + W*costheta
+        
+        if compute_EW == True:
+            # Calculate the W velocity in the VORLAX frame for later calcs
+            # The angles are Dihedral angle of the current panel - dihedral angle of the influencing panel
+            COS1   = np.cos(DL.T[rows] - DL)
+            SIN1   = np.sin(DL.T[rows] - DL) 
+            WEIGHT = 1
+            
+            EW[:,block] = (W*COS1-V*SIN1)*WEIGHT
+
+    return C_mn, np.broadcast_to(s,(n_rec,n_cp)), RFLAG, EW
+
+def compute_block_size(n_mach,n_cp,max_memory):
+    """  This computes the number of receiving points evaluated at once so that the temporary arrays
+    of compute_wing_induced_velocity fit in the memory limit
+
+    Assumptions: 
+    Every temporary array is sized by the number of mach numbers, receiving points and horseshoes.
+    At least one receiving point is evaluated at once, whatever the limit.
+
+    Source:  
+    None
 
-    return C_mn, s, RFLAG, EW
+    Inputs: 
+    n_mach      number of mach numbers                       [-]
+    n_cp        number of control points                     [-]
+    max_memory  memory limit of the temporary arrays, None evaluates every receiving point at once [bytes]
+
+    Outputs:           
+    block_size  number of receiving points evaluated at once [-]
+
+    Properties Used:
+    N/A
+    """  
+    if max_memory is None:
+        return max(n_cp,1)
+    
+    bytes_per_row = BYTES_PER_ELEMENT*max(n_mach,1)*n_cp
+    return int(np.clip(max_memory//bytes_per_row,1,max(n_cp,1)))
     
 def subsonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,X1,Y1,X2,Y2,RTV1,RTV2):
     """  This computes the induced velocities at each control point 
@@ -285,7 +348,7 @@ def subsonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,X1,Y1,X2,Y2,RTV1,RTV2):
     
     return U, V, W
 
-def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV1,RTV2,CUTOFF,CHORD,RNMAX,n_cp,TE_ind, LE_ind):
+def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV1,RTV2,CUTOFF,CHORD,RNMAX,n_cp,TE_ind, LE_ind, rows=None):
     """  This computes the induced velocities at each control point 
     of the vehicle vortex lattice for supersonic mach numbers
 
@@ -321,6 +384,7 @@ def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV
     n_cp         number of control points                     [-]
     TE_ind       indices of the trailing edge                 [-]
     LE_ind       indices of the leading edge                  [-]
+    rows         receiving points of the block, None for all  [-]
     
 
     
@@ -408,7 +472,7 @@ def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV
     Y1_in    = Y1[ZSQ<TOLSQ2]
     Y2_in    = Y2[ZSQ<TOLSQ2]
     XTY_in   = XTY[ZSQ<TOLSQ2]
-    TOL_in   = TOL[ZSQ<TOLSQ2]
+    TOL_in   = np.broadcast_to(TOL,np.shape(ZSQ))[ZSQ<TOLSQ2]
     
     if np.sum(in_plane)>0:
         W_in = supersonic_in_plane(RAD1_in, RAD2_in, Y1_in, Y2_in, TOL_in, XTY_in, CPI)
@@ -422,41 +486,15 @@ def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV
     # DETERMINE IF TRANSVERSE VORTEX LEG OF HORSESHOE ASSOCIATED TO THE
     # CONTROL POINT UNDER CONSIDERATION IS SONIC (SWEPT PARALLEL TO MACH
     # LINE)? IF SO THEN RFLAG = 0.0, OTHERWISE RFLAG = 1.0.
-    size   = shape[1]
-    n_mach = shape[0]    
-    T2S = np.atleast_2d(T2[0,:])*np.ones((n_mach,1))
-    T2F = np.zeros((n_mach,size))
-    T2A = np.zeros((n_mach,size))
-    
-    # Setup masks
-    F_mask = np.ones((n_mach,size),dtype=np.bool8)
-    A_mask = np.ones((n_mach,size),dtype=np.bool8)
-    F_mask[:,TE_ind] = False
-    A_mask[:,LE_ind] = False
-    
-    # Apply the mask
-    T2F[A_mask] = T2S[F_mask]
-    T2A[F_mask] = T2S[A_mask]
-    
-    # Zero out terms on the LE and TE
-    T2F[:,TE_ind] = 0.
-    T2A[:,LE_ind]        = 0.
-
-    TRANS = (B2[:,:,0]-T2F)*(B2[:,:,0]-T2A)
-    
-    RFLAG = np.ones((n_mach,size),dtype=np.int8)
-    RFLAG[TRANS<0] = 0.
-    
-    FLAG_bool          = np.zeros_like(TRANS,dtype=bool)
-    FLAG_bool[TRANS<0] = True
-    FLAG_bool          = np.reshape(FLAG_bool,(n_mach,size,-1))
-    
+    if rows is None:
+        rows = slice(0,shape[2])
+    RFLAG, FLAG_bool = compute_sonic_flags(T2,B2,TE_ind,LE_ind)
 
     # COMPUTE THE GENERALIZED PRINCIPAL PART OF THE VORTEX-INDUCED VELOCITY INTEGRAL, WWAVE.
     # FROM LINE 2647 VORLAX, the IR .NE. IRR means that we're looking at vortices that affect themselves
     WWAVE   = np.zeros(shape,dtype=np.float32)
     COX     = CHORD /RNMAX
-    eye     = np.eye(n_cp,dtype=np.int8)
+    eye     = np.eye(n_cp,dtype=np.int8)[rows]
     T2      = np.broadcast_to(T2,shape)*eye
     B2_full = np.broadcast_to(B2,shape)*eye
     COX     = np.broadcast_to(COX,shape)*eye
@@ -464,34 +502,8 @@ def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV
 
     W = W + WWAVE    
     
-    # IF CONTROL POINT BELONGS TO A SONIC HORSESHOE VORTEX, AND THE
-    # SENDING ELEMENT IS SUCH HORSESHOE, THEN MODIFY THE NORMALWASH
-    # COEFFICIENTS IN SUCH A WAY THAT THE STRENGTH OF THE SONIC VORTEX
-    # WILL BE THE AVERAGE OF THE STRENGTHS OF THE HORSESHOES IMMEDIATELY
-    # IN FRONT OF AND BEHIND IT.
-    
-    # Zero out the row
-    FLAG_bool_rep     = np.broadcast_to(FLAG_bool,shape)
-    W[FLAG_bool_rep]  = 0. # Default to zero
-
-    # The self velocity goes to 2
-    FLAG_bool_split   = np.array(np.split(FLAG_bool.ravel(),n_mach))
-    FLAG_ind          = np.array(np.where(FLAG_bool_split))
-    squares           = np.zeros((size,size,n_mach))
-    squares[FLAG_ind[1],FLAG_ind[1],FLAG_ind[0]] = 1
-    squares           = np.ravel(squares,order='F')
-    
-    FLAG_bool_self    = np.where(squares==1)[0]
-    W                 = W.ravel()
-    W[FLAG_bool_self] = 2. # It's own value, -2
-    
-    # The panels before and after go to -1
-    FLAG_bool_bef = FLAG_bool_self - 1
-    FLAG_bool_aft = FLAG_bool_self + 1
-    W[FLAG_bool_bef] = -1.
-    W[FLAG_bool_aft] = -1.
-    
-    W = np.reshape(W,shape)
+    # Modify the normalwash coefficients of sonic horseshoe vortices
+    W = apply_sonic_flags(W,FLAG_bool,rows)
 
     return U, V, W, RFLAG
 
@@ -545,3 +557,113 @@ def supersonic_in_plane(RAD1,RAD2,Y1,Y2,TOL,XTY,CPI):
     W[np.abs(XTY)>TOL] = (-F1[np.abs(XTY)>TOL] + F2[np.abs(XTY)>TOL])/(XTY[np.abs(XTY)>TOL]*CPI)
 
     return W
+
+
+def compute_sonic_flags(T2,B2,TE_ind,LE_ind):
+    """  This determines if the transverse vortex leg of the horseshoe associated to each
+    control point is sonic, i.e. swept parallel to the mach line
+
+    Assumptions: 
+    None
+
+    Source:  
+    1. Miranda, Luis R., Robert D. Elliot, and William M. Baker. "A generalized vortex 
+    lattice method for subsonic and supersonic flow applications." (1977). (NASA CR)
+    
+    2. VORLAX Source Code
+
+    Inputs: 
+    T2         tangent of the horshoe vortex squared        [-] 
+    B2         mach^2-1 (-beta2)                            [-] 
+    TE_ind     indices of the trailing edge                 [-]
+    LE_ind     indices of the leading edge                  [-]
+    
+    Outputs:           
+    RFLAG      sonic vortex flag, 0 if sonic                [boolean] 
+    FLAG_bool  sonic vortex flag, True if sonic             [boolean] 
+
+    Properties Used:
+    N/A
+    """    
+    size   = np.shape(T2)[-1]
+    n_mach = np.shape(B2)[0]
+    T2S = np.atleast_2d(T2[0,:])*np.ones((n_mach,1))
+    T2F = np.zeros((n_mach,size))
+    T2A = np.zeros((n_mach,size))
+    
+    # Setup masks
+    F_mask = np.ones((n_mach,size),dtype=np.bool8)
+    A_mask = np.ones((n_mach,size),dtype=np.bool8)
+    F_mask[:,TE_ind] = False
+    A_mask[:,LE_ind] = False
+    
+    # Apply the mask
+    T2F[A_mask] = T2S[F_mask]
+    T2A[F_mask] = T2S[A_mask]
+    
+    # Zero out terms on the LE and TE
+    T2F[:,TE_ind] = 0.
+    T2A[:,LE_ind]        = 0.
+
+    TRANS = (B2[:,:,0]-T2F)*(B2[:,:,0]-T2A)
+    
+    RFLAG = np.ones((n_mach,size),dtype=np.int8)
+    RFLAG[TRANS<0] = 0.
+    
+    FLAG_bool          = np.zeros_like(TRANS,dtype=bool)
+    FLAG_bool[TRANS<0] = True
+    FLAG_bool          = np.reshape(FLAG_bool,(n_mach,size,-1))
+    
+    return RFLAG, FLAG_bool
+
+
+def apply_sonic_flags(W,FLAG_bool,rows):
+    """  If a control point belongs to a sonic horseshoe vortex, and the sending element is
+    such horseshoe, then this modifies the normalwash coefficients in such a way that the
+    strength of the sonic vortex will be the average of the strengths of the horseshoes
+    immediately in front of and behind it.
+
+    Assumptions: 
+    None
+
+    Source:  
+    1. Miranda, Luis R., Robert D. Elliot, and William M. Baker. "A generalized vortex 
+    lattice method for subsonic and supersonic flow applications." (1977). (NASA CR)
+    
+    2. VORLAX Source Code
+
+    Inputs: 
+    W          Z velocity of a block of control points      [unitless]
+    FLAG_bool  sonic vortex flag, True if sonic             [boolean] 
+    rows       control points of the block                  [-]
+    
+    Outputs:           
+    W          Z velocity of a block of control points      [unitless]
+
+    Properties Used:
+    N/A
+    """    
+    shape  = np.shape(W)
+    n_rows = shape[1]
+    size   = shape[2]
+    
+    # Zero out the row
+    FLAG_bool_rep     = np.broadcast_to(FLAG_bool[:,rows],shape)
+    W[FLAG_bool_rep]  = 0. # Default to zero
+
+    # The self velocity goes to 2
+    FLAG_ind          = np.array(np.where(FLAG_bool_rep[:,:,0]))
+    self_ind          = np.arange(size)[rows]
+    FLAG_bool_self    = (FLAG_ind[0]*n_rows + FLAG_ind[1])*size + self_ind[FLAG_ind[1]]
+    W                 = W.ravel()
+    W[FLAG_bool_self] = 2. # It's own value, -2
+    
+    # The panels before and after go to -1
+    FLAG_bool_bef = FLAG_bool_self - 1
+    FLAG_bool_aft = FLAG_bool_self + 1
+    W[FLAG_bool_bef] = -1.
+    W[FLAG_bool_aft] = -1.
+    
+    W = np.reshape(W,shape)
+    
+    return W
@@ -88,15 +88,17 @@ def evaluate_surrogate(state,settings,geometry):
     h_sub            = lambda M:sub_trans_spline.compute(M)          
     sup_trans_spline = Cubic_Spline_Blender(hsup_max, hsup_min) 
     h_sup            = lambda M:sup_trans_spline.compute(M)    
+
+    # blending weights of each Mach regime, shared by every coefficient
+    w_sub            = h_sub(Mach)
+    w_sup            = h_sup(Mach)
+    w_trans          = 1 - (w_sup + w_sub)
  
     # only compute derivative if control surface exists
     if aerodynamics.aileron_flag:  
         pts_delta_a    = np.hstack((delta_a,Mach))
         
-        results_delta_a =  compute_coefficients(sub_sur.Clift_delta_a,sub_sur.Cdrag_delta_a,sub_sur.CX_delta_a,sub_sur.CY_delta_a,sub_sur.CZ_delta_a,sub_sur.CL_delta_a,sub_sur.CM_delta_a, sub_sur.CN_delta_a,
-         trans_sur.Clift_delta_a,trans_sur.Cdrag_delta_a,trans_sur.CX_delta_a,trans_sur.CY_delta_a,trans_sur.CZ_delta_a,trans_sur.CL_delta_a,trans_sur.CM_delta_a, trans_sur.CN_delta_a,
-         sup_sur.Clift_delta_a,sup_sur.Cdrag_delta_a,sup_sur.CX_delta_a,sup_sur.CY_delta_a,sup_sur.CZ_delta_a,sup_sur.CL_delta_a,sup_sur.CM_delta_a, sup_sur.CN_delta_a,
-        h_sub,h_sup,Mach, pts_delta_a)
+        results_delta_a =  compute_coefficients(sub_sur.delta_a,trans_sur.delta_a,sup_sur.delta_a,w_sub,w_trans,w_sup,pts_delta_a)
          
         Clift_delta_a   = results_delta_a.Clift   
         Cdrag_delta_a   = results_delta_a.Cdrag   
@@ -111,10 +113,7 @@ def evaluate_surrogate(state,settings,geometry):
     if aerodynamics.elevator_flag: 
         pts_delta_e    = np.hstack((delta_e,Mach))
 
-        results_delta_e =  compute_coefficients(sub_sur.Clift_delta_e,sub_sur.Cdrag_delta_e,sub_sur.CX_delta_e,sub_sur.CY_delta_e,sub_sur.CZ_delta_e,sub_sur.CL_delta_e,sub_sur.CM_delta_e, sub_sur.CN_delta_e,
-         trans_sur.Clift_delta_e,trans_sur.Cdrag_delta_e,trans_sur.CX_delta_e,trans_sur.CY_delta_e,trans_sur.CZ_delta_e,trans_sur.CL_delta_e,trans_sur.CM_delta_e, trans_sur.CN_delta_e,
-         sup_sur.Clift_delta_e,sup_sur.Cdrag_delta_e,sup_sur.CX_delta_e,sup_sur.CY_delta_e,sup_sur.CZ_delta_e,sup_sur.CL_delta_e,sup_sur.CM_delta_e, sup_sur.CN_delta_e,
-        h_sub,h_sup,Mach, pts_delta_e)
+        results_delta_e =  compute_coefficients(sub_sur.delta_e,trans_sur.delta_e,sup_sur.delta_e,w_sub,w_trans,w_sup,pts_delta_e)
          
         Clift_delta_e   = results_delta_e.Clift   
         Cdrag_delta_e   = results_delta_e.Cdrag   
@@ -128,10 +127,7 @@ def evaluate_surrogate(state,settings,geometry):
     if aerodynamics.rudder_flag: 
         pts_delta_r    = np.hstack((delta_r,Mach))
         
-        results_delta_r =  compute_coefficients(sub_sur.Clift_delta_r,sub_sur.Cdrag_delta_r,sub_sur.CX_delta_r,sub_sur.CY_delta_r,sub_sur.CZ_delta_r,sub_sur.CL_delta_r,sub_sur.CM_delta_r, sub_sur.CN_delta_r,
-         trans_sur.Clift_delta_r,trans_sur.Cdrag_delta_r,trans_sur.CX_delta_r,trans_sur.CY_delta_r,trans_sur.CZ_delta_r,trans_sur.CL_delta_r,trans_sur.CM_delta_r, trans_sur.CN_delta_r,
-         sup_sur.Clift_delta_r,sup_sur.Cdrag_delta_r,sup_sur.CX_delta_r,sup_sur.CY_delta_r,sup_sur.CZ_delta_r,sup_sur.CL_delta_r,sup_sur.CM_delta_r, sup_sur.CN_delta_r,
-        h_sub,h_sup,Mach, pts_delta_r)
+        results_delta_r =  compute_coefficients(sub_sur.delta_r,trans_sur.delta_r,sup_sur.delta_r,w_sub,w_trans,w_sup,pts_delta_r)
          
         Clift_delta_r   = results_delta_r.Clift   
         Cdrag_delta_r   = results_delta_r.Cdrag   
@@ -145,10 +141,7 @@ def evaluate_surrogate(state,settings,geometry):
     if aerodynamics.flap_flag:   
         pts_delta_f    = np.hstack((delta_f,Mach))
         
-        results_delta_f =  compute_coefficients(sub_sur.Clift_delta_f,sub_sur.Cdrag_delta_f,sub_sur.CX_delta_f,sub_sur.CY_delta_f,sub_sur.CZ_delta_f,sub_sur.CL_delta_f,sub_sur.CM_delta_f, sub_sur.CN_delta_f,
-         trans_sur.Clift_delta_f,trans_sur.Cdrag_delta_f,trans_sur.CX_delta_f,trans_sur.CY_delta_f,trans_sur.CZ_delta_f,trans_sur.CL_delta_f,trans_sur.CM_delta_f, trans_sur.CN_delta_f,
-         sup_sur.Clift_delta_f,sup_sur.Cdrag_delta_f,sup_sur.CX_delta_f,sup_sur.CY_delta_f,sup_sur.CZ_delta_f,sup_sur.CL_delta_f,sup_sur.CM_delta_f, sup_sur.CN_delta_f,
-        h_sub,h_sup,Mach, pts_delta_f)
+        results_delta_f =  compute_coefficients(sub_sur.delta_f,trans_sur.delta_f,sup_sur.delta_f,w_sub,w_trans,w_sup,pts_delta_f)
          
         Clift_delta_f   = results_delta_f.Clift   
         Cdrag_delta_f   = results_delta_f.Cdrag   
@@ -162,10 +155,7 @@ def evaluate_surrogate(state,settings,geometry):
     if aerodynamics.slat_flag: 
         pts_delta_s    = np.hstack((delta_s,Mach)) 
         
-        results_delta_s =  compute_coefficients(sub_sur.Clift_delta_s,sub_sur.Cdrag_delta_s,sub_sur.CX_delta_s,sub_sur.CY_delta_s,sub_sur.CZ_delta_s,sub_sur.CL_delta_s,sub_sur.CM_delta_s, sub_sur.CN_delta_s,
-         trans_sur.Clift_delta_s,trans_sur.Cdrag_delta_s,trans_sur.CX_delta_s,trans_sur.CY_delta_s,trans_sur.CZ_delta_s,trans_sur.CL_delta_s,trans_sur.CM_delta_s, trans_sur.CN_delta_s,
-         sup_sur.Clift_delta_s,sup_sur.Cdrag_delta_s,sup_sur.CX_delta_s,sup_sur.CY_delta_s,sup_sur.CZ_delta_s,sup_sur.CL_delta_s,sup_sur.CM_delta_s, sup_sur.CN_delta_s,
-        h_sub,h_sup,Mach, pts_delta_s)
+        results_delta_s =  compute_coefficients(sub_sur.delta_s,trans_sur.delta_s,sup_sur.delta_s,w_sub,w_trans,w_sup,pts_delta_s)
          
         Clift_delta_s   = results_delta_s.Clift   
         Cdrag_delta_s   = results_delta_s.Cdrag   
@@ -194,10 +184,7 @@ def evaluate_surrogate(state,settings,geometry):
     pts_r                = np.hstack((r,Mach))
     
     # Alpha 
-    results_alpha    = compute_coefficients( sub_sur.Clift_alpha,  sub_sur.Cdrag_alpha,  sub_sur.CX_alpha,  sub_sur.CY_alpha,  sub_sur.CZ_alpha,  sub_sur.CL_alpha,  sub_sur.CM_alpha,   sub_sur.CN_alpha,
-                                           trans_sur.Clift_alpha,trans_sur.Cdrag_alpha,trans_sur.CX_alpha,trans_sur.CY_alpha,trans_sur.CZ_alpha,trans_sur.CL_alpha,trans_sur.CM_alpha, trans_sur.CN_alpha,
-                                             sup_sur.Clift_alpha,  sup_sur.Cdrag_alpha,  sup_sur.CX_alpha,  sup_sur.CY_alpha,  sup_sur.CZ_alpha,  sup_sur.CL_alpha,  sup_sur.CM_alpha,   sup_sur.CN_alpha,
-                                              h_sub,h_sup,Mach, pts_alpha)        
+    results_alpha    = compute_coefficients(sub_sur.alpha,trans_sur.alpha,sup_sur.alpha,w_sub,w_trans,w_sup,pts_alpha)        
 
     Clift_alpha    = results_alpha.Clift   
     Cdrag_alpha    = results_alpha.Cdrag   
@@ -209,10 +196,7 @@ def evaluate_surrogate(state,settings,geometry):
     CN_alpha       = results_alpha.CN         
      
     # Beta 
-    results_beta =  compute_coefficients(sub_sur.Clift_beta,  sub_sur.Cdrag_beta,  sub_sur.CX_beta,  sub_sur.CY_beta,  sub_sur.CZ_beta,  sub_sur.CL_beta,  sub_sur.CM_beta,   sub_sur.CN_beta,
-                                       trans_sur.Clift_beta,trans_sur.Cdrag_beta,trans_sur.CX_beta,trans_sur.CY_beta,trans_sur.CZ_beta,trans_sur.CL_beta,trans_sur.CM_beta, trans_sur.CN_beta,
-                                         sup_sur.Clift_beta,  sup_sur.Cdrag_beta,  sup_sur.CX_beta,  sup_sur.CY_beta,  sup_sur.CZ_beta,  sup_sur.CL_beta,  sup_sur.CM_beta,   sup_sur.CN_beta,
-                                         h_sub,h_sup,Mach, pts_beta)
+    results_beta =  compute_coefficients(sub_sur.beta,trans_sur.beta,sup_sur.beta,w_sub,w_trans,w_sup,pts_beta)
      
     Clift_beta   = results_beta.Clift   
     Cdrag_beta   = results_beta.Cdrag   
@@ -224,10 +208,7 @@ def evaluate_surrogate(state,settings,geometry):
     CN_beta      = results_beta.CN 
 
     # u  
-    results_u    =  compute_coefficients(sub_sur.Clift_u,  sub_sur.Cdrag_u,  sub_sur.CX_u,  sub_sur.CY_u,  sub_sur.CZ_u,  sub_sur.CL_u,  sub_sur.CM_u,   sub_sur.CN_u,
-                                       trans_sur.Clift_u,trans_sur.Cdrag_u,trans_sur.CX_u,trans_sur.CY_u,trans_sur.CZ_u,trans_sur.CL_u,trans_sur.CM_u, trans_sur.CN_u,
-                                         sup_sur.Clift_u,  sup_sur.Cdrag_u,  sup_sur.CX_u,  sup_sur.CY_u,  sup_sur.CZ_u,  sup_sur.CL_u,  sup_sur.CM_u,   sup_sur.CN_u,
-                                         h_sub,h_sup,Mach, pts_u)
+    results_u    =  compute_coefficients(sub_sur.u,trans_sur.u,sup_sur.u,w_sub,w_trans,w_sup,pts_u)
      
     Clift_u   = results_u.Clift   
     Cdrag_u   = results_u.Cdrag   
@@ -239,10 +220,7 @@ def evaluate_surrogate(state,settings,geometry):
     CN_u      = results_u.CN          
 
     # v  
-    results_v    =  compute_coefficients(sub_sur.Clift_v,  sub_sur.Cdrag_v,  sub_sur.CX_v,  sub_sur.CY_v,  sub_sur.CZ_v,  sub_sur.CL_v,  sub_sur.CM_v,   sub_sur.CN_v,
-                                       trans_sur.Clift_v,trans_sur.Cdrag_v,trans_sur.CX_v,trans_sur.CY_v,trans_sur.CZ_v,trans_sur.CL_v,trans_sur.CM_v, trans_sur.CN_v,
-                                         sup_sur.Clift_v,  sup_sur.Cdrag_v,  sup_sur.CX_v,  sup_sur.CY_v,  sup_sur.CZ_v,  sup_sur.CL_v,  sup_sur.CM_v,   sup_sur.CN_v,
-                                         h_sub,h_sup,Mach, pts_v)
+    results_v    =  compute_coefficients(sub_sur.v,trans_sur.v,sup_sur.v,w_sub,w_trans,w_sup,pts_v)
      
     Clift_v   = results_v.Clift   
     Cdrag_v   = results_v.Cdrag   
@@ -254,10 +232,7 @@ def evaluate_surrogate(state,settings,geometry):
     CN_v      = results_v.CN       
 
     # w  
-    results_w    =  compute_coefficients(sub_sur.Clift_w,  sub_sur.Cdrag_w,  sub_sur.CX_w,  sub_sur.CY_w,  sub_sur.CZ_w,  sub_sur.CL_w,  sub_sur.CM_w,   sub_sur.CN_w,
-                                       trans_sur.Clift_w,trans_sur.Cdrag_w,trans_sur.CX_w,trans_sur.CY_w,trans_sur.CZ_w,trans_sur.CL_w,trans_sur.CM_w, trans_sur.CN_w,
-                                         sup_sur.Clift_w,  sup_sur.Cdrag_w,  sup_sur.CX_w,  sup_sur.CY_w,  sup_sur.CZ_w,  sup_sur.CL_w,  sup_sur.CM_w,   sup_sur.CN_w,
-                                        h_sub,h_sup,Mach, pts_w)
+    results_w    =  compute_coefficients(sub_sur.w,trans_sur.w,sup_sur.w,w_sub,w_trans,w_sup,pts_w)
      
     Clift_w   = results_w.Clift   
     Cdrag_w   = results_w.Cdrag   
@@ -270,10 +245,7 @@ def evaluate_surrogate(state,settings,geometry):
     
 
     # p  
-    results_p    =  compute_coefficients(sub_sur.Clift_p,  sub_sur.Cdrag_p,  sub_sur.CX_p,  sub_sur.CY_p,  sub_sur.CZ_p,  sub_sur.CL_p,  sub_sur.CM_p,   sub_sur.CN_p,
-                                       trans_sur.Clift_p,trans_sur.Cdrag_p,trans_sur.CX_p,trans_sur.CY_p,trans_sur.CZ_p,trans_sur.CL_p,trans_sur.CM_p, trans_sur.CN_p,
-                                         sup_sur.Clift_p,  sup_sur.Cdrag_p,  sup_sur.CX_p,  sup_sur.CY_p,  sup_sur.CZ_p,  sup_sur.CL_p,  sup_sur.CM_p,   sup_sur.CN_p,
-                                        h_sub,h_sup,Mach, pts_p)
+    results_p    =  compute_coefficients(sub_sur.p,trans_sur.p,sup_sur.p,w_sub,w_trans,w_sup,pts_p)
      
     Clift_p   = results_p.Clift   
     Cdrag_p   = results_p.Cdrag   
@@ -286,10 +258,7 @@ def evaluate_surrogate(state,settings,geometry):
      
 
     # q  
-    results_q    =  compute_coefficients(sub_sur.Clift_q,  sub_sur.Cdrag_q,  sub_sur.CX_q,  sub_sur.CY_q,  sub_sur.CZ_q,  sub_sur.CL_q,  sub_sur.CM_q,   sub_sur.CN_q,
-                                       trans_sur.Clift_q,trans_sur.Cdrag_q,trans_sur.CX_q,trans_sur.CY_q,trans_sur.CZ_q,trans_sur.CL_q,trans_sur.CM_q, trans_sur.CN_q,
-                                         sup_sur.Clift_q,  sup_sur.Cdrag_q,  sup_sur.CX_q,  sup_sur.CY_q,  sup_sur.CZ_q,  sup_sur.CL_q,  sup_sur.CM_q,   sup_sur.CN_q,
-                                        h_sub,h_sup,Mach, pts_q)
+    results_q    =  compute_coefficients(sub_sur.q,trans_sur.q,sup_sur.q,w_sub,w_trans,w_sup,pts_q)
      
     Clift_q   = results_q.Clift   
     Cdrag_q   = results_q.Cdrag   
@@ -301,10 +270,7 @@ def evaluate_surrogate(state,settings,geometry):
     CN_q      = results_q.CN
     
     # r  
-    results_r    =  compute_coefficients(sub_sur.Clift_r,  sub_sur.Cdrag_r,  sub_sur.CX_r,  sub_sur.CY_r,  sub_sur.CZ_r,  sub_sur.CL_r,  sub_sur.CM_r,   sub_sur.CN_r,
-                                       trans_sur.Clift_r,trans_sur.Cdrag_r,trans_sur.CX_r,trans_sur.CY_r,trans_sur.CZ_r,trans_sur.CL_r,trans_sur.CM_r, trans_sur.CN_r,
-                                         sup_sur.Clift_r,  sup_sur.Cdrag_r,  sup_sur.CX_r,  sup_sur.CY_r,  sup_sur.CZ_r,  sup_sur.CL_r,  sup_sur.CM_r,   sup_sur.CN_r,
-                                        h_sub,h_sup,Mach, pts_r)
+    results_r    =  compute_coefficients(sub_sur.r,trans_sur.r,sup_sur.r,w_sub,w_trans,w_sup,pts_r)
      
     Clift_r   = results_r.Clift   
     Cdrag_r   = results_r.Cdrag   
@@ -431,63 +397,65 @@ def evaluate_surrogate(state,settings,geometry):
         conditions.control_surfaces.slat.static_stability.coefficients.N          = CN_delta_s                     
      
     
-    conditions.static_stability.derivatives.Clift_alpha = compute_stability_derivative(sub_sur.dClift_dalpha ,trans_sur.dClift_dalpha ,sup_sur.dClift_dalpha , h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CX_alpha    = compute_stability_derivative(sub_sur.dCX_dalpha    ,trans_sur.dCX_dalpha    ,sup_sur.dCX_dalpha    , h_sub,h_sup,Mach)  
-    conditions.static_stability.derivatives.CY_alpha    = compute_stability_derivative(sub_sur.dCY_dalpha    ,trans_sur.dCY_dalpha    ,sup_sur.dCY_dalpha    , h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CZ_alpha    = compute_stability_derivative(sub_sur.dCZ_dalpha    ,trans_sur.dCZ_dalpha    ,sup_sur.dCZ_dalpha    , h_sub,h_sup,Mach) 
-    conditions.static_stability.derivatives.CL_alpha    = compute_stability_derivative(sub_sur.dCL_dalpha    ,trans_sur.dCL_dalpha    ,sup_sur.dCL_dalpha    , h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CM_alpha    = compute_stability_derivative(sub_sur.dCM_dalpha    ,trans_sur.dCM_dalpha    ,sup_sur.dCM_dalpha    , h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CN_alpha    = compute_stability_derivative(sub_sur.dCN_dalpha    ,trans_sur.dCN_dalpha    ,sup_sur.dCN_dalpha    , h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.Clift_beta  = compute_stability_derivative(sub_sur.dClift_dbeta  ,trans_sur.dClift_dbeta  ,sup_sur.dClift_dbeta  , h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CX_beta     = compute_stability_derivative(sub_sur.dCX_dbeta     ,trans_sur.dCX_dbeta     ,sup_sur.dCX_dbeta     , h_sub,h_sup,Mach)  
-    conditions.static_stability.derivatives.CY_beta     = compute_stability_derivative(sub_sur.dCY_dbeta     ,trans_sur.dCY_dbeta     ,sup_sur.dCY_dbeta     , h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CZ_beta     = compute_stability_derivative(sub_sur.dCZ_dbeta     ,trans_sur.dCZ_dbeta     ,sup_sur.dCZ_dbeta     , h_sub,h_sup,Mach) 
-    conditions.static_stability.derivatives.CL_beta     = compute_stability_derivative(sub_sur.dCL_dbeta     ,trans_sur.dCL_dbeta     ,sup_sur.dCL_dbeta     , h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CM_beta     = compute_stability_derivative(sub_sur.dCM_dbeta     ,trans_sur.dCM_dbeta     ,sup_sur.dCM_dbeta     , h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CN_beta     = compute_stability_derivative(sub_sur.dCN_dbeta     ,trans_sur.dCN_dbeta     ,sup_sur.dCN_dbeta     , h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.Clift_p     = compute_stability_derivative(sub_sur.dClift_dp     ,trans_sur.dClift_dp     ,sup_sur.dClift_dp     , h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.Clift_q     = compute_stability_derivative(sub_sur.dClift_dq     ,trans_sur.dClift_dq     ,sup_sur.dClift_dq     , h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.Clift_r     = compute_stability_derivative(sub_sur.dClift_dr     ,trans_sur.dClift_dr     ,sup_sur.dClift_dr     , h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CX_u        = compute_stability_derivative(sub_sur.dCX_du, trans_sur.dCX_du, sup_sur.dCX_du, h_sub,h_sup,Mach)   
-    conditions.static_stability.derivatives.CX_v        = compute_stability_derivative(sub_sur.dCX_dv, trans_sur.dCX_dv, sup_sur.dCX_dv, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CX_w        = compute_stability_derivative(sub_sur.dCX_dw, trans_sur.dCX_dw, sup_sur.dCX_dw, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CY_u        = compute_stability_derivative(sub_sur.dCY_du, trans_sur.dCY_du, sup_sur.dCY_du, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CY_v        = compute_stability_derivative(sub_sur.dCY_dv, trans_sur.dCY_dv, sup_sur.dCY_dv, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CY_w        = compute_stability_derivative(sub_sur.dCY_dw, trans_sur.dCY_dw, sup_sur.dCY_dw, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CZ_u        = compute_stability_derivative(sub_sur.dCZ_du, trans_sur.dCZ_du, sup_sur.dCZ_du, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CZ_v        = compute_stability_derivative(sub_sur.dCZ_dv, trans_sur.dCZ_dv, sup_sur.dCZ_dv, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CZ_w        = compute_stability_derivative(sub_sur.dCZ_dw, trans_sur.dCZ_dw, sup_sur.dCZ_dw, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CL_u        = compute_stability_derivative(sub_sur.dCL_du, trans_sur.dCL_du, sup_sur.dCL_du, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CL_v        = compute_stability_derivative(sub_sur.dCL_dv, trans_sur.dCL_dv, sup_sur.dCL_dv, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CL_w        = compute_stability_derivative(sub_sur.dCL_dw, trans_sur.dCL_dw, sup_sur.dCL_dw, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CM_u        = compute_stability_derivative(sub_sur.dCM_du, trans_sur.dCM_du, sup_sur.dCM_du, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CM_v        = compute_stability_derivative(sub_sur.dCM_dv, trans_sur.dCM_dv, sup_sur.dCM_dv, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CM_w        = compute_stability_derivative(sub_sur.dCM_dw, trans_sur.dCM_dw, sup_sur.dCM_dw, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CN_u        = compute_stability_derivative(sub_sur.dCN_du, trans_sur.dCN_du, sup_sur.dCN_du, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CN_v        = compute_stability_derivative(sub_sur.dCN_dv, trans_sur.dCN_dv, sup_sur.dCN_dv, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CN_w        = compute_stability_derivative(sub_sur.dCN_dw, trans_sur.dCN_dw, sup_sur.dCN_dw, h_sub,h_sup,Mach) 
-    conditions.static_stability.derivatives.CX_p        = compute_stability_derivative(sub_sur.dCX_dp, trans_sur.dCX_dp, sup_sur.dCX_dp, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CX_q        = compute_stability_derivative(sub_sur.dCX_dq, trans_sur.dCX_dq, sup_sur.dCX_dq, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CX_r        = compute_stability_derivative(sub_sur.dCX_dr, trans_sur.dCX_dr, sup_sur.dCX_dr, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CY_p        = compute_stability_derivative(sub_sur.dCY_dp, trans_sur.dCY_dp, sup_sur.dCY_dp, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CY_q        = compute_stability_derivative(sub_sur.dCY_dq, trans_sur.dCY_dq, sup_sur.dCY_dq, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CY_r        = compute_stability_derivative(sub_sur.dCY_dr, trans_sur.dCY_dr, sup_sur.dCY_dr, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CZ_p        = compute_stability_derivative(sub_sur.dCZ_dp, trans_sur.dCZ_dp, sup_sur.dCZ_dp, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CZ_q        = compute_stability_derivative(sub_sur.dCZ_dq, trans_sur.dCZ_dq, sup_sur.dCZ_dq, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CZ_r        = compute_stability_derivative(sub_sur.dCZ_dr, trans_sur.dCZ_dr, sup_sur.dCZ_dr, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CL_p        = compute_stability_derivative(sub_sur.dCL_dp, trans_sur.dCL_dp, sup_sur.dCL_dp, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CL_q        = compute_stability_derivative(sub_sur.dCL_dq, trans_sur.dCL_dq, sup_sur.dCL_dq, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CL_r        = compute_stability_derivative(sub_sur.dCL_dr, trans_sur.dCL_dr, sup_sur.dCL_dr, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CM_p        = compute_stability_derivative(sub_sur.dCM_dp, trans_sur.dCM_dp, sup_sur.dCM_dp, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CM_q        = compute_stability_derivative(sub_sur.dCM_dq, trans_sur.dCM_dq, sup_sur.dCM_dq, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CM_r        = compute_stability_derivative(sub_sur.dCM_dr, trans_sur.dCM_dr, sup_sur.dCM_dr, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CN_p        = compute_stability_derivative(sub_sur.dCN_dp, trans_sur.dCN_dp, sup_sur.dCN_dp, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CN_q        = compute_stability_derivative(sub_sur.dCN_dq, trans_sur.dCN_dq, sup_sur.dCN_dq, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CN_r        = compute_stability_derivative(sub_sur.dCN_dr, trans_sur.dCN_dr, sup_sur.dCN_dr, h_sub,h_sup,Mach) 
-
+    derivatives = compute_coefficients(sub_sur.derivatives,trans_sur.derivatives,sup_sur.derivatives,w_sub,w_trans,w_sup,Mach)
+    conditions.static_stability.derivatives.Clift_alpha = derivatives.dClift_dalpha
+    conditions.static_stability.derivatives.CX_alpha    = derivatives.dCX_dalpha
+    conditions.static_stability.derivatives.CY_alpha    = derivatives.dCY_dalpha
+    conditions.static_stability.derivatives.CZ_alpha    = derivatives.dCZ_dalpha
+    conditions.static_stability.derivatives.CL_alpha    = derivatives.dCL_dalpha
+    conditions.static_stability.derivatives.CM_alpha    = derivatives.dCM_dalpha
+    conditions.static_stability.derivatives.CN_alpha    = derivatives.dCN_dalpha
+    conditions.static_stability.derivatives.Clift_beta  = derivatives.dClift_dbeta
+    conditions.static_stability.derivatives.CX_beta     = derivatives.dCX_dbeta
+    conditions.static_stability.derivatives.CY_beta     = derivatives.dCY_dbeta
+    conditions.static_stability.derivatives.CZ_beta     = derivatives.dCZ_dbeta
+    conditions.static_stability.derivatives.CL_beta     = derivatives.dCL_dbeta
+    conditions.static_stability.derivatives.CM_beta     = derivatives.dCM_dbeta
+    conditions.static_stability.derivatives.CN_beta     = derivatives.dCN_dbeta
+    conditions.static_stability.derivatives.Clift_p     = derivatives.dClift_dp
+    conditions.static_stability.derivatives.Clift_q     = derivatives.dClift_dq
+    conditions.static_stability.derivatives.Clift_r     = derivatives.dClift_dr
+    conditions.static_stability.derivatives.CX_u        = derivatives.dCX_du
+    conditions.static_stability.derivatives.CX_v        = derivatives.dCX_dv
+    conditions.static_stability.derivatives.CX_w        = derivatives.dCX_dw
+    conditions.static_stability.derivatives.CY_u        = derivatives.dCY_du
+    conditions.static_stability.derivatives.CY_v        = derivatives.dCY_dv
+    conditions.static_stability.derivatives.CY_w        = derivatives.dCY_dw
+    conditions.static_stability.derivatives.CZ_u        = derivatives.dCZ_du
+    conditions.static_stability.derivatives.CZ_v        = derivatives.dCZ_dv
+    conditions.static_stability.derivatives.CZ_w        = derivatives.dCZ_dw
+    conditions.static_stability.derivatives.CL_u        = derivatives.dCL_du
+    conditions.static_stability.derivatives.CL_v        = derivatives.dCL_dv
+    conditions.static_stability.derivatives.CL_w        = derivatives.dCL_dw
+    conditions.static_stability.derivatives.CM_u        = derivatives.dCM_du
+    conditions.static_stability.derivatives.CM_v        = derivatives.dCM_dv
+    conditions.static_stability.derivatives.CM_w        = derivatives.dCM_dw
+    conditions.static_stability.derivatives.CN_u        = derivatives.dCN_du
+    conditions.static_stability.derivatives.CN_v        = derivatives.dCN_dv
+    conditions.static_stability.derivatives.CN_w        = derivatives.dCN_dw
+    conditions.static_stability.derivatives.CX_p        = derivatives.dCX_dp
+    conditions.static_stability.derivatives.CX_q        = derivatives.dCX_dq
+    conditions.static_stability.derivatives.CX_r        = derivatives.dCX_dr
+    conditions.static_stability.derivatives.CY_p        = derivatives.dCY_dp
+    conditions.static_stability.derivatives.CY_q        = derivatives.dCY_dq
+    conditions.static_stability.derivatives.CY_r        = derivatives.dCY_dr
+    conditions.static_stability.derivatives.CZ_p        = derivatives.dCZ_dp
+    conditions.static_stability.derivatives.CZ_q        = derivatives.dCZ_dq
+    conditions.static_stability.derivatives.CZ_r        = derivatives.dCZ_dr
+    conditions.static_stability.derivatives.CL_p        = derivatives.dCL_dp
+    conditions.static_stability.derivatives.CL_q        = derivatives.dCL_dq
+    conditions.static_stability.derivatives.CL_r        = derivatives.dCL_dr
+    conditions.static_stability.derivatives.CM_p        = derivatives.dCM_dp
+    conditions.static_stability.derivatives.CM_q        = derivatives.dCM_dq
+    conditions.static_stability.derivatives.CM_r        = derivatives.dCM_dr
+    conditions.static_stability.derivatives.CN_p        = derivatives.dCN_dp
+    conditions.static_stability.derivatives.CN_q        = derivatives.dCN_dq
+    conditions.static_stability.derivatives.CN_r        = derivatives.dCN_dr
+
+    wing_coefficients = compute_coefficient(sub_sur.wing_alpha,trans_sur.wing_alpha,sup_sur.wing_alpha,w_sub,w_trans,w_sup,pts_alpha)
     for wing in geometry.wings:   
-        inviscid_wing_lifts = compute_coefficient(sub_sur.Clift_wing_alpha[wing.tag],trans_sur.Clift_wing_alpha[wing.tag],sup_sur.Cdrag_wing_alpha[wing.tag],h_sub,h_sup,Mach,pts_alpha)
-        inviscid_wing_drags = compute_coefficient(sub_sur.Cdrag_wing_alpha[wing.tag],trans_sur.Cdrag_wing_alpha[wing.tag],sup_sur.Cdrag_wing_alpha[wing.tag],h_sub,h_sup,Mach,pts_alpha)
+        inviscid_wing_lifts = wing_coefficients['Clift_' + wing.tag]
+        inviscid_wing_drags = wing_coefficients['Cdrag_' + wing.tag]
         # Pack 
         conditions.aerodynamics.coefficients.lift.inviscid_wings[wing.tag]         =  inviscid_wing_lifts 
         conditions.aerodynamics.coefficients.lift.compressible_wings[wing.tag]     =  inviscid_wing_lifts 
@@ -550,71 +518,74 @@ def evaluate_no_surrogate(state,settings,geometry):
 
     return
 
-def compute_stability_derivative(sub_sur,trans_sur,sup_sur,h_sub,h_sup,Mach): 
-    derivative = h_sub(Mach)*sub_sur(Mach) +   (1 - (h_sup(Mach) + h_sub(Mach)))*trans_sur(Mach)  + h_sup(Mach)*sup_sur(Mach) 
-    return derivative
+def compute_coefficients(sub_sur,trans_sur,sup_sur,w_sub,w_trans,w_sup,pts): 
+    """Queries the multi-output surrogates of each Mach regime once and blends every coefficient in a single pass.
+    
+    Assumptions:
+        None
+        
+    Source:
+        None
 
-def compute_coefficients(sub_sur_Clift,sub_sur_Cdrag,sub_sur_CX,sub_sur_CY,sub_sur_CZ,sub_sur_CL,sub_sur_CM,sub_sur_CN,
-                         trans_sur_Clift,trans_sur_Cdrag,trans_sur_CX,trans_sur_CY,trans_sur_CZ,trans_sur_CL,trans_sur_CM,trans_sur_CN,
-                         sup_sur_Clift,sup_sur_Cdrag,sup_sur_CX,sup_sur_CY,sup_sur_CZ,sup_sur_CL,sup_sur_CM,sup_sur_CN,
-                         h_sub,h_sup,Mach, pts): 
+    Args:
+        sub_sur    : subsonic surrogate                  [unitless]
+        trans_sur  : transonic surrogate                 [unitless]
+        sup_sur    : supersonic surrogate                [unitless]
+        w_sub      : subsonic blending weight            [unitless]
+        w_trans    : transonic blending weight           [unitless]
+        w_sup      : supersonic blending weight          [unitless]
+        pts        : query points                        [unitless]
+        
+    Returns: 
+        results    : coefficients, keyed by output name  [unitless]
+    """
 
-    #  subsonic 
-    sub_Clift  = np.atleast_2d(sub_sur_Clift(pts)).T  
-    sub_Cdrag  = np.atleast_2d(sub_sur_Cdrag(pts)).T  
-    sub_CX     = np.atleast_2d(sub_sur_CX(pts)).T 
-    sub_CY     = np.atleast_2d(sub_sur_CY(pts)).T     
-    sub_CZ     = np.atleast_2d(sub_sur_CZ(pts)).T     
-    sub_CL     = np.atleast_2d(sub_sur_CL(pts)).T     
-    sub_CM     = np.atleast_2d(sub_sur_CM(pts)).T     
-    sub_CN     = np.atleast_2d(sub_sur_CN(pts)).T
-  
-    # transonic 
-    trans_Clift  = np.atleast_2d(trans_sur_Clift(pts)).T  
-    trans_Cdrag  = np.atleast_2d(trans_sur_Cdrag(pts)).T  
-    trans_CX     = np.atleast_2d(trans_sur_CX(pts)).T 
-    trans_CY     = np.atleast_2d(trans_sur_CY(pts)).T     
-    trans_CZ     = np.atleast_2d(trans_sur_CZ(pts)).T     
-    trans_CL     = np.atleast_2d(trans_sur_CL(pts)).T     
-    trans_CM     = np.atleast_2d(trans_sur_CM(pts)).T     
-    trans_CN     = np.atleast_2d(trans_sur_CN(pts)).T
-    
-    # supersonic 
-    sup_Clift  = np.atleast_2d(sup_sur_Clift(pts)).T  
-    sup_Cdrag  = np.atleast_2d(sup_sur_Cdrag(pts)).T  
-    sup_CX     = np.atleast_2d(sup_sur_CX(pts)).T 
-    sup_CY     = np.atleast_2d(sup_sur_CY(pts)).T     
-    sup_CZ     = np.atleast_2d(sup_sur_CZ(pts)).T     
-    sup_CL     = np.atleast_2d(sup_sur_CL(pts)).T     
-    sup_CM     = np.atleast_2d(sup_sur_CM(pts)).T     
-    sup_CN     = np.atleast_2d(sup_sur_CN(pts)).T            
-    
     # apply 
-    results       = Data() 
-    results.Clift = h_sub(Mach)*sub_Clift +   (1 - (h_sup(Mach) + h_sub(Mach)))*trans_Clift  + h_sup(Mach)*sup_Clift
-    results.Cdrag = h_sub(Mach)*sub_Cdrag +   (1 - (h_sup(Mach) + h_sub(Mach)))*trans_Cdrag  + h_sup(Mach)*sup_Cdrag
-    results.CX    = h_sub(Mach)*sub_CX    +   (1 - (h_sup(Mach) + h_sub(Mach)))*trans_CX     + h_sup(Mach)*sup_CX   
-    results.CY    = h_sub(Mach)*sub_CY    +   (1 - (h_sup(Mach) + h_sub(Mach)))*trans_CY     + h_sup(Mach)*sup_CY   
-    results.CZ    = h_sub(Mach)*sub_CZ    +   (1 - (h_sup(Mach) + h_sub(Mach)))*trans_CZ     + h_sup(Mach)*sup_CZ   
-    results.CL    = h_sub(Mach)*sub_CL    +   (1 - (h_sup(Mach) + h_sub(Mach)))*trans_CL     + h_sup(Mach)*sup_CL   
-    results.CM    = h_sub(Mach)*sub_CM    +   (1 - (h_sup(Mach) + h_sub(Mach)))*trans_CM     + h_sup(Mach)*sup_CM   
-    results.CN    = h_sub(Mach)*sub_CN    +   (1 - (h_sup(Mach) + h_sub(Mach)))*trans_CN     + h_sup(Mach)*sup_CN
+    coefficients = w_sub*sub_sur(pts) + w_trans*trans_sur(pts) + w_sup*sup_sur(pts)
+
+    results = Data() 
+    for i, name in enumerate(sub_sur.outputs):
+        results[name] = coefficients[:,i:i+1]
   
     return results
 
 
-def compute_coefficient(sub_sur_coef,trans_sur_coef, sup_sur_coef, h_sub,h_sup,Mach, pts): 
+def compute_coefficient(sub_sur,trans_sur, sup_sur, w_sub,w_trans,w_sup, pts): 
+    """Queries the wing surrogates of each Mach regime once and blends every wing coefficient.
+    
+    Assumptions:
+        The subsonic surrogate is used in place of the supersonic surrogate
+        
+    Source:
+        None
+
+    Args:
+        sub_sur    : subsonic surrogate                  [unitless]
+        trans_sur  : transonic surrogate                 [unitless]
+        sup_sur    : supersonic surrogate                [unitless]
+        w_sub      : subsonic blending weight            [unitless]
+        w_trans    : transonic blending weight           [unitless]
+        w_sup      : supersonic blending weight          [unitless]
+        pts        : query points                        [unitless]
+        
+    Returns: 
+        results    : coefficients, keyed by output name  [unitless]
+    """
 
     #  subsonic 
-    sub_coef  = np.atleast_2d(sub_sur_coef(pts)).T     
+    sub_coef    = sub_sur(pts)
   
     # transonic 
-    trans_coef  = np.atleast_2d(trans_sur_coef(pts)).T    
+    trans_coef  = trans_sur(pts)
     
     # supersonic 
-    sup_coef  = np.atleast_2d(sub_sur_coef(pts)).T             
+    sup_coef    = sub_coef
     
     # apply  
-    coef = h_sub(Mach)*sub_coef +   (1 - (h_sup(Mach) + h_sub(Mach)))*trans_coef  + h_sub(Mach)*sup_coef 
+    coef = w_sub*sub_coef +   w_trans*trans_coef  + w_sub*sup_coef 
+
+    results = Data() 
+    for i, name in enumerate(sub_sur.outputs):
+        results[name] = coef[:,i:i+1]
   
-    return coef 
+    return results 
@@ -0,0 +1,91 @@
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+# solve_AIC.py
+#
+# Created:  Oct 2026, agent
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+# package imports
+import numpy as np
+from collections import OrderedDict
+from scipy.linalg import lu_factor, lu_solve
+
+# LU factors of aerodynamic influence coefficient matrices, least recently used first
+AIC_cache = OrderedDict()
+
+# ----------------------------------------------------------------------
+#  Solve AIC
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def solve_AIC(A,m_unique,inv,RHS,key,settings):
+    """ Solves for the vortex strengths of every case by factoring the aerodynamic influence coefficient matrix once
+    per unique Mach number and back-substituting the right-hand sides of all cases at that Mach number. Factors are
+    kept between calls for geometries identified by key, so that every surrogate training case at a Mach number
+    reuses the same factorization.
+
+    Assumptions:
+    The influence coefficient matrix depends only on the vortex distribution and the Mach number, not on the angles
+    of attack, sideslip or rotation rates.
+
+    Source:
+    None
+
+    Inputs:
+    A        - influence coefficient matrix of each unique Mach number                  [Unitless]
+    m_unique - unique Mach numbers                                                       [Unitless]
+    inv      - index of the unique Mach number of each case                              [Unitless]
+    RHS      - right-hand side of each case                                              [Unitless]
+    key      - hash of the vortex distribution, None disables the cache                  [string]
+    settings.use_VORLAX_matrix_calculation                                               [boolean]
+    settings.AIC_factorization_cache_size                                                [Unitless], 0 disables the cache
+
+    Outputs:
+    GAMMA    - vortex strengths of each case                                             [Unitless]
+
+    Properties Used:
+    N/A
+    """
+    cache_size = settings.AIC_factorization_cache_size if ('AIC_factorization_cache_size' in settings.keys()) else 0
+    dtype      = np.result_type(A,RHS)
+    GAMMA      = np.zeros(RHS.shape,dtype=dtype)
+
+    for i, mach in enumerate(m_unique[:,0]):
+        factor_key = (key,float(mach),settings.use_VORLAX_matrix_calculation,dtype.str)
+        factors    = AIC_cache.pop(factor_key,None) if (cache_size and key is not None) else None
+        if factors is None:
+            factors = lu_factor(A[i].astype(dtype),check_finite=False)
+
+        cases        = np.where(inv == i)[0]
+        GAMMA[cases] = lu_solve(factors,RHS[cases].T.astype(dtype),check_finite=False).T
+
+        if cache_size and key is not None:
+            AIC_cache[factor_key] = factors
+            while len(AIC_cache) > cache_size:
+                AIC_cache.popitem(last=False)
+
+    return GAMMA
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def clear_AIC_cache():
+    """ Empties the influence coefficient matrix factorization cache
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    None
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    AIC_cache.clear()
+    return
@@ -0,0 +1,196 @@
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+# symmetric_half_model.py
+#
+# Created:  Oct 2026, agent
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+# package imports
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Panel Images
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def compute_panel_images(VD, tolerance=1E-6):
+    """ Pairs every panel of the vortex lattice with its mirror image across the xz-plane of the vehicle, so that a
+    symmetric flight condition can be solved on one half of the lattice.
+
+    Assumptions:
+    Panels that are their own image, such as those of a vertical tail on the centerline, must lie in the plane of
+    symmetry. Their vortex strength is zero in symmetric flight.
+    The lattice is not mirror symmetric if any panel has no image, for instance with deflected ailerons.
+
+    Source:
+    None
+
+    Inputs:
+    VD.XC, VD.YC, VD.ZC      control points                                     [m]
+    VD.YAH, VD.YBH           spanwise ends of the bound vortices                [m]
+    tolerance                matching tolerance relative to the lattice size    [-]
+
+    Outputs:
+    images                   index of the image of each panel, None if the     [-]
+                             lattice is not mirror symmetric
+
+    Properties Used:
+    N/A
+    """
+    points = np.stack([np.ravel(VD.XC),np.ravel(VD.YC),np.ravel(VD.ZC)],axis=1).astype(float)
+    n_cp   = len(points)
+    if n_cp == 0:
+        return None
+
+    # round the control points and their reflections onto a common grid and match them
+    scale  = tolerance*max(np.max(np.abs(points)),1E-12)
+    keys   = [tuple(key) for key in np.round(points/scale).astype(np.int64)]
+    mirror = [tuple(key) for key in np.round(points*np.array([1.,-1.,1.])/scale).astype(np.int64)]
+    lookup = dict(zip(keys,range(n_cp)))
+    if len(lookup) != n_cp:
+        return None
+
+    images = np.array([lookup.get(key,-1) for key in mirror])
+    if np.any(images < 0):
+        return None
+
+    # panels that are their own image must lie in the plane of symmetry
+    in_plane = images == np.arange(n_cp)
+    span     = np.maximum(np.abs(np.ravel(VD.YAH)),np.abs(np.ravel(VD.YBH)))
+    if np.any(span[in_plane] > scale):
+        return None
+
+    return images
+
+# ----------------------------------------------------------------------
+#  Symmetric Conditions
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def symmetric_conditions(RHS, images, tolerance=1E-6):
+    """ Checks if every case is a symmetric flight condition, i.e. if the right-hand side of the vortex lattice is
+    the same on both halves of the lattice and zero on the panels in the plane of symmetry. This is the case without
+    sideslip, roll or yaw rates, antisymmetric deflections or propeller wakes.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    RHS        right-hand side of each case                                 [Unitless]
+    images     index of the image of each panel, None if not symmetric      [-]
+    tolerance  tolerance relative to the largest right-hand side            [-]
+
+    Outputs:
+    symmetric  True if the half-model solves every case                     [boolean]
+
+    Properties Used:
+    N/A
+    """
+    if images is None:
+        return False
+
+    atol     = tolerance*max(np.max(np.abs(RHS)),1E-12)
+    in_plane = images == np.arange(len(images))
+    return bool(np.all(np.abs(RHS - RHS[:,images]) <= atol) and np.all(np.abs(RHS[:,in_plane]) <= atol))
+
+# ----------------------------------------------------------------------
+#  Half Model
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def half_model_panels(VD, images):
+    """ Selects the panels of the half-model: the starboard panel of each pair of images, whose vortex strengths are
+    the unknowns, and the receiving points at which induced velocities are computed, which also include the panels
+    in the plane of symmetry.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    VD.YC        spanwise location of the control points                   [m]
+    images       index of the image of each panel                          [-]
+
+    Outputs:
+    half         starboard panel of each pair of images                    [-]
+    receivers    receiving points of the half-model, sorted                [-]
+
+    Properties Used:
+    N/A
+    """
+    n_cp      = len(images)
+    YC        = np.ravel(VD.YC)
+    paired    = images != np.arange(n_cp)
+    half      = np.where(paired & ((YC > YC[images]) | ((YC == YC[images]) & (np.arange(n_cp) < images))))[0]
+    receivers = np.sort(np.concatenate([half,np.where(~paired)[0]]))
+
+    return half, receivers
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def fold_AIC(A, half, receivers, images):
+    """ Folds the influence coefficient matrix of the receiving points of the half-model onto its unknowns: the
+    vortex of each starboard panel induces velocities together with its image, which has the same strength.
+
+    Assumptions:
+    Symmetric flight condition, see symmetric_conditions
+
+    Source:
+    None
+
+    Inputs:
+    A            influence coefficients at the receiving points, (n_mach, n_receivers, n_cp)   [Unitless]
+    half         starboard panel of each pair of images                                          [-]
+    receivers    receiving points of the half-model                                              [-]
+    images       index of the image of each panel                                                [-]
+
+    Outputs:
+    A_half       influence coefficient matrix of the half-model, (n_mach, n_half, n_half)        [Unitless]
+
+    Properties Used:
+    N/A
+    """
+    rows   = np.searchsorted(receivers,half)
+    A_rows = A[:,rows,:]
+    return A_rows[:,:,half] + A_rows[:,:,images[half]]
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def mirror_receiver_rows(M, receivers, images, indices):
+    """ Recovers rows of a matrix of the full lattice from the rows of the receiving points of the half-model. The
+    row of a port panel is the row of its image with its columns mirrored.
+
+    Assumptions:
+    The matrix is unchanged by a reflection of both the receiving and sending panels, as is the normalwash EW
+
+    Source:
+    None
+
+    Inputs:
+    M            matrix at the receiving points, (n_mach, n_receivers, n_cp)     [Unitless]
+    receivers    receiving points of the half-model                              [-]
+    images       index of the image of each panel                                [-]
+    indices      rows of the full lattice to recover                             [-]
+
+    Outputs:
+    M_rows       matrix at the requested rows, (n_mach, n_indices, n_cp)         [Unitless]
+
+    Properties Used:
+    N/A
+    """
+    n_cp        = len(images)
+    position    = np.full(n_cp,-1)
+    position[receivers] = np.arange(len(receivers))
+
+    indices     = np.asarray(indices)
+    M_rows      = np.empty((M.shape[0],len(indices),M.shape[2]),dtype=M.dtype)
+    received    = position[indices] >= 0
+    M_rows[:,received] = M[:,position[indices[received]]]
+    M_rows[:,~received] = M[:,position[images[indices[~received]]]][:,:,images]
+
+    return M_rows
@@ -9,8 +9,23 @@
 import RCAIDE 
 from RCAIDE.Framework.Core import  Data 
 from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method.VLM import  VLM
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method.cached_vortex_distribution import cached_vortex_distribution
 # package imports
 import numpy                                                     as np 
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+
+# settings and geometry shipped to each training worker process once, when the worker starts
+_training_settings = None
+_training_geometry = None
+
+# longitudinal coefficients of evaluate_VLM checked by the adaptive training grid, the lateral ones vanish in the
+# symmetric alpha sweep
+adaptive_coefficient_names = ['Clift','Cdrag','CX','CZ','CM']
+all_coefficient_names      = ['Clift','Cdrag','CX','CY','CZ','CL','CM','CN']
+
+# times an interval of the coarse adaptive grid may be bisected, bounding refinement where coefficients are not smooth
+max_bisections = 6
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  Vortex_Lattice
@@ -32,28 +47,35 @@ def train_VLM_surrogates(aerodynamics):
         None    
     """
  
-    Mach          = aerodynamics.training.Mach 
     training      = aerodynamics.training  
+    if 'adaptive' in training.keys() and training.adaptive:
+        Mach, AoA, samples = adapt_training_grid(aerodynamics)
+    else:
+        Mach, AoA, samples = training.Mach, training.angle_of_attack, None
     sub_len       = int(sum(Mach<1.))  
     sub_Mach      = Mach[:sub_len] 
     sup_Mach      = Mach[sub_len:] 
     
-    training.subsonic    =  train_model(aerodynamics, sub_Mach)  
-    training.supersonic  =  train_model(aerodynamics, sup_Mach)
-    training.transonic   =  train_trasonic_model(aerodynamics, training.subsonic,training.supersonic,sub_Mach, sup_Mach) 
+    training.subsonic    =  train_model(aerodynamics, sub_Mach, AoA, samples)  
+    training.supersonic  =  train_model(aerodynamics, sup_Mach, AoA, samples)
+    training.transonic   =  train_trasonic_model(aerodynamics, training.subsonic,training.supersonic,sub_Mach, sup_Mach, AoA) 
     return 
     
-def train_model(aerodynamics, Mach): 
+def train_model(aerodynamics, Mach, AoA, samples=None): 
     """Sub function that call methods to run VLM for sample point evaluation. 
     
     Assumptions:
-        None
+        The alpha sweep is gathered from the samples of the adaptive training grid when they are given, instead of
+        being evaluated again.
         
     Source:
         None
 
     Args:
-        aerodynamics       : VLM analysis          [unitless] 
+        aerodynamics       : VLM analysis                                             [unitless] 
+        Mach               : Mach number grid                                         [unitless] 
+        AoA                : angle of attack grid                                     [radians] 
+        samples            : VLM outputs of each pair of Mach number and angle of attack, or None [dict]
         
     Returns: 
         None    
@@ -61,35 +83,19 @@ def train_model(aerodynamics, Mach):
 
     geometry       = aerodynamics.geometry
     settings       = aerodynamics.settings
-    AoA            = aerodynamics.training.angle_of_attack                  
     Beta           = aerodynamics.training.sideslip_angle
     training       = Data()
     training.Mach  = Mach 
+    training.angle_of_attack = AoA
     
     # loop through wings to determine what control surfaces are present 
+    control_surface_sweeps = get_control_surface_sweeps(aerodynamics)
     for wing in aerodynamics.geometry.wings: 
         for control_surface in wing.control_surfaces:
             control_surface.deflection  =  0.0
-            if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Aileron:  
-                delta_a                    = aerodynamics.training.aileron_deflection
-                len_d_a                    = len(delta_a)
-                aerodynamics.aileron_flag  = True 
-            if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Elevator:  
-                delta_e                    = aerodynamics.training.elevator_deflection
-                len_d_e                    = len(delta_e)   
-                aerodynamics.elevator_flag = True 
-            if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Rudder:   
-                delta_r                    = aerodynamics.training.rudder_deflection
-                aerodynamics.rudder_flag   = True
-                len_d_r                    = len(delta_r)  
-            if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Slat:  
-                delta_s                = aerodynamics.training.slat_deflection
-                len_d_s                = len(delta_s)   
-                aerodynamics.slat_flag = True 
-            if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Flap: 
-                delta_f                     = aerodynamics.training.rudder_deflection
-                len_d_f                     = len(delta_f)  
-                aerodynamics.flap_flag      = True 
+            for name, control_surface_type, deflections in control_surface_sweeps:
+                if type(control_surface) == control_surface_type:
+                    aerodynamics[name + '_flag'] = True 
              
     u              = aerodynamics.training.u
     v              = aerodynamics.training.v
@@ -107,6 +113,9 @@ def train_model(aerodynamics, Mach):
     len_p          = len(roll_rate) 
     len_r          = len(yaw_rate) 
     
+    # conditions and control surface deflection of every sweep, evaluated together below
+    sweeps         = []
+    
     # --------------------------------------------------------------------------------------------------------------
     # Alpha
     # --------------------------------------------------------------------------------------------------------------
@@ -121,7 +130,135 @@ def train_model(aerodynamics, Mach):
     conditions.freestream.mach_number               = Machs
     conditions.aerodynamics.angles.alpha            = np.ones_like(Machs)*AoAs 
     
-    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res, S_ref,b_ref,c_ref,X_ref,Y_ref ,Z_ref, Clift_wing_res, Cdrag_wing_res,_= evaluate_VLM(conditions,settings,geometry)
+    sweeps.append(Data(conditions = conditions, deflection = None))
+    
+    # --------------------------------------------------------------------------------------------------------------
+    # Beta 
+    # --------------------------------------------------------------------------------------------------------------
+    Betas         = np.atleast_2d(np.tile(Beta,len_Mach).T.flatten()).T 
+    Machs         = np.atleast_2d(np.repeat(Mach,len_Beta)).T        
+
+    conditions                                      = RCAIDE.Framework.Mission.Common.Results()
+    conditions.expand_rows(rows= len(Machs))
+    conditions.freestream.mach_number               = Machs 
+    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
+    conditions.aerodynamics.angles.beta             = np.ones_like(Machs)*Betas   
+    
+    sweeps.append(Data(conditions = conditions, deflection = None))
+    
+    # -------------------------------------------------------      
+    # Velocity u 
+    # -------------------------------------------------------
+    u_s     = np.atleast_2d(np.tile(u, len_Mach).T.flatten()).T 
+    Machs   = np.atleast_2d(np.repeat(Mach,len_u)).T                   
+    conditions                                      = RCAIDE.Framework.Mission.Common.Results() 
+    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12 
+    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
+    conditions.freestream.mach_number               = Machs + Machs*u_s 
+    
+    sweeps.append(Data(conditions = conditions, deflection = None))
+    
+    # -------------------------------------------------------               
+    # Velocity v 
+    # -------------------------------------------------------
+    v_s     = np.atleast_2d(np.tile(v, len_Mach).T.flatten()).T 
+    Machs         = np.atleast_2d(np.repeat(Mach,len_v)).T    
+
+    conditions                                      = RCAIDE.Framework.Mission.Common.Results()  
+    conditions.freestream.mach_number               = Machs
+    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
+    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
+    conditions.aerodynamics.angles.beta             = np.arcsin(v_s)       
+    
+    sweeps.append(Data(conditions = conditions, deflection = None))
+    
+    # -------------------------------------------------------               
+    # Velocity w 
+    # -------------------------------------------------------
+    w_s     = np.atleast_2d(np.tile(w, len_Mach).T.flatten()).T 
+    Machs   = np.atleast_2d(np.repeat(Mach,len_w)).T
+     
+    conditions                                      = RCAIDE.Framework.Mission.Common.Results()  
+    conditions.freestream.mach_number               = Machs 
+    conditions.aerodynamics.angles.alpha            = np.arcsin(w_s)
+    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
+    
+    sweeps.append(Data(conditions = conditions, deflection = None))
+    
+    # -------------------------------------------------------               
+    # Pitch Rate 
+    # -------------------------------------------------------
+    q_s     = np.atleast_2d(np.tile(pitch_rate, len_Mach).T.flatten()).T 
+    Machs   = np.atleast_2d(np.repeat(Mach,len_q)).T
+
+    conditions                                      = RCAIDE.Framework.Mission.Common.Results() 
+    conditions.freestream.mach_number               = Machs 
+    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
+    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
+    conditions.static_stability.pitch_rate          = np.ones_like(Machs)*q_s     
+    conditions.freestream.velocity                  = Machs * 343 # speed of sound   
+    
+    sweeps.append(Data(conditions = conditions, deflection = None))
+    
+    # -------------------------------------------------------               
+    # Roll  Rate 
+    # -------------------------------------------------------    
+    p_s     = np.atleast_2d(np.tile(roll_rate, len_Mach).T.flatten()).T 
+    Machs         = np.atleast_2d(np.repeat(Mach,len_p)).T
+
+    conditions                                      = RCAIDE.Framework.Mission.Common.Results() 
+    conditions.freestream.mach_number               = Machs  
+    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12 
+    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
+    conditions.static_stability.roll_rate           = np.ones_like(Machs)*p_s 
+    conditions.freestream.velocity                  = Machs * 343 # speed of sound           
+        
+    sweeps.append(Data(conditions = conditions, deflection = None))
+    
+    # -------------------------------------------------------               
+    # Yaw Rate 
+    # -------------------------------------------------------        
+    r_s     = np.atleast_2d(np.tile(yaw_rate, len_Mach).T.flatten()).T 
+    Machs         = np.atleast_2d(np.repeat(Mach,len_r)).T
+
+    conditions                                      = RCAIDE.Framework.Mission.Common.Results() 
+    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
+    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
+    conditions.freestream.mach_number               = Machs 
+    conditions.static_stability.yaw_rate            = np.ones_like(Machs)*r_s
+    conditions.freestream.velocity                  = Machs * 343 # speed of sound  
+    
+    sweeps.append(Data(conditions = conditions, deflection = None))
+    
+    # --------------------------------------------------------------------------------------------------------------
+    # Control Surfaces 
+    # --------------------------------------------------------------------------------------------------------------
+    for name, control_surface_type, deflections in control_surface_sweeps:
+        if aerodynamics[name + '_flag']:
+            for wing in aerodynamics.geometry.wings: 
+                for control_surface in wing.control_surfaces:  
+                    if type(control_surface) == control_surface_type:
+                        for delta in deflections:
+                            Machs                                           = np.atleast_2d(np.repeat(Mach,1)).T         
+                            conditions                                      = RCAIDE.Framework.Mission.Common.Results()
+                            conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
+                            conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
+                            conditions.freestream.mach_number               = Machs 
+                            conditions.control_surfaces[name].deflection    = np.ones_like(Machs)*delta
+                            deflection                                      = [wing.tag, control_surface.tag, delta]
+                            sweeps.append(Data(conditions = conditions, deflection = deflection))
+     
+    # evaluate the sweeps, in parallel if settings.training_workers > 1, and merge the results in order
+    if samples is None:
+        sweep_results  = iter(evaluate_VLM_sweeps(sweeps,settings,geometry))
+    else:
+        alpha_results  = stack_VLM_results([samples[(m,a)] for m in Mach for a in AoA])
+        sweep_results  = iter([alpha_results] + evaluate_VLM_sweeps(sweeps[1:],settings,geometry))
+    
+    # --------------------------------------------------------------------------------------------------------------
+    # Alpha
+    # --------------------------------------------------------------------------------------------------------------
+    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res, S_ref,b_ref,c_ref,X_ref,Y_ref ,Z_ref, Clift_wing_res, Cdrag_wing_res,_= next(sweep_results)
     
     Clift_alpha   = np.reshape(Clift_res,(len_Mach,len_AoA)).T 
     Cdrag_alpha   = np.reshape(Cdrag_res,(len_Mach,len_AoA)).T 
@@ -133,14 +270,15 @@ def train_model(aerodynamics, Mach):
     CN_alpha      = np.reshape(CN_res,(len_Mach,len_AoA)).T  
     
     # Angle of Attack at 0 Degrees 
-    Clift_alpha_0   =  np.tile(Clift_alpha[2][None,:],(3,1))
-    Cdrag_alpha_0   =  np.tile(Cdrag_alpha[2][None,:],(3,1))
-    CX_alpha_0      =  np.tile(CX_alpha[2][None,:],(3, 1)) 
-    CY_alpha_0      =  np.tile(CY_alpha[2][None,:],(3, 1)) 
-    CZ_alpha_0      =  np.tile(CZ_alpha[2][None,:],(3, 1)) 
-    CL_alpha_0      =  np.tile(CL_alpha[2][None,:],(3, 1)) 
-    CM_alpha_0      =  np.tile(CM_alpha[2][None,:],(3, 1)) 
-    CN_alpha_0      =  np.tile(CN_alpha[2][None,:],(3, 1))  
+    i_0             =  np.argmin(np.abs(AoA))
+    Clift_alpha_0   =  np.tile(Clift_alpha[i_0][None,:],(3,1))
+    Cdrag_alpha_0   =  np.tile(Cdrag_alpha[i_0][None,:],(3,1))
+    CX_alpha_0      =  np.tile(CX_alpha[i_0][None,:],(3, 1)) 
+    CY_alpha_0      =  np.tile(CY_alpha[i_0][None,:],(3, 1)) 
+    CZ_alpha_0      =  np.tile(CZ_alpha[i_0][None,:],(3, 1)) 
+    CL_alpha_0      =  np.tile(CL_alpha[i_0][None,:],(3, 1)) 
+    CM_alpha_0      =  np.tile(CM_alpha[i_0][None,:],(3, 1)) 
+    CN_alpha_0      =  np.tile(CN_alpha[i_0][None,:],(3, 1))  
 
     aerodynamics.reference_values.S_ref = S_ref
     aerodynamics.reference_values.b_ref = b_ref
@@ -160,16 +298,7 @@ def train_model(aerodynamics, Mach):
     # --------------------------------------------------------------------------------------------------------------
     # Beta 
     # --------------------------------------------------------------------------------------------------------------
-    Betas         = np.atleast_2d(np.tile(Beta,len_Mach).T.flatten()).T 
-    Machs         = np.atleast_2d(np.repeat(Mach,len_Beta)).T        
-
-    conditions                                      = RCAIDE.Framework.Mission.Common.Results()
-    conditions.expand_rows(rows= len(Machs))
-    conditions.freestream.mach_number               = Machs 
-    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
-    conditions.aerodynamics.angles.beta             = np.ones_like(Machs)*Betas   
-    
-    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_= evaluate_VLM(conditions,settings,geometry)
+    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_= next(sweep_results)
     
     Clift_beta = np.reshape(Clift_res,(len_Mach,len_Beta)).T - Clift_alpha_0
     Cdrag_beta = np.reshape(Cdrag_res,(len_Mach,len_Beta)).T - Cdrag_alpha_0                                
@@ -183,14 +312,7 @@ def train_model(aerodynamics, Mach):
     # -------------------------------------------------------      
     # Velocity u 
     # -------------------------------------------------------
-    u_s     = np.atleast_2d(np.tile(u, len_Mach).T.flatten()).T 
-    Machs   = np.atleast_2d(np.repeat(Mach,len_u)).T                   
-    conditions                                      = RCAIDE.Framework.Mission.Common.Results() 
-    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12 
-    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-    conditions.freestream.mach_number               = Machs + Machs*u_s 
-    
-    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_= evaluate_VLM(conditions,settings,geometry)
+    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_= next(sweep_results)
     
     Clift_u     = np.reshape(Clift_res,(len_Mach,len_u)).T - Clift_alpha_0
     Cdrag_u     = np.reshape(Cdrag_res,(len_Mach,len_u)).T - Cdrag_alpha_0
@@ -204,16 +326,7 @@ def train_model(aerodynamics, Mach):
     # -------------------------------------------------------               
     # Velocity v 
     # -------------------------------------------------------
-    v_s     = np.atleast_2d(np.tile(v, len_Mach).T.flatten()).T 
-    Machs         = np.atleast_2d(np.repeat(Mach,len_v)).T    
-
-    conditions                                      = RCAIDE.Framework.Mission.Common.Results()  
-    conditions.freestream.mach_number               = Machs
-    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
-    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-    conditions.aerodynamics.angles.beta             = np.arcsin(v_s)       
-    
-    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_= evaluate_VLM(conditions,settings,geometry)
+    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_= next(sweep_results)
     
     Clift_v     = np.reshape(Clift_res,(len_Mach,len_v)).T - Clift_alpha_0
     Cdrag_v     = np.reshape(Cdrag_res,(len_Mach,len_v)).T - Cdrag_alpha_0
@@ -227,15 +340,7 @@ def train_model(aerodynamics, Mach):
     # -------------------------------------------------------               
     # Velocity w 
     # -------------------------------------------------------
-    w_s     = np.atleast_2d(np.tile(w, len_Mach).T.flatten()).T 
-    Machs   = np.atleast_2d(np.repeat(Mach,len_w)).T
-     
-    conditions                                      = RCAIDE.Framework.Mission.Common.Results()  
-    conditions.freestream.mach_number               = Machs 
-    conditions.aerodynamics.angles.alpha            = np.arcsin(w_s)
-    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-    
-    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_= evaluate_VLM(conditions,settings,geometry)
+    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_= next(sweep_results)
     
     Clift_w     = np.reshape(Clift_res,(len_Mach,len_w)).T - Clift_alpha_0
     Cdrag_w     = np.reshape(Cdrag_res,(len_Mach,len_w)).T - Cdrag_alpha_0
@@ -249,17 +354,7 @@ def train_model(aerodynamics, Mach):
     # -------------------------------------------------------               
     # Pitch Rate 
     # -------------------------------------------------------
-    q_s     = np.atleast_2d(np.tile(pitch_rate, len_Mach).T.flatten()).T 
-    Machs   = np.atleast_2d(np.repeat(Mach,len_q)).T
-
-    conditions                                      = RCAIDE.Framework.Mission.Common.Results() 
-    conditions.freestream.mach_number               = Machs 
-    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
-    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-    conditions.static_stability.pitch_rate          = np.ones_like(Machs)*q_s     
-    conditions.freestream.velocity                  = Machs * 343 # speed of sound   
-    
-    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_= evaluate_VLM(conditions,settings,geometry)
+    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_= next(sweep_results)
     
     Clift_q     = np.reshape(Clift_res,(len_Mach,len_q)).T - Clift_alpha_0
     Cdrag_q     = np.reshape(Cdrag_res,(len_Mach,len_q)).T - Cdrag_alpha_0
@@ -273,17 +368,7 @@ def train_model(aerodynamics, Mach):
     # -------------------------------------------------------               
     # Roll  Rate 
     # -------------------------------------------------------    
-    p_s     = np.atleast_2d(np.tile(roll_rate, len_Mach).T.flatten()).T 
-    Machs         = np.atleast_2d(np.repeat(Mach,len_p)).T
-
-    conditions                                      = RCAIDE.Framework.Mission.Common.Results() 
-    conditions.freestream.mach_number               = Machs  
-    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12 
-    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-    conditions.static_stability.roll_rate           = np.ones_like(Machs)*p_s 
-    conditions.freestream.velocity                  = Machs * 343 # speed of sound           
-        
-    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_= evaluate_VLM(conditions,settings,geometry)  
+    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_= next(sweep_results)
         
     Clift_p     = np.reshape(Clift_res,(len_Mach,len_p)).T - Clift_alpha_0
     Cdrag_p     = np.reshape(Cdrag_res,(len_Mach,len_p)).T - Cdrag_alpha_0
@@ -297,17 +382,7 @@ def train_model(aerodynamics, Mach):
     # -------------------------------------------------------               
     # Yaw Rate 
     # -------------------------------------------------------        
-    r_s     = np.atleast_2d(np.tile(yaw_rate, len_Mach).T.flatten()).T 
-    Machs         = np.atleast_2d(np.repeat(Mach,len_r)).T
-
-    conditions                                      = RCAIDE.Framework.Mission.Common.Results() 
-    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
-    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-    conditions.freestream.mach_number               = Machs 
-    conditions.static_stability.yaw_rate            = np.ones_like(Machs)*r_s
-    conditions.freestream.velocity                  = Machs * 343 # speed of sound  
-    
-    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_= evaluate_VLM(conditions,settings,geometry)
+    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_= next(sweep_results)
     
     Clift_r     = np.reshape(Clift_res,(len_Mach,len_r)).T - Clift_alpha_0
     Cdrag_r     = np.reshape(Cdrag_res,(len_Mach,len_r)).T - Cdrag_alpha_0
@@ -472,304 +547,36 @@ def train_model(aerodynamics, Mach):
     training.dCN_dr = (CN_r[0,:] - CN_r[1,:]) / (yaw_rate[0]-yaw_rate[1])
 
 
-    '''  for control surfaces, subtract inflence WITHOUT control surface deflected from coefficients WITH control surfaces'''
-     
-    # --------------------------------------------------------------------------------------------------------------
-    # Aileron 
-    # --------------------------------------------------------------------------------------------------------------   
-    if aerodynamics.aileron_flag:  
-        for wing in aerodynamics.geometry.wings: 
-            for control_surface in wing.control_surfaces:  
-                if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Aileron:
-                    
-                    Clift_d_a      = np.zeros((len_d_a,len_Mach)) 
-                    Cdrag_d_a      = np.zeros((len_d_a,len_Mach)) 
-                    CX_d_a         = np.zeros((len_d_a,len_Mach)) 
-                    CY_d_a         = np.zeros((len_d_a,len_Mach)) 
-                    CZ_d_a         = np.zeros((len_d_a,len_Mach)) 
-                    CL_d_a         = np.zeros((len_d_a,len_Mach)) 
-                    CM_d_a         = np.zeros((len_d_a,len_Mach)) 
-                    CN_d_a         = np.zeros((len_d_a,len_Mach))
-                    config_delta_a = 1 * control_surface.deflection
-                    for a_i in range(len_d_a):   
-                        Delta_a_s                                       = np.atleast_2d(np.tile(delta_a[a_i],len_Mach).T.flatten()).T 
-                        Machs                                           = np.atleast_2d(np.repeat(Mach,1)).T         
-                        conditions                                      = RCAIDE.Framework.Mission.Common.Results()
-                        conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
-                        conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-                        conditions.freestream.mach_number               = Machs 
-                        conditions.control_surfaces.aileron.deflection  = np.ones_like(Machs)*Delta_a_s
-                        control_surface.deflection                      = delta_a[a_i]
-                        
-                        Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_= evaluate_VLM(conditions,settings,geometry)   
-                        Clift_d_a[a_i,:] = Clift_res[:,0]  - Clift_alpha_0[0,:]
-                        Cdrag_d_a[a_i,:] = Cdrag_res[:,0]  - Cdrag_alpha_0[0,:]                                
-                        CX_d_a[a_i,:]    = CX_res[:,0]   - CX_alpha_0[0,:]   
-                        CY_d_a[a_i,:]    = CY_res[:,0]   - CY_alpha_0[0,:]  
-                        CZ_d_a[a_i,:]    = CZ_res[:,0]   - CZ_alpha_0[0,:]  
-                        CL_d_a[a_i,:]    = CL_res[:,0]   - CL_alpha_0[0,:]  
-                        CM_d_a[a_i,:]    = CM_res[:,0]   - CM_alpha_0[0,:]  
-                        CN_d_a[a_i,:]    = CN_res[:,0]   - CN_alpha_0[0,:]
-                        
-                    # reset deflection 
-                    control_surface.deflection =  config_delta_a 
-
-     
-        training.Clift_delta_a  = Clift_d_a
-        training.Cdrag_delta_a  = Cdrag_d_a 
-        training.CX_delta_a     = CX_d_a 
-        training.CY_delta_a     = CY_d_a 
-        training.CZ_delta_a     = CZ_d_a 
-        training.CL_delta_a     = CL_d_a 
-        training.CM_delta_a     = CM_d_a 
-        training.CN_delta_a     = CN_d_a
-        
-        training.dClift_ddelta_a = (Clift_d_a[0,:] - Clift_d_a[1,:]) / (delta_a[0] - delta_a[1])
-        training.dCdrag_ddelta_a = (Cdrag_d_a[0,:] - Cdrag_d_a[1,:]) / (delta_a[0] - delta_a[1]) 
-        training.dCX_ddelta_a = (CX_d_a[0,:] - CX_d_a[1,:]) / (delta_a[0] - delta_a[1]) 
-        training.dCY_ddelta_a = (CY_d_a[0,:] - CY_d_a[1,:]) / (delta_a[0] - delta_a[1]) 
-        training.dCZ_ddelta_a = (CZ_d_a[0,:] - CZ_d_a[1,:]) / (delta_a[0] - delta_a[1]) 
-        training.dCL_ddelta_a = (CL_d_a[0,:] - CL_d_a[1,:]) / (delta_a[0] - delta_a[1]) 
-        training.dCM_ddelta_a = (CM_d_a[0,:] - CM_d_a[1,:]) / (delta_a[0] - delta_a[1]) 
-        training.dCN_ddelta_a = (CN_d_a[0,:] - CN_d_a[1,:]) / (delta_a[0] - delta_a[1])
-    
-    # --------------------------------------------------------------------------------------------------------------
-    # Elevator 
-    # -------------------------------------------------------------------------------------------------------------- 
-    if aerodynamics.elevator_flag: 
-        for wing in aerodynamics.geometry.wings: 
-            for control_surface in wing.control_surfaces:  
-                if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Elevator: 
-                
-                    Clift_d_e      = np.zeros((len_d_e,len_Mach)) 
-                    Cdrag_d_e      = np.zeros((len_d_e,len_Mach)) 
-                    CX_d_e         = np.zeros((len_d_e,len_Mach)) 
-                    CY_d_e         = np.zeros((len_d_e,len_Mach)) 
-                    CZ_d_e         = np.zeros((len_d_e,len_Mach)) 
-                    CL_d_e         = np.zeros((len_d_e,len_Mach)) 
-                    CM_d_e         = np.zeros((len_d_e,len_Mach)) 
-                    CN_d_e         = np.zeros((len_d_e,len_Mach))
-
-                    config_delta_e = 1 * control_surface.deflection                
-                    for e_i in range(len_d_e):   
-                        Delta_e_s                                       = np.atleast_2d(np.tile(delta_e[e_i],len_Mach).T.flatten()).T 
-                        Machs                                           = np.atleast_2d(np.repeat(Mach,1)).T         
-                        conditions                                      = RCAIDE.Framework.Mission.Common.Results()
-                        conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
-                        conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-                        conditions.freestream.mach_number               = Machs 
-                        conditions.control_surfaces.elevator.deflection = np.ones_like(Machs)*Delta_e_s
-                        control_surface.deflection                      = delta_e[e_i]
-                        
-                        Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_= evaluate_VLM(conditions,settings,geometry)   
-                        Clift_d_e[e_i,:] = Clift_res[:,0]  - Clift_alpha_0[0,:]
-                        Cdrag_d_e[e_i,:] = Cdrag_res[:,0]  - Cdrag_alpha_0[0,:]                                
-                        CX_d_e[e_i,:]    = CX_res[:,0]   - CX_alpha_0[0,:]   
-                        CY_d_e[e_i,:]    = CY_res[:,0]   - CY_alpha_0[0,:]  
-                        CZ_d_e[e_i,:]    = CZ_res[:,0]   - CZ_alpha_0[0,:]  
-                        CL_d_e[e_i,:]    = CL_res[:,0]   - CL_alpha_0[0,:]  
-                        CM_d_e[e_i,:]    = CM_res[:,0]   - CM_alpha_0[0,:]  
-                        CN_d_e[e_i,:]    = CN_res[:,0]   - CN_alpha_0[0,:]                   
-    
-                    # reset deflection 
-                    control_surface.deflection =  config_delta_e 
-                    
-        training.Clift_delta_e  = Clift_d_e
-        training.Cdrag_delta_e  = Cdrag_d_e  
-        training.CX_delta_e  = CX_d_e   
-        training.CY_delta_e  = CY_d_e   
-        training.CZ_delta_e  = CZ_d_e  
-        training.CL_delta_e  = CL_d_e  
-        training.CM_delta_e  = CM_d_e  
-        training.CN_delta_e  = CN_d_e
-        
-        training.dClift_ddelta_e = (Clift_d_e[0,:] - Clift_d_e[1,:]) / (delta_e[0] - delta_e[1])
-        training.dCdrag_ddelta_e = (Cdrag_d_e[0,:] - Cdrag_d_e[1,:]) / (delta_e[0] - delta_e[1])  
-        training.dCX_ddelta_e = (CX_d_e[0,:] - CX_d_e[1,:]) / (delta_e[0] - delta_e[1])  
-        training.dCY_ddelta_e = (CY_d_e[0,:] - CY_d_e[1,:]) / (delta_e[0] - delta_e[1]) 
-        training.dCZ_ddelta_e = (CZ_d_e[0,:] - CZ_d_e[1,:]) / (delta_e[0] - delta_e[1]) 
-        training.dCL_ddelta_e = (CL_d_e[0,:] - CL_d_e[1,:]) / (delta_e[0] - delta_e[1])  
-        training.dCM_ddelta_e = (CM_d_e[0,:] - CM_d_e[1,:]) / (delta_e[0] - delta_e[1])  
-        training.dCN_ddelta_e = (CN_d_e[0,:] - CN_d_e[1,:]) / (delta_e[0] - delta_e[1])
-        
-    # --------------------------------------------------------------------------------------------------------------
-    # Rudder 
-    # -------------------------------------------------------------------------------------------------------------- 
-    if aerodynamics.rudder_flag:
-        for wing in aerodynamics.geometry.wings: 
-            for control_surface in wing.control_surfaces:  
-                if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Rudder: 
-                    Clift_d_r      = np.zeros((len_d_r,len_Mach)) 
-                    Cdrag_d_r      = np.zeros((len_d_r,len_Mach)) 
-                    CX_d_r         = np.zeros((len_d_r,len_Mach)) 
-                    CY_d_r         = np.zeros((len_d_r,len_Mach)) 
-                    CZ_d_r         = np.zeros((len_d_r,len_Mach)) 
-                    CL_d_r         = np.zeros((len_d_r,len_Mach)) 
-                    CM_d_r         = np.zeros((len_d_r,len_Mach)) 
-                    CN_d_r         = np.zeros((len_d_r,len_Mach))
-
-                    config_delta_r = 1 * control_surface.deflection                  
-                    for r_i in range(len_d_r):   
-                        Delta_r_s                                       = np.atleast_2d(np.tile(delta_r[r_i],len_Mach).T.flatten()).T 
-                        Machs                                           = np.atleast_2d(np.repeat(Mach,1)).T         
-                        conditions                                      = RCAIDE.Framework.Mission.Common.Results()
-                        conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
-                        conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-                        conditions.freestream.mach_number               = Machs 
-                        conditions.control_surfaces.rudder.deflection  = np.ones_like(Machs)*Delta_r_s
-                        control_surface.deflection                      = delta_r[r_i]
-                        
-                        Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_= evaluate_VLM(conditions,settings,geometry)   
-                        Clift_d_r[r_i,:] = Clift_res[:,0]  - Clift_alpha_0[0,:]
-                        Cdrag_d_r[r_i,:] = Cdrag_res[:,0]  - Cdrag_alpha_0[0,:]                                
-                        CX_d_r[r_i,:]    = CX_res[:,0]   - CX_alpha_0[0,:]   
-                        CY_d_r[r_i,:]    = CY_res[:,0]   - CY_alpha_0[0,:]  
-                        CZ_d_r[r_i,:]    = CZ_res[:,0]   - CZ_alpha_0[0,:]  
-                        CL_d_r[r_i,:]    = CL_res[:,0]   - CL_alpha_0[0,:]  
-                        CM_d_r[r_i,:]    = CM_res[:,0]   - CM_alpha_0[0,:]  
-                        CN_d_r[r_i,:]    = CN_res[:,0]   - CN_alpha_0[0,:] 
-    
-                    # reset deflection 
-                    control_surface.deflection =  config_delta_r
-                    
-        training.Clift_delta_r  = Clift_d_r
-        training.Cdrag_delta_r  = Cdrag_d_r     
-        training.CX_delta_r  = CX_d_r   
-        training.CY_delta_r  = CY_d_r 
-        training.CZ_delta_r  = CZ_d_r 
-        training.CL_delta_r  = CL_d_r  
-        training.CM_delta_r  = CM_d_r                   
-        training.CN_delta_r  = CN_d_r    
-        training.dClift_ddelta_r = (Clift_d_r[0,:] - Clift_d_r[1,:]) / (delta_r[0] - delta_r[1])
-        training.dCdrag_ddelta_r = (Cdrag_d_r[0,:] - Cdrag_d_r[1,:]) / (delta_r[0] - delta_r[1])  
-        training.dCX_ddelta_r = (CX_d_r[0,:] - CX_d_r[1,:]) / (delta_r[0] - delta_r[1])   
-        training.dCY_ddelta_r = (CY_d_r[0,:] - CY_d_r[1,:]) / (delta_r[0] - delta_r[1]) 
-        training.dCZ_ddelta_r = (CZ_d_r[0,:] - CZ_d_r[1,:]) / (delta_r[0] - delta_r[1])  
-        training.dCL_ddelta_r = (CL_d_r[0,:] - CL_d_r[1,:]) / (delta_r[0] - delta_r[1])  
-        training.dCM_ddelta_r = (CM_d_r[0,:] - CM_d_r[1,:]) / (delta_r[0] - delta_r[1]) 
-        training.dCN_ddelta_r = (CN_d_r[0,:] - CN_d_r[1,:]) / (delta_r[0] - delta_r[1])  
-                        
     # --------------------------------------------------------------------------------------------------------------
-    # Flap
-    # -------------------------------------------------------------------------------------------------------------- 
-    if aerodynamics.flap_flag:
-        for wing in aerodynamics.geometry.wings: 
-            for control_surface in wing.control_surfaces:  
-                if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Flap:
-                    Clift_d_f      = np.zeros((len_d_f,len_Mach)) 
-                    Cdrag_d_f      = np.zeros((len_d_f,len_Mach)) 
-                    CX_d_f         = np.zeros((len_d_f,len_Mach)) 
-                    CY_d_f         = np.zeros((len_d_f,len_Mach)) 
-                    CZ_d_f         = np.zeros((len_d_f,len_Mach)) 
-                    CL_d_f         = np.zeros((len_d_f,len_Mach)) 
-                    CM_d_f         = np.zeros((len_d_f,len_Mach)) 
-                    CN_d_f         = np.zeros((len_d_f,len_Mach))
-
-                    config_delta_f = 1 * control_surface.deflection                      
-                    for f_i in range(len_d_f):   
-                        Delta_f_s                                       = np.atleast_2d(np.tile(delta_f[f_i],len_Mach).T.flatten()).T 
-                        Machs                                           = np.atleast_2d(np.repeat(Mach,1)).T         
-                        conditions                                      = RCAIDE.Framework.Mission.Common.Results()
-                        conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
-                        conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-                        conditions.freestream.mach_number               = Machs 
-                        conditions.control_surfaces.flap.deflection     = np.ones_like(Machs)*Delta_f_s
-                        control_surface.deflection                      = delta_f[f_i]
-                        
-                        Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_= evaluate_VLM(conditions,settings,geometry)   
-                        Clift_d_f[f_i,:] = Clift_res[:,0]  - Clift_alpha_0[0,:]
-                        Cdrag_d_f[f_i,:] = Cdrag_res[:,0]  - Cdrag_alpha_0[0,:]                                
-                        CX_d_f[f_i,:]    = CX_res[:,0]   - CX_alpha_0[0,:]   
-                        CY_d_f[f_i,:]    = CY_res[:,0]   - CY_alpha_0[0,:]  
-                        CZ_d_f[f_i,:]    = CZ_res[:,0]   - CZ_alpha_0[0,:]  
-                        CL_d_f[f_i,:]    = CL_res[:,0]   - CL_alpha_0[0,:]  
-                        CM_d_f[f_i,:]    = CM_res[:,0]   - CM_alpha_0[0,:]  
-                        CN_d_f[f_i,:]    = CN_res[:,0]   - CN_alpha_0[0,:]         
-    
-                    # reset deflection 
-                    control_surface.deflection =  config_delta_f
-        
-        training.Clift_delta_f  = Clift_d_f    
-        training.Cdrag_delta_f  = Cdrag_d_f    
-        training.CX_delta_f     = CX_d_f  
-        training.CY_delta_f     = CY_d_f  
-        training.CZ_delta_f     = CZ_d_f  
-        training.CL_delta_f     = CL_d_f  
-        training.CM_delta_f     = CM_d_f                   
-        training.CN_delta_f     = CN_d_f 
-        training.dClift_ddelta_f = (Clift_d_f[0,:] - Clift_d_f[1,:]) / (delta_f[0] - delta_f[1])
-        training.dCdrag_ddelta_f = (Cdrag_d_f[0,:] - Cdrag_d_f[1,:]) / (delta_f[0] - delta_f[1])  
-        training.dCX_ddelta_f    = (CX_d_f[0,:] - CX_d_f[1,:]) / (delta_f[0] - delta_f[1])  
-        training.dCY_ddelta_f    = (CY_d_f[0,:] - CY_d_f[1,:]) / (delta_f[0] - delta_f[1]) 
-        training.dCZ_ddelta_f    = (CZ_d_f[0,:] - CZ_d_f[1,:]) / (delta_f[0] - delta_f[1])   
-        training.dCL_ddelta_f    = (CL_d_f[0,:] - CL_d_f[1,:]) / (delta_f[0] - delta_f[1])  
-        training.dCM_ddelta_f    = (CM_d_f[0,:] - CM_d_f[1,:]) / (delta_f[0] - delta_f[1])  
-        training.dCN_ddelta_f    = (CN_d_f[0,:] - CN_d_f[1,:]) / (delta_f[0] - delta_f[1])   
-                    
+    # Control Surfaces 
     # --------------------------------------------------------------------------------------------------------------
-    # Slat
-    # -------------------------------------------------------------------------------------------------------------- 
-    if aerodynamics.slat_flag:
-        for wing in aerodynamics.geometry.wings: 
-            for control_surface in wing.control_surfaces:  
-                if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Slat:
-                    
-                    Clift_d_s      = np.zeros((len_d_s,len_Mach)) 
-                    Cdrag_d_s      = np.zeros((len_d_s,len_Mach)) 
-                    CX_d_s         = np.zeros((len_d_s,len_Mach)) 
-                    CY_d_s         = np.zeros((len_d_s,len_Mach)) 
-                    CZ_d_s         = np.zeros((len_d_s,len_Mach)) 
-                    CL_d_s         = np.zeros((len_d_s,len_Mach)) 
-                    CM_d_s         = np.zeros((len_d_s,len_Mach)) 
-                    CN_d_s         = np.zeros((len_d_s,len_Mach))
-
-                    config_delta_s = 1 * control_surface.deflection                  
-                    for s_i in range(len_d_s):   
-                        Delta_s_s                                       = np.atleast_2d(np.tile(delta_f[f_i],len_Mach).T.flatten()).T 
-                        Machs                                           = np.atleast_2d(np.repeat(Mach,1)).T         
-                        conditions                                      = RCAIDE.Framework.Mission.Common.Results()
-                        conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
-                        conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-                        conditions.freestream.mach_number               = Machs 
-                        conditions.control_surfaces.slat.deflection     = np.ones_like(Machs)*Delta_s_s
-                        control_surface.deflection                      = delta_s[s_i]
-                        
-                        Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_= evaluate_VLM(conditions,settings,geometry)   
-                        Clift_d_s[s_i,:] = Clift_res[:,0]  - Clift_alpha_0[0,:]
-                        Cdrag_d_s[s_i,:] = Cdrag_res[:,0]  - Cdrag_alpha_0[0,:]                                
-                        CX_d_s[s_i,:]    = CX_res[:,0]   - CX_alpha_0[0,:]   
-                        CY_d_s[s_i,:]    = CY_res[:,0]   - CY_alpha_0[0,:]  
-                        CZ_d_s[s_i,:]    = CZ_res[:,0]   - CZ_alpha_0[0,:]  
-                        CL_d_s[s_i,:]    = CL_res[:,0]   - CL_alpha_0[0,:]  
-                        CM_d_s[s_i,:]    = CM_res[:,0]   - CM_alpha_0[0,:]  
-                        CN_d_s[s_i,:]    = CN_res[:,0]   - CN_alpha_0[0,:] 
-    
-                    # reset deflection 
-                    control_surface.deflection =  config_delta_s                        
-
-        training.Clift_delta_s  = Clift_d_s
-        training.Cdrag_delta_s  = Cdrag_d_s
-        training.CX_delta_s  = CX_d_s
-        training.CY_delta_s  = CY_d_s 
-        training.CZ_delta_s  = CZ_d_s 
-        training.CL_delta_s  = CL_d_s 
-        training.CM_delta_s  = CM_d_s
-        training.CN_delta_s  = CN_d_s  
-        training.dClift_ddelta_s = (Clift_d_s[0,:] - Clift_d_s[1,:]) / (delta_s[0] - delta_s[1])
-        training.dCdrag_ddelta_s = (Cdrag_d_s[0,:] - Cdrag_d_s[1,:]) / (delta_s[0] - delta_s[1])
-        training.dCX_ddelta_s = (CX_d_s[0,:] - CX_d_s[1,:]) / (delta_s[0] - delta_s[1])
-        training.dCY_ddelta_s = (CY_d_s[0,:] - CY_d_s[1,:]) / (delta_s[0] - delta_s[1])
-        training.dCZ_ddelta_s = (CZ_d_s[0,:] - CZ_d_s[1,:]) / (delta_s[0] - delta_s[1]) 
-        training.dCL_ddelta_s = (CL_d_s[0,:] - CL_d_s[1,:]) / (delta_s[0] - delta_s[1]) 
-        training.dCM_ddelta_s = (CM_d_s[0,:] - CM_d_s[1,:]) / (delta_s[0] - delta_s[1])  
-        training.dCN_ddelta_s = (CN_d_s[0,:] - CN_d_s[1,:]) / (delta_s[0] - delta_s[1])  
+    # for control surfaces, subtract inflence WITHOUT control surface deflected from coefficients WITH control surfaces
+    coefficients   = ['Clift','Cdrag','CX','CY','CZ','CL','CM','CN']
+    coefficients_0 = [Clift_alpha_0,Cdrag_alpha_0,CX_alpha_0,CY_alpha_0,CZ_alpha_0,CL_alpha_0,CM_alpha_0,CN_alpha_0]
+    for name, control_surface_type, deflections in control_surface_sweeps:
+        if aerodynamics[name + '_flag']:
+            suffix = '_' + name[0]
+            for wing in aerodynamics.geometry.wings: 
+                for control_surface in wing.control_surfaces:  
+                    if type(control_surface) == control_surface_type:
+                        C_delta = np.zeros((len(coefficients),len(deflections),len_Mach))
+                        for d_i in range(len(deflections)):
+                            results = next(sweep_results)
+                            for c_i in range(len(coefficients)):
+                                C_delta[c_i,d_i,:] = results[c_i][:,0] - coefficients_0[c_i][0,:]
+                                
+            for c_i, coefficient in enumerate(coefficients):
+                training[coefficient + '_delta' + suffix] = C_delta[c_i]
+            for c_i, coefficient in enumerate(coefficients):
+                training['d' + coefficient + '_ddelta' + suffix] = (C_delta[c_i][0,:] - C_delta[c_i][1,:]) / (deflections[0] - deflections[1])
+            
     training.NP            = 0  
     
     return training
         
         
 
-def train_trasonic_model(aerodynamics, training_subsonic,training_supersonic,sub_Mach, sup_Mach): 
+def train_trasonic_model(aerodynamics, training_subsonic,training_supersonic,sub_Mach, sup_Mach, AoA): 
     """Sub function that call methods to run VLM for sample point evaluation. 
     
     Assumptions:
@@ -780,16 +587,17 @@ def train_trasonic_model(aerodynamics, training_subsonic,training_supersonic,sub
 
     Args:
         aerodynamics       : VLM analysis          [unitless] 
+        AoA                : angle of attack grid  [radians] 
         
     Returns: 
         None    
     """    
 
     geometry       = aerodynamics.geometry 
-    AoA            = aerodynamics.training.angle_of_attack                  
     Beta           = aerodynamics.training.sideslip_angle
     training       = Data() 
     training.Mach  = np.array([sub_Mach[-1], sup_Mach[0]])
+    training.angle_of_attack = AoA
     u              = aerodynamics.training.u
     v              = aerodynamics.training.v
     w              = aerodynamics.training.w
@@ -1171,6 +979,290 @@ def train_trasonic_model(aerodynamics, training_subsonic,training_supersonic,sub
     
     return training
         
+# ----------------------------------------------------------------------
+#  Training Sweeps
+# ----------------------------------------------------------------------
+def adapt_training_grid(aerodynamics):
+    """Builds the angle of attack and Mach number grids of the training sweeps adaptively. The alpha sweep is first
+    sampled on a coarse grid. Then, pass after pass, intervals of either grid are checked at their midpoint, those
+    bisected after the largest errors first, and the midpoint is inserted where linear interpolation of any longitudinal
+    coefficient misses the VLM by more than the tolerance. Refinement stops when every interval passes or when the next
+    check would exceed the budget of VLM cases, which includes the coarse grid. The VLM outputs of the adapted alpha
+    sweep are returned with the grids, so that the alpha sweep is not evaluated again.
+    
+    Assumptions:
+        The coarse Mach grid holds the first, middle and last subsonic and supersonic Mach numbers of training.Mach,
+        and intervals are only bisected within each regime. Every other training sweep is evaluated at each Mach
+        number, so refining the Mach grid costs the most.
+        The coarse angle of attack grid is training.angle_of_attack. The interval between the first two angles, which
+        give the alpha derivatives, is not refined.
+        The tolerance is an error relative to the magnitude of each coefficient at the midpoint, which is floored at
+        1% of the largest magnitude of that coefficient so that coefficients crossing zero are not over-refined.
+        
+    Source:
+        None
+
+    Args:
+        aerodynamics       : VLM analysis                                    [unitless] 
+        
+    Returns: 
+        Mach               : adapted Mach number grid                        [unitless] 
+        AoA                : adapted angle of attack grid                    [radians] 
+        samples            : VLM outputs of each pair of Mach number and angle of attack [dict]
+    """
+    geometry  = aerodynamics.geometry
+    settings  = aerodynamics.settings
+    training  = aerodynamics.training
+    tolerance = training.adaptive_tolerance
+    budget    = training.adaptive_budget
+    
+    # training leaves every control surface undeflected
+    for wing in geometry.wings: 
+        for control_surface in wing.control_surfaces:
+            control_surface.deflection = 0.0
+    
+    # coarse grids
+    Mach      = np.sort(np.asarray(training.Mach,dtype=float))
+    AoA       = np.asarray(training.angle_of_attack,dtype=float)
+    grids     = [[],sorted(set(AoA))]
+    for regime in [Mach[Mach<1.],Mach[Mach>=1.]]:
+        if len(regime) > 0:
+            grids[0] += sorted(set([regime[0],regime[len(regime)//2],regime[-1]]))
+    widths    = [np.ptp(grids[0]) + 1E-12,np.ptp(grids[1]) + 1E-12]
+    
+    # intervals that may be bisected: axis (0 for Mach, 1 for angle of attack), bounds, number of bisections and
+    # the error of the check that bisected them
+    intervals  = [[0,x_0,x_1,0,np.inf] for x_0, x_1 in zip(grids[0][:-1],grids[0][1:]) if (x_0 < 1.) == (x_1 < 1.)]
+    intervals += [[1,x_0,x_1,0,np.inf] for x_0, x_1 in zip(grids[1][:-1],grids[1][1:]) if [x_0,x_1] != sorted(AoA[:2])]
+    
+    # outputs and longitudinal coefficients of every evaluated pair of Mach number and angle of attack
+    samples   = {}
+    values    = {}
+    def evaluate(points):
+        conditions                           = RCAIDE.Framework.Mission.Common.Results()
+        conditions.freestream.mach_number    = np.array([[m] for m, a in points])
+        conditions.aerodynamics.angles.alpha = np.array([[a] for m, a in points])
+        results      = evaluate_VLM_sweeps([Data(conditions = conditions, deflection = None)],settings,geometry)[0]
+        coefficients = np.concatenate([results[all_coefficient_names.index(name)] for name in adaptive_coefficient_names],axis=1)
+        for i, point in enumerate(points):
+            samples[point] = select_VLM_results(results,i)
+            values[point]  = coefficients[i]
+        return len(points)
+    
+    def line(axis,x):
+        return [(x,y) for y in grids[1]] if axis == 0 else [(y,x) for y in grids[0]]
+    
+    n_evaluated = evaluate([(m,a) for m in grids[0] for a in grids[1]])
+    
+    while len(intervals) > 0:
+        
+        # check the midpoints of the intervals with the largest errors, then the widest, along the current grid of the
+        # other axis
+        intervals.sort(key=lambda interval: (-interval[4],interval[3],-(interval[2] - interval[1])/widths[interval[0]]))
+        checks  = []
+        points  = []
+        for axis, x_0, x_1, level, _ in intervals:
+            x        = 0.5*(x_0 + x_1)
+            midpoint = line(axis,x)
+            if n_evaluated + len(points) + len(midpoint) > budget:
+                break
+            checks.append([axis,x_0,x,x_1,level,zip(midpoint,line(axis,x_0),line(axis,x_1))])
+            points  += midpoint
+        if len(checks) == 0:
+            break
+        n_evaluated += evaluate(points)
+        
+        # insert the midpoints that linear interpolation misses, and bisect their intervals 
+        floor     = 1E-2*np.max(np.abs(np.array(list(values.values()))),axis=0) + 1E-12
+        intervals = intervals[len(checks):]
+        for axis, x_0, x, x_1, level, stencils in checks:
+            error = max([np.max(np.abs(values[point] - 0.5*(values[point_0] + values[point_1]))/np.maximum(np.abs(values[point]),floor)) 
+                         for point, point_0, point_1 in stencils])
+            if error > tolerance:
+                grids[axis].append(x)
+                if level + 1 < max_bisections:
+                    intervals += [[axis,x_0,x,level + 1,error],[axis,x,x_1,level + 1,error]]
+        grids[0].sort()
+        grids[1].sort()
+        
+        # pairs of a Mach number and an angle of attack both inserted in this pass
+        missing = [(m,a) for m in grids[0] for a in grids[1] if (m,a) not in samples]
+        if len(missing) > 0:
+            n_evaluated += evaluate(missing)
+            
+    return np.array(grids[0]), np.array(grids[1]), samples
+
+def select_VLM_results(results,row):
+    """Selects the outputs of evaluate_VLM at a single flight condition.
+        
+    Assumptions:
+        None
+        
+    Source:
+        None
+
+    Args: 
+        results    : outputs of evaluate_VLM                        [tuple]
+        row        : index of the flight condition                  [int]
+        
+    Returns: 
+        results    : outputs of evaluate_VLM at the flight condition [tuple]
+    """
+    def select(value):
+        if isinstance(value,Data):
+            return Data([(key,select(item)) for key, item in value.items()])
+        if isinstance(value,np.ndarray):
+            return value[row:row+1]
+        return value
+    return tuple([select(value) for value in results])
+
+def stack_VLM_results(results):
+    """Stacks the outputs of evaluate_VLM at single flight conditions, as if they were evaluated together.
+        
+    Assumptions:
+        Reference values are the same at every flight condition
+        
+    Source:
+        None
+
+    Args: 
+        results    : outputs of evaluate_VLM at each flight condition  [list]
+        
+    Returns: 
+        results    : outputs of evaluate_VLM                           [tuple]
+    """
+    def stack(values):
+        if isinstance(values[0],Data):
+            return Data([(key,stack([value[key] for value in values])) for key in values[0].keys()])
+        if isinstance(values[0],np.ndarray):
+            return np.concatenate(values,axis=0)
+        return values[0]
+    return tuple([stack(list(values)) for values in zip(*results)])
+
+def get_control_surface_sweeps(aerodynamics):
+    """Lists the control surfaces that are trained and their deflections, in the order of the training sweeps.
+        
+    Assumptions:
+        None
+        
+    Source:
+        None
+
+    Args: 
+        aerodynamics       : VLM analysis          [unitless] 
+        
+    Returns: 
+        control_surface_sweeps : name, type and deflections of each control surface     [list]
+    """
+    Control_Surfaces = RCAIDE.Library.Components.Wings.Control_Surfaces
+    training         = aerodynamics.training
+    
+    control_surface_sweeps = [['aileron' ,Control_Surfaces.Aileron  ,training.aileron_deflection ],
+                              ['elevator',Control_Surfaces.Elevator ,training.elevator_deflection],
+                              ['rudder'  ,Control_Surfaces.Rudder   ,training.rudder_deflection  ],
+                              ['flap'    ,Control_Surfaces.Flap     ,training.flap_deflection    ],
+                              ['slat'    ,Control_Surfaces.Slat     ,training.slat_deflection    ]]
+    
+    return control_surface_sweeps
+
+def evaluate_VLM_sweeps(sweeps,settings,geometry):
+    """Evaluates the VLM for every training sweep, fanning the sweeps out over a pool of settings.training_workers
+    processes. The geometry is sent to each worker once, when the worker starts, and results are returned in the
+    order of the sweeps. With or without workers, the geometry is left with the vortex distribution of the
+    undeflected geometry.
+        
+    Assumptions:
+        Control surface deflections are applied to the copy of the geometry held by the process evaluating the sweep.
+        
+    Source:
+        None
+
+    Args: 
+        sweeps     : conditions and control surface deflection of each sweep     [list]
+        settings   : VLM analysis settings                                       [unitless]
+        geometry   : vehicle configuration                                       [unitless] 
+        
+    Returns: 
+        results    : outputs of evaluate_VLM for each sweep                      [list]
+    """
+    global _training_settings, _training_geometry
+    
+    workers = settings.training_workers if 'training_workers' in settings.keys() else 1
+    workers = min(workers,len(sweeps))
+    
+    if workers <= 1:
+        _training_settings = settings
+        _training_geometry = geometry
+        results = [evaluate_VLM_sweep(sweep) for sweep in sweeps]
+    else:
+        # forked workers inherit the geometry without pickling it
+        if 'fork' in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context('fork')
+        else:
+            context = multiprocessing.get_context()
+        with ProcessPoolExecutor(max_workers=workers,mp_context=context,initializer=initialize_training_worker,initargs=(settings,geometry)) as pool:
+            results = list(pool.map(evaluate_VLM_sweep,sweeps))
+    _training_settings = None
+    _training_geometry = None
+    
+    # the workers panel their own copies of the geometry
+    cached_vortex_distribution(geometry,settings)
+    
+    return results
+
+def initialize_training_worker(settings,geometry):
+    """Stores the settings and geometry in a training worker process.
+        
+    Assumptions:
+        None
+        
+    Source:
+        None
+
+    Args: 
+        settings   : VLM analysis settings [unitless]
+        geometry   : vehicle configuration [unitless] 
+        
+    Returns: 
+        None  
+    """
+    global _training_settings, _training_geometry
+    _training_settings = settings
+    _training_geometry = geometry
+    return
+
+def evaluate_VLM_sweep(sweep):
+    """Evaluates the VLM for a single training sweep, deflecting a control surface for the duration of the sweep.
+        
+    Assumptions:
+        None
+        
+    Source:
+        None
+
+    Args: 
+        sweep      : conditions and control surface deflection      [unitless]
+        
+    Returns: 
+        results    : outputs of evaluate_VLM                        [tuple]
+    """
+    settings = _training_settings
+    geometry = _training_geometry
+    
+    if sweep.deflection is None:
+        return evaluate_VLM(sweep.conditions,settings,geometry)
+    
+    wing_tag, control_surface_tag, delta = sweep.deflection
+    control_surface                      = geometry.wings[wing_tag].control_surfaces[control_surface_tag]
+    config_delta                         = 1 * control_surface.deflection
+    control_surface.deflection           = delta
+    results                              = evaluate_VLM(sweep.conditions,settings,geometry)
+    
+    # reset deflection 
+    control_surface.deflection           = config_delta
+    
+    return results
+        
 # ----------------------------------------------------------------------
 #  Evaluate VLM
 # ----------------------------------------------------------------------
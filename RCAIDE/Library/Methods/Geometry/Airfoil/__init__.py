@@ -11,6 +11,7 @@
 # @ingroup Methods-Geometry-Two_Dimensional-Cross_Section
 
 from .compute_naca_4series        import compute_naca_4series 
+from .airfoil_database            import clear_airfoil_database
 from .compute_airfoil_properties  import compute_airfoil_properties
 from .import_airfoil_dat          import import_airfoil_dat
 from .import_airfoil_geometry     import import_airfoil_geometry 
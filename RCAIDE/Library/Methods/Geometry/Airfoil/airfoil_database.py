@@ -0,0 +1,128 @@
+## @ingroup Library-Methods-Geometry-Two_Dimensional-Airfoil
+# RCAIDE/Library/Methods/Geometry/Two_Dimensional/Airfoil/airfoil_database.py
+#
+#
+# Created:  Oct 2026, agent
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+
+from RCAIDE.Library.Methods.Utilities import Content_Addressed_Store, compute_hash, flatten_data, unflatten_data
+
+# package imports
+import numpy as np
+
+# airfoil properties computed in this process, keyed by hash of the polar files, geometry and options
+airfoil_database = Content_Addressed_Store()
+
+# increment when the airfoil properties computed by compute_airfoil_properties change, invalidating stored properties
+airfoil_database_version = 2
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Airfoil Database
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Library-Methods-Geometry-Two_Dimensional-Airfoil
+def load_airfoil_properties(key,store_directory=None):
+    """Loads the airfoil properties stored under a key, from memory or from the on disk database. Arrays loaded from
+    disk are memory-mapped, so they are only read when accessed.
+
+    Assumptions:
+    Loaded arrays are read only and shared by every airfoil with the same properties
+
+    Source:
+    None
+
+    Inputs:
+    key              hash of the polar files, geometry and options     [string]
+    store_directory  on disk database, None for memory only            [string]
+
+    Outputs:
+    Airfoil_Data     airfoil properties, None if not stored            <data_structure>
+
+    Properties Used:
+    N/A
+    """
+    stored = airfoil_database.load(key,store_directory)
+    if stored is None:
+        return None
+    return unflatten_data(stored,copy=False)
+
+## @ingroup Library-Methods-Geometry-Two_Dimensional-Airfoil
+def save_airfoil_properties(key,Airfoil_Data,store_directory=None):
+    """Stores airfoil properties in memory and, if store_directory is set, on disk
+
+    Assumptions:
+    Every airfoil property is a numeric array or scalar
+
+    Source:
+    None
+
+    Inputs:
+    key              hash of the polar files, geometry and options     [string]
+    Airfoil_Data     airfoil properties                                <data_structure>
+    store_directory  on disk database, None for memory only            [string]
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    airfoil_database.save(key,flatten_data(Airfoil_Data),store_directory)
+    return
+
+## @ingroup Library-Methods-Geometry-Two_Dimensional-Airfoil
+def compute_airfoil_database_key(airfoil_geometry,airfoil_polar_files,use_pre_stall_data):
+    """Hashes the contents of the polar files, the airfoil coordinates and the options that define the properties
+    computed by compute_airfoil_properties
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    airfoil_geometry        <data_structure>
+    airfoil_polar_files     <list of strings>
+    use_pre_stall_data      [Boolean]
+
+    Outputs:
+    key                     hash                [string]
+
+    Properties Used:
+    N/A
+    """
+    coordinates = None
+    if airfoil_geometry is not None:
+        coordinates = [np.asarray(airfoil_geometry.x_coordinates,dtype=float),np.asarray(airfoil_geometry.y_coordinates,dtype=float)]
+    polars      = None
+    if airfoil_polar_files is not None:
+        polars = []
+        for polar_file in airfoil_polar_files:
+            with open(polar_file,'rb') as f:
+                polars.append(f.read())
+    return compute_hash(airfoil_database_version,bool(use_pre_stall_data),coordinates,polars)
+
+## @ingroup Library-Methods-Geometry-Two_Dimensional-Airfoil
+def clear_airfoil_database():
+    """Empties the in memory airfoil database, files on disk are kept
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    None
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    airfoil_database.clear()
+    return
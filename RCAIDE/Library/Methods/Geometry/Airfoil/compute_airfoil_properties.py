@@ -16,6 +16,7 @@ from RCAIDE.Library.Methods.Geometry.Airfoil.import_airfoil_polars
 from RCAIDE.Library.Methods.Geometry.Airfoil.compute_naca_4series                   import compute_naca_4series  
 from RCAIDE.Library.Methods.Aerodynamics.AERODAS.pre_stall_coefficients             import pre_stall_coefficients
 from RCAIDE.Library.Methods.Aerodynamics.AERODAS.post_stall_coefficients            import post_stall_coefficients
+from RCAIDE.Library.Methods.Geometry.Airfoil.airfoil_database                       import compute_airfoil_database_key, load_airfoil_properties, save_airfoil_properties
 
 # numpy imports 
 import numpy as np
@@ -24,7 +25,7 @@ import numpy as np
 #  compute_airfoil_properties
 # ----------------------------------------------------------------------------------------------------------------------   
 ## @ingroup Library-Methods-Geometry-Two_Dimensional-Airfoil
-def compute_airfoil_properties(airfoil_geometry, airfoil_polar_files = None,use_pre_stall_data=True):
+def compute_airfoil_properties(airfoil_geometry, airfoil_polar_files = None,use_pre_stall_data=True,store_directory=None):
     """This computes the aerodynamic properties and coefficients of an airfoil in stall regimes using pre-stall
     characterstics and AERODAS formation for post stall characteristics. This is useful for 
     obtaining a more accurate prediction of wing and blade loading as well as aeroacoustics. Pre stall characteristics 
@@ -41,6 +42,7 @@ def compute_airfoil_properties(airfoil_geometry, airfoil_polar_files = None,use_
     airfoil_polar_files                     <string>
     boundary_layer_files                    <string>
     use_pre_stall_data                      [Boolean]
+    store_directory                         [string]
     Outputs:
     airfoil_data.
         cl_polars                           [unitless]
@@ -70,6 +72,12 @@ def compute_airfoil_properties(airfoil_geometry, airfoil_polar_files = None,use_
     Properties Used:
     N/A
     """     
+    # airfoils with the same geometry, polar files and options are only computed once, see airfoil_database
+    database_key   = compute_airfoil_database_key(airfoil_geometry,airfoil_polar_files,use_pre_stall_data)
+    Airfoil_Data   = load_airfoil_properties(database_key,store_directory)
+    if Airfoil_Data is not None:
+        return Airfoil_Data
+    
     Airfoil_Data   = Data()  
    
     # ----------------------------------------------------------------------------------------
@@ -123,6 +131,8 @@ def compute_airfoil_properties(airfoil_geometry, airfoil_polar_files = None,use_
     Airfoil_Data.angle_of_attacks    = AoA_sweep_rad 
     Airfoil_Data.lift_coefficients   = CL 
     Airfoil_Data.drag_coefficients   = CD    
+    
+    save_airfoil_properties(database_key,Airfoil_Data,store_directory)
         
     return Airfoil_Data
  
@@ -3,11 +3,13 @@
 # 
 # 
 # Created:  Jul 2023, M. Clarke
+# Modified: Oct 2026, agent
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
 # RCAIDE imports  
+from RCAIDE.Framework.Mission.Common import alias_conditions
 from RCAIDE.Framework.Core import Units  
 from RCAIDE.Library.Methods.Propulsors.Converters.Engine import compute_throttle_from_power
 from RCAIDE.Library.Methods.Propulsors.Converters.Rotor.compute_rotor_performance import  compute_rotor_performance
@@ -106,8 +108,8 @@ def reuse_stored_ice_cs_prop_data(propulsor,state,fuel_line,stored_propulsor_tag
     engine_0                   = fuel_line.propulsors[stored_propulsor_tag].engine
     propeller_0                = fuel_line.propulsors[stored_propulsor_tag].propeller  
     
-    conditions.energy[fuel_line.tag][propulsor.tag][engine.tag]        = conditions.energy[fuel_line.tag][stored_propulsor_tag][engine_0.tag]
-    conditions.energy[fuel_line.tag][propulsor.tag][propeller.tag]        = conditions.energy[fuel_line.tag][stored_propulsor_tag][propeller_0.tag] 
+    conditions.energy[fuel_line.tag][propulsor.tag][engine.tag]        = alias_conditions(conditions.energy[fuel_line.tag][stored_propulsor_tag][engine_0.tag])
+    conditions.energy[fuel_line.tag][propulsor.tag][propeller.tag]     = alias_conditions(conditions.energy[fuel_line.tag][stored_propulsor_tag][propeller_0.tag])
   
     thrust                  = conditions.energy[fuel_line.tag][propulsor.tag][propeller.tag].thrust 
     power                   = conditions.energy[fuel_line.tag][propulsor.tag][propeller.tag].power 
@@ -67,7 +67,7 @@ def blade_geometry_setup(rotor,number_of_stations):
                     airfoil.geometry = import_airfoil_geometry(airfoil.coordinate_file,airfoil.number_of_points) 
     
             if airfoil.polars == None: # compute airfoil polars for airfoils
-                airfoil.polars = compute_airfoil_properties(airfoil.geometry, airfoil_polar_files= airfoil.polar_files) 
+                airfoil.polars = compute_airfoil_properties(airfoil.geometry, airfoil_polar_files= airfoil.polar_files,store_directory=airfoil.store_directory) 
                      
     # thickness to chord         
     t_c           = np.zeros(N)    
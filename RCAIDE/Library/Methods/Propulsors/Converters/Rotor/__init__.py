@@ -9,10 +9,11 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
  
-from .                          import Design
-from .                          import Wake
-from .design_propeller          import design_propeller 
-from .design_lift_rotor         import design_lift_rotor
-from .design_prop_rotor         import design_prop_rotor
-from .append_rotor_conditions   import append_rotor_conditions
-from .compute_rotor_performance import compute_rotor_performance
\ No newline at end of file
+from .                            import Design
+from .                            import Wake
+from .design_propeller            import design_propeller 
+from .design_lift_rotor           import design_lift_rotor
+from .design_prop_rotor           import design_prop_rotor
+from .append_rotor_conditions     import append_rotor_conditions
+from .compute_rotor_performance   import compute_rotor_performance
+from .rotor_performance_surrogate import train_rotor_performance_surrogate, clear_rotor_performance_surrogate_store
\ No newline at end of file
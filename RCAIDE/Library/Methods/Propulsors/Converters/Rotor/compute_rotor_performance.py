@@ -2,6 +2,7 @@
 # (c) Copyright 2023 Aerospace Research Community LLC
 # 
 # Created:  Jul 2024, RCAIDE Team 
+# Modified: Oct 2026, agent
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
@@ -10,6 +11,7 @@
 from RCAIDE.Framework.Core                              import Data , Units, orientation_product, orientation_transpose 
 from RCAIDE.Framework.Analyses.Propulsion               import Rotor_Wake_Fidelity_One
 from RCAIDE.Library.Methods.Aerodynamics.Common.Lift    import compute_airfoil_aerodynamics,compute_inflow_and_tip_loss  
+from RCAIDE.Library.Methods.Propulsors.Converters.Rotor.rotor_performance_surrogate import compute_surrogate_rotor_performance
 
 # package imports
 import  numpy as  np 
@@ -45,7 +47,7 @@ def compute_rotor_performance(propulsor,state,disributor,center_of_gravity= [[0.
       throttle                           [-]
 
     Outputs:
-    conditions.energy.outputs.
+    conditions.energy.outputs.         (integrated outputs only if rotor.performance_surrogate.active, see rotor_performance_surrogate)
        number_radial_stations            [-]
        number_azimuthal_stations         [-]
        disc_radial_distribution          [m]
@@ -153,6 +155,13 @@ def compute_rotor_performance(propulsor,state,disributor,center_of_gravity= [[0.
     V         = V_thrust[:,0,None]
     V[V==0.0] = 1E-6
 
+    # interpolate the performance map of the rotor inside its trained envelope
+    if rotor.performance_surrogate.active and not (use_2d_analysis or nonuniform_freestream or np.any(np.array([sweep])!=0)):
+        outputs = compute_surrogate_rotor_performance(rotor,conditions,V,omega,pitch_c,eta,T_body2thrust,orientation,center_of_gravity,compute_rotor_performance)
+        if outputs is not None:
+            conditions.energy[disributor.tag][propulsor.tag][rotor.tag] = outputs
+            return
+
     # Non-dimensional radial distribution and differential radius
     chi           = r_1d/R
     diff_r        = np.diff(r_1d)
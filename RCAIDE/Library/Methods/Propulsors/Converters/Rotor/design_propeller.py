@@ -116,7 +116,7 @@ def design_propeller(prop,number_of_stations=20):
                     airfoil.geometry = import_airfoil_geometry(airfoil.coordinate_file,airfoil.number_of_points) 
     
             if airfoil.polars == None: # compute airfoil polars for airfoils
-                airfoil.polars = compute_airfoil_properties(airfoil.geometry, airfoil_polar_files= airfoil.polar_files) 
+                airfoil.polars = compute_airfoil_properties(airfoil.geometry, airfoil_polar_files= airfoil.polar_files,store_directory=airfoil.store_directory) 
     else:
         print('\nDefaulting to scaled DAE51') 
         
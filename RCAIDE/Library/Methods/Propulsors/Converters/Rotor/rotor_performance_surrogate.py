@@ -0,0 +1,465 @@
+# RCAIDE/Library/Methods/Propulsors/Converters/Rotor/rotor_performance_surrogate.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created:  Oct 2026, agent
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+ # RCAIDE imports
+from RCAIDE.Framework.Core                                                  import Data , Units, orientation_product, orientation_transpose
+from RCAIDE.Framework.Mission.Common                                        import Results, Conditions
+from RCAIDE.Framework.Analyses.Atmospheric                                  import US_Standard_1976
+from RCAIDE.Library.Methods.Utilities                                       import Surrogate, Content_Addressed_Store, compute_hash
+
+# package imports
+import numpy as np
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from copy               import deepcopy
+from itertools          import product
+
+# performance maps of every rotor design trained in this process, keyed by hash
+rotor_performance_surrogate_store = Content_Addressed_Store()
+
+# increment when the training data produced by train_rotor_performance_surrogate changes, invalidating stored maps
+rotor_performance_surrogate_version = 2
+
+# rotor properties that change the performance map
+rotor_surrogate_keys = ['number_of_blades','tip_radius','hub_radius','twist_distribution','chord_distribution','thickness_to_chord',
+                        'radius_distribution','airfoil_polar_stations','Airfoils','variable_pitch','sol_tolerance','Wake']
+
+# training grid of the performance map
+rotor_surrogate_training_keys = ['advance_ratio','tip_mach','reynolds_number','pitch_command']
+
+# outputs of the performance map
+rotor_surrogate_outputs = ['thrust_coefficient','torque_coefficient','rotor_drag_coefficient']
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Rotor Performance Surrogate
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Energy-Propulsion-Converters
+def compute_surrogate_rotor_performance(rotor,conditions,V,omega,pitch_c,eta,T_body2thrust,orientation,center_of_gravity,rotor_performance):
+    """Computes the integrated performance of a rotor by interpolating its performance map instead of running the
+    blade element analysis. The map is trained on first use, see train_rotor_performance_surrogate. If an operating
+    point lies outside the trained envelope by more than rotor.performance_surrogate.extrapolation_tolerance, nothing
+    is computed and the full model is run for every control point.
+
+    Assumptions:
+    Uniform axial freestream (1D analysis). The thrust, torque and rotor drag coefficients depend only on the advance
+    ratio, the tip Mach number, the rotor Reynolds number omega*R*R/nu and the blade pitch command. The effect of the
+    freestream temperature on the compressible skin friction correction is that of sea level.
+    Blade and disc distributions are not computed, analyses that need them (e.g. rotor noise) need the full model.
+
+    Source:
+    None
+
+    Inputs:
+    rotor                                [-]
+    conditions.freestream.
+      density                            [kg/m^3]
+      dynamic_viscosity                  [kg/(m-s)]
+      speed_of_sound                     [m/s]
+    V                                    [m/s]
+    omega                                [radian/s]
+    pitch_c                              [rad]
+    eta                                  [-]
+    T_body2thrust                        (rotation matrix)
+    orientation                          [rad]
+    center_of_gravity                    [m]
+    rotor_performance                    full model used to train the map (compute_rotor_performance)
+
+    Outputs:
+    outputs.
+       thrust                            [N]
+       torque                            [Nm]
+       power                             [W]
+       moment                            [Nm]
+       thrust_omega_derivative           [N-s]
+       torque_omega_derivative           [Nm-s]
+       ...                               integrated outputs of compute_rotor_performance
+       or None outside of the trained envelope
+
+    Properties Used:
+    rotor.
+      tip_radius                         [m]
+      hub_radius                         [m]
+      number_of_blades                   [-]
+      performance_surrogate              [-]
+    """
+    surrogate = train_rotor_performance_surrogate(rotor,rotor_performance)
+    tol       = rotor.performance_surrogate.extrapolation_tolerance
+
+    # Unpack freestream conditions
+    rho      = conditions.freestream.density[:,0,None]
+    mu       = conditions.freestream.dynamic_viscosity[:,0,None]
+    a        = conditions.freestream.speed_of_sound[:,0,None]
+    nu       = mu/rho
+    ctrl_pts = len(V)
+    B        = rotor.number_of_blades
+    R        = rotor.tip_radius
+    D        = 2*R
+    n        = omega/(2.*np.pi)
+    pitch    = np.zeros((ctrl_pts,1)) + np.reshape(pitch_c,(-1,1))
+
+    # inputs of the map, points that are not spinning take the lower bound of the map
+    spinning = omega[:,0] != 0.
+    points   = np.zeros((ctrl_pts,4))
+    for dim, grid in enumerate(surrogate.grid):
+        points[:,dim] = grid[0]
+    w                   = omega[spinning]
+    points[spinning,0]  = np.pi*V[spinning,0]/(w[:,0]*R)
+    points[spinning,1]  = w[:,0]*R/a[spinning,0]
+    points[spinning,2]  = np.log10(w[:,0]*R*R/nu[spinning,0])
+    points[spinning,3]  = pitch[spinning,0]
+
+    # check the trained envelope
+    if np.any(omega < 0.):
+        return None
+    for dim, grid in enumerate(surrogate.grid):
+        margin = tol*(grid[-1] - grid[0]) + 1E-9
+        if np.any(points[:,dim] < grid[0] - margin) or np.any(points[:,dim] > grid[-1] + margin):
+            return None
+
+    values      = surrogate.compute(points)
+    derivatives = surrogate.compute_derivatives(points)
+    Ct          = values[:,0,None]
+    Cq          = values[:,1,None]
+    Crd         = values[:,2,None]
+
+    # forces
+    thrust     = Ct*rho*(n*n)*(D*D*D*D)
+    torque     = Cq*rho*(n*n)*(D*D*D*D*D)
+    rotor_drag = Crd*rho*(n*n)*(D*D*D*D)
+    power      = omega*torque
+
+    # derivatives with respect to omega, through the coefficients, the advance ratio, tip Mach and Reynolds numbers
+    J, Mt = points[:,0,None], points[:,1,None]
+    dCt   = -J*derivatives[:,0,0,None] + Mt*derivatives[:,0,1,None] + derivatives[:,0,2,None]/np.log(10.)
+    dCq   = -J*derivatives[:,1,0,None] + Mt*derivatives[:,1,1,None] + derivatives[:,1,2,None]/np.log(10.)
+    dT_dw = np.zeros_like(omega)
+    dQ_dw = np.zeros_like(omega)
+    dT_dw[spinning] = (rho*(n*n)*(D*D*D*D)*(2*Ct + dCt))[spinning]/omega[spinning]
+    dQ_dw[spinning] = (rho*(n*n)*(D*D*D*D*D)*(2*Cq + dCq))[spinning]/omega[spinning]
+
+    # calculate coefficients
+    rho_0    = rho
+    Cq       = torque/(rho_0*(n*n)*(D*D*D*D*D))
+    Ct       = thrust/(rho_0*(n*n)*(D*D*D*D))
+    Cp       = power/(rho_0*(n*n*n)*(D*D*D*D*D))
+    Crd      = rotor_drag/(rho_0*(n*n)*(D*D*D*D))
+    etap     = V*thrust/power
+    A        = np.pi*(R**2 - rotor.hub_radius**2)
+    FoM      = thrust*np.sqrt(thrust/(2*rho_0*A))/power
+
+    # prevent things from breaking
+    Cq[Cq<0]                   = 0.
+    Ct[Ct<0]                   = 0.
+    Cp[Cp<0]                   = 0.
+    thrust[omega==0.0]         = 0.0
+    power[omega==0.0]          = 0.0
+    torque[omega==0.0]         = 0.0
+    rotor_drag[omega==0.0]     = 0.0
+    Ct[omega==0.0]             = 0.0
+    Cp[omega==0.0]             = 0.0
+    etap[omega==0.0]           = 0.
+
+    thrust[eta[:,0]  <=0.0]    = 0.0
+    power[eta[:,0]  <=0.0]     = 0.0
+    torque[eta[:,0]  <=0.0]    = 0.0
+    dT_dw[eta[:,0]  <=0.0]     = 0.0
+    dQ_dw[eta[:,0]  <=0.0]     = 0.0
+    power[eta>1.0]             = power[eta>1.0]*eta[eta>1.0]
+    thrust[eta[:,0]>1.0,:]     = thrust[eta[:,0]>1.0,:]*eta[eta[:,0]>1.0,:]
+    dT_dw[eta[:,0]>1.0,:]      = dT_dw[eta[:,0]>1.0,:]*eta[eta[:,0]>1.0,:]
+
+    disc_loading           = thrust/(np.pi*(R**2))
+    power_loading          = thrust/(power)
+
+    # Make the thrust a 3D vector
+    thrust_prop_frame      = np.zeros((ctrl_pts,3))
+    thrust_prop_frame[:,0] = thrust[:,0]
+    thrust_vector          = orientation_product(orientation_transpose(T_body2thrust),thrust_prop_frame)
+
+    # Compute moment
+    moment_vector           = np.zeros((ctrl_pts,3))
+    moment_vector[:,0]      = rotor.origin[0][0]  -  center_of_gravity[0][0]
+    moment_vector[:,1]      = rotor.origin[0][1]  -  center_of_gravity[0][1]
+    moment_vector[:,2]      = rotor.origin[0][2]  -  center_of_gravity[0][2]
+    moment                  =  np.cross(moment_vector, thrust_vector)
+
+    outputs                                       = Data(
+                torque                            = torque,
+                thrust                            = thrust_vector,
+                power                             = power,
+                moment                            = moment,
+                rpm                               = omega /Units.rpm ,
+                tip_mach                          = omega * R / conditions.freestream.speed_of_sound,
+                efficiency                        = etap,
+                orientation                       = orientation,
+                speed_of_sound                    = conditions.freestream.speed_of_sound,
+                density                           = conditions.freestream.density,
+                velocity                          = conditions.frames.inertial.velocity_vector,
+                disc_loading                      = disc_loading,
+                power_loading                     = power_loading,
+                omega                             = omega,
+                thrust_per_blade                  = thrust/B,
+                thrust_coefficient                = Ct,
+                torque_per_blade                  = torque/B,
+                torque_coefficient                = Cq,
+                power_coefficient                 = Cp,
+                rotor_drag                        = rotor_drag,
+                rotor_drag_coefficient            = Crd,
+                pitch_command                     = pitch_c,
+                figure_of_merit                   = FoM,
+                thrust_omega_derivative           = dT_dw,
+                torque_omega_derivative           = dQ_dw,
+        )
+
+    return outputs
+
+## @ingroup Energy-Propulsion-Converters
+def train_rotor_performance_surrogate(rotor,rotor_performance):
+    """Returns the performance map of a rotor design. Maps are trained once per rotor design and training grid and
+    kept in memory and, if rotor.performance_surrogate.store_directory is set, on disk. Training evaluates the full
+    model over the grid in chunks of training_chunk_size control points, in parallel if training_workers > 1.
+
+    Assumptions:
+    The pitch command is only a dimension of the map for variable pitch rotors.
+
+    Source:
+    None
+
+    Inputs:
+    rotor                                [-]
+    rotor_performance                    full model (compute_rotor_performance)
+
+    Outputs:
+    surrogate                            performance map (Surrogate)
+
+    Properties Used:
+    rotor.performance_surrogate.
+      advance_ratio                      [-]
+      tip_mach                           [-]
+      reynolds_number                    [-]
+      pitch_command                      [rad]
+      training_chunk_size                [-]
+      training_workers                   [-]
+      store_directory                    [string]
+    """
+    settings  = rotor.performance_surrogate
+    key       = compute_rotor_performance_surrogate_key(rotor)
+    stored    = rotor_performance_surrogate_store.load(key,settings.store_directory)
+    if stored is not None:
+        return Surrogate([stored['grid_' + str(dim)] for dim in range(4)],stored['values'],rotor_surrogate_outputs)
+
+    # training grid
+    pitch  = settings.pitch_command if rotor.variable_pitch else [0.]
+    grid   = [np.atleast_1d(settings.advance_ratio)*1.,
+              np.atleast_1d(settings.tip_mach)*1.,
+              np.log10(np.atleast_1d(settings.reynolds_number)*1.),
+              np.atleast_1d(pitch)*1.]
+    points = np.array(list(product(*grid)))
+    chunks = np.array_split(points,int(np.ceil(len(points)/settings.training_chunk_size)))
+
+    # training evaluates a copy of the rotor with the full model
+    training_rotor                              = deepcopy(rotor)
+    training_rotor.performance_surrogate.active = False
+
+    values    = np.concatenate(evaluate_training_chunks(chunks,training_rotor,rotor_performance,settings.training_workers))
+    shape     = tuple([len(points) for points in grid])
+    stored    = {'grid_' + str(dim): grid[dim] for dim in range(4)}
+    stored['values'] = values.reshape(shape + (len(rotor_surrogate_outputs),))
+    surrogate = Surrogate(grid,stored['values'],rotor_surrogate_outputs)
+    rotor_performance_surrogate_store.save(key,stored,settings.store_directory)
+
+    return surrogate
+
+## @ingroup Energy-Propulsion-Converters
+def compute_rotor_performance_surrogate_key(rotor):
+    """Hashes the blade design, wake model and training grid that define the performance map of a rotor.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    rotor                                [-]
+
+    Outputs:
+    key                                  [string]
+
+    Properties Used:
+    None
+    """
+    rotor_values    = [(key,rotor[key]) for key in rotor_surrogate_keys]
+    training_values = [(key,rotor.performance_surrogate[key]) for key in rotor_surrogate_training_keys]
+
+    return compute_hash(rotor_performance_surrogate_version,rotor_values,training_values)
+
+## @ingroup Energy-Propulsion-Converters
+def clear_rotor_performance_surrogate_store():
+    """Empties the in memory store of performance maps, files on disk are kept.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    None
+
+    Outputs:
+    None
+
+    Properties Used:
+    None
+    """
+    rotor_performance_surrogate_store.clear()
+    return
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Training
+# ----------------------------------------------------------------------------------------------------------------------
+def evaluate_training_chunks(chunks,rotor,rotor_performance,workers):
+    """Evaluates the full model for every chunk of training points, fanning the chunks out over a pool of workers
+    processes. The rotor is sent to each worker once, when the worker starts, and results are returned in the order of
+    the chunks.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    chunks              - training points, [advance ratio, tip Mach, log10 Reynolds, pitch]     [list]
+    rotor               - rotor                                                                 [-]
+    rotor_performance   - full model                                                            [-]
+    workers             - number of processes                                                   [-]
+
+    Outputs:
+    values              - thrust, torque and rotor drag coefficients of each chunk              [list]
+
+    Properties Used:
+    None
+    """
+    global _training_rotor, _training_performance
+
+    workers = min(workers,len(chunks))
+    if workers <= 1:
+        _training_rotor       = rotor
+        _training_performance = rotor_performance
+        values = [evaluate_training_chunk(chunk) for chunk in chunks]
+    else:
+        # forked workers inherit the rotor without pickling it
+        if 'fork' in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context('fork')
+        else:
+            context = multiprocessing.get_context()
+        with ProcessPoolExecutor(max_workers=workers,mp_context=context,initializer=initialize_training_worker,initargs=(rotor,rotor_performance)) as pool:
+            values = list(pool.map(evaluate_training_chunk,chunks))
+    _training_rotor       = None
+    _training_performance = None
+
+    return values
+
+def initialize_training_worker(rotor,rotor_performance):
+    """Stores the rotor and the full model in a training worker process.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    rotor               - rotor          [-]
+    rotor_performance   - full model     [-]
+
+    Outputs:
+    None
+
+    Properties Used:
+    None
+    """
+    global _training_rotor, _training_performance
+    _training_rotor       = rotor
+    _training_performance = rotor_performance
+    return
+
+def evaluate_training_chunk(points):
+    """Evaluates the full model at training points. Each point is a control point of a sea level condition whose
+    rotational speed, axial velocity and density give the advance ratio, tip Mach and Reynolds numbers of the point.
+
+    Assumptions:
+    Rotor axis aligned with the freestream.
+
+    Source:
+    None
+
+    Inputs:
+    points              - [advance ratio, tip Mach, log10 Reynolds, pitch], (n_points,4)        [-]
+
+    Outputs:
+    values              - thrust, torque and rotor drag coefficients, (n_points,3)              [-]
+
+    Properties Used:
+    None
+    """
+    rotor    = _training_rotor
+    R        = rotor.tip_radius
+    D        = 2*R
+    ctrl_pts = len(points)
+
+    # sea level speed of sound, viscosity and temperature
+    atmosphere = US_Standard_1976()
+    atmo_data  = atmosphere.compute_values(np.zeros(1))
+    a          = atmo_data.speed_of_sound[0,0]
+    mu         = atmo_data.dynamic_viscosity[0,0]
+
+    omega = points[:,1,None]*a/R
+    V     = points[:,0,None]*omega*R/np.pi
+    nu    = omega*R*R/(10**points[:,2,None])
+    rho   = mu/nu
+    n     = omega/(2.*np.pi)
+
+    # velocity along the rotor axis with the body frame aligned with the inertial frame
+    body2thrust, _ = rotor.body_to_prop_vel(np.zeros((ctrl_pts,1)))
+    V_thrust       = np.zeros((ctrl_pts,3))
+    V_thrust[:,0]  = V[:,0]
+
+    conditions = Results()
+    conditions.expand_rows(ctrl_pts)
+    conditions.freestream.density                = rho
+    conditions.freestream.dynamic_viscosity      = mu*np.ones((ctrl_pts,1))
+    conditions.freestream.speed_of_sound         = a*np.ones((ctrl_pts,1))
+    conditions.freestream.temperature            = atmo_data.temperature[0,0]*np.ones((ctrl_pts,1))
+    conditions.frames.body.transform_to_inertial = np.tile(np.eye(3)[None,:,:],(ctrl_pts,1,1))
+    conditions.frames.inertial.velocity_vector   = orientation_product(body2thrust,V_thrust)
+
+    distributor = Data(tag = 'training')
+    propulsor   = Data(tag = 'propulsor', rotor = rotor)
+    conditions.energy[distributor.tag]                                         = Conditions()
+    conditions.energy[distributor.tag][propulsor.tag]                          = Conditions()
+    conditions.energy[distributor.tag][propulsor.tag].commanded_thrust_vector_angle = np.zeros((ctrl_pts,1))
+    rotor_conditions                                                           = Conditions()
+    rotor_conditions.omega                                                     = omega
+    rotor_conditions.pitch_command                                             = points[:,3,None]*1.
+    rotor_conditions.throttle                                                  = np.ones((ctrl_pts,1))
+    conditions.energy[distributor.tag][propulsor.tag][rotor.tag]               = rotor_conditions
+
+    state            = Data()
+    state.conditions = conditions
+    _training_performance(propulsor,state,distributor)
+    outputs          = conditions.energy[distributor.tag][propulsor.tag][rotor.tag]
+
+    values        = np.zeros((ctrl_pts,3))
+    values[:,0]   = (outputs.thrust_per_blade*rotor.number_of_blades/(rho*(n*n)*(D*D*D*D)))[:,0]
+    values[:,1]   = (outputs.torque/(rho*(n*n)*(D*D*D*D*D)))[:,0]
+    values[:,2]   = (outputs.rotor_drag/(rho*(n*n)*(D*D*D*D)))[:,0]
+
+    return values
@@ -3,11 +3,13 @@
 # 
 # 
 # Created:  Jul 2023, M. Clarke
+# Modified: Oct 2026, agent
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
 # RCAIDE imports   
+from RCAIDE.Framework.Mission.Common import alias_conditions
 from RCAIDE.Library.Methods.Propulsors.Modulators.Electronic_Speed_Controller.compute_esc_performance  import * 
 from RCAIDE.Library.Methods.Propulsors.Converters.DC_Motor.compute_motor_performance                   import *
 from RCAIDE.Library.Methods.Propulsors.Converters.Rotor.compute_rotor_performance                      import * 
@@ -15,7 +17,6 @@ from RCAIDE.Library.Methods.Propulsors.Converters.Rotor.compute_rotor_performanc
 
 # pacakge imports  
 import numpy as np 
-from copy import deepcopy
 
 # ----------------------------------------------------------------------------------------------------------------------
 # compute_electric_rotor_performance
@@ -128,9 +129,9 @@ def reuse_stored_electric_rotor_data(propulsor,state,bus,stored_propulsor_tag,ce
     rotor_0                    = bus.propulsors[stored_propulsor_tag].rotor 
     esc_0                      = bus.propulsors[stored_propulsor_tag].electronic_speed_controller
     
-    conditions.energy[bus.tag][propulsor.tag][motor.tag]        = deepcopy(conditions.energy[bus.tag][stored_propulsor_tag][motor_0.tag])
-    conditions.energy[bus.tag][propulsor.tag][rotor.tag]        = deepcopy(conditions.energy[bus.tag][stored_propulsor_tag][rotor_0.tag])
-    conditions.energy[bus.tag][propulsor.tag][esc.tag]          = deepcopy(conditions.energy[bus.tag][stored_propulsor_tag][esc_0.tag])
+    conditions.energy[bus.tag][propulsor.tag][motor.tag]        = alias_conditions(conditions.energy[bus.tag][stored_propulsor_tag][motor_0.tag])
+    conditions.energy[bus.tag][propulsor.tag][rotor.tag]        = alias_conditions(conditions.energy[bus.tag][stored_propulsor_tag][rotor_0.tag])
+    conditions.energy[bus.tag][propulsor.tag][esc.tag]          = alias_conditions(conditions.energy[bus.tag][stored_propulsor_tag][esc_0.tag])
   
     thrust                  = conditions.energy[bus.tag][propulsor.tag][rotor.tag].thrust 
     power                   = conditions.energy[bus.tag][propulsor.tag][esc.tag].power 
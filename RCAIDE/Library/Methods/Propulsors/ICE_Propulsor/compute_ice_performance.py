@@ -3,17 +3,18 @@
 # 
 # 
 # Created:  Jul 2023, M. Clarke
+# Modified: Oct 2026, agent
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
 # RCAIDE imports  
+from RCAIDE.Framework.Mission.Common import alias_conditions
 from RCAIDE.Framework.Core import Units  
 from RCAIDE.Library.Methods.Propulsors.Converters.Engine import compute_power_from_throttle
 from RCAIDE.Library.Methods.Propulsors.Converters.Rotor.compute_rotor_performance import  compute_rotor_performance
 
 # pacakge imports  
-from copy import deepcopy
 import numpy as np 
 
 
@@ -115,8 +116,8 @@ def reuse_stored_ice_data(propulsor,state,fuel_line,stored_propulsor_tag,center_
     engine_0     = fuel_line.propulsors[stored_propulsor_tag].engine
     propeller_0  = fuel_line.propulsors[stored_propulsor_tag].propeller  
     
-    conditions.energy[fuel_line.tag][propulsor.tag][engine.tag]        = deepcopy(conditions.energy[fuel_line.tag][stored_propulsor_tag][engine_0.tag])
-    conditions.energy[fuel_line.tag][propulsor.tag][propeller.tag]     = deepcopy(conditions.energy[fuel_line.tag][stored_propulsor_tag][propeller_0.tag])
+    conditions.energy[fuel_line.tag][propulsor.tag][engine.tag]        = alias_conditions(conditions.energy[fuel_line.tag][stored_propulsor_tag][engine_0.tag])
+    conditions.energy[fuel_line.tag][propulsor.tag][propeller.tag]     = alias_conditions(conditions.energy[fuel_line.tag][stored_propulsor_tag][propeller_0.tag])
   
     thrust                  = conditions.energy[fuel_line.tag][propulsor.tag][propeller.tag].thrust 
     power                   = conditions.energy[fuel_line.tag][propulsor.tag][propeller.tag].power 
@@ -3,11 +3,13 @@
 # 
 # 
 # Created:  Jul 2024, RCAIDE Team
+# Modified: Oct 2026, agent
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
 # RCAIDE imports  
+from RCAIDE.Framework.Mission.Common import alias_conditions
 from RCAIDE.Framework.Core import Data   
 from RCAIDE.Library.Methods.Propulsors.Converters.Ram                import compute_ram_performance
 from RCAIDE.Library.Methods.Propulsors.Converters.Combustor          import compute_combustor_performance
@@ -19,7 +21,6 @@ from RCAIDE.Library.Methods.Propulsors.Converters.Compression_Nozzle import comp
 from RCAIDE.Library.Methods.Propulsors.Turbofan_Propulsor            import compute_thrust
 
 import  numpy as  np
-from copy import  deepcopy
 
 # ----------------------------------------------------------------------------------------------------------------------
 # compute_performance
@@ -262,8 +263,8 @@ def reuse_stored_turbofan_data(turbofan,state,fuel_line,stored_propulsor_tag,cen
     N.A.        
     ''' 
     conditions                                      = state.conditions  
-    conditions.energy[fuel_line.tag][turbofan.tag]  = deepcopy(conditions.energy[fuel_line.tag][stored_propulsor_tag])
-    conditions.noise[fuel_line.tag][turbofan.tag]   = deepcopy(conditions.noise[fuel_line.tag][stored_propulsor_tag])
+    conditions.energy[fuel_line.tag][turbofan.tag]  = alias_conditions(conditions.energy[fuel_line.tag][stored_propulsor_tag])
+    conditions.noise[fuel_line.tag][turbofan.tag]   = alias_conditions(conditions.noise[fuel_line.tag][stored_propulsor_tag])
     
     # compute moment  
     moment_vector      = 0*state.ones_row(3)
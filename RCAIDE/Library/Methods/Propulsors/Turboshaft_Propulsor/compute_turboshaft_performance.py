@@ -3,11 +3,13 @@
 # 
 # 
 # Created:  Jul 2023, M. Clarke
+# Modified: Oct 2026, agent
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
 # RCAIDE imports      
+from RCAIDE.Framework.Mission.Common import alias_conditions
 from RCAIDE.Framework.Core import Data   
 from RCAIDE.Library.Methods.Propulsors.Converters.Ram                import compute_ram_performance
 from RCAIDE.Library.Methods.Propulsors.Converters.Combustor          import compute_combustor_performance
@@ -18,7 +20,6 @@ from RCAIDE.Library.Methods.Propulsors.Converters.Compression_Nozzle import comp
 from RCAIDE.Library.Methods.Propulsors.Turboshaft_Propulsor          import compute_power
  
 # python imports 
-from copy import deepcopy 
 # ----------------------------------------------------------------------------------------------------------------------
 # compute_turboshaft_performance
 # ---------------------------------------------------------------------------------------------------------------------- 
@@ -188,8 +189,8 @@ def reuse_stored_turboshaft_data(turboshaft,state,fuel_line,stored_propulsor_tag
     N.A.        
     ''' 
     conditions                                        = state.conditions   
-    conditions.energy[fuel_line.tag][turboshaft.tag]  = deepcopy(conditions.energy[fuel_line.tag][stored_propulsor_tag])
-    conditions.noise[fuel_line.tag][turboshaft.tag]   = deepcopy(conditions.noise[fuel_line.tag][stored_propulsor_tag])
+    conditions.energy[fuel_line.tag][turboshaft.tag]  = alias_conditions(conditions.energy[fuel_line.tag][stored_propulsor_tag])
+    conditions.noise[fuel_line.tag][turboshaft.tag]   = alias_conditions(conditions.noise[fuel_line.tag][stored_propulsor_tag])
       
     power    = conditions.energy[fuel_line.tag][turboshaft.tag].power    
     moment   = 0*state.ones_row(3)
@@ -0,0 +1,239 @@
+## @ingroup Methods-Utilities
+# RCAIDE/Library/Methods/Utilities/Content_Addressed_Store.py
+#
+#
+# Created:  Oct 2026, agent
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+
+# RCAIDE imports
+from RCAIDE.Framework.Core import Data
+
+# package imports
+import numpy as np
+import tempfile
+import json
+import os
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Content_Addressed_Store
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Methods-Utilities
+class Content_Addressed_Store():
+    """Store of named arrays keyed by a hash of the content that produced them, see compute_hash. Entries are kept in
+    memory and, if a directory is given, on disk as a json index and a single binary array. Arrays loaded from disk
+    are memory-mapped, so they are only read when accessed.
+
+    Assumptions:
+    Arrays returned by load are read only and shared by every caller. Object arrays are only kept in memory.
+
+    Source:
+    None
+    """
+
+    def __init__(self):
+        """Creates an empty store
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Outputs:
+        None
+
+        Properties Used:
+        N/A
+        """
+        self.entries = {}
+
+    def load(self, key, directory=None):
+        """Returns the arrays stored under a key, from memory or from the directory
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        key          - hash                                 [string]
+        directory    - on disk store, None for memory only  [string]
+
+        Outputs:
+        arrays       - arrays, None if not stored           [dict]
+
+        Properties Used:
+        N/A
+        """
+        arrays = self.entries.get(key)
+        if arrays is not None or directory is None:
+            return arrays
+
+        path = os.path.join(os.path.expanduser(directory),key)
+        if not os.path.isfile(path + '.npy'):
+            return None
+        try:
+            with open(path + '.json') as f:
+                index = json.load(f)
+            values = np.load(path + '.npy',mmap_mode='r')
+        except (OSError,ValueError):
+            return None
+
+        arrays = {}
+        for name, (dtype, offset, shape) in index.items():
+            dtype        = np.dtype(dtype)
+            size         = int(np.prod(shape))*dtype.itemsize
+            arrays[name] = values[offset:offset + size].view(dtype).reshape(shape)
+        self.entries[key] = arrays
+
+        return arrays
+
+    def save(self, key, arrays, directory=None):
+        """Stores arrays under a key in memory and, if a directory is given, on disk
+
+        Assumptions:
+        Concurrent processes storing the same key store the same arrays
+
+        Source:
+        N/A
+
+        Inputs:
+        key          - hash                                 [string]
+        arrays       - arrays                               [dict]
+        directory    - on disk store, None for memory only  [string]
+
+        Outputs:
+        None
+
+        Properties Used:
+        N/A
+        """
+        arrays = {name: np.array(value) for name, value in arrays.items()}
+        for value in arrays.values():
+            value.flags.writeable = False
+        self.entries[key] = arrays
+
+        if directory is None or any([value.dtype == object for value in arrays.values()]):
+            return
+
+        # arrays are packed into one byte array, aligned so that every view is aligned
+        index  = {}
+        offset = 0
+        for name, value in arrays.items():
+            index[name] = (value.dtype.str,offset,list(value.shape))
+            offset     += -(-value.nbytes//16)*16
+        values = np.zeros(offset,dtype=np.uint8)
+        for name, value in arrays.items():
+            start = index[name][1]
+            values[start:start + value.nbytes] = np.ascontiguousarray(value).view(np.uint8).ravel()
+
+        # write to temporary files first so that concurrent processes never read a partial file, the index is written
+        # first so that a complete array file always has an index
+        directory = os.path.expanduser(directory)
+        path      = os.path.join(directory,key)
+        os.makedirs(directory,exist_ok=True)
+        for suffix, write in [('.json',lambda f: f.write(json.dumps(index).encode())),('.npy',lambda f: np.save(f,values))]:
+            handle, temporary_path = tempfile.mkstemp(suffix=suffix,dir=directory)
+            try:
+                with os.fdopen(handle,'wb') as f:
+                    write(f)
+                os.replace(temporary_path,path + suffix)
+            except OSError:
+                if os.path.exists(temporary_path):
+                    os.remove(temporary_path)
+                return
+
+        return
+
+    def clear(self):
+        """Empties the in memory store, files on disk are kept
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Outputs:
+        None
+
+        Properties Used:
+        N/A
+        """
+        self.entries.clear()
+        return
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Methods-Utilities
+def flatten_data(data,prefix=''):
+    """Flattens nested data into a dictionary of arrays keyed by '/' separated paths
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    data           nested data                   <data_structure>
+    prefix         path of data                  [string]
+
+    Outputs:
+    flat           arrays                        [dict]
+
+    Properties Used:
+    N/A
+    """
+    flat = {}
+    for name, value in data.items():
+        if isinstance(value,dict):
+            flat.update(flatten_data(value,prefix + name + '/'))
+        else:
+            flat[prefix + name] = np.asarray(value)
+    return flat
+
+## @ingroup Methods-Utilities
+def unflatten_data(flat,copy=True):
+    """Rebuilds nested data from a dictionary of arrays keyed by '/' separated paths
+
+    Assumptions:
+    Zero dimensional arrays are returned as scalars
+
+    Source:
+    None
+
+    Inputs:
+    flat           arrays                                    [dict]
+    copy           copy every array, else arrays are shared  [Boolean]
+
+    Outputs:
+    data           nested data                               <data_structure>
+
+    Properties Used:
+    N/A
+    """
+    data = Data()
+    for path, value in flat.items():
+        names     = path.split('/')
+        container = data
+        for name in names[:-1]:
+            if name not in container:
+                container[name] = Data()
+            container = container[name]
+        if value.ndim == 0:
+            container[names[-1]] = value.item()
+        else:
+            container[names[-1]] = np.array(value) if copy else value
+    return data
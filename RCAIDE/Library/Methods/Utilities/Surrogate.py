@@ -0,0 +1,191 @@
+## @ingroup Methods-Utilities
+# RCAIDE/Library/Methods/Utilities/Surrogate.py
+#
+#
+# Created:  Oct 2026, agent
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+
+# package imports
+import numpy as np
+from itertools import product
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Surrogate
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Methods-Utilities
+class Surrogate():
+    """Multi-output linear interpolator on a regular grid. Every output shares the grid, so each query point is located
+    once and all outputs are gathered together, instead of building and querying one interpolator per output.
+
+    Assumptions:
+    Points outside of the grid are linearly extrapolated from the nearest grid cell, matching a
+    scipy RegularGridInterpolator with fill_value=None and an interp1d with fill_value='extrapolate'.
+
+    Source:
+    None
+    """
+
+    def __init__(self, grid, values, outputs=None):
+        """Stores the grid and the values of every output.
+
+        Assumptions:
+        The points of each dimension are strictly ascending or strictly descending
+
+        Source:
+        N/A
+
+        Inputs:
+        grid     - points of each dimension, (n_1,), ..., (n_d,)                 [tuple]
+        values   - outputs at the grid points, (n_1, ..., n_d, n_outputs)        [array]
+        outputs  - names of the outputs                                          [list]
+
+        Outputs:
+        None
+
+        Properties Used:
+        N/A
+        """
+        grid   = [np.asarray(points,dtype=float) for points in grid]
+        values = np.asarray(values,dtype=float)
+
+        # flip descending dimensions so that every dimension is ascending
+        for dim, points in enumerate(grid):
+            if len(points) > 1 and points[1] < points[0]:
+                grid[dim] = points[::-1]
+                values    = np.flip(values,axis=dim)
+
+        self.grid      = grid
+        self.shape     = values.shape[:len(grid)]
+        self.values    = np.ascontiguousarray(values.reshape((-1,values.shape[-1])))
+        self.strides   = np.cumprod((self.shape[1:] + (1,))[::-1])[::-1]
+        self.outputs   = outputs if outputs is not None else list(range(values.shape[-1]))
+
+    def __call__(self, points):
+        """Interpolates every output at the query points, see compute
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        points   - query points, (n_points, d)                  [array]
+
+        Outputs:
+        values   - outputs, (n_points, n_outputs)               [array]
+
+        Properties Used:
+        N/A
+        """
+        return self.compute(points)
+
+    def compute(self, points):
+        """Interpolates every output at the query points
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        points   - query points, (n_points, d)                  [array]
+
+        Outputs:
+        values   - outputs, (n_points, n_outputs)               [array]
+
+        Properties Used:
+        N/A
+        """
+        points  = np.asarray(points,dtype=float).reshape((-1,len(self.grid)))
+        indices = []
+        weights = []
+
+        # locate each query point in every dimension once
+        for dim, grid in enumerate(self.grid):
+            x = points[:,dim]
+            if len(grid) == 1:
+                indices.append(np.zeros(len(x),dtype=int))
+                weights.append(np.zeros(len(x)))
+                continue
+            i = np.clip(np.searchsorted(grid,x) - 1,0,len(grid) - 2)
+            indices.append(i)
+            weights.append((x - grid[i])/(grid[i+1] - grid[i]))
+
+        # gather and weight the outputs at the corners of the cells
+        values = np.zeros((len(points),self.values.shape[1]))
+        for corner in product((0,1),repeat=len(self.grid)):
+            flat_index = np.zeros(len(points),dtype=int)
+            weight     = np.ones(len(points))
+            for dim, c in enumerate(corner):
+                if c and self.shape[dim] == 1:
+                    weight = weight*0.
+                    continue
+                flat_index += (indices[dim] + c)*self.strides[dim]
+                weight      = weight*(weights[dim] if c else 1. - weights[dim])
+            values += weight[:,None]*self.values[flat_index]
+
+        return values
+
+    def compute_derivatives(self, points):
+        """Computes the derivatives of every output with respect to each dimension at the query points, the slopes of
+        the interpolant within the cell that contains each point
+
+        Assumptions:
+        Derivatives are discontinuous across cell faces, points on a face take the slope of the cell above it
+
+        Source:
+        N/A
+
+        Inputs:
+        points       - query points, (n_points, d)                            [array]
+
+        Outputs:
+        derivatives  - derivatives, (n_points, n_outputs, d)                  [array]
+
+        Properties Used:
+        N/A
+        """
+        points  = np.asarray(points,dtype=float).reshape((-1,len(self.grid)))
+        indices = []
+        weights = []
+        spacing = []
+
+        # locate each query point in every dimension once
+        for dim, grid in enumerate(self.grid):
+            x = points[:,dim]
+            if len(grid) == 1:
+                indices.append(np.zeros(len(x),dtype=int))
+                weights.append(np.zeros(len(x)))
+                spacing.append(np.ones(len(x)))
+                continue
+            i = np.clip(np.searchsorted(grid,x,side='right') - 1,0,len(grid) - 2)
+            indices.append(i)
+            spacing.append(grid[i+1] - grid[i])
+            weights.append((x - grid[i])/spacing[dim])
+
+        # differentiate the weight of each corner of the cells
+        derivatives = np.zeros((len(points),self.values.shape[1],len(self.grid)))
+        for corner in product((0,1),repeat=len(self.grid)):
+            if any([c and self.shape[dim] == 1 for dim, c in enumerate(corner)]):
+                continue
+            flat_index = np.zeros(len(points),dtype=int)
+            for dim, c in enumerate(corner):
+                flat_index += (indices[dim] + c)*self.strides[dim]
+            corner_values = self.values[flat_index]
+            for d in range(len(self.grid)):
+                if self.shape[d] == 1:
+                    continue
+                weight = np.ones(len(points))
+                for dim, c in enumerate(corner):
+                    if dim == d:
+                        weight = weight*(1. if c else -1.)/spacing[dim]
+                    else:
+                        weight = weight*(weights[dim] if c else 1. - weights[dim])
+                derivatives[:,:,d] += weight[:,None]*corner_values
+
+        return derivatives
@@ -14,4 +14,8 @@ from . import Chebyshev
 
 from Legacy.trunk.S.Methods.Utilities.soft_max                 import soft_max
 from Legacy.trunk.S.Methods.Utilities.latin_hypercube_sampling import latin_hypercube_sampling
-from Legacy.trunk.S.Methods.Utilities.Cubic_Spline_Blender     import Cubic_Spline_Blender
\ No newline at end of file
+from Legacy.trunk.S.Methods.Utilities.Cubic_Spline_Blender     import Cubic_Spline_Blender
+
+from .Surrogate                                                 import Surrogate
+from .hash_data                                                 import hash_data, compute_hash
+from .Content_Addressed_Store                                   import Content_Addressed_Store, flatten_data, unflatten_data
@@ -0,0 +1,93 @@
+## @ingroup Methods-Utilities
+# RCAIDE/Library/Methods/Utilities/hash_data.py
+#
+#
+# Created:  Oct 2026, agent
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+
+# package imports
+import numpy as np
+import hashlib
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  hash_data
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Methods-Utilities
+def hash_data(h,value,visited):
+    """ Recursively adds the content of a value to a hash
+
+    Assumptions:
+    Objects that are not data, arrays, numbers, strings or bytes are identified by their type
+
+    Source:
+    None
+
+    Inputs:
+    h        - hash                               [hashlib]
+    value    - value to hash                      [Any]
+    visited  - ids of hashed data                 [set]
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    if isinstance(value,dict):
+        if id(value) in visited:
+            return
+        visited.add(id(value))
+        h.update(b'{')
+        for k in sorted(value.keys(),key=str):
+            h.update(str(k).encode())
+            hash_data(h,dict.__getitem__(value,k),visited)
+        h.update(b'}')
+    elif isinstance(value,(list,tuple)):
+        h.update(b'[')
+        for v in value:
+            hash_data(h,v,visited)
+        h.update(b']')
+    elif isinstance(value,np.ndarray):
+        h.update((str(value.dtype) + str(value.shape)).encode())
+        if value.dtype == object:
+            for v in value.flat:
+                hash_data(h,v,visited)
+        else:
+            h.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value,(bytes,bytearray)):
+        h.update(hashlib.sha1(value).digest())
+    elif value is None or isinstance(value,(bool,int,float,complex,str,np.generic)):
+        h.update(repr(value).encode())
+    elif isinstance(value,type):
+        h.update(value.__name__.encode())
+    else:
+        h.update(type(value).__name__.encode())
+    return
+
+## @ingroup Methods-Utilities
+def compute_hash(*values):
+    """ Hashes the content of values, see hash_data
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    values   - values to hash                     [Any]
+
+    Outputs:
+    key      - hash                               [string]
+
+    Properties Used:
+    N/A
+    """
+    h       = hashlib.sha1()
+    visited = set()
+    for value in values:
+        hash_data(h,value,visited)
+    return h.hexdigest()
@@ -26,6 +26,33 @@ def sequential_segments(mission):
         segment.process.initialize.expand_state(segment) 
         segment.process.initialize.expand_state = RCAIDE.Library.Methods.skip        
         segment.evaluate()
+
+def simultaneous_segments(mission):
+
+    # initialize every segment about the initial guess of the previous segment
+    last_tag = None
+    for tag,segment in mission.segments.items():
+        if last_tag:
+            segment.state.initials = mission.segments[last_tag].state
+        last_tag = tag
+
+        segment.process.initialize.expand_state(segment)
+        segment.process.initialize.expand_state = RCAIDE.Library.Methods.skip
+        segment.process.initialize(segment)
+        segment.process.iterate(segment)
+
+    # solve all segments at once
+    RCAIDE.Library.Mission.Solver.converge_simultaneous(mission)
+
+    # chain the converged segments and post process them in order
+    last_tag = None
+    for tag,segment in mission.segments.items():
+        if last_tag:
+            segment.state.initials = mission.segments[last_tag].state
+        last_tag = tag
+
+        segment.process.iterate(segment)
+        segment.process.post_process(segment)
         
 def update_segments(mission):   
     for tag,segment in mission.segments.items():
@@ -18,6 +18,7 @@ from .altitude                         import altitude
 from .atmosphere                       import atmosphere
 from .battery_age                      import battery_age
 from .differentials_time               import differentials_time
+from .detached_conditions              import detached_conditions
 from .forces                           import forces
 from .noise                            import noise
 from .emissions                        import emissions   
@@ -0,0 +1,38 @@
+## @ingroup Library-Missions-Common-Update
+# RCAIDE/Library/Missions/Common/Update/detached_conditions.py
+# 
+# 
+# Created:  Oct 2026, agent
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports 
+from RCAIDE.Framework.Mission.Common import detach_conditions
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Update Detached Conditions
+# ---------------------------------------------------------------------------------------------------------------------- 
+## @ingroup Library-Missions-Common-Update
+def detached_conditions(segment):  
+    """Replaces the read-only views shared by the results of identical propulsors with copies once the segment has
+       converged, so that post processing and users can modify the results in place.
+       
+       Source: 
+       N/A
+
+       Assumptions:
+       None
+
+       Inputs: 
+       segment.state.conditions                [Data]
+
+       Outputs:
+       segment.state.conditions                [Data]
+
+       Properties Used:
+       N/A 
+    """  
+    detach_conditions(segment.state.conditions)
+    
+    return
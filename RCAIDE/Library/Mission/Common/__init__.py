@@ -18,4 +18,5 @@ from .   import Update
 
 from .Segments import * 
 from .compute_point_to_point_geospacial_data import compute_point_to_point_geospacial_data
+from .evaluate_batch                         import evaluate_batch
  
\ No newline at end of file
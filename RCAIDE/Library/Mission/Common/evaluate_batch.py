@@ -0,0 +1,179 @@
+## @ingroup Library-Missions-Common
+# RCAIDE/Library/Missions/Common/evaluate_batch.py
+#
+#
+# Created:  Oct 2026, agent
+# Modified: Oct 2026, agent
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Framework.Core  import Data, DataOrdered
+
+# Package imports
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from copy               import deepcopy
+import multiprocessing
+import os
+
+# missions shipped to each worker process once, when the worker starts
+_batch_missions = None
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Evaluate Batch
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Library-Missions-Common
+def evaluate_batch(missions,parameter_grid=None,executor='process',workers=None):
+    """Evaluates a set of missions, or every mission over a grid of parameters, in parallel. The missions, together
+    with their vehicles and analyses (including trained surrogates), are sent to each worker once when the worker
+    starts. Only the conditions of every segment are sent back.
+
+    Assumptions:
+    The analyses of the missions have been finalized so that surrogates are trained before the workers start.
+    Every task evaluates, and applies its parameters to, a copy of its mission with every executor. The original
+    missions are not modified, and tasks run on threads share no vehicle or analyses.
+
+    Source:
+    N/A
+
+    Inputs:
+    missions         - missions to evaluate, keyed by tag                                  [Data]
+    parameter_grid   - list of dictionaries of dotted paths and values, for example
+                       [{'segments.cruise.distance': 1000. * Units.km}, ...]               [list]
+    executor         - 'process', 'thread' or 'serial'                                     [string]
+    workers          - number of workers, defaults to the number of processors             [int]
+
+    Outputs:
+    results          - results of every mission keyed by tag, a list of results in the
+                       order of the parameter grid if a grid is given                     [Data]
+
+    Properties Used:
+    N/A
+    """
+    global _batch_missions
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    tags  = [tag for tag,mission in missions.items() if not isinstance(mission,str)]
+    if parameter_grid is None:
+        tasks = [(tag,None) for tag in tags]
+    else:
+        tasks = [(tag,parameters) for tag in tags for parameters in parameter_grid]
+
+    if executor == 'serial' or workers == 1:
+        _batch_missions = missions
+        outputs = [evaluate_task(task) for task in tasks]
+    elif executor == 'thread':
+        _batch_missions = missions
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            outputs = list(pool.map(evaluate_task,tasks))
+    elif executor == 'process':
+        # forked workers inherit the missions without pickling them
+        if 'fork' in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context('fork')
+        else:
+            context = multiprocessing.get_context()
+        with ProcessPoolExecutor(max_workers=workers,mp_context=context,initializer=initialize_worker,initargs=(missions,)) as pool:
+            outputs = list(pool.map(evaluate_task,tasks))
+    else:
+        raise AttributeError('Unknown executor ' + str(executor) + ', use process, thread or serial')
+    _batch_missions = None
+
+    results = Data()
+    for (tag,parameters),output in zip(tasks,outputs):
+        if parameter_grid is None:
+            results[tag] = output
+        else:
+            if tag not in results:
+                results[tag] = []
+            results[tag].append(output)
+
+    return results
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Library-Missions-Common
+def initialize_worker(missions):
+    """Stores the missions in a worker process.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    missions         - missions to evaluate, keyed by tag    [Data]
+
+    Outputs:
+    N/A
+
+    Properties Used:
+    N/A
+    """
+    global _batch_missions
+    _batch_missions = missions
+    return
+
+## @ingroup Library-Missions-Common
+def evaluate_task(task):
+    """Evaluates a copy of a single mission of the batch, with the parameters of the task applied to it.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    task             - mission tag and dictionary of parameters, or None    [tuple]
+
+    Outputs:
+    results          - segment conditions of the mission                    [Data]
+
+    Properties Used:
+    N/A
+    """
+    tag, parameters = task
+    mission         = deepcopy(_batch_missions[tag])
+    if parameters is not None:
+        for key,value in parameters.items():
+            mission.deep_set(key,value)
+    mission.evaluate()
+
+    return pack_results(mission)
+
+## @ingroup Library-Missions-Common
+def pack_results(mission):
+    """Strips an evaluated mission down to the conditions of its segments, so that results may be sent back from a
+    worker without the vehicle and analyses.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    mission          - evaluated mission                     [Data]
+
+    Outputs:
+    results          - tag and segment conditions            [Data]
+
+    Properties Used:
+    N/A
+    """
+    results          = Data()
+    results.tag      = mission.tag
+    results.segments = DataOrdered()
+    for tag,segment in mission.segments.items():
+        segment_results            = Data()
+        segment_results.tag        = segment.tag
+        segment_results.conditions = segment.state.conditions
+        segment_results.converged  = segment.state.numerics.converged
+        results.segments[tag]      = segment_results
+
+    return results
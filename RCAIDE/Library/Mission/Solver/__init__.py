@@ -10,7 +10,10 @@
 # ----------------------------------------------------------------------------------------------------------------------
 # @ingroup Methods-Mission
 
-from .converge_root import converge_root
-from .expand_state  import expand_state
-from .optimize      import converge_opt
+from .converge_root         import converge_root
+from .expand_state          import expand_state
+from .optimize              import converge_opt
+from .compute_jacobian      import compute_jacobian, compute_jacobian_sparsity, color_jacobian_columns, get_array_layout
+from .newton_raphson        import newton_raphson
+from .converge_simultaneous import converge_simultaneous
  
\ No newline at end of file
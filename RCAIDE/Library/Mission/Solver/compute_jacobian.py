@@ -0,0 +1,261 @@
+## @ingroup Library-Missions-Segments
+# RCAIDE/Library/Missions/Segments/compute_jacobian.py
+#
+#
+# Created:  Oct 2026, agent
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# Package imports
+import numpy as np
+import scipy.sparse as sp
+
+# ----------------------------------------------------------------------------------------------------------------------
+# compute_jacobian
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Library-Missions-Segments
+def compute_jacobian(function,unknowns,residuals,sparsity,colors,step_size=None):
+    """Computes a sparse forward-difference Jacobian of the residual function. Columns that do not share a nonzero
+    row in the sparsity pattern are grouped into the same color and perturbed simultaneously, so the number of
+    residual evaluations equals the number of colors rather than the number of unknowns.
+
+    Assumptions:
+    The sparsity pattern is a superset of the true nonzero structure of the Jacobian.
+
+    Source:
+    Curtis, A. R., Powell, M. J. D., and Reid, J. K., "On the Estimation of Sparse Jacobian Matrices",
+    IMA Journal of Applied Mathematics, 1974.
+
+    Inputs:
+    function            - residual function f(x)                         [function]
+    unknowns            - point about which the Jacobian is evaluated    [array]
+    residuals           - residuals evaluated at unknowns                [array]
+    sparsity            - boolean sparsity pattern (n_res x n_unknowns)  [scipy.sparse]
+    colors              - column colors from color_jacobian_columns      [array]
+    step_size           - relative step size, as epsfcn in fsolve        [Unitless]
+
+    Outputs:
+    jacobian            - sparse Jacobian (n_res x n_unknowns)           [scipy.sparse.csc_matrix]
+
+    Properties Used:
+    N/A
+    """
+    x0      = np.asarray(unknowns,dtype=float)
+    f0      = np.asarray(residuals,dtype=float)
+    h       = finite_difference_steps(x0,step_size)
+    pattern = sp.csc_matrix(sparsity)
+    rows    = pattern.indices
+    cols    = np.repeat(np.arange(pattern.shape[1]),np.diff(pattern.indptr))
+    values  = np.zeros(len(rows))
+
+    for color in range(int(np.max(colors))+1 if len(colors) else 0):
+        columns      = np.where(colors == color)[0]
+        x            = x0.copy()
+        x[columns]  += h[columns]
+        df           = np.asarray(function(x),dtype=float) - f0
+        entries      = np.isin(cols,columns)
+        values[entries] = df[rows[entries]]/h[cols[entries]]
+
+    jacobian = sp.csc_matrix((values,(rows,cols)),shape=pattern.shape)
+
+    return jacobian
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Library-Missions-Segments
+def compute_jacobian_sparsity(function,unknowns,residuals,unknowns_layout,residuals_layout,step_size=None,threshold=0.):
+    """Detects the block sparsity pattern of the mission residuals. Unknowns and residuals are grouped into
+    families (e.g. body_angle, throttle_0, force_x) defined over the control points. One unknown family at a time is
+    probed at a single interior control point; a residual family that only responds at that same control point is
+    coupled through a diagonal block, a residual family that responds elsewhere (e.g. through the Chebyshev
+    differentiation or integration matrices) is coupled through a dense block.
+
+    Assumptions:
+    Coupling between a pair of families is either pointwise or dense. Families that do not respond to the probe are
+    taken to be uncoupled. Off-point responses smaller than threshold times the pointwise response are neglected,
+    which gives an approximate Jacobian with far fewer colors (e.g. the weak coupling of throttle to mass through the
+    integrated fuel burn).
+
+    Source:
+    N/A
+
+    Inputs:
+    function            - residual function f(x)                               [function]
+    unknowns            - packed unknowns                                      [array]
+    residuals           - residuals evaluated at unknowns                      [array]
+    unknowns_layout     - (family, control point) of every packed unknown      [tuple]
+    residuals_layout    - (family, control point) of every packed residual     [tuple]
+    step_size           - relative step size, as epsfcn in fsolve              [Unitless]
+    threshold           - relative size of neglected off-point responses       [Unitless]
+
+    Outputs:
+    sparsity            - boolean sparsity pattern (n_res x n_unknowns)        [scipy.sparse.csc_matrix]
+    evaluations         - number of residual evaluations used                  [int]
+
+    Properties Used:
+    N/A
+    """
+    x0                = np.asarray(unknowns,dtype=float)
+    f0                = np.asarray(residuals,dtype=float)
+    h                 = finite_difference_steps(x0,step_size)
+    u_family,u_point  = unknowns_layout
+    r_family,r_point  = residuals_layout
+    n_res             = len(f0)
+    evaluations       = 0
+    row_blocks        = []
+    col_blocks        = []
+
+    for family in np.unique(u_family):
+        columns = np.where(u_family == family)[0]
+        probe   = columns[len(columns)//2]
+
+        # probe the family, trying the opposite direction if the residuals are insensitive (e.g. a clipped input)
+        for direction in [1.,-1.]:
+            x         = x0.copy()
+            x[probe] += direction*h[probe]
+            df        = np.abs(np.asarray(function(x),dtype=float) - f0)
+            changed   = df != 0.
+            evaluations += 1
+            if np.any(changed):
+                break
+
+        for res_family in np.unique(r_family[changed]):
+            res_rows  = np.where(r_family == res_family)[0]
+            at_probe  = r_point[res_rows] == u_point[probe]
+            pointwise = (len(columns) > 1) and np.any(changed[res_rows[at_probe]]) and \
+                        np.all(df[res_rows[~at_probe]] <= threshold*np.max(df[res_rows[at_probe]]))
+            if pointwise:
+                # diagonal block, match rows and columns by control point
+                for col in columns:
+                    match = res_rows[r_point[res_rows] == u_point[col]]
+                    row_blocks.append(match)
+                    col_blocks.append(np.full(len(match),col))
+            else:
+                # dense block
+                row_blocks.append(np.tile(res_rows,len(columns)))
+                col_blocks.append(np.repeat(columns,len(res_rows)))
+
+    if row_blocks:
+        rows = np.concatenate(row_blocks)
+        cols = np.concatenate(col_blocks)
+    else:
+        rows = np.zeros(0,dtype=int)
+        cols = np.zeros(0,dtype=int)
+    sparsity = sp.csc_matrix((np.ones(len(rows),dtype=bool),(rows,cols)),shape=(n_res,len(x0)))
+
+    return sparsity, evaluations
+
+## @ingroup Library-Missions-Segments
+def color_jacobian_columns(sparsity):
+    """Groups the columns of a sparse Jacobian into structurally orthogonal sets (columns within a set share no
+    nonzero row) using a greedy largest-first coloring of the column intersection graph.
+
+    Assumptions:
+    N/A
+
+    Source:
+    Coleman, T. F., and More, J. J., "Estimation of Sparse Jacobian Matrices and Graph Coloring Problems",
+    SIAM Journal on Numerical Analysis, 1983.
+
+    Inputs:
+    sparsity            - boolean sparsity pattern (n_res x n_unknowns)  [scipy.sparse]
+
+    Outputs:
+    colors              - color of every column                          [array]
+
+    Properties Used:
+    N/A
+    """
+    pattern   = sp.csc_matrix(sparsity,dtype=bool).astype(int)
+    n_cols    = pattern.shape[1]
+    adjacency = (pattern.T @ pattern).tolil()
+    degree    = np.asarray((adjacency != 0).sum(axis=1)).ravel()
+    colors    = np.full(n_cols,-1,dtype=int)
+
+    for col in np.argsort(-degree,kind='stable'):
+        used = colors[adjacency.rows[col]]
+        used = set(used[used >= 0])
+        color = 0
+        while color in used:
+            color += 1
+        colors[col] = color
+
+    return colors
+
+## @ingroup Library-Missions-Segments
+def get_array_layout(data):
+    """Returns the family and control point index of every entry of data.pack_array(), mirroring the traversal
+    order of Data.pack_array.
+
+    Assumptions:
+    Scalars are assigned the control point index -1.
+
+    Source:
+    N/A
+
+    Inputs:
+    data                - unknowns or residuals                          [Data]
+
+    Outputs:
+    family              - family index of every packed entry             [array]
+    point               - control point index of every packed entry      [array]
+
+    Properties Used:
+    N/A
+    """
+    families = []
+    points   = []
+
+    def do_layout(D):
+        for v in D.values():
+            if isinstance(v,dict):
+                do_layout(v)
+                continue
+            elif not isinstance(v,(int,float,np.ndarray)):
+                continue
+            rank = np.ndim(v)
+            if rank > 2:
+                continue
+            elif rank == 0:
+                point = np.array([-1])
+            else:
+                v     = v.reshape(v.shape[0],-1)
+                point = np.tile(np.arange(v.shape[0]),v.shape[1])
+            families.append(np.full(len(point),len(families)))
+            points.append(point)
+
+    do_layout(data)
+
+    if families:
+        return np.concatenate(families), np.concatenate(points)
+    else:
+        return np.zeros(0,dtype=int), np.zeros(0,dtype=int)
+
+## @ingroup Library-Missions-Segments
+def finite_difference_steps(unknowns,step_size=None):
+    """Forward-difference step for every unknown, following the MINPACK convention used by fsolve.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    unknowns            - packed unknowns                   [array]
+    step_size           - relative step size (epsfcn)       [Unitless]
+
+    Outputs:
+    h                   - step for every unknown            [array]
+
+    Properties Used:
+    N/A
+    """
+    eps = np.finfo(float).eps
+    if step_size is None or step_size < eps:
+        step_size = eps
+    h = np.sqrt(step_size)*np.abs(unknowns)
+    h[h == 0.] = np.sqrt(step_size)
+    return h
@@ -7,8 +7,13 @@
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports 
+from .compute_jacobian import compute_jacobian, compute_jacobian_sparsity, color_jacobian_columns, get_array_layout
+from .newton_raphson   import newton_raphson
+
 # Package imports 
 import scipy.optimize
+import scipy.sparse as sp
 import numpy as np 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -28,6 +33,8 @@ def converge_root(segment):
     segment                            [Data]
     segment.settings.root_finder       [Data]
     state.numerics.tolerance_solution  [Unitless]
+    state.numerics.solver_jacobian     [string/function]
+    state.numerics.solver_method       [string]
 
     Outputs:
     state.unknowns                     [Any]
@@ -38,19 +45,23 @@ def converge_root(segment):
     """       
     
     unknowns = segment.state.unknowns.pack_array()
+    numerics = segment.state.numerics
     
-    try:
-        root_finder = segment.settings.root_finder
-    except AttributeError:
-        root_finder = scipy.optimize.fsolve 
-    
-    unknowns,infodict,ier,msg = root_finder( iterate,
-                                         unknowns,
-                                         args = segment,
-                                         xtol = segment.state.numerics.tolerance_solution,
-                                         maxfev = segment.state.numerics.max_evaluations,
-                                         epsfcn = segment.state.numerics.step_size,
-                                         full_output = 1)
+    if isinstance(numerics.solver_jacobian,str) and numerics.solver_jacobian == "none":
+        try:
+            root_finder = segment.settings.root_finder
+        except AttributeError:
+            root_finder = scipy.optimize.fsolve 
+        
+        unknowns,infodict,ier,msg = root_finder( iterate,
+                                             unknowns,
+                                             args = segment,
+                                             xtol = numerics.tolerance_solution,
+                                             maxfev = numerics.max_evaluations,
+                                             epsfcn = numerics.step_size,
+                                             full_output = 1)
+    else:
+        unknowns,infodict,ier,msg = converge_jacobian(segment,unknowns)
     
     if ier!=1:
         print("Segment did not converge. Segment Tag: " + segment.tag)
@@ -66,6 +77,96 @@ def converge_root(segment):
 # ---------------------------------------------------------------------------------------------------------------------- 
 #  Helper Functions
 # ---------------------------------------------------------------------------------------------------------------------- 
+## @ingroup Library-Missions-Segments
+def converge_jacobian(segment,unknowns):
+    """Solves the segment with a user supplied (analytic) Jacobian or a sparse, column-colored forward-difference
+    Jacobian. The sparsity pattern of the colored Jacobian is detected once per solve from the unknown and residual
+    families of the segment.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    segment                            [Data]
+    unknowns                           [array]
+    state.numerics.solver_jacobian     [string/function]
+        "sparse"   - colored forward-difference Jacobian
+        function   - analytic Jacobian, called as solver_jacobian(segment,unknowns) 
+    state.numerics.solver_method       [string]
+        "newton"   - damped Newton-Raphson with a sparse linear solve 
+        "hybr"     - MINPACK hybrid Powell method, scipy.optimize.root
+        "lm"       - MINPACK Levenberg-Marquardt method, scipy.optimize.root 
+
+    Outputs:
+    unknowns                           [array]
+    infodict                           [dict]
+    ier                                [int]
+    msg                                [string]
+
+    Properties Used:
+    N/A
+    """     
+    numerics  = segment.state.numerics
+    method    = numerics.solver_method 
+    nfev      = [0]
+    last      = [None,None]
+    
+    def function(x):
+        if last[0] is None or not np.array_equal(x,last[0]):
+            nfev[0] += 1
+            last[0]  = np.array(x,dtype=float)
+            last[1]  = iterate(last[0],segment)
+        return last[1]
+    
+    if callable(numerics.solver_jacobian):
+        def jacobian(x,f=None): 
+            segment.state.unknowns.unpack_array(x)
+            return numerics.solver_jacobian(segment,x)
+    elif numerics.solver_jacobian == "sparse":
+        residuals  = function(unknowns)
+        sparsity,n_probes = compute_jacobian_sparsity(lambda x: iterate(x,segment),unknowns,residuals,
+                                                      get_array_layout(segment.state.unknowns),
+                                                      get_array_layout(segment.state.residuals),numerics.step_size,
+                                                      numerics.jacobian_sparsity_threshold)
+        nfev[0]  += n_probes 
+        colors    = color_jacobian_columns(sparsity)
+        def jacobian(x,f=None):
+            if f is None:
+                f = function(x)
+            nfev[0] += int(np.max(colors)) + 1 if len(colors) else 0
+            return compute_jacobian(lambda x: iterate(x,segment),x,f,sparsity,colors,numerics.step_size)
+    else:
+        raise AttributeError('solver_jacobian must be "none", "sparse" or a function')
+    
+    if method == 'newton':
+        unknowns,infodict,ier,msg = newton_raphson(function,unknowns,jacobian,
+                                                   xtol   = numerics.tolerance_solution,
+                                                   maxfev = numerics.max_evaluations)
+    elif method in ['hybr','lm']:
+        def dense_jacobian(x):
+            J = jacobian(x)
+            return J.toarray() if sp.issparse(J) else np.asarray(J)
+        if method == 'hybr':
+            options = {'xtol': numerics.tolerance_solution, 'maxfev': int(numerics.max_evaluations)}
+        else:
+            options = {'xtol': numerics.tolerance_solution, 'maxiter': int(numerics.max_evaluations)}
+        sol      = scipy.optimize.root(function,unknowns,jac=dense_jacobian,method=method,options=options) 
+        unknowns = sol.x
+        infodict = {'njev': sol.get('njev',0),'fvec': sol.fun}
+        ier      = 1 if sol.success else 0
+        msg      = sol.message
+    else:
+        raise AttributeError('solver_method must be "newton", "hybr" or "lm"')
+    
+    # leave the segment state at the solution
+    iterate(unknowns,segment)
+    infodict['nfev'] = nfev[0] + 1
+    
+    return unknowns,infodict,ier,msg
+
 ## @ingroup Library-Missions-Segments
 def iterate(unknowns, segment):
     
@@ -0,0 +1,373 @@
+## @ingroup Library-Missions-Segments
+# RCAIDE/Library/Missions/Segments/converge_simultaneous.py
+#
+#
+# Created:  Oct 2026, agent
+# Modified: Oct 2026, agent
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Framework.Mission.Common import Conditions
+from .converge_root                  import iterate
+from .compute_jacobian               import compute_jacobian, compute_jacobian_sparsity, color_jacobian_columns, get_array_layout
+from .newton_raphson                 import newton_raphson
+
+# Package imports
+from concurrent.futures import ThreadPoolExecutor
+from copy               import deepcopy
+import scipy.sparse as sp
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+# converge_simultaneous
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Library-Missions-Segments
+def converge_simultaneous(mission):
+    """Solves the unknowns of every segment of a mission in a single Newton loop. The initial state of each segment
+    (time, mass, position and energy storage states read from state.initials) becomes an additional unknown, and the
+    continuity of these initials with the final state of the previous segment is enforced as a residual. The Jacobian
+    of the stacked system is block-banded: it is assembled from per-segment Jacobians, so each segment is perturbed
+    independently and segment evaluations may be run concurrently.
+
+    Assumptions:
+    Every segment has been initialized and iterated once so that state.initials can be snapshotted. Quantities that
+    segments read from the previous segment while initializing (e.g. altitude or air speed) are taken from this
+    initial pass.
+    
+    Analyses store results on themselves and on the vehicle (e.g. surrogates and rotor wake states), so only segments
+    that share no analysis and no vehicle are evaluated on different threads. Segments flown with the same analyses
+    are evaluated one after another on one thread. The module-level caches (vortex distributions, AIC factorizations,
+    Hess-Smith and airfoil polar tables) are shared by every thread: entries are popped and stored whole, so a
+    concurrent miss only repeats a computation.
+
+    Source:
+    N/A
+
+    Inputs:
+    mission.segments                             [Data]
+    mission.state.numerics.tolerance_solution    [Unitless]
+    mission.state.numerics.max_evaluations       [Unitless]
+    mission.state.numerics.step_size             [Unitless]
+    mission.settings.number_of_workers           [int]
+
+    Outputs:
+    segment.state.unknowns                       [Any]
+    segment.state.numerics.converged             [Unitless]
+
+    Properties Used:
+    N/A
+    """
+    segments  = list(mission.segments.values())
+    numerics  = mission.state.numerics
+    workers   = mission.settings.number_of_workers
+    blocks    = []
+
+    # set up the block of unknowns and residuals of each segment
+    for i, segment in enumerate(segments):
+        block           = Conditions()
+        block.unknowns  = segment.state.unknowns.pack_array()
+        block.fields    = []
+        block.scale     = np.zeros(0)
+        if i > 0:
+            previous                 = segments[i-1]
+            block.fields             = get_continuity_fields(segment,previous)
+            initials                 = Conditions()
+            initials.conditions      = deepcopy(previous.state.conditions)
+            segment.state.initials   = initials
+            values                   = get_final_values(previous.state.conditions,block.fields)
+            block.scale              = np.maximum(np.abs(values),1.)
+            block.unknowns           = np.hstack([block.unknowns,values/block.scale])
+        block.n_unknowns = len(segment.state.unknowns.pack_array())
+        blocks.append(block)
+
+    for i, block in enumerate(blocks):
+        block.n_final     = len(blocks[i+1].scale) if i < len(blocks) - 1 else 0
+        block.final_scale = blocks[i+1].scale if i < len(blocks) - 1 else np.zeros(0)
+        block.final       = blocks[i+1].fields if i < len(blocks) - 1 else []
+
+    sizes   = [len(block.unknowns) for block in blocks]
+    offsets = np.hstack([0,np.cumsum(sizes)]).astype(int)
+
+    def segment_function(i):
+        return lambda x: evaluate_segment(segments[i],blocks[i],x)
+
+    # segments sharing analyses are evaluated in sequence within one thread
+    groups = get_independent_groups(segments)
+    def run(function):
+        if workers > 1 and len(groups) > 1:
+            results = [None]*len(segments)
+            def run_group(group):
+                for i in group:
+                    results[i] = function(i)
+            with ThreadPoolExecutor(max_workers=min(workers,len(groups))) as executor:
+                list(executor.map(run_group,groups))
+            return results
+        return [function(i) for i in range(len(segments))]
+
+    # the residuals of every segment at the latest point
+    last = [None,None]
+    def local_residuals(x):
+        if last[0] is None or not np.array_equal(x,last[0]):
+            last[0] = np.array(x,dtype=float)
+            last[1] = run(lambda i: segment_function(i)(last[0][offsets[i]:offsets[i+1]]))
+        return last[1]
+
+    def function(x):
+        local     = local_residuals(x)
+        residuals = []
+        for i, block in enumerate(blocks):
+            n_res = len(local[i]) - block.n_final
+            residuals.append(local[i][:n_res])
+            if i < len(blocks) - 1:
+                # continuity of the initials of the next segment with the final state of this segment
+                residuals.append(x[offsets[i+1]+blocks[i+1].n_unknowns:offsets[i+2]] - local[i][n_res:])
+        return np.hstack(residuals)
+
+    # detect the sparsity of each segment block
+    def detect(i):
+        x  = np.array(blocks[i].unknowns)
+        f  = segment_function(i)(x)
+        u_family, u_point = get_array_layout(segments[i].state.unknowns)
+        r_family, r_point = get_array_layout(segments[i].state.residuals)
+        n_c      = len(x) - len(u_family)
+        u_family = np.hstack([u_family,np.max(u_family,initial=-1) + 1 + np.arange(n_c)]).astype(int)
+        u_point  = np.hstack([u_point,-np.ones(n_c)]).astype(int)
+        r_family = np.hstack([r_family,np.max(r_family,initial=-1) + 1 + np.arange(blocks[i].n_final)]).astype(int)
+        r_point  = np.hstack([r_point,-np.ones(blocks[i].n_final)]).astype(int)
+        sparsity,_ = compute_jacobian_sparsity(segment_function(i),x,f,(u_family,u_point),(r_family,r_point),
+                                               numerics.step_size,segments[i].state.numerics.jacobian_sparsity_threshold)
+        return sparsity, color_jacobian_columns(sparsity)
+
+    patterns = run(detect)
+
+    def jacobian(x,f=None):
+        local = local_residuals(x)
+        def local_jacobian(i):
+            sparsity, colors = patterns[i]
+            return compute_jacobian(segment_function(i),x[offsets[i]:offsets[i+1]],local[i],sparsity,colors,numerics.step_size)
+        J_local = run(local_jacobian)
+
+        # assemble the block-banded mission jacobian
+        n_seg = len(blocks)
+        rows  = []
+        for i, block in enumerate(blocks):
+            n_res         = J_local[i].shape[0] - block.n_final
+            row           = [None]*n_seg
+            row[i]        = J_local[i][:n_res,:]
+            rows.append(row)
+            if i < n_seg - 1 and block.n_final:
+                nxt       = blocks[i+1]
+                row       = [None]*n_seg
+                row[i]    = -J_local[i][n_res:,:]
+                row[i+1]  = sp.hstack([sp.csc_matrix((block.n_final,nxt.n_unknowns)),sp.identity(block.n_final,format='csc')])
+                rows.append(row)
+        return sp.bmat(rows,format='csc')
+
+    x0 = np.hstack([block.unknowns for block in blocks])
+    unknowns,infodict,ier,msg = newton_raphson(function,x0,jacobian,
+                                               xtol   = numerics.tolerance_solution,
+                                               maxfev = numerics.max_evaluations)
+
+    # leave every segment at the solution
+    for i, segment in enumerate(segments):
+        segment.state.unknowns.unpack_array(unknowns[offsets[i]:offsets[i]+blocks[i].n_unknowns])
+
+    if ier!=1:
+        print("Mission did not converge. Mission Tag: " + mission.tag)
+        print("Error Message:\n" + msg)
+
+    for segment in segments:
+        segment.state.numerics.converged = ier == 1
+        segment.converged                = ier == 1
+    mission.state.numerics.converged = ier == 1
+
+    return
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Library-Missions-Segments
+def evaluate_segment(segment,block,x):
+    """Evaluates the residuals of a single segment for given unknowns and initials, and returns the final values of
+    the fields that the next segment reads from its initials.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    segment                            [Data]
+    block.n_unknowns                   [int]
+    block.fields                       [list]
+    block.scale                        [array]
+    block.final                        [list]
+    block.final_scale                  [array]
+    x                                  [array]
+
+    Outputs:
+    residuals                          [array]
+
+    Properties Used:
+    N/A
+    """
+    if len(block.fields):
+        set_initial_values(segment.state.initials.conditions,block.fields,x[block.n_unknowns:]*block.scale)
+    residuals = iterate(x[:block.n_unknowns],segment)
+    if len(block.final):
+        residuals = np.hstack([residuals,get_final_values(segment.state.conditions,block.final)/block.final_scale])
+    return residuals
+
+## @ingroup Library-Missions-Segments
+def get_independent_groups(segments):
+    """Groups the segments that share an analysis or a vehicle, directly or through other segments. Groups share no
+    analyses and may be evaluated concurrently.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    segments                           [list]
+
+    Outputs:
+    groups                             [list of lists of segment indices]
+
+    Properties Used:
+    N/A
+    """
+    owners = {}
+    group  = list(range(len(segments)))
+    
+    def find(i):
+        while group[i] != i:
+            group[i] = group[group[i]]
+            i        = group[i]
+        return i
+    
+    for i, segment in enumerate(segments):
+        shared = []
+        for analysis in segment.analyses.values():
+            if not isinstance(analysis,dict):
+                continue
+            shared.append(analysis)
+            for key in ['vehicle','geometry']:
+                if analysis.get(key,None) is not None:
+                    shared.append(analysis[key])
+        for item in shared:
+            j = owners.setdefault(id(item),i)
+            group[find(i)] = find(j)
+    
+    groups = {}
+    for i in range(len(segments)):
+        groups.setdefault(find(i),[]).append(i)
+    
+    return list(groups.values())
+
+## @ingroup Library-Missions-Segments
+def get_continuity_fields(segment,previous):
+    """Lists the conditions that a segment reads from the final control point of the previous segment through its
+    initials, mirroring Common.Initialize (time, weights, inertial and planet position, and energy).
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    segment                            [Data]
+    previous                           [Data]
+
+    Outputs:
+    fields                             [list]
+
+    Properties Used:
+    N/A
+    """
+    fields = ['frames.inertial.time',
+              'weights.total_mass',
+              'frames.inertial.position_vector',
+              'frames.inertial.aircraft_range',
+              'frames.planet.latitude',
+              'frames.planet.longitude']
+
+    for network in segment.analyses.energy.vehicle.networks:
+        if 'busses' in network:
+            for bus in network.busses:
+                for battery in bus.batteries:
+                    for key in ['pack.energy','pack.temperature','cell.temperature','cell.charge_throughput','cell.state_of_charge']:
+                        fields.append('energy.' + bus.tag + '.' + battery.tag + '.' + key)
+        elif 'fuel_lines' in network:
+            for fuel_line in  network.fuel_lines:
+                for fuel_tank in fuel_line.fuel_tanks:
+                    fields.append('energy.' + fuel_line.tag + '.' + fuel_tank.tag + '.mass')
+
+    continuity_fields = []
+    for field in fields:
+        try:
+            value = previous.state.conditions.deep_get(field)
+        except (KeyError,AttributeError):
+            continue
+        if isinstance(value,np.ndarray) and value.ndim == 2 and value.size:
+            continuity_fields.append(field)
+
+    return continuity_fields
+
+## @ingroup Library-Missions-Segments
+def get_final_values(conditions,fields):
+    """Packs the final control point of the listed conditions into a vector.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    conditions                         [Data]
+    fields                             [list]
+
+    Outputs:
+    values                             [array]
+
+    Properties Used:
+    N/A
+    """
+    if not len(fields):
+        return np.zeros(0)
+    return np.hstack([conditions.deep_get(field)[-1,:] for field in fields]).astype(float)
+
+## @ingroup Library-Missions-Segments
+def set_initial_values(conditions,fields,values):
+    """Unpacks a vector into the final control point of the listed conditions.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    conditions                         [Data]
+    fields                             [list]
+    values                             [array]
+
+    Outputs:
+    conditions                         [Data]
+
+    Properties Used:
+    N/A
+    """
+    index = 0
+    for field in fields:
+        array         = conditions.deep_get(field)
+        n             = array.shape[1]
+        array[-1,:]   = values[index:index+n]
+        index        += n
+    return conditions
@@ -0,0 +1,144 @@
+## @ingroup Library-Missions-Segments
+# RCAIDE/Library/Missions/Segments/newton_raphson.py
+#
+#
+# Created:  Oct 2026, agent
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# Package imports
+import numpy as np
+import scipy.linalg
+import scipy.sparse as sp
+import scipy.sparse.linalg
+
+# ----------------------------------------------------------------------------------------------------------------------
+# newton_raphson
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Library-Missions-Segments
+def newton_raphson(function,unknowns,jacobian,xtol=1e-8,maxfev=0,residuals=None,contraction=0.5):
+    """Damped Newton-Raphson root finder that accepts sparse Jacobians. The Jacobian is LU factorized once and
+    reused for as long as the residual norm keeps contracting, after which it is re-evaluated. Every step backtracks
+    along the Newton direction until the residual norm decreases.
+
+    Assumptions:
+    Convergence is declared on the relative step size, following the xtol convention of fsolve.
+
+    Source:
+    Dennis, J. E., and Schnabel, R. B., "Numerical Methods for Unconstrained Optimization and Nonlinear
+    Equations", SIAM, 1996.
+
+    Inputs:
+    function            - residual function f(x)                                       [function]
+    unknowns            - initial guess                                                [array]
+    jacobian            - Jacobian function J(x,f(x)), dense or scipy.sparse           [function]
+    xtol                - relative step tolerance                                      [Unitless]
+    maxfev              - residual evaluations outside the Jacobian, 0 for 100*(n+1)  [int]
+    residuals           - residuals at the initial guess, if already known             [array]
+    contraction         - residual reduction below which the Jacobian is kept          [Unitless]
+
+    Outputs:
+    unknowns            - solution                                                     [array]
+    infodict            - nfev, njev and the final residuals (fvec)                    [dict]
+    ier                 - 1 if converged                                               [int]
+    msg                 - solver message                                               [str]
+
+    Properties Used:
+    N/A
+    """
+    x    = np.array(unknowns,dtype=float)
+    n    = len(x)
+    if not maxfev:
+        maxfev = 100*(n+1)
+
+    nfev = [0]
+    def fun(x):
+        nfev[0] += 1
+        return np.asarray(function(x),dtype=float)
+
+    f     = fun(x) if residuals is None else np.asarray(residuals,dtype=float)
+    njev  = 0
+    ier   = 0
+    msg   = 'The number of calls to function has reached maxfev = ' + str(maxfev) + '.'
+    solve = None
+    fresh = False
+
+    while nfev[0] < maxfev:
+        # the Jacobian and its factorization are reused until the residual stops contracting
+        if solve is None:
+            solve = factorize(jacobian(x,f))
+            fresh = True
+            njev += 1
+        dx = solve(-f)
+
+        # backtracking line search on the residual norm
+        norm_f = np.linalg.norm(f)
+        alpha  = 1.
+        while True:
+            x_new = x + alpha*dx
+            f_new = fun(x_new)
+            if np.linalg.norm(f_new) <= (1. - 1e-4*alpha)*norm_f or alpha < 1e-3 or nfev[0] >= maxfev:
+                break
+            alpha *= 0.5
+
+        if alpha < 1e-3 and np.linalg.norm(f_new) >= norm_f:
+            if fresh:
+                ier = 5
+                msg = 'The iteration is not making good progress, the line search could not reduce the residuals.'
+                break
+            # retry from the same point with an updated Jacobian
+            solve = None
+            continue
+
+        step = np.linalg.norm(alpha*dx)
+        x, f = x_new, f_new
+        if np.linalg.norm(f) > contraction*norm_f:
+            solve = None
+        fresh = False
+
+        if step <= xtol*(np.linalg.norm(x) + xtol):
+            ier = 1
+            msg = 'The relative error between two consecutive iterates is at most ' + str(xtol)
+            break
+
+    infodict = {'nfev': nfev[0], 'njev': njev, 'fvec': f}
+
+    return x, infodict, ier, msg
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Library-Missions-Segments
+def factorize(J):
+    """Factorizes a dense or sparse Jacobian once and returns a function that solves J dx = b. A singular
+    Jacobian falls back to a least-squares solution.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    J                   - Jacobian, dense or scipy.sparse     [array]
+
+    Outputs:
+    solve               - function returning dx for a given b [function]
+
+    Properties Used:
+    N/A
+    """
+    try:
+        if sp.issparse(J):
+            lu = scipy.sparse.linalg.splu(sp.csc_matrix(J))
+            solve = lu.solve
+        else:
+            lu_piv = scipy.linalg.lu_factor(J,check_finite=True)
+            if np.any(np.diag(lu_piv[0]) == 0.):
+                raise np.linalg.LinAlgError
+            solve = lambda b: scipy.linalg.lu_solve(lu_piv,b)
+    except (np.linalg.LinAlgError,RuntimeError,ValueError):
+        J     = J.toarray() if sp.issparse(J) else np.asarray(J)
+        solve = lambda b: np.linalg.lstsq(J,b,rcond=None)[0]
+    return solve
@@ -0,0 +1,60 @@
+# airfoil_boundary_layer_test.py
+#
+# Created: Oct 2026, agent
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+from RCAIDE.Library.Methods.Aerodynamics.Airfoil_Panel_Method import airfoil_analysis
+from RCAIDE.Library.Methods.Geometry.Airfoil                  import compute_naca_4series
+
+# python imports
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+    # laminar, transitional and turbulent boundary layers over a sweep of Reynolds numbers and angles of attack
+    airfoil_geometry = compute_naca_4series('2412',npoints = 101)
+    AoA              = np.tile((np.array([-4,2,8,14])*np.pi/180)[None,:],(3,1))
+    Re               = np.tile((np.array([1,10,100])*1E4)[:,None],(1,4))
+    with np.errstate(all='ignore'):
+        airfoil_properties = airfoil_analysis(airfoil_geometry,AoA,Re)
+
+    # truth values of the Thwaites and Head methods marching each case and surface point by point, at panels 10, 30,
+    # 60 and 90 of the cases at Re = 1E5, AoA = 8 deg and Re = 1E6, AoA = 14 deg
+    truth               = {}
+    truth['theta']      = [[0.00162285461450621, 0.00077189267100645, 0.00068079176183203, 0.00560033095596103],
+                           [0.00042034051908994, 0.00020094293192594, 0.00037886286886415, 0.00753217048770861]]
+    truth['delta_star'] = [[0.00417740728631768, 0.00194231241561264, 0.00283613640923477, 0.01102537861688359],
+                           [0.00103747480174543, 0.00049453454670992, 0.00063158886979236, 0.01699090041629727]]
+    truth['H']          = [[2.57411061285287   , 2.5162985588140137 , 4.1659382034862436 , 1.9687012613331558 ],
+                           [2.4681770008554804 , 2.461069627928915  , 1.6670645811395939 , 2.25577746069661   ]]
+    truth['cf']         = [[0.00054261261055215, 0.00377548899493334, 0.00047324683059195, 0.00463028372816218],
+                           [0.00028054170542486, 0.00185515613448349, 0.00010363047032496, 0.00193507463675725]]
+    truth['Re_theta']   = [[152.00948294258177 , 66.20349805425539  , 111.68368100631174 , 582.932844789803   ],
+                           [379.2741994921389  , 135.19323203740365 , 734.3157195465759  , 7720.400364193783  ]]
+    truth['delta']      = [[0.01491196069311889, 0.00842036694970399, 0.00445506515219064, 0.03347653014654872],
+                           [0.0047086458960644 , 0.00279550574646346, 0.00248885916740773, 0.04473307562154744]]
+    cd_visc_truth       = [[0.03315191847396796, 0.03198916517613054, 0.04041127830967856, 0.07859669969296845],
+                           [0.01100817478792437, 0.0103010776205979 , 0.01799346853986172, 0.05559770124387233],
+                           [0.00692425947536953, 0.00598482388295524, 0.01103990007928647, 0.02441563713680524]]
+
+    # marching every case together matches the point by point march to roundoff
+    panels = [10,30,60,90]
+    for key, values in truth.items():
+        computed = np.array([airfoil_properties[key][1,2,panels],airfoil_properties[key][2,3,panels]])
+        error    = np.max(np.abs(computed - values)/np.abs(values))
+        print(key + ' error : ' + str(error))
+        assert error < 1E-9
+
+    error = np.max(np.abs(airfoil_properties.cd_visc - cd_visc_truth)/np.abs(cd_visc_truth))
+    print('cd_visc error : ' + str(error))
+    assert error < 1E-9
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+# hess_smith_cache_test.py
+#
+# Created: Oct 2026, agent
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+from RCAIDE.Library.Methods.Aerodynamics.Airfoil_Panel_Method            import hess_smith, panel_geometry, infl_coeff, velocity_distribution
+from RCAIDE.Library.Methods.Aerodynamics.Airfoil_Panel_Method.hess_smith import panel_method_cache
+from RCAIDE.Library.Methods.Geometry.Airfoil                             import compute_naca_4series
+
+# python imports
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+    # two airfoils, each shared by half of the cases, at every control point
+    ncases   = 4
+    ncpts    = 3
+    airfoils = [compute_naca_4series('4412',npoints = 101),compute_naca_4series('2412',npoints = 101)]
+    npanel   = len(airfoils[0].x_coordinates) - 1
+    x_coord  = np.zeros((npanel+1,ncases,ncpts))
+    y_coord  = np.zeros((npanel+1,ncases,ncpts))
+    for case in range(ncases):
+        x_coord[:,case,:] = airfoils[case % 2].x_coordinates[:,None]
+        y_coord[:,case,:] = airfoils[case % 2].y_coordinates[:,None]
+    alpha    = np.tile(np.array([-2.,4.,8.,12.])[None,:]*np.pi/180,(ncpts,1))
+    Re       = np.ones((ncpts,ncases))*1E5
+
+    # factors computed on a cache miss, read on a cache hit, and computed without the cache
+    panel_method_cache.clear()
+    miss     = hess_smith(x_coord,y_coord,alpha,Re,npanel,cache = True)
+    assert len(panel_method_cache) == 2
+    hit      = hess_smith(x_coord,y_coord,alpha,Re,npanel,cache = True)
+    assert len(panel_method_cache) == 2
+    no_cache = hess_smith(x_coord,y_coord,alpha,Re,npanel,cache = False)
+    for result in [hit,no_cache]:
+        for value, value_miss in zip(result,miss):
+            assert np.array_equal(value,value_miss)
+
+    # a dense solve of the influence coefficients of every case and control point
+    alpha_2d      = np.repeat(alpha.T[np.newaxis,:,:],npanel,axis=0)
+    l,st,ct,xbar,ybar,norm = panel_geometry(x_coord,y_coord,npanel,ncases,ncpts)
+    ainfl         = infl_coeff(x_coord,y_coord,xbar,ybar,st,ct,npanel,ncases,ncpts)
+    b_2d          = np.zeros((npanel+1,ncases,ncpts))
+    b_2d[:-1,:,:] = st*np.cos(alpha_2d) - np.sin(alpha_2d)*ct
+    b_2d[-1,:,:]  = -(ct[0,:,:]*np.cos(alpha_2d[-1,:,:]) + st[0,:,:]*np.sin(alpha_2d[-1,:,:]))-(ct[-1,:,:]*np.cos(alpha_2d[-1,:,:]) +st[-1,:,:]*np.sin(alpha_2d[-1,:,:]))
+    qg            = np.swapaxes(np.linalg.solve(ainfl,np.swapaxes(b_2d.T,0,1)).T,1,2)
+    vt            = velocity_distribution(qg,x_coord,y_coord,xbar,ybar,st,ct,alpha_2d,npanel,ncases,ncpts)
+
+    error = np.max(np.abs(hit[2] - vt))/np.max(np.abs(vt))
+    print('tangential velocity error : ' + str(error))
+    assert error < 1E-12
+
+    return
+
+if __name__ == '__main__':
+    main()
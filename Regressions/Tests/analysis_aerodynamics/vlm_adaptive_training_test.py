@@ -0,0 +1,90 @@
+# vlm_adaptive_training_test.py
+#
+# Created: Oct 2026, agent
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+import RCAIDE
+from RCAIDE.Framework.Core import Units
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method import train_VLM_surrogates, build_VLM_surrogates
+
+# python imports
+import numpy as np
+
+# local imports
+import sys
+sys.path.append('../../Vehicles')
+from Boeing_737    import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+    # count the flight conditions evaluated by the VLM during training
+    training_module = sys.modules['RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method.train_VLM_surrogates']
+    VLM             = training_module.VLM
+    n_cases         = [0]
+    def counted_VLM(conditions,settings,geometry):
+        n_cases[0] += len(conditions.freestream.mach_number)
+        return VLM(conditions,settings,geometry)
+
+    # random flight conditions, subsonic and supersonic, over the usual range of angles of attack
+    n_points   = 200
+    np.random.seed(1)
+    alpha      = np.random.uniform(-5,15,n_points) * Units.deg
+    mach       = np.concatenate([np.random.uniform(0.05,0.9,n_points//2),np.random.uniform(1.3,3.4,n_points//2)])
+    conditions = RCAIDE.Framework.Mission.Common.Results()
+    conditions.expand_rows(n_points)
+    conditions.freestream.mach_number[:,0]       = mach
+    conditions.freestream.velocity[:,0]          = mach*343.
+    conditions.aerodynamics.angles.alpha[:,0]    = alpha
+
+    cases  = {}
+    errors = {}
+    training_module.VLM = counted_VLM
+    try:
+        for adaptive in [False,True]:
+            analysis   = analysis_setup(adaptive)
+            n_cases[0] = 0
+            with np.errstate(all='ignore'):
+                train_VLM_surrogates(analysis)
+            build_VLM_surrogates(analysis)
+            cases[adaptive] = n_cases[0]
+
+            # error of the alpha surrogates relative to the range of each coefficient, against the VLM
+            if not adaptive:
+                with np.errstate(all='ignore'):
+                    results = VLM(conditions,analysis.settings,analysis.geometry)
+                reference = np.hstack([results.CL,results.CDi,results.CM])
+            predicted = np.zeros_like(reference)
+            for regime, rows in [('subsonic',mach < 1.),('supersonic',mach >= 1.)]:
+                surrogate       = analysis.surrogates[regime].alpha
+                values          = surrogate(np.stack([alpha[rows],mach[rows]],axis=1))
+                predicted[rows] = values[:,[surrogate.outputs.index(name) for name in ['Clift','Cdrag','CM']]]
+            errors[adaptive] = np.abs(predicted - reference)/np.ptp(reference,axis=0)
+            print(('adaptive' if adaptive else 'fixed   ') + ' grid VLM cases : ' + str(cases[adaptive]) +
+                  ' max error CL, CDi, CM : ' + str(np.max(errors[adaptive],axis=0)) +
+                  ' mean error CL, CDi, CM : ' + str(np.mean(errors[adaptive],axis=0)))
+    finally:
+        training_module.VLM = VLM
+
+    # the adaptive grid needs fewer VLM cases for a surrogate at least as accurate as the fixed grid
+    assert cases[True] < 0.9*cases[False]
+    assert np.all(np.max(errors[True],axis=0)  <= np.max(errors[False],axis=0))
+    assert np.all(np.mean(errors[True],axis=0) <= np.mean(errors[False],axis=0))
+    assert np.all(np.max(errors[True],axis=0)  < [5E-2,1.2E-1,4E-2])
+
+    return
+
+def analysis_setup(adaptive):
+    analysis                                       = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method()
+    analysis.geometry                              = vehicle_setup()
+    analysis.settings.number_of_spanwise_vortices  = 10
+    analysis.settings.number_of_chordwise_vortices = 3
+    analysis.training.adaptive                     = adaptive
+    return analysis
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+# vlm_batch_test.py
+#
+# Created: Oct 2026, agent
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+import RCAIDE
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method import VLM, VLM_batch
+
+# python imports
+import numpy as np
+
+# local imports
+import sys
+sys.path.append('../../Vehicles')
+from Boeing_737    import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+    analysis  = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method()
+    settings  = analysis.settings
+    settings.number_of_spanwise_vortices  = 8
+    settings.number_of_chordwise_vortices = 2
+
+    # planform variants with different numbers of panels
+    geometries = []
+    for scale in [0.8,1.0,1.2]:
+        vehicle = vehicle_setup()
+        vehicle.wings.main_wing.spans.projected     *= scale
+        vehicle.wings.main_wing.sweeps.quarter_chord *= scale
+        geometries.append(vehicle)
+    geometries[2].wings.pop('vertical_stabilizer')
+
+    conditions = RCAIDE.Framework.Mission.Common.Results()
+    conditions.expand_rows(4)
+    conditions.freestream.mach_number[:,0]       = [0.3,0.8,0.3,1.5]
+    conditions.freestream.velocity[:,0]          = 100.
+    conditions.aerodynamics.angles.alpha[:,0]    = [0.05,-0.02,0.1,0.03]
+    conditions.aerodynamics.angles.beta[:,0]     = [0.,0.,0.05,0.]
+
+    # one batch, then batches of single geometries
+    with np.errstate(all='ignore'):
+        single  = [VLM(conditions,settings,geometry) for geometry in geometries]
+        batched = VLM_batch(geometries,conditions,settings)
+        settings.max_aic_memory = 1.
+        grouped = VLM_batch(geometries,conditions,settings)
+
+    for results in [batched,grouped]:
+        assert(len(results) == len(geometries))
+        for single_results, batch_results in zip(single,results):
+            for coefficient in ['CL','CDi','CM','CY','gamma']:
+                error = np.max(np.abs(batch_results[coefficient] - single_results[coefficient]))/np.max(np.abs(single_results[coefficient]))
+                print(coefficient + ' error : ' + str(error))
+                assert(error < 1E-6)
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+# vlm_kernel_test.py
+#
+# Created: Oct 2026, agent
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+import RCAIDE
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method import generate_vortex_distribution, compute_wing_induced_velocity, VLM
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method.compiled_induced_velocity import numba_available
+
+# python imports
+import numpy as np
+
+# local imports
+import sys
+sys.path.append('../../Vehicles')
+from Boeing_737    import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+    # coarse lattice, the kernel runs as plain python when numba is not installed, which checks its algebra
+    vehicle   = vehicle_setup()
+    analysis  = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method()
+    settings  = analysis.settings
+    settings.number_of_spanwise_vortices  = 8
+    settings.number_of_chordwise_vortices = 2
+    VD        = generate_vortex_distribution(vehicle,settings)
+
+    # subsonic and supersonic mach numbers
+    mach      = np.atleast_2d([0.3,0.8,1.2,1.5,2.5]).T
+
+    print('numba available : ' + str(numba_available))
+    C_mn_numpy, _, RFLAG_numpy, EW_numpy = compute_wing_induced_velocity(VD,mach,compute_EW=True,kernel='numpy')
+    with np.errstate(all='ignore'):
+        C_mn_numba, _, RFLAG_numba, EW_numba = compute_wing_induced_velocity(VD,mach,compute_EW=True,kernel='numba')
+
+        # row blocks of the induced velocity matrix
+        C_mn_block, _, RFLAG_block, EW_block = compute_wing_induced_velocity(VD,mach,compute_EW=True,kernel='numba',max_memory=1E5)
+
+    C_mn_error = np.max(np.abs(C_mn_numba - C_mn_numpy))/np.max(np.abs(C_mn_numpy))
+    EW_error   = np.max(np.abs(EW_numba - EW_numpy))/np.max(np.abs(EW_numpy))
+    print('C_mn error : ' + str(C_mn_error))
+    print('EW error   : ' + str(EW_error))
+    assert(C_mn_error < 1E-6)
+    assert(EW_error < 1E-6)
+    assert(np.all(RFLAG_numba == RFLAG_numpy))
+    assert(np.all(C_mn_block == C_mn_numba))
+    assert(np.all(EW_block == EW_numba))
+    assert(np.all(RFLAG_block == RFLAG_numba))
+
+    # without numba the VLM falls back to the numpy kernel, so there is no compiled kernel to compare
+    if not numba_available:
+        print('SKIPPED compiled VLM kernel comparison : numba is not installed, install the optional test dependencies with pip install .[test]')
+        return
+
+    # full VLM solution with each kernel
+    conditions = RCAIDE.Framework.Mission.Common.Results()
+    conditions.expand_rows(len(mach))
+    conditions.freestream.mach_number          = mach*1.
+    conditions.aerodynamics.angles.alpha[:,0]  = 3. * np.pi / 180.
+
+    results = []
+    for kernel in ['numpy','numba']:
+        settings.vlm_kernel = kernel
+        with np.errstate(all='ignore'):
+            results.append(VLM(conditions,settings,vehicle))
+
+    CL_error = np.max(np.abs(results[1].CL - results[0].CL))/np.max(np.abs(results[0].CL))
+    print('CL error   : ' + str(CL_error))
+    assert(CL_error < 1E-6)
+
+    return
+
+if __name__ == '__main__':
+    main()
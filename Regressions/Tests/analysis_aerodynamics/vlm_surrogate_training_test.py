@@ -0,0 +1,85 @@
+# vlm_surrogate_training_test.py
+#
+# Created: Oct 2026, agent
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+import RCAIDE
+from RCAIDE.Framework.Core import Units
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method import clear_VLM_surrogate_store
+
+# python imports
+import numpy as np
+import tempfile
+import shutil
+import os
+
+# local imports
+import sys
+sys.path.append('../../Vehicles')
+from Boeing_737    import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+    store_directory = tempfile.mkdtemp()
+    clear_VLM_surrogate_store()
+
+    # training stores the training data in memory and on disk
+    trained = analysis_setup(store_directory)
+    trained.initialize()
+    assert sorted([os.path.splitext(name)[1] for name in os.listdir(store_directory)]) == ['.json','.npy']
+
+    # a new analysis of the same geometry loads the training data from disk
+    clear_VLM_surrogate_store()
+    loaded  = analysis_setup(store_directory)
+    loaded.initialize()
+    check_training_data(trained,loaded)
+
+    # and from memory once loaded
+    shutil.rmtree(store_directory)
+    loaded  = analysis_setup(store_directory)
+    loaded.initialize()
+    check_training_data(trained,loaded)
+    assert not os.path.isdir(store_directory)
+
+    # training on a pool of worker processes gives the training data of the serial training
+    clear_VLM_surrogate_store()
+    workers = analysis_setup(None,training_workers=2)
+    workers.initialize()
+    check_training_data(trained,workers)
+
+    return
+
+def check_training_data(trained,loaded):
+    for regime in ['subsonic','supersonic','transonic']:
+        assert data_equal(loaded.training[regime],trained.training[regime])
+
+    # the geometry is left with the vortex distribution of the undeflected geometry, as after training
+    VD_trained = trained.geometry.vortex_distribution
+    VD_loaded  = loaded.geometry.vortex_distribution
+    assert np.all(VD_loaded.XC == VD_trained.XC)
+    assert np.all(VD_loaded.ZC == VD_trained.ZC)
+    return
+
+def data_equal(data_1,data_2):
+    if isinstance(data_1,dict):
+        return sorted(data_1.keys()) == sorted(data_2.keys()) and all([data_equal(data_1[key],data_2[key]) for key in data_1.keys()])
+    return np.array_equal(data_1,data_2)
+
+def analysis_setup(store_directory,training_workers=1):
+    analysis                                       = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method()
+    analysis.geometry                              = vehicle_setup()
+    analysis.settings.number_of_spanwise_vortices  = 10
+    analysis.settings.number_of_chordwise_vortices = 3
+    analysis.settings.surrogate_store_directory    = store_directory
+    analysis.settings.training_workers             = training_workers
+    analysis.training.angle_of_attack              = np.array([-2., 1E-12, 5.0]) * Units.deg
+    analysis.training.Mach                         = np.array([0.1, 0.5, 0.85, 1.5, 2.0])
+    return analysis
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+# vlm_symmetric_solve_test.py
+#
+# Created: Oct 2026, agent
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+import RCAIDE
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method import VLM, clear_AIC_cache
+
+# python imports
+import numpy as np
+
+# local imports
+import sys
+sys.path.append('../../Vehicles')
+from Boeing_737    import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+    vehicle   = vehicle_setup()
+    analysis  = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method()
+    settings  = analysis.settings
+    settings.number_of_spanwise_vortices  = 10
+    settings.number_of_chordwise_vortices = 3
+
+    # symmetric flight conditions are solved on half of the vehicle
+    full = run_VLM(vehicle,settings,False)
+    half = run_VLM(vehicle,settings,True)
+    assert(half.VD.panel_images is not None)
+
+    for coefficient in ['CL','CDi','CM','CL_wing','CDi_wing','gamma']:
+        error = np.max(np.abs(half[coefficient] - full[coefficient]))/np.max(np.abs(full[coefficient]))
+        print(coefficient + ' error : ' + str(error))
+        assert(error < 1E-4)
+
+    # lateral coefficients vanish
+    for coefficient in ['CY','CL_mom','CN']:
+        print(coefficient + ' : ' + str(np.max(np.abs(half[coefficient]))))
+        assert(np.max(np.abs(half[coefficient])) < 1E-6)
+
+    # sideslip falls back to the full vehicle
+    full = run_VLM(vehicle,settings,False,beta=0.05)
+    half = run_VLM(vehicle,settings,True,beta=0.05)
+    assert(np.all(half.CY == full.CY))
+    assert(np.all(half.CL == full.CL))
+
+    return
+
+def run_VLM(vehicle,settings,use_symmetric_solve,beta=0.):
+    conditions = RCAIDE.Framework.Mission.Common.Results()
+    conditions.expand_rows(4)
+    conditions.freestream.mach_number[:,0]       = [0.3,0.8,1.5,2.0]
+    conditions.freestream.velocity[:,0]          = 100.
+    conditions.aerodynamics.angles.alpha[:,0]    = [0.05,-0.02,0.1,0.03]
+    conditions.aerodynamics.angles.beta[:,0]     = beta
+
+    settings.use_symmetric_solve = use_symmetric_solve
+    clear_AIC_cache()
+    with np.errstate(all='ignore'):
+        results = VLM(conditions,settings,vehicle)
+
+    return results
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+# Regression/scripts/Tests/analysis_propulsion/rotor_performance_surrogate_test.py
+#
+#
+# Created:  Oct 2026, agent
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from RCAIDE.Framework.Core import Data, Units
+from RCAIDE.Framework.Mission.Common import Results, Conditions
+from RCAIDE.Library.Methods.Propulsors.Converters.Rotor import compute_rotor_performance, clear_rotor_performance_surrogate_store
+
+# package imports
+import numpy as np
+import tempfile
+import shutil
+import time
+import sys
+import os
+
+# local imports
+sys.path.append('../../Vehicles/Rotors')
+from NACA_4412_Propeller import NACA_4412_Propeller
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  REGRESSION
+# ----------------------------------------------------------------------------------------------------------------------
+def main():
+    prop = NACA_4412_Propeller()
+
+    # operating points from hover to above the design speed
+    ctrl_pts = 32
+    V        = np.linspace(0.,80.,ctrl_pts)
+    omega    = np.linspace(1800.,2800.,ctrl_pts)[::-1] * Units.rpm
+    altitude = np.linspace(0.,4000.,ctrl_pts)
+
+    t0 = time.perf_counter()
+    full = rotor_performance(prop,V,omega,altitude)
+    t1 = time.perf_counter()
+
+    # train the performance map and store it on disk
+    store_directory                            = tempfile.mkdtemp()
+    prop.performance_surrogate.active          = True
+    prop.performance_surrogate.store_directory = store_directory
+    clear_rotor_performance_surrogate_store()
+    rotor_performance(prop,V,omega,altitude)
+    t2 = time.perf_counter()
+    surrogate = rotor_performance(prop,V,omega,altitude)
+    t3 = time.perf_counter()
+
+    print('Full model              : ' + str(t1-t0) + ' s')
+    print('Training                : ' + str(t2-t1) + ' s')
+    print('Performance map         : ' + str(t3-t2) + ' s')
+
+    thrust_error = np.max(np.abs(surrogate.thrust - full.thrust))/np.max(np.abs(full.thrust))
+    torque_error = np.max(np.abs(surrogate.torque - full.torque))/np.max(np.abs(full.torque))
+    print('thrust error            : ' + str(thrust_error))
+    print('torque error            : ' + str(torque_error))
+    assert thrust_error < 1e-2
+    assert torque_error < 1e-2
+    assert 'disc_circulation' not in surrogate
+
+    # derivatives with respect to omega
+    d_omega     = 1E-3
+    torque_plus = rotor_performance(prop,V,omega + d_omega,altitude).torque
+    torque_min  = rotor_performance(prop,V,omega - d_omega,altitude).torque
+    dQ_dw       = (torque_plus - torque_min)/(2*d_omega)
+    assert np.max(np.abs(surrogate.torque_omega_derivative - dQ_dw))/np.max(np.abs(dQ_dw)) < 1e-6
+
+    # the map is loaded from disk
+    clear_rotor_performance_surrogate_store()
+    loaded = rotor_performance(prop,V,omega,altitude)
+    assert sorted([os.path.splitext(name)[1] for name in os.listdir(store_directory)]) == ['.json','.npy']
+    assert np.all(loaded.thrust == surrogate.thrust)
+
+    # operating points outside of the trained envelope run the full model
+    fallback = rotor_performance(prop,V + 200.,omega,altitude)
+    assert 'disc_circulation' in fallback
+    shutil.rmtree(store_directory)
+
+    return
+
+def rotor_performance(prop,V,omega,altitude):
+    ctrl_pts   = len(V)
+    atmosphere = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+    atmo_data  = atmosphere.compute_values(altitude)
+
+    conditions                                   = Results()
+    conditions.expand_rows(ctrl_pts)
+    conditions.freestream.update(atmo_data)
+    conditions.frames.inertial.velocity_vector[:,0] = V
+    conditions.frames.body.transform_to_inertial = np.tile(np.eye(3)[None,:,:],(ctrl_pts,1,1))
+
+    bus                                          = Data(tag = 'bus')
+    propulsor                                    = Data(tag = 'propulsor', propeller = prop)
+    conditions.energy[bus.tag]                   = Conditions()
+    conditions.energy[bus.tag][propulsor.tag]    = Conditions()
+    conditions.energy[bus.tag][propulsor.tag].commanded_thrust_vector_angle = np.zeros((ctrl_pts,1))
+    rotor_conditions                             = Conditions()
+    rotor_conditions.omega                       = omega[:,None]
+    rotor_conditions.pitch_command               = np.zeros((ctrl_pts,1))
+    rotor_conditions.throttle                    = np.ones((ctrl_pts,1))
+    conditions.energy[bus.tag][propulsor.tag][prop.tag] = rotor_conditions
+
+    state            = Data()
+    state.conditions = conditions
+    compute_rotor_performance(propulsor,state,bus)
+
+    return conditions.energy[bus.tag][propulsor.tag][prop.tag]
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+# rotor_polar_tables_test.py
+#
+# Created: Oct 2026, agent
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+from RCAIDE.Framework.Core                           import Data, interp2d
+from RCAIDE.Library.Methods.Geometry.Airfoil         import import_airfoil_geometry, compute_airfoil_properties
+from RCAIDE.Library.Methods.Aerodynamics.Common.Lift import compute_airfoil_aerodynamics
+
+# python imports
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+    # two airfoils with different Reynolds number and angle of attack grids, from polar files and the panel method
+    rel_path         = '../../Vehicles/Airfoils/'
+    airfoil_geometry = import_airfoil_geometry(rel_path + 'NACA_4412.txt')
+    polar_files      = [rel_path + 'Polars/NACA_4412_polar_Re_' + str(Re) + '.txt' for Re in [50000,100000,200000,500000,1000000]]
+    airfoils         = [Data(polars = compute_airfoil_properties(airfoil_geometry,polar_files)),
+                        Data(polars = compute_airfoil_properties(airfoil_geometry))]
+
+    np.random.seed(0)
+    for a_loc in [[0]*10 + [1]*10, list(np.random.randint(0,2,20))]:
+        for shape in [(16,20),(16,20,24)]:
+            # local angles of attack and Reynolds numbers within and beyond the polars, some on grid points
+            ctrl_pts, Nr = shape[:2]
+            Wa    = np.random.uniform(1,50,shape)
+            Wt    = np.random.uniform(1,200,shape)
+            beta  = np.random.uniform(-0.5,1.8,shape)
+            beta.flat[:50] = np.arctan2(Wa,Wt).flat[:50] + airfoils[0].polars.angle_of_attacks[np.random.randint(0,len(airfoils[0].polars.angle_of_attacks),50)]
+            c     = np.random.uniform(0.01,0.3,shape)
+            a     = 340*np.ones(shape)
+            nu    = 1.5E-5*np.ones(shape)
+            Na    = shape[-1]
+            Cl, Cd, alpha, Ma, W, Re = compute_airfoil_aerodynamics(beta,c,None,None,None,Wa,Wt,a,nu,airfoils,a_loc,ctrl_pts,Nr,Na,None,len(shape) == 3)
+
+            # interpolation of the polars of every airfoil over every station, keeping the stations of that airfoil
+            Cl_interp2d = np.zeros(shape)
+            Cd_interp2d = np.zeros(shape)
+            for jj, airfoil in enumerate(airfoils):
+                polars    = airfoil.polars
+                locs      = np.where(np.array(a_loc) == jj)
+                Cl_values = interp2d(Re,alpha,polars.reynolds_numbers,polars.angle_of_attacks,polars.lift_coefficients)
+                Cd_values = interp2d(Re,alpha,polars.reynolds_numbers,polars.angle_of_attacks,polars.drag_coefficients)
+                Cl_interp2d[:,locs] = Cl_values[:,locs]
+                Cd_interp2d[:,locs] = Cd_values[:,locs]
+            Cl_interp2d[Cl_interp2d == 0] = 1e-6
+
+            Cl_error = np.max(np.abs(Cl - Cl_interp2d))
+            Cd_error = np.max(np.abs(Cd - Cd_interp2d))
+            print(str(shape) + ' Cl error : ' + str(Cl_error) + ' Cd error : ' + str(Cd_error))
+            assert Cl_error < 1E-12
+            assert Cd_error < 1E-12
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+# Regression/scripts/Tests/analysis_propulsion/rotor_wake_fidelity_one_test.py
+#
+#
+# Created:  Oct 2026, agent
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from RCAIDE.Framework.Core import Units
+from Legacy.trunk.S.Core import Data
+from Legacy.trunk.S.Methods.Propulsion.Rotor_Wake.Fidelity_One.fidelity_one_wake_convergence import warm_start_wake_state, initialize_wake_state
+
+# package imports
+import numpy as np
+import sys
+
+# local imports
+sys.path.append('../../Vehicles/Rotors')
+from Fidelity_One_Propeller import Fidelity_One_Propeller, spin_conditions
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  REGRESSION
+# ----------------------------------------------------------------------------------------------------------------------
+def main():
+    operating_point = ([30.,40.],[2400.,2500.])
+    nearby_point    = ([30.5,40.],[2410.,2500.])
+
+    # cold starts, without stored wake states
+    prop_cold = Fidelity_One_Propeller(wake_state_cache_size = 0)
+    va_cold, vt_cold   = spin(prop_cold,*operating_point)
+    va_again, vt_again = spin(prop_cold,*operating_point)
+    assert np.array_equal(va_again,va_cold) and np.array_equal(vt_again,vt_cold)
+    assert prop_cold.wake_state.key is None
+    va_cold_nearby, vt_cold_nearby = spin(prop_cold,*nearby_point)
+
+    # the first spin with stored wake states is a cold start, a repeated operating point reuses the stored wake
+    prop = Fidelity_One_Propeller(wake_state_cache_size = 64)
+    for _ in range(2):
+        va, vt = spin(prop,*operating_point)
+        assert np.array_equal(va,va_cold) and np.array_equal(vt,vt_cold)
+
+    # a nearby operating point starts from the stored inflow and converges to the cold start solution
+    va_warm, vt_warm = spin(prop,*nearby_point)
+    va_error         = np.max(np.abs(va_warm - va_cold_nearby))
+    vt_error         = np.max(np.abs(vt_warm - vt_cold_nearby))
+    print('warm start va error : ' + str(va_error))
+    print('warm start vt error : ' + str(vt_error))
+    assert va_error < prop.Wake.axial_velocity_convergence_tolerance
+    assert vt_error < prop.Wake.axial_velocity_convergence_tolerance
+
+    # a stopped rotor is matched to the stored operating point by its absolute velocities
+    wake_state                               = initialize_wake_state()
+    wake_state.operating_points              = np.array([[0.,10.,0.,0.,0.],[200.,10.,0.,0.,0.]])
+    wake_state.disc_axial_induced_velocities = np.array([np.ones((2,3)),2*np.ones((2,3))])
+    rotor                                    = Data(outputs = Data(disc_axial_induced_velocity = np.zeros((1,2,3))))
+    warm_start_wake_state(wake_state,rotor,np.array([[0.,11.,0.,0.,0.]]))
+    assert np.all(rotor.outputs.disc_axial_induced_velocity == 1.)
+
+    # rotors of both libraries carry stored wake states
+    assert RCAIDE.Library.Components.Propulsors.Converters.Propeller().wake_state.key is None
+
+    return
+
+def spin(prop,V,rpm):
+    prop.inputs.omega         = np.atleast_2d(rpm).T * Units.rpm
+    prop.inputs.pitch_command = 0.
+    prop.thickness_to_chord   = np.full((len(V),len(prop.chord_distribution),prop.number_azimuthal_stations),0.12)
+
+    _, _, _, _, outputs, _    = prop.spin(spin_conditions(V))
+    return outputs.disc_axial_induced_velocity, outputs.disc_tangential_induced_velocity
+
+if __name__ == '__main__':
+    main()
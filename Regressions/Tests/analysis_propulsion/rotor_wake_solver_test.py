@@ -0,0 +1,107 @@
+# Regression/scripts/Tests/analysis_propulsion/rotor_wake_solver_test.py
+#
+#
+# Created:  Oct 2026, agent
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from RCAIDE.Framework.Core import Data, Units
+
+# package imports
+import numpy as np
+import time
+import sys
+from copy import deepcopy
+
+# local imports
+sys.path.append('../../Vehicles/Rotors')
+from NACA_4412_Propeller import NACA_4412_Propeller
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  REGRESSION
+# ----------------------------------------------------------------------------------------------------------------------
+def main():
+    prop = NACA_4412_Propeller(variable_pitch = True)
+
+    # operating points from hover to above the design speed
+    ctrl_pts   = 16
+    V          = np.linspace(1.,80.,ctrl_pts)[:,None]
+    omega      = np.linspace(1800.,2800.,ctrl_pts)[:,None] * Units.rpm
+    atmosphere = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+    atmo_data  = atmosphere.compute_values(np.linspace(0.,3000.,ctrl_pts))
+    a          = atmo_data.speed_of_sound
+    nu         = atmo_data.dynamic_viscosity/atmo_data.density
+
+    # the 2D analysis uses every fourth operating point at a small incidence angle
+    for use_2d_analysis,idx in [(False,slice(None)),(True,slice(None,None,4))]:
+        wake_inputs = rotor_wake_inputs(prop,V[idx],omega[idx],a[idx],nu[idx],use_2d_analysis)
+
+        # reference solution from the banded root finder
+        wake_fsolve                   = deepcopy(prop.Wake)
+        wake_fsolve.use_newton_solver = False
+        t0 = time.perf_counter()
+        va_fsolve, vt_fsolve          = wake_fsolve.evaluate(prop,wake_inputs,None)
+        t1 = time.perf_counter()
+
+        # per-station Newton solve
+        wake_newton                   = deepcopy(prop.Wake)
+        wake_newton.use_newton_solver = True
+        t2 = time.perf_counter()
+        va_newton, vt_newton          = wake_newton.evaluate(prop,wake_inputs,None)
+        t3 = time.perf_counter()
+
+        print('2D analysis             : ' + str(use_2d_analysis))
+        print('fsolve wake solve       : ' + str(t1-t0) + ' s')
+        print('Newton wake solve       : ' + str(t3-t2) + ' s')
+
+        va_error = np.max(np.abs(va_newton - va_fsolve))/np.max(np.abs(va_fsolve))
+        vt_error = np.max(np.abs(vt_newton - vt_fsolve))/np.max(np.abs(vt_fsolve))
+        print('va error                : ' + str(va_error))
+        print('vt error                : ' + str(vt_error))
+        assert va_error < 1e-6
+        assert vt_error < 1e-6
+
+    return
+
+def rotor_wake_inputs(prop,V,omega,a,nu,use_2d_analysis):
+    ctrl_pts = len(V)
+    r        = prop.radius_distribution
+    c        = prop.chord_distribution
+    beta     = prop.twist_distribution
+    Nr       = len(r)
+    Na       = prop.number_azimuthal_stations
+
+    if use_2d_analysis:
+        r    = np.tile(r[None,:,None],(ctrl_pts,1,Na))
+        c    = np.tile(c[None,:,None],(ctrl_pts,1,Na))
+        beta = np.tile(beta[None,:,None],(ctrl_pts,1,Na))
+        Ua   = np.tile(V[:,:,None],(1,Nr,Na))
+        psi  = np.linspace(0,2*np.pi,Na+1)[:-1]
+        Ut   = omega[:,:,None]*r - 0.1*V[:,:,None]*np.sin(psi)[None,None,:]
+        a    = np.tile(a[:,:,None],(1,Nr,Na))
+        nu   = np.tile(nu[:,:,None],(1,Nr,Na))
+    else:
+        Ua   = np.outer(V,np.ones_like(r))
+        Ut   = np.outer(omega,r)
+
+    wake_inputs                       = Data()
+    wake_inputs.velocity_total        = np.sqrt(Ua*Ua + Ut*Ut)
+    wake_inputs.velocity_axial        = Ua
+    wake_inputs.velocity_tangential   = Ut
+    wake_inputs.ctrl_pts              = ctrl_pts
+    wake_inputs.Nr                    = Nr
+    wake_inputs.Na                    = Na
+    wake_inputs.use_2d_analysis       = use_2d_analysis
+    wake_inputs.twist_distribution    = beta
+    wake_inputs.chord_distribution    = c
+    wake_inputs.radius_distribution   = r
+    wake_inputs.speed_of_sounds       = a
+    wake_inputs.dynamic_viscosities   = nu
+
+    return wake_inputs
+
+if __name__ == '__main__':
+    main()
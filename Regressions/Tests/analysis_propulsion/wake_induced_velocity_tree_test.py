@@ -0,0 +1,69 @@
+# Regression/scripts/Tests/analysis_propulsion/wake_induced_velocity_tree_test.py
+#
+#
+# Created:  Oct 2026, agent
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from RCAIDE.Framework.Core import Units
+from Legacy.trunk.S.Core import Data
+from Legacy.trunk.S.Methods.Propulsion.Rotor_Wake.Fidelity_One.compute_wake_induced_velocity import compute_wake_induced_velocity
+
+# package imports
+import numpy as np
+import sys
+from copy import deepcopy
+
+# local imports
+sys.path.append('../../Vehicles/Rotors')
+from Fidelity_One_Propeller import Fidelity_One_Propeller, spin_conditions
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  REGRESSION
+# ----------------------------------------------------------------------------------------------------------------------
+def main():
+    # fully prescribed wake of two operating points
+    prop                      = Fidelity_One_Propeller(semi_prescribed_converge = False)
+    V                         = np.array([30.,40.])
+    prop.inputs.omega         = np.array([[2400.],[2500.]]) * Units.rpm
+    prop.inputs.pitch_command = 0.
+    prop.thickness_to_chord   = np.full((len(V),len(prop.chord_distribution),prop.number_azimuthal_stations),0.12)
+    prop.spin(spin_conditions(V))
+    WD                        = prop.Wake.vortex_distribution
+    cpts                      = len(V)
+
+    # evaluation points on a wing behind the propeller
+    x, y       = np.meshgrid(np.linspace(0.2,1.2,10),np.linspace(-2.,2.,30))
+    VD         = Data()
+    VD.XC      = x.ravel()
+    VD.YC      = y.ravel()
+    VD.ZC      = 0.05 + 0.*x.ravel()
+    VD.n_cp    = len(VD.XC)
+
+    # the tree evaluation matches direct summation to within the error of the dipole expansion
+    direct     = compute_wake_induced_velocity(WD,VD,cpts,azi_start_idx=3)
+    V_max      = np.max(np.linalg.norm(direct,axis=2))
+    for opening_angle, tolerance in [(0.25,5E-3),(0.5,3E-2)]:
+        tree   = compute_wake_induced_velocity(WD,VD,cpts,azi_start_idx=3,opening_angle=opening_angle)
+        error  = np.max(np.linalg.norm(tree - direct,axis=2))/V_max
+        print('opening angle ' + str(opening_angle) + ' max error : ' + str(error))
+        assert tree.shape == direct.shape
+        assert error < tolerance
+
+    # a wake without circulation induces no velocity
+    WD_zero       = deepcopy(WD)
+    WD_zero.GAMMA = 0.*WD.GAMMA
+    direct        = compute_wake_induced_velocity(WD_zero,VD,cpts,azi_start_idx=3)
+    assert np.all(direct == 0.)
+    for opening_angle in [0.25,0.5]:
+        tree      = compute_wake_induced_velocity(WD_zero,VD,cpts,azi_start_idx=3,opening_angle=opening_angle)
+        assert tree.shape == direct.shape
+        assert np.all(tree == 0.)
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -6,9 +6,11 @@
   
 from RCAIDE.Library.Plots import *  
 from RCAIDE.Library.Methods.Geometry.Airfoil   import import_airfoil_geometry, compute_airfoil_properties, convert_airfoil_to_meshgrid
+from RCAIDE.Library.Methods.Geometry.Airfoil   import clear_airfoil_database
 
 # python imports 
 import os
+import tempfile
 import numpy as np
 import matplotlib.pyplot as plt  
 # ----------------------------------------------------------------------------------------------------------------    
@@ -39,6 +41,18 @@ def main():
     airfoil_polar_data_1 = compute_airfoil_properties(airfoil_geometry_1,airfoil_polar_files) 
     plot_airfoil_polar_files(airfoil_polar_data_1) 
 
+    # properties of the same airfoil are loaded from the airfoil database, in memory and on disk 
+    with tempfile.TemporaryDirectory() as database_directory: 
+        clear_airfoil_database()
+        airfoil_polar_data_2 = compute_airfoil_properties(airfoil_geometry_1,airfoil_polar_files,store_directory=database_directory)
+        clear_airfoil_database()
+        airfoil_polar_data_3 = compute_airfoil_properties(airfoil_geometry_1,airfoil_polar_files,store_directory=database_directory)
+        assert(not airfoil_polar_data_3.lift_coefficients.flags.writeable)
+        for airfoil_polar_data in [airfoil_polar_data_2,airfoil_polar_data_3]:
+            assert(np.array_equal(airfoil_polar_data.lift_coefficients,airfoil_polar_data_1.lift_coefficients))
+            assert(np.array_equal(airfoil_polar_data.boundary_layer.theta_lower_surface,airfoil_polar_data_1.boundary_layer.theta_lower_surface))
+        del airfoil_polar_data_3
+
     # ----------------------------------------------------------------------------------------------------------------
     #  
     # ----------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,98 @@
+# Regression/scripts/Tests/methods_utilities/surrogate_test.py
+#
+#
+# Created:  Oct 2026, agent
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Library.Methods.Utilities import Surrogate
+
+# package imports
+import numpy as np
+from scipy.interpolate import RegularGridInterpolator
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  REGRESSION
+# ----------------------------------------------------------------------------------------------------------------------
+def main():
+    np.random.seed(0)
+
+    # three dimensional grid with a descending dimension and two outputs
+    grid   = (np.array([0., 0.5, 2., 3.]), np.array([4., 2., 1., -1., -3.]), np.linspace(-1., 1., 3))
+    values = np.random.rand(4,5,3,2)
+    compute_test(grid,values)
+    derivatives_test(grid,values)
+
+    # singleton dimensions are constant, compared against the interpolator on the remaining dimensions
+    grid   = (np.array([0., 1., 3.]), np.array([2.]), np.array([-1., 0., 2., 5.]))
+    values = np.random.rand(3,1,4,3)
+    compute_test(grid,values)
+    derivatives_test(grid,values)
+
+    return
+
+def compute_test(grid,values):
+    surrogate = Surrogate(grid,values)
+    points    = query_points(grid,200)
+    reference = reference_values(grid,values,points)
+
+    # points inside of the grid and outside of the grid, which are extrapolated from the nearest cell
+    lower, upper = np.array([np.min(g) for g in grid]), np.array([np.max(g) for g in grid])
+    inside       = np.all((points >= lower) & (points <= upper),axis=1)
+    assert np.any(inside) and np.any(~inside)
+    error = np.max(np.abs(surrogate.compute(points) - reference))
+    print('compute error : ' + str(error))
+    assert error < 1e-12
+
+    # grid points return the grid values
+    mesh  = np.stack(np.meshgrid(*grid,indexing='ij'),axis=-1).reshape((-1,len(grid)))
+    error = np.max(np.abs(surrogate(mesh) - values.reshape((-1,values.shape[-1]))))
+    assert error < 1e-12
+    return
+
+def derivatives_test(grid,values):
+    surrogate   = Surrogate(grid,values)
+    points      = query_points(grid,200)
+    derivatives = surrogate.compute_derivatives(points)
+    assert derivatives.shape == (len(points),values.shape[-1],len(grid))
+
+    # central differences of compute within the cell of each point, away from the cell faces
+    h = 1e-6
+    for d in range(len(grid)):
+        if len(grid[d]) == 1:
+            assert np.all(derivatives[:,:,d] == 0.)
+            continue
+        step              = np.zeros(len(grid))
+        step[d]           = h
+        finite_difference = (surrogate.compute(points + step) - surrogate.compute(points - step))/(2*h)
+        distance          = np.min(np.abs(points[:,d][:,None] - grid[d][None,1:-1]),axis=1)
+        away              = distance > 10*h
+        error             = np.max(np.abs(derivatives[away,:,d] - finite_difference[away]))
+        print('compute_derivatives error dimension ' + str(d) + ' : ' + str(error))
+        assert error < 1e-6
+    return
+
+def query_points(grid,n_points):
+    # uniform points over each dimension extended by a quarter of its range on either side
+    points = np.zeros((n_points,len(grid)))
+    for dim, g in enumerate(grid):
+        extent        = np.max(g) - np.min(g)
+        points[:,dim] = np.random.uniform(np.min(g) - 0.25*extent,np.max(g) + 0.25*extent,n_points)
+    return points
+
+def reference_values(grid,values,points):
+    # scipy requires ascending dimensions with more than one point
+    grid   = [np.asarray(g) for g in grid]
+    keep   = [dim for dim, g in enumerate(grid) if len(g) > 1]
+    values = values.reshape(tuple(len(grid[dim]) for dim in keep) + (values.shape[-1],))
+    for i, dim in enumerate(keep):
+        if grid[dim][1] < grid[dim][0]:
+            grid[dim] = grid[dim][::-1]
+            values    = np.flip(values,axis=i)
+    interpolator = RegularGridInterpolator([grid[dim] for dim in keep],values,method='linear',bounds_error=False,fill_value=None)
+    return interpolator(points[:,keep])
+
+if __name__ == '__main__':
+    main()
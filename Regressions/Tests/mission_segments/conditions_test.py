@@ -0,0 +1,96 @@
+# Regression/scripts/Tests/mission_segments/conditions_test.py
+#
+#
+# Created:  Oct 2026, agent
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Framework.Core           import Data
+from RCAIDE.Framework.Mission.Common import Results, Conditions, Unknowns, Residuals, alias_conditions, detach_conditions
+
+# package imports
+import numpy as np
+import pickle
+from copy import deepcopy
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  REGRESSION
+# ----------------------------------------------------------------------------------------------------------------------
+def main():
+    n_cp       = 16
+    conditions = Results()
+    conditions.expand_rows(n_cp)
+
+    # keys and attributes are the same objects, the number of control points is not a key
+    assert conditions.freestream is conditions['freestream']
+    assert conditions.freestream.velocity.shape == (n_cp,1)
+    assert '_size' not in conditions
+    assert conditions.freestream._size == n_cp
+
+    conditions.freestream.test = np.ones((n_cp,1))
+    assert 'test' in conditions.freestream
+    del conditions.freestream.test
+    assert 'test' not in conditions.freestream
+
+    # copies and pickles keep the keys and the number of control points
+    for copied in [deepcopy(conditions),pickle.loads(pickle.dumps(conditions))]:
+        assert type(copied.freestream) == Conditions
+        assert copied.frames.inertial._size == n_cp
+        assert copied.frames.inertial.velocity_vector is copied['frames']['inertial']['velocity_vector']
+        assert sorted(copied.keys()) == sorted(conditions.keys())
+
+    # pack and unpack
+    unknowns            = Unknowns()
+    unknowns.body_angle = np.linspace(0,1,n_cp)[:,None]
+    unknowns.throttle   = np.linspace(1,2,n_cp)[:,None]
+    packed              = unknowns.pack_array()
+    assert np.all(packed == Data.pack_array(unknowns))
+    unknowns.unpack_array(2*packed)
+    assert np.all(unknowns.pack_array() == 2*packed)
+
+    # replaced arrays are copied into the contiguous vector, new keys rebuild it
+    unknowns.throttle   = np.zeros((n_cp,1))
+    assert np.all(unknowns.pack_array()[n_cp:] == 0.)
+    unknowns.velocity   = np.ones((n_cp,1))
+    assert len(unknowns.pack_array()) == 3*n_cp
+    assert np.all(unknowns.pack_array() == Data.pack_array(unknowns))
+
+    # replaced nested data, with the same keys, rebuild the layout
+    residuals                = Residuals()
+    residuals.network        = Residuals()
+    residuals.network.torque = np.ones((n_cp,1))
+    residuals.force_x        = np.ones((n_cp,1))
+    residuals.pack_array()
+    residuals.network        = Residuals()
+    residuals.network.torque = 3*np.ones((n_cp,1))
+    assert np.all(residuals.pack_array() == Data.pack_array(residuals))
+
+    # views of identical propulsor results share the reference arrays read-only
+    reference                  = Conditions()
+    reference.thrust           = np.ones((n_cp,1))
+    reference.outputs          = Conditions()
+    reference.outputs.power    = 2*np.ones((n_cp,1))
+    reference.noise            = Data(velocity = np.ones((n_cp,1)))
+    view                       = alias_conditions(reference)
+    assert type(view.outputs) == Conditions and type(view.noise) == Data
+    assert np.shares_memory(view.outputs.power,reference.outputs.power)
+    assert not view.outputs.power.flags.writeable
+    view.moment = np.zeros((n_cp,3))
+    assert 'moment' not in reference
+    view.writeable_array('thrust')[:,0] = 3.
+    assert np.all(reference.thrust == 1.) and np.all(view.thrust == 3.)
+    assert deepcopy(view).outputs.power.flags.writeable
+
+    # detached views own their arrays and can be modified in place
+    detach_conditions(view)
+    assert not np.shares_memory(view.outputs.power,reference.outputs.power)
+    assert view.outputs.power.flags.writeable and view.noise.velocity.flags.writeable
+    view.outputs.power[:,0] = 4.
+    assert np.all(reference.outputs.power == 2.)
+
+    return
+
+if __name__ == '__main__':
+    main()
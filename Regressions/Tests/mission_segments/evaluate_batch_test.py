@@ -0,0 +1,146 @@
+# Regression/scripts/Tests/mission_segments/evaluate_batch_test.py
+#
+#
+# Created:  Oct 2026, agent
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from RCAIDE.Framework.Core import Units
+
+# python imports
+import numpy as np
+import sys
+
+# local imports
+sys.path.append('../../Vehicles')
+from NASA_X57    import vehicle_setup, configs_setup
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  REGRESSION
+# ----------------------------------------------------------------------------------------------------------------------
+def main():
+    vehicle  = vehicle_setup()
+    analyses = analyses_setup(configs_setup(vehicle))
+    mission  = mission_setup(analyses)
+
+    # the first evaluation trains the surrogates that are shared with the workers
+    reference = mission.evaluate()
+    time      = mission.segments.cruise.state.conditions.frames.inertial.time
+
+    parameter_grid = [{'segments.cruise.distance': 10. * Units.nautical_mile},
+                      {'segments.cruise.distance': 20. * Units.nautical_mile}]
+    results        = {}
+    for executor in ['serial','thread','process']:
+        results[executor] = mission.evaluate_batch(parameter_grid,executor=executor,workers=2)
+
+        # the mission of the caller is not modified
+        assert mission.segments.cruise.distance == 20. * Units.nautical_mile
+        assert mission.segments.cruise.state.conditions.frames.inertial.time is time
+
+    # every executor gives the same results
+    for executor in ['serial','thread','process']:
+        for i in range(len(parameter_grid)):
+            segment = results[executor][i].segments.cruise
+            assert segment.converged
+            for field in ['frames.inertial.time','energy.bus.li_ion_battery.cell.state_of_charge','energy.thrust_force_vector']:
+                error = np.max(np.abs(segment.conditions.deep_get(field) - results['serial'][i].segments.cruise.conditions.deep_get(field)))
+                print(executor + ' grid point ' + str(i) + ' ' + field + ' difference : ' + str(error))
+                assert error < 1e-10
+
+    # the grid point at the original distance matches the direct evaluation
+    error = np.max(np.abs(results['serial'][1].segments.cruise.conditions.frames.inertial.time - reference.segments.cruise.conditions.frames.inertial.time))
+    assert error < 1e-10
+    assert results['serial'][0].segments.cruise.conditions.frames.inertial.time[-1,0] < reference.segments.cruise.conditions.frames.inertial.time[-1,0]
+
+    return
+
+def base_analysis(vehicle):
+
+    # ------------------------------------------------------------------
+    #   Initialize the Analyses
+    # ------------------------------------------------------------------
+    analyses = RCAIDE.Framework.Analyses.Vehicle()
+
+    # ------------------------------------------------------------------
+    #  Weights
+    weights         = RCAIDE.Framework.Analyses.Weights.Weights_eVTOL()
+    weights.vehicle = vehicle
+    analyses.append(weights)
+
+    # ------------------------------------------------------------------
+    #  Aerodynamics Analysis
+    aerodynamics          = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method()
+    aerodynamics.geometry = vehicle
+    analyses.append(aerodynamics)
+
+    # ------------------------------------------------------------------
+    #  Energy
+    energy          = RCAIDE.Framework.Analyses.Energy.Energy()
+    energy.vehicle  = vehicle
+    analyses.append(energy)
+
+    # ------------------------------------------------------------------
+    #  Planet Analysis
+    planet = RCAIDE.Framework.Analyses.Planets.Planet()
+    analyses.append(planet)
+
+    # ------------------------------------------------------------------
+    #  Atmosphere Analysis
+    atmosphere = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+    atmosphere.features.planet = planet.features
+    analyses.append(atmosphere)
+
+    # done!
+    return analyses
+
+def analyses_setup(configs):
+
+    analyses = RCAIDE.Framework.Analyses.Analysis.Container()
+
+    # build a base analysis for each config
+    for tag,config in configs.items():
+        analysis = base_analysis(config)
+        analyses[tag] = analysis
+
+    return analyses
+
+def mission_setup(analyses):
+
+    # ------------------------------------------------------------------
+    #   Initialize the Mission
+    # ------------------------------------------------------------------
+    mission       = RCAIDE.Framework.Mission.Sequential_Segments()
+    mission.tag   = 'mission'
+    Segments      = RCAIDE.Framework.Mission.Segments
+    base_segment  = Segments.Segment()
+    base_segment.state.numerics.number_of_control_points  = 4
+
+    # ------------------------------------------------------------------
+    #   Cruise
+    # ------------------------------------------------------------------
+    segment                                               = Segments.Cruise.Constant_Speed_Constant_Altitude(base_segment)
+    segment.tag                                           = "Cruise"
+    segment.analyses.extend(analyses.base)
+    segment.initial_battery_state_of_charge               = 0.89
+    segment.altitude                                      = 5000. * Units.ft
+    segment.air_speed                                     = 130.  * Units.kts
+    segment.distance                                      = 20.   * Units.nautical_mile
+
+    # define flight dynamics to model
+    segment.flight_dynamics.force_x                       = True
+    segment.flight_dynamics.force_z                       = True
+
+    # define flight controls
+    segment.assigned_control_variables.throttle.active               = True
+    segment.assigned_control_variables.throttle.assigned_propulsors  = [['starboard_propulsor','port_propulsor']]
+    segment.assigned_control_variables.body_angle.active             = True
+
+    mission.append_segment(segment)
+
+    return mission
+
+if __name__ == '__main__':
+    main()
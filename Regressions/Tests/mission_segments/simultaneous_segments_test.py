@@ -0,0 +1,164 @@
+# Regression/scripts/Tests/mission_segments/simultaneous_segments_test.py
+#
+#
+# Created:  Oct 2026, agent
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from RCAIDE.Framework.Core import Units
+from RCAIDE.Library.Mission.Solver.converge_simultaneous import get_independent_groups
+
+# python imports
+import numpy as np
+import sys
+from copy import deepcopy
+
+# local imports
+sys.path.append('../../Vehicles')
+from NASA_X57    import vehicle_setup, configs_setup
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  REGRESSION
+# ----------------------------------------------------------------------------------------------------------------------
+def main():
+    vehicle    = vehicle_setup()
+    analyses   = analyses_setup(configs_setup(vehicle))
+
+    # reference solution, one segment after the other
+    sequential = mission_setup(RCAIDE.Framework.Mission.Sequential_Segments(),analyses,analyses).evaluate()
+
+    # segments sharing analyses run in sequence, segments with their own analyses and vehicle run on two threads
+    analyses_2 = analyses_setup(configs_setup(deepcopy(vehicle)))
+    for second_segment_analyses, number_of_workers, number_of_groups in [(analyses,1,1),(analyses,2,1),(analyses_2,2,2)]:
+        mission                            = mission_setup(RCAIDE.Framework.Mission.Simultaneous_Segments(),analyses,second_segment_analyses)
+        mission.settings.number_of_workers = number_of_workers
+        assert len(get_independent_groups(list(mission.segments.values()))) == number_of_groups
+        results = mission.evaluate()
+
+        for tag in ['climb','cruise']:
+            segment    = results.segments[tag]
+            reference  = sequential.segments[tag]
+            soc_error  = np.max(np.abs(segment.conditions.energy.bus.li_ion_battery.cell.state_of_charge -
+                                       reference.conditions.energy.bus.li_ion_battery.cell.state_of_charge))
+            time_error = np.max(np.abs(segment.conditions.frames.inertial.time - reference.conditions.frames.inertial.time))
+            thr_error  = np.max(np.abs(segment.state.unknowns.throttle_0 - reference.state.unknowns.throttle_0))
+            print(tag + ' workers ' + str(number_of_workers) + ' groups ' + str(number_of_groups) +
+                  ' SOC error : ' + str(soc_error) + ' time error : ' + str(time_error) + ' throttle error : ' + str(thr_error))
+            assert segment.state.numerics.converged
+            assert soc_error  < 1e-6
+            assert time_error < 1e-6
+            assert thr_error  < 1e-5
+
+    return
+
+def base_analysis(vehicle):
+
+    # ------------------------------------------------------------------
+    #   Initialize the Analyses
+    # ------------------------------------------------------------------
+    analyses = RCAIDE.Framework.Analyses.Vehicle()
+
+    # ------------------------------------------------------------------
+    #  Weights
+    weights         = RCAIDE.Framework.Analyses.Weights.Weights_eVTOL()
+    weights.vehicle = vehicle
+    analyses.append(weights)
+
+    # ------------------------------------------------------------------
+    #  Aerodynamics Analysis
+    aerodynamics          = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method()
+    aerodynamics.geometry = vehicle
+    analyses.append(aerodynamics)
+
+    # ------------------------------------------------------------------
+    #  Energy
+    energy          = RCAIDE.Framework.Analyses.Energy.Energy()
+    energy.vehicle  = vehicle
+    analyses.append(energy)
+
+    # ------------------------------------------------------------------
+    #  Planet Analysis
+    planet = RCAIDE.Framework.Analyses.Planets.Planet()
+    analyses.append(planet)
+
+    # ------------------------------------------------------------------
+    #  Atmosphere Analysis
+    atmosphere = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+    atmosphere.features.planet = planet.features
+    analyses.append(atmosphere)
+
+    # done!
+    return analyses
+
+def analyses_setup(configs):
+
+    analyses = RCAIDE.Framework.Analyses.Analysis.Container()
+
+    # build a base analysis for each config
+    for tag,config in configs.items():
+        analysis = base_analysis(config)
+        analyses[tag] = analysis
+
+    return analyses
+
+def mission_setup(mission,climb_analyses,cruise_analyses):
+
+    # ------------------------------------------------------------------
+    #   Initialize the Mission
+    # ------------------------------------------------------------------
+    mission.tag   = 'mission'
+    Segments      = RCAIDE.Framework.Mission.Segments
+    base_segment  = Segments.Segment()
+    base_segment.state.numerics.number_of_control_points  = 4
+
+    # ------------------------------------------------------------------
+    #   Climb
+    # ------------------------------------------------------------------
+    segment                                               = Segments.Climb.Constant_Speed_Constant_Rate(base_segment)
+    segment.tag                                           = "Climb"
+    segment.analyses.extend(climb_analyses.base)
+    segment.initial_battery_state_of_charge               = 0.89
+    segment.altitude_start                                = 2000. * Units.ft
+    segment.altitude_end                                  = 5000. * Units.ft
+    segment.air_speed                                     = 120.  * Units.kts
+    segment.climb_rate                                    = 500.  * Units['ft/min']
+
+    # define flight dynamics to model
+    segment.flight_dynamics.force_x                       = True
+    segment.flight_dynamics.force_z                       = True
+
+    # define flight controls
+    segment.assigned_control_variables.throttle.active               = True
+    segment.assigned_control_variables.throttle.assigned_propulsors  = [['starboard_propulsor','port_propulsor']]
+    segment.assigned_control_variables.body_angle.active             = True
+
+    mission.append_segment(segment)
+
+    # ------------------------------------------------------------------
+    #   Cruise
+    # ------------------------------------------------------------------
+    segment                                               = Segments.Cruise.Constant_Speed_Constant_Altitude(base_segment)
+    segment.tag                                           = "Cruise"
+    segment.analyses.extend(cruise_analyses.base)
+    segment.altitude                                      = 5000. * Units.ft
+    segment.air_speed                                     = 130.  * Units.kts
+    segment.distance                                      = 20.   * Units.nautical_mile
+
+    # define flight dynamics to model
+    segment.flight_dynamics.force_x                       = True
+    segment.flight_dynamics.force_z                       = True
+
+    # define flight controls
+    segment.assigned_control_variables.throttle.active               = True
+    segment.assigned_control_variables.throttle.assigned_propulsors  = [['starboard_propulsor','port_propulsor']]
+    segment.assigned_control_variables.body_angle.active             = True
+
+    mission.append_segment(segment)
+
+    return mission
+
+if __name__ == '__main__':
+    main()
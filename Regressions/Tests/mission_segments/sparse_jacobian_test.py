@@ -0,0 +1,179 @@
+# Regression/scripts/Tests/mission_segments/sparse_jacobian_test.py
+# 
+# 
+# Created:  Oct 2026, agent
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports 
+import RCAIDE
+from RCAIDE.Framework.Core                    import Units
+from RCAIDE.Framework.Mission.Common          import Unknowns, Residuals
+from RCAIDE.Library.Methods.Utilities.Chebyshev import chebyshev_data
+from RCAIDE.Library.Mission.Solver            import compute_jacobian, compute_jacobian_sparsity, color_jacobian_columns, get_array_layout, newton_raphson
+
+# package imports  
+import numpy as np
+import sys
+
+# local imports
+sys.path.append('../../Vehicles')
+from NASA_X57    import vehicle_setup, configs_setup
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  REGRESSION
+# ----------------------------------------------------------------------------------------------------------------------  
+def main():
+    n_cp    = 16
+    x,D,I   = chebyshev_data(n_cp)
+    
+    # two pointwise families (body angle, throttle) and one family coupled through the differentiation matrix (velocity) 
+    unknowns            = Unknowns()
+    unknowns.body_angle = np.ones((n_cp,1))*0.05
+    unknowns.throttle   = np.ones((n_cp,1))*0.5
+    unknowns.velocity   = np.ones((n_cp,1))*100.
+    
+    residuals           = Residuals()
+    residuals.force_x   = np.zeros((n_cp,1))
+    residuals.force_z   = np.zeros((n_cp,1))
+    residuals.velocity  = np.zeros((n_cp,1))
+    
+    def function(z):
+        unknowns.unpack_array(z)
+        theta    = unknowns.body_angle
+        throttle = unknowns.throttle
+        V        = unknowns.velocity
+        residuals.force_x  = 1E3*throttle - 0.05*V**2*(1 + 10*theta**2) - 1E2*np.dot(D,V)
+        residuals.force_z  = 0.5*V**2*theta*20 - 1E3
+        residuals.velocity = V - (100. + 20.*x[:,None])
+        return residuals.pack_array()
+    
+    z0       = unknowns.pack_array()
+    f0       = function(z0)
+    sparsity, n_probes = compute_jacobian_sparsity(function,z0,f0,get_array_layout(unknowns),get_array_layout(residuals))
+    colors   = color_jacobian_columns(sparsity)
+    J_sparse = compute_jacobian(function,z0,f0,sparsity,colors).toarray()
+    
+    # dense forward difference reference
+    h        = np.sqrt(np.finfo(float).eps)*np.maximum(np.abs(z0),1.)
+    J_dense  = np.zeros((len(f0),len(z0)))
+    for i in range(len(z0)):
+        z        = z0.copy()
+        z[i]    += h[i]
+        J_dense[:,i] = (function(z) - f0)/h[i]
+        
+    n_colors = np.max(colors) + 1 
+    print('Number of colors   : ' + str(n_colors))
+    print('Number of unknowns : ' + str(len(z0)))
+    assert(n_probes == 3)
+    assert(n_colors == n_cp + 2)
+    assert(np.max(np.abs(J_sparse - J_dense)) < 1E-4*np.max(np.abs(J_dense)))
+    
+    # solve with the colored jacobian
+    jacobian  = lambda z,f: compute_jacobian(function,z,f,sparsity,colors)
+    z,infodict,ier,msg = newton_raphson(function,z0,jacobian,xtol=1E-10)
+    print(msg) 
+    assert(ier == 1)
+    assert(np.max(np.abs(function(z))) < 1E-6*np.max(np.abs(f0)))
+    
+    # converge a cruise segment with the colored jacobian and each solver method
+    segment_test()
+    
+    return 
+
+def segment_test():
+    vehicle  = vehicle_setup()
+    configs  = configs_setup(vehicle)
+    analyses = analyses_setup(configs)
+    
+    # reference solution from fsolve with a dense jacobian
+    mission   = mission_setup(analyses)
+    reference = mission.evaluate().segments.cruise
+    
+    for solver_method in ['newton','hybr','lm']:
+        mission = mission_setup(analyses)
+        mission.segments.cruise.state.numerics.solver_jacobian = "sparse"
+        mission.segments.cruise.state.numerics.solver_method   = solver_method
+        segment = mission.evaluate().segments.cruise
+        
+        throttle_error   = np.max(np.abs(segment.state.unknowns.throttle_0 - reference.state.unknowns.throttle_0))
+        body_angle_error = np.max(np.abs(segment.state.unknowns.body_angle - reference.state.unknowns.body_angle))
+        print(solver_method + ' throttle error   : ' + str(throttle_error))
+        print(solver_method + ' body angle error : ' + str(body_angle_error))
+        assert(segment.state.numerics.converged)
+        assert(throttle_error   < 1E-5)
+        assert(body_angle_error < 1E-5)
+    
+    return
+
+def base_analysis(vehicle):
+    analyses = RCAIDE.Framework.Analyses.Vehicle() 
+    
+    # ------------------------------------------------------------------
+    #  Weights
+    weights         = RCAIDE.Framework.Analyses.Weights.Weights_eVTOL()
+    weights.vehicle = vehicle
+    analyses.append(weights)
+    
+    # ------------------------------------------------------------------
+    #  Aerodynamics Analysis
+    aerodynamics          = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method() 
+    aerodynamics.geometry = vehicle
+    analyses.append(aerodynamics)
+    
+    # ------------------------------------------------------------------
+    #  Energy
+    energy          = RCAIDE.Framework.Analyses.Energy.Energy()
+    energy.vehicle  = vehicle 
+    analyses.append(energy)
+    
+    # ------------------------------------------------------------------
+    #  Planet Analysis
+    planet = RCAIDE.Framework.Analyses.Planets.Planet()
+    analyses.append(planet)
+    
+    # ------------------------------------------------------------------
+    #  Atmosphere Analysis
+    atmosphere = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+    atmosphere.features.planet = planet.features
+    analyses.append(atmosphere)   
+    
+    return analyses    
+
+def analyses_setup(configs):
+    analyses = RCAIDE.Framework.Analyses.Analysis.Container()
+    for tag,config in configs.items():
+        analyses[tag] = base_analysis(config)
+    return analyses
+
+def mission_setup(analyses):
+    mission       = RCAIDE.Framework.Mission.Sequential_Segments()
+    mission.tag   = 'mission'
+    Segments      = RCAIDE.Framework.Mission.Segments  
+    base_segment  = Segments.Segment()
+    base_segment.state.numerics.number_of_control_points = 4
+    
+    segment                                    = Segments.Cruise.Constant_Speed_Constant_Altitude(base_segment)
+    segment.tag                                = "Cruise"
+    segment.analyses.extend(analyses.base)
+    segment.initial_battery_state_of_charge    = 0.89 
+    segment.altitude                           = 5000. * Units.ft
+    segment.air_speed                          = 130.  * Units.kts
+    segment.distance                           = 20.   * Units.nautical_mile
+    
+    # define flight dynamics to model 
+    segment.flight_dynamics.force_x            = True  
+    segment.flight_dynamics.force_z            = True     
+    
+    # define flight controls 
+    segment.assigned_control_variables.throttle.active               = True           
+    segment.assigned_control_variables.throttle.assigned_propulsors  = [['starboard_propulsor','port_propulsor']] 
+    segment.assigned_control_variables.body_angle.active             = True                 
+    
+    mission.append_segment(segment)
+    
+    return mission
+
+if __name__ == '__main__': 
+    main()
@@ -68,17 +68,17 @@ def main():
             print(val)
     
     # Truth values
-    vertical_climb_throttle_truth                       = 0.6076504419441053
-    hover_throttle_truth                                = 0.6044572977444364
-    vertical_climb_2_throttle_truth                     = 0.6079718628008569
-    vertical_transition_throttle_truth                  = 0.6043028366156381
-    low_speed_climb_transition_throttle_truth           = 0.5411198887621672
-    high_speed_climb_transition_throttle_truth          = 0.3163340311366646
-    cruise_throttle_truth                               = 0.33153148526487025
-    descent_throttle_truth                              = 0.3123412690545646
-    reserve_climb_throttle_truth                        = 0.2923889200977024
-    reserve_cruise_throttle_truth                       = 0.30689740485385486
-    reserve_descent_throttle_truth                      = 0.28269327552102963
+    vertical_climb_throttle_truth                       = 0.6075510339115672
+    hover_throttle_truth                                = 0.6043655005368546
+    vertical_climb_2_throttle_truth                     = 0.6078722904773506
+    vertical_transition_throttle_truth                  = 0.6042098363739825
+    low_speed_climb_transition_throttle_truth           = 0.5475773172924782
+    high_speed_climb_transition_throttle_truth          = 0.3153402861349242
+    cruise_throttle_truth                               = 0.3292382479865848
+    descent_throttle_truth                              = 0.3099810767719771
+    reserve_climb_throttle_truth                        = 0.29091636829644285
+    reserve_cruise_throttle_truth                       = 0.3048350692622438
+    reserve_descent_throttle_truth                      = 0.2805563608370778
     
     # Store errors 
     error = Data()
@@ -98,7 +98,7 @@ def main():
     print(error)
      
     for k,v in list(error.items()):
-        assert(np.abs(v)<1e-1)   # lower tolerance due to lose bounds on prop-rotor blade design 
+        assert(np.abs(v)<1e-3)
     return     
  
 # ----------------------------------------------------------------------
@@ -0,0 +1,198 @@
+# Regression/scripts/Tests/network_all_electric/multi_battery_bus_test.py
+#
+#
+# Created:  Oct 2026, agent
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from RCAIDE.Framework.Core import Units
+from RCAIDE.Library.Methods.Performance.estimate_stall_speed import estimate_stall_speed
+
+# python imports
+import numpy as np
+import sys
+from copy import deepcopy
+
+# local imports
+sys.path.append('../../Vehicles')
+from NASA_X57    import vehicle_setup, configs_setup
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  REGRESSION
+# ----------------------------------------------------------------------------------------------------------------------
+def main():
+
+    # vehicle data
+    base_vehicle = vehicle_setup()
+
+    results = {}
+    for number_of_batteries in [1,4]:
+        # split the bus between identical battery packs
+        vehicle = deepcopy(base_vehicle)
+        for network in vehicle.networks:
+            for bus in network.busses:
+                battery                       = bus.batteries[list(bus.batteries.keys())[0]]
+                battery.bus_power_split_ratio = 1./number_of_batteries
+                for i in range(1,number_of_batteries):
+                    additional_battery     = deepcopy(battery)
+                    additional_battery.tag = battery.tag + '_' + str(i+1)
+                    bus.batteries.append(additional_battery)
+
+        configs  = configs_setup(vehicle)
+        analyses = analyses_setup(configs)
+        mission  = mission_setup(analyses,vehicle)
+
+        results[number_of_batteries] = mission.evaluate()
+
+    # the propulsors are evaluated once per bus, the bus and charging power are shared by the batteries
+    for network in base_vehicle.networks:
+        for bus in network.busses:
+            battery_tag = list(bus.batteries.keys())[0]
+            for segment_tag in ['cruise','recharge']:
+                conditions_1 = results[1].segments[segment_tag].conditions
+                conditions_4 = results[4].segments[segment_tag].conditions
+                thrust_1     = conditions_1.energy.thrust_force_vector
+                thrust_4     = conditions_4.energy.thrust_force_vector
+                power_1      = conditions_1.energy[bus.tag][battery_tag].pack.power_draw
+                power_4      = 0*power_1
+                for tag in conditions_4.energy[bus.tag].keys():
+                    if tag.startswith(battery_tag):
+                        power_4 += conditions_4.energy[bus.tag][tag].pack.power_draw
+
+                thrust_error = np.max(np.abs(thrust_4 - thrust_1))/max(np.max(np.abs(thrust_1)),1.)
+                power_error  = np.max(np.abs(power_4 - power_1))/np.max(np.abs(power_1))
+                print(segment_tag + ' thrust difference        : ' + str(thrust_error))
+                print(segment_tag + ' battery power difference : ' + str(power_error))
+                assert thrust_error < 1e-6
+                assert power_error  < 1e-6
+
+    # the results of identical propulsors own their arrays once the segment has converged
+    for segment in results[1].segments:
+        assert arrays_writeable(segment.conditions)
+    for network in base_vehicle.networks:
+        for bus in network.busses:
+            for propulsor in bus.propulsors:
+                propulsor_conditions = results[1].segments.cruise.conditions.energy[bus.tag][propulsor.tag]
+                for tag in propulsor_conditions.keys():
+                    if 'thrust' in propulsor_conditions[tag]:
+                        propulsor_conditions[tag].thrust *= 2.
+
+    return
+
+def arrays_writeable(conditions):
+    for value in conditions.values():
+        if isinstance(value,np.ndarray) and not value.flags.writeable:
+            return False
+        elif isinstance(value,dict) and not arrays_writeable(value):
+            return False
+    return True
+
+def base_analysis(vehicle):
+
+    # ------------------------------------------------------------------
+    #   Initialize the Analyses
+    # ------------------------------------------------------------------
+    analyses = RCAIDE.Framework.Analyses.Vehicle()
+
+    # ------------------------------------------------------------------
+    #  Weights
+    weights         = RCAIDE.Framework.Analyses.Weights.Weights_eVTOL()
+    weights.vehicle = vehicle
+    analyses.append(weights)
+
+    # ------------------------------------------------------------------
+    #  Aerodynamics Analysis
+    aerodynamics          = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method()
+    aerodynamics.geometry = vehicle
+    aerodynamics.settings.drag_coefficient_increment = 0.0000
+    analyses.append(aerodynamics)
+
+    # ------------------------------------------------------------------
+    #  Energy
+    energy          = RCAIDE.Framework.Analyses.Energy.Energy()
+    energy.vehicle  = vehicle
+    analyses.append(energy)
+
+    # ------------------------------------------------------------------
+    #  Planet Analysis
+    planet = RCAIDE.Framework.Analyses.Planets.Planet()
+    analyses.append(planet)
+
+    # ------------------------------------------------------------------
+    #  Atmosphere Analysis
+    atmosphere = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+    atmosphere.features.planet = planet.features
+    analyses.append(atmosphere)
+
+    # done!
+    return analyses
+
+def analyses_setup(configs):
+
+    analyses = RCAIDE.Framework.Analyses.Analysis.Container()
+
+    # build a base analysis for each config
+    for tag,config in configs.items():
+        analysis = base_analysis(config)
+        analyses[tag] = analysis
+
+    return analyses
+
+def mission_setup(analyses,vehicle):
+
+    # Determine Stall Speed
+    vehicle_mass   = vehicle.mass_properties.max_takeoff
+    reference_area = vehicle.reference_area
+    altitude       = 0.0
+    CL_max         = 1.2
+    Vstall         = estimate_stall_speed(vehicle_mass,reference_area,altitude,CL_max)
+
+    # ------------------------------------------------------------------
+    #   Initialize the Mission
+    # ------------------------------------------------------------------
+    mission       = RCAIDE.Framework.Mission.Sequential_Segments()
+    mission.tag   = 'mission'
+    Segments      = RCAIDE.Framework.Mission.Segments
+    base_segment  = Segments.Segment()
+    base_segment.state.numerics.number_of_control_points  = 5
+
+    # ------------------------------------------------------------------
+    #   Constant Altitude Cruises
+    # ------------------------------------------------------------------
+    segment                                               = Segments.Cruise.Constant_Speed_Constant_Altitude(base_segment)
+    segment.tag                                           = "Cruise"
+    segment.analyses.extend( analyses.base)
+    segment.initial_battery_state_of_charge               = 0.89
+    segment.altitude                                      = 1000. * Units.ft
+    segment.air_speed                                     = Vstall*1.2
+    segment.distance                                      = 1000
+
+    # define flight dynamics to model
+    segment.flight_dynamics.force_x                       = True
+    segment.flight_dynamics.force_z                       = True
+
+    # define flight controls
+    segment.assigned_control_variables.throttle.active               = True
+    segment.assigned_control_variables.throttle.assigned_propulsors  = [['starboard_propulsor','port_propulsor']]
+    segment.assigned_control_variables.body_angle.active             = True
+
+    mission.append_segment(segment)
+
+    # ------------------------------------------------------------------
+    #   Recharge
+    # ------------------------------------------------------------------
+    segment                                               = Segments.Ground.Battery_Recharge(base_segment)
+    segment.analyses.extend(analyses.base)
+    segment.tag                                           = 'Recharge'
+    segment.time                                          = 10 * Units.minutes
+    segment.current                                       = 100
+
+    mission.append_segment(segment)
+
+    return mission
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+# Fidelity_One_Propeller.py
+#
+# Created:  Oct 2026, agent
+
+# Imports
+import RCAIDE
+import Legacy.trunk.S as SUAVE
+from Legacy.trunk.S.Core import Data
+from Legacy.trunk.S.Analyses.Propulsion.Rotor_Wake_Fidelity_One import Rotor_Wake_Fidelity_One
+from Legacy.trunk.S.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.compute_naca_4series import compute_naca_4series
+import numpy as np
+
+# propeller with a Fidelity One wake
+
+def Fidelity_One_Propeller(semi_prescribed_converge = True, wake_state_cache_size = 64):
+    prop                                 = SUAVE.Components.Energy.Converters.Propeller()
+    prop.tag                             = 'Fidelity_One_Propeller'
+    prop.number_of_blades                = 2
+    prop.tip_radius                      = 0.9652
+    prop.hub_radius                      = 0.2032
+    prop.radius_distribution             = np.linspace(prop.hub_radius,0.96*prop.tip_radius,20)
+    prop.twist_distribution              = np.arctan(2.5/(2*np.pi*prop.radius_distribution))
+    prop.chord_distribution              = 0.14 - 0.1*(prop.radius_distribution - prop.hub_radius)/(prop.tip_radius - prop.hub_radius)
+    prop.use_2d_analysis                 = True
+    prop.number_azimuthal_stations       = 12
+    prop.origin                          = [[0.,0.,0.]]
+
+    airfoil                              = SUAVE.Components.Airfoils.Airfoil()
+    airfoil.geometry                     = compute_naca_4series('4412',npoints=61)
+    prop.append_airfoil(airfoil)
+    prop.airfoil_polar_stations          = None
+
+    wake                                            = Rotor_Wake_Fidelity_One()
+    wake.semi_prescribed_converge                   = semi_prescribed_converge
+    wake.wake_state_cache_size                      = wake_state_cache_size
+    wake.wake_settings.number_rotor_rotations       = 5
+    wake.wake_settings.number_steps_per_rotation    = prop.number_azimuthal_stations
+    prop.Wake                                       = wake
+
+    return prop
+
+def spin_conditions(velocity, altitude = 1000.):
+    ctrl_pts                                     = len(velocity)
+    atmosphere                                   = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+    atmo_data                                    = atmosphere.compute_values(altitude * np.ones(ctrl_pts))
+    conditions                                   = Data()
+    conditions.freestream                        = Data()
+    conditions.frames                            = Data()
+    conditions.frames.inertial                   = Data()
+    conditions.frames.body                       = Data()
+    conditions.propulsion                        = Data()
+    conditions.freestream.density                = atmo_data.density
+    conditions.freestream.dynamic_viscosity      = atmo_data.dynamic_viscosity
+    conditions.freestream.speed_of_sound         = atmo_data.speed_of_sound
+    conditions.freestream.temperature            = atmo_data.temperature
+    conditions.frames.inertial.velocity_vector   = np.zeros((ctrl_pts,3))
+    conditions.frames.inertial.velocity_vector[:,0] = velocity
+    conditions.frames.body.transform_to_inertial = np.tile(np.eye(3)[None],(ctrl_pts,1,1))
+    conditions.propulsion.throttle               = np.ones((ctrl_pts,1))
+
+    return conditions
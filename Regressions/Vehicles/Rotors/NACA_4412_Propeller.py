@@ -0,0 +1,38 @@
+# NACA_4412_Propeller.py
+#
+# Created:  Oct 2026, agent
+
+# Imports
+import RCAIDE
+from RCAIDE.Framework.Core import Units
+from RCAIDE.Library.Methods.Propulsors.Converters.Rotor import design_propeller
+import os
+
+# design propeller
+def NACA_4412_Propeller(variable_pitch = False):
+    prop                                   = RCAIDE.Library.Components.Propulsors.Converters.Propeller()
+    prop.tag                               = 'NACA_4412_Propeller'
+    prop.number_of_blades                  = 2.0
+    prop.variable_pitch                    = variable_pitch
+    prop.tip_radius                        = 76./2. * Units.inches
+    prop.hub_radius                        = 8.     * Units.inches
+    prop.cruise.design_freestream_velocity = 119.   * Units.knots
+    prop.cruise.design_angular_velocity    = 2650.  * Units.rpm
+    prop.cruise.design_Cl                  = 0.8
+    prop.cruise.design_altitude            = 12000. * Units.feet
+    prop.cruise.design_power               = .64 * 180. * Units.horsepower
+    ospath    = os.path.abspath(__file__)
+    separator = os.path.sep
+    rel_path  = os.path.dirname(ospath) + separator
+    airfoil                                = RCAIDE.Library.Components.Airfoils.Airfoil()
+    airfoil.coordinate_file                = rel_path + '../Airfoils/NACA_4412.txt'
+    airfoil.polar_files                    = [rel_path + '../Airfoils/Polars/NACA_4412_polar_Re_50000.txt' ,
+                                              rel_path + '../Airfoils/Polars/NACA_4412_polar_Re_100000.txt' ,
+                                              rel_path + '../Airfoils/Polars/NACA_4412_polar_Re_200000.txt' ,
+                                              rel_path + '../Airfoils/Polars/NACA_4412_polar_Re_500000.txt' ,
+                                              rel_path + '../Airfoils/Polars/NACA_4412_polar_Re_1000000.txt' ]
+    prop.append_airfoil(airfoil)
+    prop.airfoil_polar_stations            = [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]
+    design_propeller(prop)
+
+    return prop
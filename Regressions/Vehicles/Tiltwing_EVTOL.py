@@ -286,7 +286,7 @@ def vehicle_setup():
                                                      rel_path + 'Airfoils' + separator + 'Polars' + separator + 'NACA_4412_polar_Re_7500000.txt' ]
     prop_rotor.append_airfoil(airfoil)                
     prop_rotor.airfoil_polar_stations             = [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]   
-    design_prop_rotor(prop_rotor)
+    design_prop_rotor(prop_rotor,solver_sense_step = 1E-3,solver_tolerance = 1E-4)
     lift_propulsor.rotor                          = prop_rotor 
      
     
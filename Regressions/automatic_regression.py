@@ -19,6 +19,18 @@ import sys, os, traceback, time
 modules = [ 
     # ----------------------- Regression List --------------------------
     'Tests/analysis_aerodynamics/airfoil_panel_method_test.py',  
+    'Tests/analysis_aerodynamics/airfoil_boundary_layer_test.py',
+    'Tests/analysis_aerodynamics/hess_smith_cache_test.py',
+    'Tests/analysis_aerodynamics/vlm_kernel_test.py',
+    'Tests/analysis_aerodynamics/vlm_symmetric_solve_test.py',
+    'Tests/analysis_aerodynamics/vlm_batch_test.py',
+    'Tests/analysis_aerodynamics/vlm_surrogate_training_test.py',
+    'Tests/analysis_aerodynamics/vlm_adaptive_training_test.py',
+    'Tests/analysis_propulsion/rotor_wake_solver_test.py',
+    'Tests/analysis_propulsion/rotor_wake_fidelity_one_test.py',
+    'Tests/analysis_propulsion/wake_induced_velocity_tree_test.py',
+    'Tests/analysis_propulsion/rotor_performance_surrogate_test.py',
+    'Tests/analysis_propulsion/rotor_polar_tables_test.py',
     'Tests/analysis_noise/digital_elevation_test.py',  
     'Tests/analysis_noise/frequency_domain_test.py', 
     'Tests/analysis_noise/empirical_jet_noise_test.py',     
@@ -26,9 +38,15 @@ modules = [
     'Tests/analysis_stability/vlm_pertubation_test.py', 
     'Tests/geometry_airfoils/airfoil_import_test.py', 
     'Tests/geometry_airfoils/airfoil_interpolation_test.py',    
+    'Tests/methods_utilities/surrogate_test.py',
     'Tests/mission_segments/segment_test.py',     
+    'Tests/mission_segments/sparse_jacobian_test.py',
+    'Tests/mission_segments/simultaneous_segments_test.py',
+    'Tests/mission_segments/evaluate_batch_test.py',
+    'Tests/mission_segments/conditions_test.py',     
     'Tests/mission_segments/transition_segment_test.py',    
     'Tests/network_all_electric/all_electric_rotor_test.py',  
+    'Tests/network_all_electric/multi_battery_bus_test.py',
     'Tests/network_turbofan/turbofan_network_test.py',
     'Tests/network_turbojet/turbojet_network_test.py',
     'Tests/network_turboshaft/turboshaft_network_test.py',